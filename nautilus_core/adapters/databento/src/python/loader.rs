@@ -22,9 +22,17 @@ use nautilus_model::{
     identifiers::{InstrumentId, Venue},
     python::instruments::instrument_any_to_pyobject,
 };
+use nautilus_serialization::{
+    arrow::{
+        bars_to_arrow_record_batch_bytes, order_book_deltas_to_arrow_record_batch_bytes,
+        order_book_depth10_to_arrow_record_batch_bytes, quote_ticks_to_arrow_record_batch_bytes,
+        trade_ticks_to_arrow_record_batch_bytes,
+    },
+    python::arrow::grouped_arrow_record_batches_to_pybytes,
+};
 use pyo3::{
     prelude::*,
-    types::{PyCapsule, PyList},
+    types::{PyBytes, PyCapsule, PyList},
 };
 
 use crate::{
@@ -129,6 +137,27 @@ impl DatabentoDataLoader {
         exhaust_data_iter_to_pycapsule(py, iter).map_err(to_pyvalue_err)
     }
 
+    #[pyo3(name = "load_order_book_deltas_as_arrow")]
+    #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
+    fn py_load_order_book_deltas_as_arrow(
+        &self,
+        py: Python,
+        filepath: PathBuf,
+        instrument_id: Option<InstrumentId>,
+        price_precision: Option<u8>,
+    ) -> PyResult<Vec<Py<PyBytes>>> {
+        let data = self
+            .load_order_book_deltas(&filepath, instrument_id, price_precision)
+            .map_err(to_pyvalue_err)?;
+
+        grouped_arrow_record_batches_to_pybytes(
+            py,
+            data,
+            |x| x.instrument_id,
+            order_book_deltas_to_arrow_record_batch_bytes,
+        )
+    }
+
     #[pyo3(name = "load_order_book_depth10")]
     #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
     fn py_load_order_book_depth10(
@@ -157,6 +186,27 @@ impl DatabentoDataLoader {
         exhaust_data_iter_to_pycapsule(py, iter).map_err(to_pyvalue_err)
     }
 
+    #[pyo3(name = "load_order_book_depth10_as_arrow")]
+    #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
+    fn py_load_order_book_depth10_as_arrow(
+        &self,
+        py: Python,
+        filepath: PathBuf,
+        instrument_id: Option<InstrumentId>,
+        price_precision: Option<u8>,
+    ) -> PyResult<Vec<Py<PyBytes>>> {
+        let data = self
+            .load_order_book_depth10(&filepath, instrument_id, price_precision)
+            .map_err(to_pyvalue_err)?;
+
+        grouped_arrow_record_batches_to_pybytes(
+            py,
+            data,
+            |x| x.instrument_id,
+            order_book_depth10_to_arrow_record_batch_bytes,
+        )
+    }
+
     #[pyo3(name = "load_quotes")]
     #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
     fn py_load_quotes(
@@ -191,6 +241,27 @@ impl DatabentoDataLoader {
         exhaust_data_iter_to_pycapsule(py, iter).map_err(to_pyvalue_err)
     }
 
+    #[pyo3(name = "load_quotes_as_arrow")]
+    #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
+    fn py_load_quotes_as_arrow(
+        &self,
+        py: Python,
+        filepath: PathBuf,
+        instrument_id: Option<InstrumentId>,
+        price_precision: Option<u8>,
+    ) -> PyResult<Vec<Py<PyBytes>>> {
+        let data = self
+            .load_quotes(&filepath, instrument_id, price_precision)
+            .map_err(to_pyvalue_err)?;
+
+        grouped_arrow_record_batches_to_pybytes(
+            py,
+            data,
+            |x| x.instrument_id,
+            quote_ticks_to_arrow_record_batch_bytes,
+        )
+    }
+
     #[pyo3(name = "load_bbo_quotes")]
     #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
     fn py_load_bbo_quotes(
@@ -219,6 +290,27 @@ impl DatabentoDataLoader {
         exhaust_data_iter_to_pycapsule(py, iter).map_err(to_pyvalue_err)
     }
 
+    #[pyo3(name = "load_bbo_quotes_as_arrow")]
+    #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
+    fn py_load_bbo_quotes_as_arrow(
+        &self,
+        py: Python,
+        filepath: PathBuf,
+        instrument_id: Option<InstrumentId>,
+        price_precision: Option<u8>,
+    ) -> PyResult<Vec<Py<PyBytes>>> {
+        let data = self
+            .load_bbo_quotes(&filepath, instrument_id, price_precision)
+            .map_err(to_pyvalue_err)?;
+
+        grouped_arrow_record_batches_to_pybytes(
+            py,
+            data,
+            |x| x.instrument_id,
+            quote_ticks_to_arrow_record_batch_bytes,
+        )
+    }
+
     #[pyo3(name = "load_tbbo_trades")]
     #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
     fn py_load_tbbo_trades(
@@ -247,6 +339,27 @@ impl DatabentoDataLoader {
         exhaust_data_iter_to_pycapsule(py, iter).map_err(to_pyvalue_err)
     }
 
+    #[pyo3(name = "load_tbbo_trades_as_arrow")]
+    #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
+    fn py_load_tbbo_trades_as_arrow(
+        &self,
+        py: Python,
+        filepath: PathBuf,
+        instrument_id: Option<InstrumentId>,
+        price_precision: Option<u8>,
+    ) -> PyResult<Vec<Py<PyBytes>>> {
+        let data = self
+            .load_tbbo_trades(&filepath, instrument_id, price_precision)
+            .map_err(to_pyvalue_err)?;
+
+        grouped_arrow_record_batches_to_pybytes(
+            py,
+            data,
+            |x| x.instrument_id,
+            trade_ticks_to_arrow_record_batch_bytes,
+        )
+    }
+
     #[pyo3(name = "load_trades")]
     #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
     fn py_load_trades(
@@ -275,6 +388,27 @@ impl DatabentoDataLoader {
         exhaust_data_iter_to_pycapsule(py, iter).map_err(to_pyvalue_err)
     }
 
+    #[pyo3(name = "load_trades_as_arrow")]
+    #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
+    fn py_load_trades_as_arrow(
+        &self,
+        py: Python,
+        filepath: PathBuf,
+        instrument_id: Option<InstrumentId>,
+        price_precision: Option<u8>,
+    ) -> PyResult<Vec<Py<PyBytes>>> {
+        let data = self
+            .load_trades(&filepath, instrument_id, price_precision)
+            .map_err(to_pyvalue_err)?;
+
+        grouped_arrow_record_batches_to_pybytes(
+            py,
+            data,
+            |x| x.instrument_id,
+            trade_ticks_to_arrow_record_batch_bytes,
+        )
+    }
+
     #[pyo3(name = "load_bars")]
     #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
     fn py_load_bars(
@@ -303,6 +437,27 @@ impl DatabentoDataLoader {
         exhaust_data_iter_to_pycapsule(py, iter).map_err(to_pyvalue_err)
     }
 
+    #[pyo3(name = "load_bars_as_arrow")]
+    #[pyo3(signature = (filepath, instrument_id=None, price_precision=None))]
+    fn py_load_bars_as_arrow(
+        &self,
+        py: Python,
+        filepath: PathBuf,
+        instrument_id: Option<InstrumentId>,
+        price_precision: Option<u8>,
+    ) -> PyResult<Vec<Py<PyBytes>>> {
+        let data = self
+            .load_bars(&filepath, instrument_id, price_precision)
+            .map_err(to_pyvalue_err)?;
+
+        grouped_arrow_record_batches_to_pybytes(
+            py,
+            data,
+            |x| x.bar_type,
+            bars_to_arrow_record_batch_bytes,
+        )
+    }
+
     #[pyo3(name = "load_status")]
     #[pyo3(signature = (filepath, instrument_id=None))]
     fn py_load_status(
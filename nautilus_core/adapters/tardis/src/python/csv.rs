@@ -20,7 +20,17 @@ use nautilus_model::{
     data::{Data, OrderBookDelta, OrderBookDepth10, QuoteTick, TradeTick},
     identifiers::InstrumentId,
 };
-use pyo3::{prelude::*, types::PyCapsule};
+use nautilus_serialization::{
+    arrow::{
+        order_book_deltas_to_arrow_record_batch_bytes, quote_ticks_to_arrow_record_batch_bytes,
+        trade_ticks_to_arrow_record_batch_bytes,
+    },
+    python::arrow::grouped_arrow_record_batches_to_pybytes,
+};
+use pyo3::{
+    prelude::*,
+    types::{PyBytes, PyCapsule},
+};
 
 use crate::csv::{
     load_deltas, load_depth10_from_snapshot25, load_depth10_from_snapshot5, load_quote_ticks,
@@ -71,6 +81,33 @@ pub fn py_load_tardis_deltas_as_pycapsule(
     Ok(capsule.into_py(py))
 }
 
+#[pyfunction(name = "load_tardis_deltas_as_arrow")]
+#[pyo3(signature = (filepath, price_precision, size_precision, instrument_id=None, limit=None))]
+pub fn py_load_tardis_deltas_as_arrow(
+    py: Python,
+    filepath: PathBuf,
+    price_precision: u8,
+    size_precision: u8,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> PyResult<Vec<Py<PyBytes>>> {
+    let deltas = load_deltas(
+        filepath,
+        price_precision,
+        size_precision,
+        instrument_id,
+        limit,
+    )
+    .map_err(to_pyvalue_err)?;
+
+    grouped_arrow_record_batches_to_pybytes(
+        py,
+        deltas,
+        |x| x.instrument_id,
+        order_book_deltas_to_arrow_record_batch_bytes,
+    )
+}
+
 #[pyfunction(name = "load_tardis_depth10_from_snapshot5")]
 #[pyo3(signature = (filepath, price_precision, size_precision, instrument_id=None, limit=None))]
 pub fn py_load_tardis_depth10_from_snapshot5(
@@ -203,6 +240,33 @@ pub fn py_load_tardis_quotes_as_pycapsule(
     Ok(capsule.into_py(py))
 }
 
+#[pyfunction(name = "load_tardis_quotes_as_arrow")]
+#[pyo3(signature = (filepath, price_precision, size_precision, instrument_id=None, limit=None))]
+pub fn py_load_tardis_quotes_as_arrow(
+    py: Python,
+    filepath: PathBuf,
+    price_precision: u8,
+    size_precision: u8,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> PyResult<Vec<Py<PyBytes>>> {
+    let quotes = load_quote_ticks(
+        filepath,
+        price_precision,
+        size_precision,
+        instrument_id,
+        limit,
+    )
+    .map_err(to_pyvalue_err)?;
+
+    grouped_arrow_record_batches_to_pybytes(
+        py,
+        quotes,
+        |x| x.instrument_id,
+        quote_ticks_to_arrow_record_batch_bytes,
+    )
+}
+
 #[pyfunction(name = "load_tardis_trades")]
 #[pyo3(signature = (filepath, price_precision, size_precision, instrument_id=None, limit=None))]
 pub fn py_load_tardis_trades(
@@ -246,3 +310,30 @@ pub fn py_load_tardis_trades_as_pycapsule(
     let capsule = PyCapsule::new_bound::<CVec>(py, cvec, None)?;
     Ok(capsule.into_py(py))
 }
+
+#[pyfunction(name = "load_tardis_trades_as_arrow")]
+#[pyo3(signature = (filepath, price_precision, size_precision, instrument_id=None, limit=None))]
+pub fn py_load_tardis_trades_as_arrow(
+    py: Python,
+    filepath: PathBuf,
+    price_precision: u8,
+    size_precision: u8,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> PyResult<Vec<Py<PyBytes>>> {
+    let trades = load_trade_ticks(
+        filepath,
+        price_precision,
+        size_precision,
+        instrument_id,
+        limit,
+    )
+    .map_err(to_pyvalue_err)?;
+
+    grouped_arrow_record_batches_to_pybytes(
+        py,
+        trades,
+        |x| x.instrument_id,
+        trade_ticks_to_arrow_record_batch_bytes,
+    )
+}
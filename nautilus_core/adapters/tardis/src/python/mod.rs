@@ -45,6 +45,7 @@ pub fn tardis(_: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
         csv::py_load_tardis_deltas_as_pycapsule,
         m
     )?)?;
+    m.add_function(wrap_pyfunction!(csv::py_load_tardis_deltas_as_arrow, m)?)?;
     m.add_function(wrap_pyfunction!(
         csv::py_load_tardis_depth10_from_snapshot5,
         m
@@ -66,10 +67,12 @@ pub fn tardis(_: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
         csv::py_load_tardis_quotes_as_pycapsule,
         m
     )?)?;
+    m.add_function(wrap_pyfunction!(csv::py_load_tardis_quotes_as_arrow, m)?)?;
     m.add_function(wrap_pyfunction!(csv::py_load_tardis_trades, m)?)?;
     m.add_function(wrap_pyfunction!(
         csv::py_load_tardis_trades_as_pycapsule,
         m
     )?)?;
+    m.add_function(wrap_pyfunction!(csv::py_load_tardis_trades_as_arrow, m)?)?;
     Ok(())
 }
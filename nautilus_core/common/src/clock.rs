@@ -66,6 +66,9 @@ pub trait Clock {
     /// Returns the count of active timers in the clock.
     fn timer_count(&self) -> usize;
 
+    /// Returns whether an active timer with the given `name` exists in the clock.
+    fn has_timer(&self, name: &str) -> bool;
+
     /// Register a default event handler for the clock. If a `Timer`
     /// does not have an event handler, then this handler is used.
     fn register_default_handler(&mut self, callback: TimeEventCallback);
@@ -108,7 +111,7 @@ pub trait Clock {
 ///
 /// Stores the current timestamp internally which can be advanced.
 pub struct TestClock {
-    time: AtomicTime,
+    time: Arc<AtomicTime>,
     // use btree map to ensure stable ordering when scanning for timers
     // in `advance_time`
     timers: BTreeMap<Ustr, TestTimer>,
@@ -122,7 +125,7 @@ impl TestClock {
     #[must_use]
     pub fn new() -> Self {
         Self {
-            time: AtomicTime::new(false, UnixNanos::default()),
+            time: Arc::new(AtomicTime::new(false, UnixNanos::default())),
             timers: BTreeMap::new(),
             default_callback: None,
             callbacks: HashMap::new(),
@@ -136,6 +139,22 @@ impl TestClock {
         &self.timers
     }
 
+    /// Shares the time source of the `other` clock, so that setting the time of
+    /// either clock sets the time for all clocks sharing the source.
+    pub fn share_time(&mut self, other: &Self) {
+        self.time = Arc::clone(&other.time);
+    }
+
+    /// Returns the earliest next time of all active timers in the clock (if any).
+    #[must_use]
+    pub fn next_timer_ns(&self) -> Option<UnixNanos> {
+        self.timers
+            .values()
+            .filter(|timer| !timer.is_expired())
+            .map(TestTimer::next_time_ns)
+            .min()
+    }
+
     /// Advances the internal clock to the specified `to_time_ns` and optionally sets the clock to that time.
     ///
     /// This function ensures that the clock behaves in a non-decreasing manner. If `set_time` is `true`,
@@ -275,6 +294,12 @@ impl Clock for TestClock {
             .count()
     }
 
+    fn has_timer(&self, name: &str) -> bool {
+        self.timers
+            .get(&Ustr::from(name))
+            .is_some_and(|timer| !timer.is_expired())
+    }
+
     fn register_default_handler(&mut self, callback: TimeEventCallback) {
         self.default_callback = Some(callback);
     }
@@ -458,6 +483,12 @@ impl Clock for LiveClock {
             .count()
     }
 
+    fn has_timer(&self, name: &str) -> bool {
+        self.timers
+            .get(&Ustr::from(name))
+            .is_some_and(|timer| !timer.is_expired())
+    }
+
     fn register_default_handler(&mut self, handler: TimeEventCallback) {
         self.default_callback = Some(handler);
     }
@@ -718,6 +749,29 @@ mod tests {
         assert_eq!(test_clock.timer_count(), 0);
     }
 
+    #[rstest]
+    fn test_next_timer_ns(mut test_clock: TestClock) {
+        assert_eq!(test_clock.next_timer_ns(), None);
+        test_clock
+            .set_time_alert_ns("alert", 2000.into(), None)
+            .unwrap();
+        test_clock
+            .set_timer_ns("timer", 1500, 0.into(), None, None)
+            .unwrap();
+        assert_eq!(test_clock.next_timer_ns(), Some(1500.into()));
+        test_clock.cancel_timer("timer");
+        assert_eq!(test_clock.next_timer_ns(), Some(2000.into()));
+    }
+
+    #[rstest]
+    fn test_share_time() {
+        let source = TestClock::new();
+        let mut clock = TestClock::new();
+        clock.share_time(&source);
+        source.set_time(1000.into());
+        assert_eq!(*clock.timestamp_ns(), 1000);
+    }
+
     #[rstest]
     fn test_time_advancement(mut test_clock: TestClock) {
         let start_time = test_clock.timestamp_ns();
@@ -131,6 +131,28 @@ pub extern "C" fn test_clock_timer_count(clock: &mut TestClock_API) -> usize {
     clock.timer_count()
 }
 
+#[no_mangle]
+pub extern "C" fn test_clock_share_time(clock: &mut TestClock_API, other: &TestClock_API) {
+    clock.share_time(other);
+}
+
+#[no_mangle]
+pub extern "C" fn test_clock_next_timer_ns(clock: &TestClock_API) -> UnixNanos {
+    clock.next_timer_ns().unwrap_or_default()
+}
+
+/// # Safety
+///
+/// - Assumes `name_ptr` is a valid C string pointer.
+#[no_mangle]
+pub unsafe extern "C" fn test_clock_has_timer(
+    clock: &TestClock_API,
+    name_ptr: *const c_char,
+) -> u8 {
+    let name = cstr_as_str(name_ptr);
+    u8::from(clock.has_timer(name))
+}
+
 /// # Safety
 ///
 /// - Assumes `name_ptr` is a valid C string pointer.
@@ -341,6 +363,18 @@ pub extern "C" fn live_clock_timer_count(clock: &mut LiveClock_API) -> usize {
     clock.timer_count()
 }
 
+/// # Safety
+///
+/// - Assumes `name_ptr` is a valid C string pointer.
+#[no_mangle]
+pub unsafe extern "C" fn live_clock_has_timer(
+    clock: &LiveClock_API,
+    name_ptr: *const c_char,
+) -> u8 {
+    let name = cstr_as_str(name_ptr);
+    u8::from(clock.has_timer(name))
+}
+
 /// # Safety
 ///
 /// - Assumes `name_ptr` is a valid C string pointer.
@@ -27,7 +27,7 @@ use crate::{
     },
     enums::{BookType, OrderSide},
     identifiers::InstrumentId,
-    orderbook::{analysis::book_check_integrity, OrderBook},
+    orderbook::{analysis::book_check_integrity, BookLevel, OrderBook},
     types::{Price, Quantity},
 };
 
@@ -181,6 +181,69 @@ pub extern "C" fn orderbook_asks(book: &mut OrderBook_API) -> CVec {
         .into()
 }
 
+#[no_mangle]
+pub extern "C" fn orderbook_bids_depth(book: &mut OrderBook_API, depth: usize) -> CVec {
+    book.bids(Some(depth))
+        .map(|level| BookLevel_API::new(level.clone()))
+        .collect::<Vec<BookLevel_API>>()
+        .into()
+}
+
+#[no_mangle]
+pub extern "C" fn orderbook_asks_depth(book: &mut OrderBook_API, depth: usize) -> CVec {
+    book.asks(Some(depth))
+        .map(|level| BookLevel_API::new(level.clone()))
+        .collect::<Vec<BookLevel_API>>()
+        .into()
+}
+
+/// Writes the price, size and order count for up to `depth` levels of the given `side` of
+/// the book, returning the number of levels written.
+///
+/// # Safety
+///
+/// - Assumes `prices_ptr` and `sizes_ptr` are valid pointers to arrays of `f64` of length `depth`.
+/// - Assumes `counts_ptr` is a valid pointer to an array of `u64` of length `depth`.
+#[no_mangle]
+pub unsafe extern "C" fn orderbook_levels_to_arrays(
+    book: &OrderBook_API,
+    side: OrderSide,
+    depth: usize,
+    prices_ptr: *mut f64,
+    sizes_ptr: *mut f64,
+    counts_ptr: *mut u64,
+) -> usize {
+    assert!(!prices_ptr.is_null());
+    assert!(!sizes_ptr.is_null());
+    assert!(!counts_ptr.is_null());
+
+    let prices = std::slice::from_raw_parts_mut(prices_ptr, depth);
+    let sizes = std::slice::from_raw_parts_mut(sizes_ptr, depth);
+    let counts = std::slice::from_raw_parts_mut(counts_ptr, depth);
+
+    match side {
+        OrderSide::Buy => write_levels(book.bids(Some(depth)), prices, sizes, counts),
+        OrderSide::Sell => write_levels(book.asks(Some(depth)), prices, sizes, counts),
+        _ => panic!("Invalid `OrderSide` {side}"),
+    }
+}
+
+fn write_levels<'a>(
+    levels: impl Iterator<Item = &'a BookLevel>,
+    prices: &mut [f64],
+    sizes: &mut [f64],
+    counts: &mut [u64],
+) -> usize {
+    let mut len = 0;
+    for (i, level) in levels.enumerate() {
+        prices[i] = level.price.value.as_f64();
+        sizes[i] = level.size();
+        counts[i] = level.len() as u64;
+        len = i + 1;
+    }
+    len
+}
+
 #[no_mangle]
 pub extern "C" fn orderbook_has_bid(book: &mut OrderBook_API) -> u8 {
     u8::from(book.has_bid())
@@ -183,6 +183,25 @@ pub fn order_book_depth10_to_arrow_record_batch_bytes(
     OrderBookDepth10::encode_batch(&metadata, &data).map_err(EncodingError::ArrowError)
 }
 
+/// Groups the given `data` by the given `key` function, preserving the order of first
+/// appearance of each key and the order of the items within each group.
+pub fn group_by_key<T, K, F>(data: Vec<T>, key: F) -> Vec<Vec<T>>
+where
+    K: Eq + std::hash::Hash,
+    F: Fn(&T) -> K,
+{
+    let mut index: HashMap<K, usize> = HashMap::new();
+    let mut groups: Vec<Vec<T>> = Vec::new();
+    for item in data {
+        let i = *index.entry(key(&item)).or_insert_with(|| {
+            groups.push(Vec::new());
+            groups.len() - 1
+        });
+        groups[i].push(item);
+    }
+    groups
+}
+
 pub fn quote_ticks_to_arrow_record_batch_bytes(
     data: Vec<QuoteTick>,
 ) -> Result<RecordBatch, EncodingError> {
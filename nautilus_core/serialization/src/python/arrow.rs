@@ -31,13 +31,13 @@ use pyo3::{
 };
 
 use crate::arrow::{
-    bars_to_arrow_record_batch_bytes, order_book_deltas_to_arrow_record_batch_bytes,
+    bars_to_arrow_record_batch_bytes, group_by_key, order_book_deltas_to_arrow_record_batch_bytes,
     order_book_depth10_to_arrow_record_batch_bytes, quote_ticks_to_arrow_record_batch_bytes,
-    trade_ticks_to_arrow_record_batch_bytes, ArrowSchemaProvider,
+    trade_ticks_to_arrow_record_batch_bytes, ArrowSchemaProvider, EncodingError,
 };
 
 /// Transforms the given record `batches` into Python `bytes`.
-fn arrow_record_batch_to_pybytes(py: Python, batch: RecordBatch) -> PyResult<Py<PyBytes>> {
+pub fn arrow_record_batch_to_pybytes(py: Python, batch: RecordBatch) -> PyResult<Py<PyBytes>> {
     // Create a cursor to write to a byte array in memory
     let mut cursor = Cursor::new(Vec::new());
     {
@@ -59,6 +59,30 @@ fn arrow_record_batch_to_pybytes(py: Python, batch: RecordBatch) -> PyResult<Py<
     Ok(pybytes.into())
 }
 
+/// Encodes the given `data` into one Arrow IPC stream of Python `bytes` per group
+/// (as determined by the given `key`, such as the instrument ID), using `encode`.
+///
+/// Each group is encoded with its own schema metadata, so that files containing
+/// mixed instruments can be written directly to the catalog.
+pub fn grouped_arrow_record_batches_to_pybytes<T, K, F>(
+    py: Python,
+    data: Vec<T>,
+    key: F,
+    encode: fn(Vec<T>) -> Result<RecordBatch, EncodingError>,
+) -> PyResult<Vec<Py<PyBytes>>>
+where
+    K: Eq + std::hash::Hash,
+    F: Fn(&T) -> K,
+{
+    group_by_key(data, key)
+        .into_iter()
+        .map(|group| {
+            let batch = encode(group).map_err(to_pyvalue_err)?;
+            arrow_record_batch_to_pybytes(py, batch)
+        })
+        .collect()
+}
+
 #[pyfunction]
 pub fn get_arrow_schema_map(py: Python<'_>, cls: &Bound<'_, PyType>) -> PyResult<Py<PyAny>> {
     let cls_str: String = cls.getattr("__name__")?.extract()?;
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.rust.model cimport AccountType
 from nautilus_trader.core.rust.model cimport LiquiditySide
 from nautilus_trader.core.rust.model cimport OrderSide
@@ -70,6 +72,7 @@ cdef class Account:
 # -- COMMANDS --------------------------------------------------------------------------------------
 
     cpdef void apply(self, AccountState event)
+    cpdef void purge_account_events(self, uint64_t ts_now, uint64_t lookback_secs=*)
     cpdef void update_balances(self, list balances, bint allow_zero=*)
     cpdef void update_commissions(self, Money commission)
 
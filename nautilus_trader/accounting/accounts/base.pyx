@@ -17,6 +17,8 @@ from decimal import Decimal
 
 from nautilus_trader.accounting.error import AccountBalanceNegative
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport AccountType
 from nautilus_trader.core.rust.model cimport OrderSide
@@ -382,6 +384,33 @@ cdef class Account:
         self._events.append(event)
         self.update_balances(event.balances)
 
+    cpdef void purge_account_events(self, uint64_t ts_now, uint64_t lookback_secs=0):
+        """
+        Purge all account state events which are outside the lookback window.
+
+        The most recent event is always retained, so the account state remains
+        available from `last_event`.
+
+        Parameters
+        ----------
+        ts_now : uint64_t
+            UNIX timestamp (nanoseconds) for the current time.
+        lookback_secs : uint64_t, default 0
+            The lookback window (seconds) within which events are retained.
+
+        """
+        cdef uint64_t lookback_ns = lookback_secs * 1_000_000_000
+        cdef AccountState last_event = self._events[-1]
+        cdef list retained = []
+
+        cdef AccountState event
+        for event in self._events[:-1]:
+            if event.ts_event + lookback_ns > ts_now:
+                retained.append(event)
+
+        retained.append(last_event)
+        self._events = retained
+
     cpdef void update_balances(self, list balances, bint allow_zero=True):
         """
         Update the account balances.
@@ -15,10 +15,13 @@
 
 from decimal import Decimal
 
+from libc.stdint cimport int64_t
+
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.core.rust.model cimport PositionSide
 from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.objects cimport Currency
 from nautilus_trader.model.objects cimport MarginBalance
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
@@ -28,6 +31,7 @@ from nautilus_trader.model.objects cimport Quantity
 cdef class MarginAccount(Account):
     cdef dict _leverages
     cdef dict _margins
+    cdef dict _margin_totals
 
     cdef readonly default_leverage
     """The accounts default leverage setting.\n\n:returns: `Decimal`"""
@@ -53,6 +57,9 @@ cdef class MarginAccount(Account):
     cpdef void clear_margin_init(self, InstrumentId instrument_id)
     cpdef void clear_margin_maint(self, InstrumentId instrument_id)
     cpdef void clear_margin(self, InstrumentId instrument_id)
+    cdef void _adjust_margin_total(self, Currency currency, int64_t delta)
+    cdef int64_t _calculate_margin_total_raw(self, Currency currency)
+    cpdef bint check_margin_totals(self)
 
 # -- CALCULATIONS ---------------------------------------------------------------------------------
 
@@ -17,6 +17,8 @@ from decimal import Decimal
 
 from nautilus_trader.accounting.error import AccountMarginExceeded
 
+from libc.stdint cimport int64_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport AccountType
 from nautilus_trader.core.rust.model cimport LiquiditySide
@@ -64,6 +66,13 @@ cdef class MarginAccount(Account):
         self._leverages: dict[InstrumentId, Decimal] = {}
         self._margins: dict[InstrumentId, MarginBalance] = {m.instrument_id: m for m in event.margins}
 
+        # Running total (raw fixed-point) of initial and maintenance margins per currency
+        self._margin_totals: dict[Currency, int] = {}
+
+        cdef MarginBalance margin
+        for margin in self._margins.values():
+            self._adjust_margin_total(margin.currency, margin.initial._mem.raw + margin.maintenance._mem.raw)
+
     @staticmethod
     cdef dict to_dict_c(MarginAccount obj):
         Condition.not_none(obj, "obj")
@@ -315,8 +324,11 @@ cdef class MarginAccount(Account):
                 maintenance=Money(0, margin_init.currency),
                 instrument_id=instrument_id,
             )
+            self._adjust_margin_total(margin_init.currency, margin_init._mem.raw)
         else:
+            self._adjust_margin_total(margin.currency, -margin.initial._mem.raw)
             margin.initial = margin_init
+            self._adjust_margin_total(margin_init.currency, margin_init._mem.raw)
 
         self._recalculate_balance(margin_init.currency)
 
@@ -351,8 +363,11 @@ cdef class MarginAccount(Account):
                 maintenance=margin_maint,
                 instrument_id=instrument_id,
             )
+            self._adjust_margin_total(margin_maint.currency, margin_maint._mem.raw)
         else:
+            self._adjust_margin_total(margin.currency, -margin.maintenance._mem.raw)
             margin.maintenance = margin_maint
+            self._adjust_margin_total(margin_maint.currency, margin_maint._mem.raw)
 
         self._recalculate_balance(margin_maint.currency)
 
@@ -371,7 +386,15 @@ cdef class MarginAccount(Account):
         """
         Condition.not_none(margin, "margin")
 
+        cdef MarginBalance previous = self._margins.get(margin.instrument_id)
+        if previous is not None:
+            self._adjust_margin_total(
+                previous.currency,
+                -(previous.initial._mem.raw + previous.maintenance._mem.raw),
+            )
+
         self._margins[margin.instrument_id] = margin
+        self._adjust_margin_total(margin.currency, margin.initial._mem.raw + margin.maintenance._mem.raw)
         self._recalculate_balance(margin.currency)
 
     cpdef void clear_margin_init(self, InstrumentId instrument_id):
@@ -392,6 +415,8 @@ cdef class MarginAccount(Account):
 
         cdef MarginBalance margin = self._margins.get(instrument_id)
         if margin is not None:
+            self._adjust_margin_total(margin.currency, -margin.initial._mem.raw)
+
             if margin.maintenance._mem.raw == 0:
                 self._margins.pop(instrument_id)
             else:
@@ -417,6 +442,8 @@ cdef class MarginAccount(Account):
 
         cdef MarginBalance margin = self._margins.get(instrument_id)
         if margin is not None:
+            self._adjust_margin_total(margin.currency, -margin.maintenance._mem.raw)
+
             if margin.initial._mem.raw == 0:
                 self._margins.pop(instrument_id)
             else:
@@ -442,8 +469,53 @@ cdef class MarginAccount(Account):
 
         cdef MarginBalance margin = self._margins.pop(instrument_id, None)
         if margin is not None:
+            self._adjust_margin_total(
+                margin.currency,
+                -(margin.initial._mem.raw + margin.maintenance._mem.raw),
+            )
             self._recalculate_balance(margin.currency)
 
+    cdef void _adjust_margin_total(self, Currency currency, int64_t delta):
+        self._margin_totals[currency] = self._margin_totals.get(currency, 0) + delta
+
+    cdef int64_t _calculate_margin_total_raw(self, Currency currency):
+        cdef int64_t total_raw = 0
+
+        cdef MarginBalance margin
+        for margin in self._margins.values():
+            if margin.currency != currency:
+                continue
+            total_raw += margin.initial._mem.raw
+            total_raw += margin.maintenance._mem.raw
+
+        return total_raw
+
+    cpdef bint check_margin_totals(self):
+        """
+        Return a value indicating whether the running margin totals are consistent
+        with a full recalculation over every margin balance.
+
+        The running totals are maintained incrementally on each margin update, this
+        full recalculation is O(instruments) and intended only as a consistency check.
+
+        Returns
+        -------
+        bool
+
+        """
+        cdef set currencies = set(self._margin_totals.keys())
+
+        cdef MarginBalance margin
+        for margin in self._margins.values():
+            currencies.add(margin.currency)
+
+        cdef Currency currency
+        for currency in currencies:
+            if self._margin_totals.get(currency, 0) != self._calculate_margin_total_raw(currency):
+                return False
+
+        return True
+
 # -- CALCULATIONS ---------------------------------------------------------------------------------
 
     cpdef bint is_unleveraged(self, InstrumentId instrument_id):
@@ -455,28 +527,20 @@ cdef class MarginAccount(Account):
         if current_balance is None:
             raise RuntimeError("cannot recalculate balance when no current balance")
 
-        total_margin = Decimal()
-
-        cdef MarginBalance margin
-        for margin in self._margins.values():
-            if margin.currency != currency:
-                continue
-            total_margin += margin.initial
-            total_margin += margin.maintenance
-
-        total_free = current_balance.total.as_decimal() - total_margin
+        cdef int64_t total_margin_raw = self._margin_totals.get(currency, 0)
+        cdef int64_t total_free_raw = current_balance.total._mem.raw - total_margin_raw
 
-        if total_free < 0:
+        if total_free_raw < 0:
             raise AccountMarginExceeded(
                 balance=current_balance.total.as_decimal(),
-                margin=Money(total_margin, currency).as_decimal(),
+                margin=Money.from_raw_c(total_margin_raw, currency).as_decimal(),
                 currency=currency,
             )
 
         cdef AccountBalance new_balance = AccountBalance(
             current_balance.total,
-            Money(total_margin, currency),
-            Money(total_free, currency),
+            Money.from_raw_c(total_margin_raw, currency),
+            Money.from_raw_c(total_free_raw, currency),
         )
 
         self._balances[currency] = new_balance
@@ -14,7 +14,12 @@
 # -------------------------------------------------------------------------------------------------
 
 from collections.abc import Generator
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
 from os import PathLike
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
 from typing import BinaryIO
 
 import fsspec
@@ -35,6 +40,10 @@ from nautilus_trader.model.instruments import BettingInstrument
 from nautilus_trader.model.objects import Currency
 
 
+if TYPE_CHECKING:
+    from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+
 class BetfairParser:
     """
     Stateful parser that keeps market definition.
@@ -119,3 +128,119 @@ def betting_instruments_from_file(
                     )
                     instruments.extend(instruments)
     return list(set(instruments))
+
+
+def _ingest_basename(uri: PathLike[str] | str) -> str:
+    name = PurePosixPath(str(uri)).name
+    return name.split(".")[0]
+
+
+def _ingest_betfair_file(
+    uri: str,
+    currency: str,
+    catalog_path: str,
+    fs_protocol: str,
+    fs_storage_options: dict,
+) -> tuple[str, int]:
+    from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+    catalog = ParquetDataCatalog(
+        path=catalog_path,
+        fs_protocol=fs_protocol,
+        fs_storage_options=fs_storage_options,
+    )
+
+    # Market definitions are repeated throughout a stream, keep the latest instrument only
+    instruments: dict[InstrumentId, BettingInstrument] = {}
+    data: list[PARSE_TYPES] = []
+    for obj in parse_betfair_file(uri, currency=currency):
+        if isinstance(obj, BettingInstrument):
+            instruments[obj.id] = obj
+        else:
+            data.append(obj)
+
+    # Files are named by market ID, so the basename is unique per instrument directory
+    basename_template = f"{_ingest_basename(uri)}-{{i}}"
+    if instruments:
+        catalog.write_data(list(instruments.values()), basename_template=basename_template)
+    if data:
+        catalog.write_data(data, basename_template=basename_template)
+
+    return uri, len(data)
+
+
+def load_betfair_files_to_catalog(
+    uris: Iterable[PathLike[str] | str],
+    catalog: "ParquetDataCatalog",
+    currency: str,
+    max_workers: int | None = None,
+    progress_path: str | None = None,
+) -> int:
+    """
+    Parse historical Betfair stream files across a process pool, writing the
+    instruments and data for each file directly into the given catalog.
+
+    Each file is parsed and written by a single worker, with the data sorted and
+    partitioned per instrument (and a basename derived from the file name).
+    Completed files are recorded at `progress_path`, so that an interrupted
+    ingestion can be resumed by calling this function again with the same files.
+
+    Parameters
+    ----------
+    uris : Iterable[PathLike[str] | str]
+        The fsspec-compatible URIs of the stream files (typically one per market).
+    catalog : ParquetDataCatalog
+        The catalog to write to.
+    currency : str
+        The betfair account currency.
+    max_workers : int, optional
+        The maximum number of worker processes. If 1 then files are parsed in
+        the calling process. If ``None`` then uses the number of processors.
+        Workers open their own catalog, so a process pool requires a file system
+        shared between processes (not the 'memory' protocol).
+    progress_path : str, optional
+        The path of the progress file recording completed files.
+        If ``None`` then uses 'betfair_ingest_progress.txt' within the catalog path.
+
+    Returns
+    -------
+    int
+        The count of data objects written (excluding instruments).
+
+    """
+    fs = catalog.fs
+    progress_path = progress_path or f"{catalog.path}/betfair_ingest_progress.txt"
+
+    completed: set[str] = set()
+    if fs.exists(progress_path):
+        with fs.open(progress_path, "r") as f:
+            completed = {line.strip() for line in f if line.strip()}
+
+    pending = [str(uri) for uri in uris if str(uri) not in completed]
+    if not pending:
+        return 0
+
+    catalog_args = (catalog.path, catalog.fs_protocol, catalog.fs_storage_options)
+    count = 0
+
+    with fs.open(progress_path, "a") as progress:
+        if max_workers == 1:
+            for uri in pending:
+                _, file_count = _ingest_betfair_file(uri, currency, *catalog_args)
+                count += file_count
+                progress.write(f"{uri}\n")
+                progress.flush()
+            return count
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_ingest_betfair_file, uri, currency, *catalog_args)
+                for uri in pending
+            ]
+            for future in as_completed(futures):
+                uri, file_count = future.result()
+                count += file_count
+                progress.write(f"{uri}\n")
+                progress.flush()
+
+    return count
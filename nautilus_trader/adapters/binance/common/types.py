@@ -24,6 +24,7 @@ from nautilus_trader.model.data import BarType
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.serialization.base import register_serializable_type
 
 
 class BinanceBar(Bar):
@@ -451,3 +452,17 @@ class BinanceTicker(Data):
             "ts_event": obj.ts_event,
             "ts_init": obj.ts_init,
         }
+
+
+# Register serialization (loaded on first use via `_LAZY_SERIALIZABLE_TYPES`)
+register_serializable_type(
+    BinanceBar,
+    BinanceBar.to_dict,
+    BinanceBar.from_dict,
+)
+
+register_serializable_type(
+    BinanceTicker,
+    BinanceTicker.to_dict,
+    BinanceTicker.from_dict,
+)
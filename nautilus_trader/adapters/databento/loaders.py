@@ -13,19 +13,25 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from collections.abc import Generator
 from os import PathLike
 from pathlib import Path
 
+import pyarrow as pa
+
 from nautilus_trader.adapters.databento.constants import PUBLISHERS_FILEPATH
 from nautilus_trader.adapters.databento.enums import DatabentoSchema
 from nautilus_trader.core import nautilus_pyo3
+from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.data import Data
 from nautilus_trader.core.nautilus_pyo3 import drop_cvec_pycapsule
 from nautilus_trader.model.data import InstrumentStatus
+from nautilus_trader.model.data import capsule_to_chunks
 from nautilus_trader.model.data import capsule_to_list
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.instruments import instruments_from_pyo3
+from nautilus_trader.serialization.arrow.serializer import record_batches_from_bytes
 
 
 class DatabentoDataLoader:
@@ -176,6 +182,20 @@ class DatabentoDataLoader:
         if schema is None:
             raise RuntimeError("Loading files with mixed schemas not currently supported")
 
+        if as_legacy_cython:
+            capsule = self._load_as_pycapsule(
+                schema=schema,
+                path=str(path),
+                instrument_id=pyo3_instrument_id,
+                price_precision=price_precision,
+                include_trades=include_trades,
+            )
+            if capsule is not None:
+                data = capsule_to_list(capsule)
+                # Drop encapsulated `CVec` as data is now transferred
+                drop_cvec_pycapsule(capsule)
+                return data
+
         match schema:
             case DatabentoSchema.DEFINITION.value:
                 data = self._pyo3_loader.load_instruments(str(path), use_exchange_as_venue)
@@ -183,94 +203,37 @@ class DatabentoDataLoader:
                     data = instruments_from_pyo3(data)
                 return data
             case DatabentoSchema.MBO.value:
-                if as_legacy_cython:
-                    capsule = self._pyo3_loader.load_order_book_deltas_as_pycapsule(
-                        filepath=str(path),
-                        instrument_id=pyo3_instrument_id,
-                        price_precision=price_precision,
-                        include_trades=include_trades,
-                    )
-                    data = capsule_to_list(capsule)
-                    # Drop encapsulated `CVec` as data is now transferred
-                    drop_cvec_pycapsule(capsule)
-                    return data
-                else:
-                    if include_trades:
-                        raise RuntimeError(
-                            "Cannot load `OrderBookDelta` and `Trade` objects together, "
-                            "set `include_trades` to False",
-                        )
-                    return self._pyo3_loader.load_order_book_deltas(
-                        filepath=str(path),
-                        instrument_id=pyo3_instrument_id,
-                        price_precision=price_precision,
+                if include_trades:
+                    raise RuntimeError(
+                        "Cannot load `OrderBookDelta` and `Trade` objects together, "
+                        "set `include_trades` to False",
                     )
+                return self._pyo3_loader.load_order_book_deltas(
+                    filepath=str(path),
+                    instrument_id=pyo3_instrument_id,
+                    price_precision=price_precision,
+                )
             case DatabentoSchema.MBP_1.value | DatabentoSchema.TBBO.value:
-                if as_legacy_cython:
-                    capsule = self._pyo3_loader.load_quotes_as_pycapsule(
-                        filepath=str(path),
-                        instrument_id=pyo3_instrument_id,
-                        price_precision=price_precision,
-                        include_trades=include_trades,
-                    )
-                    data = capsule_to_list(capsule)
-                    # Drop encapsulated `CVec` as data is now transferred
-                    drop_cvec_pycapsule(capsule)
-                    return data
-                else:
-                    if include_trades:
-                        raise RuntimeError(
-                            "Cannot load `QuoteTick` and `TradeTick` objects together, "
-                            "set `include_trades` to False",
-                        )
-                    return self._pyo3_loader.load_quotes(
-                        filepath=str(path),
-                        instrument_id=pyo3_instrument_id,
-                        price_precision=price_precision,
+                if include_trades:
+                    raise RuntimeError(
+                        "Cannot load `QuoteTick` and `TradeTick` objects together, "
+                        "set `include_trades` to False",
                     )
+                return self._pyo3_loader.load_quotes(
+                    filepath=str(path),
+                    instrument_id=pyo3_instrument_id,
+                    price_precision=price_precision,
+                )
             case DatabentoSchema.BBO_1S.value | DatabentoSchema.BBO_1M.value:
-                if as_legacy_cython:
-                    capsule = self._pyo3_loader.load_bbo_quotes_as_pycapsule(
-                        filepath=str(path),
-                        instrument_id=pyo3_instrument_id,
-                        price_precision=price_precision,
-                    )
-                    data = capsule_to_list(capsule)
-                    # Drop encapsulated `CVec` as data is now transferred
-                    drop_cvec_pycapsule(capsule)
-                    return data
-                else:
-                    return self._pyo3_loader.load_bbo_quotes(
-                        filepath=str(path),
-                        instrument_id=pyo3_instrument_id,
-                        price_precision=price_precision,
-                    )
+                return self._pyo3_loader.load_bbo_quotes(
+                    filepath=str(path),
+                    instrument_id=pyo3_instrument_id,
+                    price_precision=price_precision,
+                )
             case DatabentoSchema.MBP_10.value:
-                if as_legacy_cython:
-                    capsule = self._pyo3_loader.load_order_book_depth10_as_pycapsule(
-                        filepath=str(path),
-                        instrument_id=pyo3_instrument_id,
-                        price_precision=price_precision,
-                    )
-                    data = capsule_to_list(capsule)
-                    # Drop encapsulated `CVec` as data is now transferred
-                    drop_cvec_pycapsule(capsule)
-                    return data
-                else:
-                    return self._pyo3_loader.load_order_book_depth10(str(path), pyo3_instrument_id)
+                return self._pyo3_loader.load_order_book_depth10(str(path), pyo3_instrument_id)
             case DatabentoSchema.TRADES.value:
-                if as_legacy_cython:
-                    capsule = self._pyo3_loader.load_trades_as_pycapsule(
-                        filepath=str(path),
-                        instrument_id=pyo3_instrument_id,
-                        price_precision=price_precision,
-                    )
-                    data = capsule_to_list(capsule)
-                    # Drop encapsulated `CVec` as data is now transferred
-                    drop_cvec_pycapsule(capsule)
-                    return data
-                else:
-                    return self._pyo3_loader.load_trades(str(path), pyo3_instrument_id)
+                return self._pyo3_loader.load_trades(str(path), pyo3_instrument_id)
             case (
                 DatabentoSchema.OHLCV_1S.value
                 | DatabentoSchema.OHLCV_1M.value
@@ -278,22 +241,11 @@ class DatabentoDataLoader:
                 | DatabentoSchema.OHLCV_1D.value
                 | DatabentoSchema.OHLCV_EOD
             ):
-                if as_legacy_cython:
-                    capsule = self._pyo3_loader.load_bars_as_pycapsule(
-                        filepath=str(path),
-                        instrument_id=pyo3_instrument_id,
-                        price_precision=price_precision,
-                    )
-                    data = capsule_to_list(capsule)
-                    # Drop encapsulated `CVec` as data is now transferred
-                    drop_cvec_pycapsule(capsule)
-                    return data
-                else:
-                    return self._pyo3_loader.load_bars(
-                        filepath=str(path),
-                        instrument_id=pyo3_instrument_id,
-                        price_precision=price_precision,
-                    )
+                return self._pyo3_loader.load_bars(
+                    filepath=str(path),
+                    instrument_id=pyo3_instrument_id,
+                    price_precision=price_precision,
+                )
             case DatabentoSchema.STATUS.value:
                 data = self._pyo3_loader.load_status(  # type: ignore [assignment]
                     filepath=str(path),
@@ -324,3 +276,237 @@ class DatabentoDataLoader:
                 )
             case _:
                 raise RuntimeError(f"Loading schema {schema} not currently supported")
+
+    def from_dbn_file_as_arrow(
+        self,
+        path: PathLike[str] | str,
+        instrument_id: InstrumentId | None = None,
+        price_precision: int | None = None,
+    ) -> list[pa.RecordBatch]:
+        """
+        Return Arrow record batches decoded from the DBN file at the given `path`.
+
+        Records are encoded directly into the Nautilus Arrow schema, with one record
+        batch per instrument (or bar type for bars), so no data objects are created.
+        The batches can be passed to `ParquetDataCatalog.write_data` along with the
+        `data_cls` for the schema:
+         - MBO -> `OrderBookDelta`
+         - MBP_1 / TBBO / BBO_1S / BBO_1M -> `QuoteTick`
+         - MBP_10 -> `OrderBookDepth10`
+         - TRADES -> `TradeTick`
+         - OHLCV_* -> `Bar`
+
+        Parameters
+        ----------
+        path : PathLike[str] | str
+            The path for the DBN data file.
+        instrument_id : InstrumentId, optional
+            The Nautilus instrument ID for the data (see `from_dbn_file`).
+        price_precision : int, optional
+            The price precision, if different to the default of 2 for USD.
+
+        Returns
+        -------
+        list[pa.RecordBatch]
+
+        Raises
+        ------
+        ValueError
+            If there is an error during decoding.
+        RuntimeError
+            If the schema of the file is not supported for Arrow output.
+
+        """
+        if isinstance(path, Path):
+            path = str(path.resolve())
+
+        pyo3_instrument_id: nautilus_pyo3.InstrumentId | None = (
+            nautilus_pyo3.InstrumentId.from_str(instrument_id.value)
+            if instrument_id is not None
+            else None
+        )
+
+        schema = self._pyo3_loader.schema_for_file(str(path))
+        if schema is None:
+            raise RuntimeError("Loading files with mixed schemas not currently supported")
+
+        match schema:
+            case DatabentoSchema.MBO.value:
+                load_as_arrow = self._pyo3_loader.load_order_book_deltas_as_arrow
+            case DatabentoSchema.MBP_1.value | DatabentoSchema.TBBO.value:
+                load_as_arrow = self._pyo3_loader.load_quotes_as_arrow
+            case DatabentoSchema.BBO_1S.value | DatabentoSchema.BBO_1M.value:
+                load_as_arrow = self._pyo3_loader.load_bbo_quotes_as_arrow
+            case DatabentoSchema.MBP_10.value:
+                load_as_arrow = self._pyo3_loader.load_order_book_depth10_as_arrow
+            case DatabentoSchema.TRADES.value:
+                load_as_arrow = self._pyo3_loader.load_trades_as_arrow
+            case (
+                DatabentoSchema.OHLCV_1S.value
+                | DatabentoSchema.OHLCV_1M.value
+                | DatabentoSchema.OHLCV_1H.value
+                | DatabentoSchema.OHLCV_1D.value
+                | DatabentoSchema.OHLCV_EOD
+            ):
+                load_as_arrow = self._pyo3_loader.load_bars_as_arrow
+            case _:
+                raise RuntimeError(f"Loading schema {schema} as Arrow not currently supported")
+
+        batches_bytes = load_as_arrow(
+            filepath=str(path),
+            instrument_id=pyo3_instrument_id,
+            price_precision=price_precision,
+        )
+        return record_batches_from_bytes(batches_bytes)
+
+    def stream_dbn_file(
+        self,
+        path: PathLike[str] | str,
+        chunk_size: int = 100_000,
+        instrument_id: InstrumentId | None = None,
+        price_precision: int | None = None,
+        as_legacy_cython: bool = True,
+        include_trades: bool = False,
+        use_exchange_as_venue: bool = False,
+    ) -> Generator[list[Data], None, None]:
+        """
+        Return a generator of data object chunks decoded from the DBN file at the given `path`.
+
+        Records are decoded into native memory and data objects are only created for
+        the chunk being yielded, so the whole file is never held as Python objects.
+        Each chunk can be passed directly to `ParquetDataCatalog.write_data` or a
+        `BacktestEngine`.
+
+        Schemas which are not decoded into native memory (definition, status, imbalance
+        and statistics), and `OrderBookDepth10` or mixed types as pyo3 objects, are
+        loaded in full and then yielded in chunks.
+
+        Parameters
+        ----------
+        path : PathLike[str] | str
+            The path for the DBN data file.
+        chunk_size : int, default 100_000
+            The maximum number of data objects per chunk.
+        instrument_id : InstrumentId, optional
+            The Nautilus instrument ID for the data (see `from_dbn_file`).
+        price_precision : int, optional
+            The price precision, if different to the default of 2 for USD.
+        as_legacy_cython : bool, default True
+            If data should be converted to 'legacy Cython' objects, otherwise pyo3 objects.
+        include_trades : bool, default False
+            If separate `TradeTick` elements will be included in the data for MBO and MBP-1 schemas.
+        use_exchange_as_venue : bool, optional
+            Whether to use actual exchanges for instrument ids or GLBX, defaults to False.
+
+        Yields
+        ------
+        list[Data] | list[pyo3 data]
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is not positive (> 0).
+
+        """
+        PyCondition.positive_int(chunk_size, "chunk_size")
+
+        if isinstance(path, Path):
+            path = str(path.resolve())
+
+        schema = self._pyo3_loader.schema_for_file(str(path))
+        if schema is None:
+            raise RuntimeError("Loading files with mixed schemas not currently supported")
+
+        capsule = None
+        if as_legacy_cython or (not include_trades and schema != DatabentoSchema.MBP_10.value):
+            capsule = self._load_as_pycapsule(
+                schema=schema,
+                path=str(path),
+                instrument_id=(
+                    nautilus_pyo3.InstrumentId.from_str(instrument_id.value)
+                    if instrument_id is not None
+                    else None
+                ),
+                price_precision=price_precision,
+                include_trades=include_trades,
+            )
+
+        if capsule is None:
+            data = self.from_dbn_file(
+                path=path,
+                instrument_id=instrument_id,
+                price_precision=price_precision,
+                as_legacy_cython=as_legacy_cython,
+                include_trades=include_trades,
+                use_exchange_as_venue=use_exchange_as_venue,
+            )
+            for start in range(0, len(data), chunk_size):
+                yield data[start : start + chunk_size]
+            return
+
+        try:
+            for chunk in capsule_to_chunks(capsule, chunk_size):
+                if not as_legacy_cython:
+                    chunk = type(chunk[0]).to_pyo3_list(chunk)
+                yield chunk
+        finally:
+            # Drop encapsulated `CVec` once all chunks are converted (or the generator is closed)
+            drop_cvec_pycapsule(capsule)
+
+    def _load_as_pycapsule(
+        self,
+        schema: str,
+        path: str,
+        instrument_id: nautilus_pyo3.InstrumentId | None,
+        price_precision: int | None,
+        include_trades: bool,
+    ) -> object | None:
+        # Returns a `PyCapsule` holding the decoded records, or ``None`` if the schema
+        # is not decoded to a capsule (caller is responsible for dropping the capsule)
+        match schema:
+            case DatabentoSchema.MBO.value:
+                return self._pyo3_loader.load_order_book_deltas_as_pycapsule(
+                    filepath=path,
+                    instrument_id=instrument_id,
+                    price_precision=price_precision,
+                    include_trades=include_trades,
+                )
+            case DatabentoSchema.MBP_1.value | DatabentoSchema.TBBO.value:
+                return self._pyo3_loader.load_quotes_as_pycapsule(
+                    filepath=path,
+                    instrument_id=instrument_id,
+                    price_precision=price_precision,
+                    include_trades=include_trades,
+                )
+            case DatabentoSchema.BBO_1S.value | DatabentoSchema.BBO_1M.value:
+                return self._pyo3_loader.load_bbo_quotes_as_pycapsule(
+                    filepath=path,
+                    instrument_id=instrument_id,
+                    price_precision=price_precision,
+                )
+            case DatabentoSchema.MBP_10.value:
+                return self._pyo3_loader.load_order_book_depth10_as_pycapsule(
+                    filepath=path,
+                    instrument_id=instrument_id,
+                    price_precision=price_precision,
+                )
+            case DatabentoSchema.TRADES.value:
+                return self._pyo3_loader.load_trades_as_pycapsule(
+                    filepath=path,
+                    instrument_id=instrument_id,
+                    price_precision=price_precision,
+                )
+            case (
+                DatabentoSchema.OHLCV_1S.value
+                | DatabentoSchema.OHLCV_1M.value
+                | DatabentoSchema.OHLCV_1H.value
+                | DatabentoSchema.OHLCV_1D.value
+                | DatabentoSchema.OHLCV_EOD
+            ):
+                return self._pyo3_loader.load_bars_as_pycapsule(
+                    filepath=path,
+                    instrument_id=instrument_id,
+                    price_precision=price_precision,
+                )
+            case _:
+                return None
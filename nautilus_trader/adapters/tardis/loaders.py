@@ -13,17 +13,23 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from collections.abc import Generator
 from os import PathLike
 from pathlib import Path
 
+import pyarrow as pa
+
 from nautilus_trader.core import nautilus_pyo3
+from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.nautilus_pyo3 import drop_cvec_pycapsule
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDepth10
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.data import capsule_to_chunks
 from nautilus_trader.model.data import capsule_to_list
 from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.serialization.arrow.serializer import record_batches_from_bytes
 
 
 class TardisCSVDataLoader:
@@ -315,3 +321,255 @@ class TardisCSVDataLoader:
             instrument_id=self._instrument_id,
             limit=limit,
         )
+
+    def load_deltas_as_arrow(
+        self,
+        filepath: PathLike[str] | str,
+        limit: int | None = None,
+    ) -> list[pa.RecordBatch]:
+        """
+        Load order book deltas data from the given `filepath` as Arrow record batches.
+
+        CSV file must be Tardis incremental book L2 format. Records are encoded directly into the
+        Nautilus Arrow schema, with one record batch per instrument, so no data objects
+        are created. The batches can be passed to `ParquetDataCatalog.write_data` with
+        `data_cls=OrderBookDelta`.
+
+        Parameters
+        ----------
+        filepath : PathLike[str] | str
+            The path for the CSV data file.
+        limit : int, optional
+            The limit for the number of records to read.
+
+        Returns
+        -------
+        list[pa.RecordBatch]
+
+        """
+        if isinstance(filepath, Path):
+            filepath = str(filepath.resolve())
+
+        batches_bytes = nautilus_pyo3.load_tardis_deltas_as_arrow(
+            filepath=str(filepath),
+            price_precision=self._price_precision,
+            size_precision=self._size_precision,
+            instrument_id=self._instrument_id,
+            limit=limit,
+        )
+        return record_batches_from_bytes(batches_bytes)
+
+    def load_quotes_as_arrow(
+        self,
+        filepath: PathLike[str] | str,
+        limit: int | None = None,
+    ) -> list[pa.RecordBatch]:
+        """
+        Load quote tick data from the given `filepath` as Arrow record batches.
+
+        CSV file must be Tardis quotes format. Records are encoded directly into the
+        Nautilus Arrow schema, with one record batch per instrument, so no data objects
+        are created. The batches can be passed to `ParquetDataCatalog.write_data` with
+        `data_cls=QuoteTick`.
+
+        Parameters
+        ----------
+        filepath : PathLike[str] | str
+            The path for the CSV data file.
+        limit : int, optional
+            The limit for the number of records to read.
+
+        Returns
+        -------
+        list[pa.RecordBatch]
+
+        """
+        if isinstance(filepath, Path):
+            filepath = str(filepath.resolve())
+
+        batches_bytes = nautilus_pyo3.load_tardis_quotes_as_arrow(
+            filepath=str(filepath),
+            price_precision=self._price_precision,
+            size_precision=self._size_precision,
+            instrument_id=self._instrument_id,
+            limit=limit,
+        )
+        return record_batches_from_bytes(batches_bytes)
+
+    def load_trades_as_arrow(
+        self,
+        filepath: PathLike[str] | str,
+        limit: int | None = None,
+    ) -> list[pa.RecordBatch]:
+        """
+        Load trade tick data from the given `filepath` as Arrow record batches.
+
+        CSV file must be Tardis trades format. Records are encoded directly into the
+        Nautilus Arrow schema, with one record batch per instrument, so no data objects
+        are created. The batches can be passed to `ParquetDataCatalog.write_data` with
+        `data_cls=TradeTick`.
+
+        Parameters
+        ----------
+        filepath : PathLike[str] | str
+            The path for the CSV data file.
+        limit : int, optional
+            The limit for the number of records to read.
+
+        Returns
+        -------
+        list[pa.RecordBatch]
+
+        """
+        if isinstance(filepath, Path):
+            filepath = str(filepath.resolve())
+
+        batches_bytes = nautilus_pyo3.load_tardis_trades_as_arrow(
+            filepath=str(filepath),
+            price_precision=self._price_precision,
+            size_precision=self._size_precision,
+            instrument_id=self._instrument_id,
+            limit=limit,
+        )
+        return record_batches_from_bytes(batches_bytes)
+
+    def stream_deltas(
+        self,
+        filepath: PathLike[str] | str,
+        chunk_size: int = 100_000,
+        as_legacy_cython: bool = True,
+        limit: int | None = None,
+    ) -> Generator[list[OrderBookDelta] | list[nautilus_pyo3.OrderBookDelta], None, None]:
+        """
+        Return a generator of order book delta chunks from the given `filepath`.
+
+        CSV file must be Tardis incremental book L2 format.
+
+        Parameters
+        ----------
+        filepath : PathLike[str] | str
+            The path for the CSV data file.
+        chunk_size : int, default 100_000
+            The maximum number of deltas per chunk.
+        as_legacy_cython : bool, True
+            If data should be converted to 'legacy Cython' objects, otherwise pyo3 objects.
+        limit : int, optional
+            The limit for the number of records to read.
+
+        Yields
+        ------
+        list[OrderBookDelta] | list[nautilus_pyo3.OrderBookDelta]
+
+        """
+        PyCondition.positive_int(chunk_size, "chunk_size")
+
+        if isinstance(filepath, Path):
+            filepath = str(filepath.resolve())
+
+        capsule = nautilus_pyo3.load_tardis_deltas_as_pycapsule(
+            filepath=str(filepath),
+            price_precision=self._price_precision,
+            size_precision=self._size_precision,
+            instrument_id=self._instrument_id,
+            limit=limit,
+        )
+        yield from self._stream_capsule(capsule, OrderBookDelta, chunk_size, as_legacy_cython)
+
+    def stream_quotes(
+        self,
+        filepath: PathLike[str] | str,
+        chunk_size: int = 100_000,
+        as_legacy_cython: bool = True,
+        limit: int | None = None,
+    ) -> Generator[list[QuoteTick] | list[nautilus_pyo3.QuoteTick], None, None]:
+        """
+        Return a generator of quote tick chunks from the given `filepath`.
+
+        CSV file must be Tardis quotes format.
+
+        Parameters
+        ----------
+        filepath : PathLike[str] | str
+            The path for the CSV data file.
+        chunk_size : int, default 100_000
+            The maximum number of quotes per chunk.
+        as_legacy_cython : bool, True
+            If data should be converted to 'legacy Cython' objects, otherwise pyo3 objects.
+        limit : int, optional
+            The limit for the number of records to read.
+
+        Yields
+        ------
+        list[QuoteTick] | list[nautilus_pyo3.QuoteTick]
+
+        """
+        PyCondition.positive_int(chunk_size, "chunk_size")
+
+        if isinstance(filepath, Path):
+            filepath = str(filepath.resolve())
+
+        capsule = nautilus_pyo3.load_tardis_quotes_as_pycapsule(
+            filepath=str(filepath),
+            price_precision=self._price_precision,
+            size_precision=self._size_precision,
+            instrument_id=self._instrument_id,
+            limit=limit,
+        )
+        yield from self._stream_capsule(capsule, QuoteTick, chunk_size, as_legacy_cython)
+
+    def stream_trades(
+        self,
+        filepath: PathLike[str] | str,
+        chunk_size: int = 100_000,
+        as_legacy_cython: bool = True,
+        limit: int | None = None,
+    ) -> Generator[list[TradeTick] | list[nautilus_pyo3.TradeTick], None, None]:
+        """
+        Return a generator of trade tick chunks from the given `filepath`.
+
+        CSV file must be Tardis trades format.
+
+        Parameters
+        ----------
+        filepath : PathLike[str] | str
+            The path for the CSV data file.
+        chunk_size : int, default 100_000
+            The maximum number of trades per chunk.
+        as_legacy_cython : bool, True
+            If data should be converted to 'legacy Cython' objects, otherwise pyo3 objects.
+        limit : int, optional
+            The limit for the number of records to read.
+
+        Yields
+        ------
+        list[TradeTick] | list[nautilus_pyo3.TradeTick]
+
+        """
+        PyCondition.positive_int(chunk_size, "chunk_size")
+
+        if isinstance(filepath, Path):
+            filepath = str(filepath.resolve())
+
+        capsule = nautilus_pyo3.load_tardis_trades_as_pycapsule(
+            filepath=str(filepath),
+            price_precision=self._price_precision,
+            size_precision=self._size_precision,
+            instrument_id=self._instrument_id,
+            limit=limit,
+        )
+        yield from self._stream_capsule(capsule, TradeTick, chunk_size, as_legacy_cython)
+
+    def _stream_capsule(
+        self,
+        capsule: object,
+        data_cls: type,
+        chunk_size: int,
+        as_legacy_cython: bool,
+    ) -> Generator[list, None, None]:
+        # Records are held in native memory, with objects only created per chunk
+        try:
+            for chunk in capsule_to_chunks(capsule, chunk_size):
+                yield chunk if as_legacy_cython else data_cls.to_pyo3_list(chunk)
+        finally:
+            # Drop encapsulated `CVec` once all chunks are converted (or the generator is closed)
+            drop_cvec_pycapsule(capsule)
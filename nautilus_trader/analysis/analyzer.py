@@ -17,6 +17,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from numpy import float64
 
@@ -30,10 +31,45 @@ from nautilus_trader.model.objects import Money
 from nautilus_trader.model.position import Position
 
 
+_INITIAL_CAPACITY = 1024
+
+
+def _ensure_capacity(values: np.ndarray, count: int) -> np.ndarray:
+    # Double the capacity when full so appends are amortized O(1)
+    if count < len(values):
+        return values
+    grown = np.empty(max(_INITIAL_CAPACITY, len(values) * 2), dtype=float64)
+    grown[:count] = values[:count]
+    return grown
+
+
+class _RunningTradeStatistics:
+    # Online accumulators for realized PnLs in a single currency
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.winners = 0
+        self.total = 0.0
+        self.peak = 0.0
+        self.max_drawdown = 0.0
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        if value > 0.0:
+            self.winners += 1
+        self.total += value
+        self.peak = max(self.peak, self.total)
+        self.max_drawdown = min(self.max_drawdown, self.total - self.peak)
+
+
 class PortfolioAnalyzer:
     """
     Provides a portfolio performance analyzer for tracking and generating performance
     metrics and statistics.
+
+    Realized PnLs and returns are accumulated in preallocated arrays, with pandas
+    series only built when requested. Running statistics are also maintained online
+    as data is added, and can be queried at any time with `running_statistics`.
     """
 
     def __init__(self) -> None:
@@ -43,8 +79,25 @@ class PortfolioAnalyzer:
         self._account_balances_starting: dict[Currency, Money] = {}
         self._account_balances: dict[Currency, Money] = {}
         self._positions: list[Position] = []
-        self._realized_pnls: dict[Currency, pd.Series] = {}
-        self._returns: pd.Series = pd.Series(dtype=float64)
+        self._reset_data()
+
+    def _reset_data(self) -> None:
+        # Realized PnLs per currency (position ID -> row)
+        self._realized_pnls_index: dict[Currency, dict[str, int]] = {}
+        self._realized_pnls_values: dict[Currency, np.ndarray] = {}
+        self._realized_pnls_series: dict[Currency, pd.Series] = {}
+
+        # Returns (timestamp -> row)
+        self._returns_index: dict[datetime, int] = {}
+        self._returns_values: np.ndarray = np.empty(_INITIAL_CAPACITY, dtype=float64)
+        self._returns_series: pd.Series | None = None
+
+        # Running statistics
+        self._running_trades: dict[Currency, _RunningTradeStatistics] = {}
+        self._running_returns_count = 0
+        self._running_returns_mean = 0.0
+        self._running_returns_m2 = 0.0
+        self._running_returns_downside_sq = 0.0
 
     def register_statistic(self, statistic: PortfolioStatistic) -> None:
         """
@@ -81,8 +134,7 @@ class PortfolioAnalyzer:
         """
         self._account_balances_starting = {}
         self._account_balances = {}
-        self._realized_pnls = {}
-        self._returns = pd.Series(dtype=float64)
+        self._reset_data()
 
     def _get_max_length_name(self) -> int:
         max_length = 0
@@ -123,7 +175,17 @@ class PortfolioAnalyzer:
         pd.Series
 
         """
-        return self._returns
+        if self._returns_series is None:
+            count = len(self._returns_index)
+            if count == 0:
+                self._returns_series = pd.Series(dtype=float64)
+            else:
+                self._returns_series = pd.Series(
+                    self._returns_values[:count].copy(),
+                    index=pd.DatetimeIndex(list(self._returns_index)),
+                )
+
+        return self._returns_series
 
     def calculate_statistics(self, account: Account, positions: list[Position]) -> None:
         """
@@ -139,11 +201,9 @@ class PortfolioAnalyzer:
         """
         self._account_balances_starting = account.starting_balances()
         self._account_balances = account.balances_total()
-        self._realized_pnls = {}
-        self._returns = pd.Series(dtype=float64)
+        self._reset_data()
 
         self.add_positions(positions)
-        self._returns.sort_index()
 
     def add_positions(self, positions: list[Position]) -> None:
         """
@@ -173,9 +233,31 @@ class PortfolioAnalyzer:
 
         """
         currency = realized_pnl.currency
-        realized_pnls = self._realized_pnls.get(currency, pd.Series(dtype=float64))
-        realized_pnls.loc[position_id.value] = realized_pnl.as_double()
-        self._realized_pnls[currency] = realized_pnls
+        value = realized_pnl.as_double()
+
+        index = self._realized_pnls_index.get(currency)
+        if index is None:
+            index = {}
+            self._realized_pnls_index[currency] = index
+            self._realized_pnls_values[currency] = np.empty(_INITIAL_CAPACITY, dtype=float64)
+
+        row = index.get(position_id.value)
+        if row is None:
+            row = len(index)
+            index[position_id.value] = row
+            self._realized_pnls_values[currency] = _ensure_capacity(
+                self._realized_pnls_values[currency],
+                row,
+            )
+            self._realized_pnls_values[currency][row] = value
+            self._update_running_trade(currency, value)
+        else:
+            # Replacing a trade (e.g. a NETTING position reopened with the same ID),
+            # so rebuild the running trade statistics in order (drawdown is path dependent)
+            self._realized_pnls_values[currency][row] = value
+            self._rebuild_running_trades(currency)
+
+        self._realized_pnls_series.pop(currency, None)
 
     def add_return(self, timestamp: datetime, value: float) -> None:
         """
@@ -189,9 +271,114 @@ class PortfolioAnalyzer:
             The return value to add.
 
         """
-        if timestamp not in self._returns:
-            self._returns.loc[timestamp] = 0.0
-        self._returns.loc[timestamp] += float(value)
+        row = self._returns_index.get(timestamp)
+        if row is None:
+            row = len(self._returns_index)
+            self._returns_index[timestamp] = row
+            self._returns_values = _ensure_capacity(self._returns_values, row)
+            self._returns_values[row] = 0.0
+
+        self._returns_values[row] += float(value)
+        self._returns_series = None
+        self._update_running_return(float(value))
+
+    def update_running_statistics(self, realized_pnl: Money, realized_return: float) -> None:
+        """
+        Update the running statistics only, without retaining the trade data.
+
+        This is an O(1) operation with bounded memory, suitable for tracking
+        performance throughout a live trading session.
+
+        Parameters
+        ----------
+        realized_pnl : Money
+            The realized PnL for the trade.
+        realized_return : double
+            The realized return for the trade.
+
+        """
+        PyCondition.not_none(realized_pnl, "realized_pnl")
+
+        self._update_running_trade(realized_pnl.currency, realized_pnl.as_double())
+        self._update_running_return(float(realized_return))
+
+    def _update_running_trade(self, currency: Currency, value: float) -> None:
+        stats = self._running_trades.get(currency)
+        if stats is None:
+            stats = _RunningTradeStatistics()
+            self._running_trades[currency] = stats
+        stats.update(value)
+
+    def _rebuild_running_trades(self, currency: Currency) -> None:
+        stats = _RunningTradeStatistics()
+        values = self._realized_pnls_values[currency]
+        for row in range(len(self._realized_pnls_index[currency])):
+            stats.update(float(values[row]))
+        self._running_trades[currency] = stats
+
+    def _update_running_return(self, value: float) -> None:
+        # Welford's online algorithm for the mean and variance
+        self._running_returns_count += 1
+        delta = value - self._running_returns_mean
+        self._running_returns_mean += delta / self._running_returns_count
+        self._running_returns_m2 += delta * (value - self._running_returns_mean)
+        if value < 0.0:
+            self._running_returns_downside_sq += value * value
+
+    def running_statistics(self, currency: Currency | None = None) -> dict[str, float]:
+        """
+        Return the running statistics, which are maintained online as data is
+        added to the analyzer (an O(1) query).
+
+        Each added return is treated as a separate observation, so the running
+        ratios are neither aggregated by timestamp, downsampled into daily bins
+        or annualized. The max drawdown is computed from the cumulative realized
+        PnL, in the order trades were added.
+
+        For multi-currency portfolios, specify the currency for the result.
+
+        Parameters
+        ----------
+        currency : Currency, optional
+            The currency for the trade statistics.
+
+        Returns
+        -------
+        dict[str, float]
+
+        Raises
+        ------
+        ValueError
+            If `currency` is ``None`` when analyzing multi-currency portfolios.
+
+        """
+        if currency is None and self._running_trades:
+            if len(self._running_trades) > 1:
+                raise ValueError("`currency` was `None` for multi-currency portfolio")
+            currency = next(iter(self._running_trades.keys()))
+
+        trades = self._running_trades.get(currency) or _RunningTradeStatistics()
+
+        count = self._running_returns_count
+        sharpe = np.nan
+        sortino = np.nan
+        if count > 1:
+            std = np.sqrt(self._running_returns_m2 / (count - 1))
+            if std > 0.0:
+                sharpe = self._running_returns_mean / std
+        if count > 0 and self._running_returns_downside_sq > 0.0:
+            downside = np.sqrt(self._running_returns_downside_sq / count)
+            sortino = self._running_returns_mean / downside
+
+        return {
+            "Trades": trades.count,
+            "Win Rate": trades.winners / float(max(1, trades.count)),
+            "PnL (realized)": trades.total,
+            "Max Drawdown": trades.max_drawdown,
+            "Returns Average": self._running_returns_mean,
+            "Sharpe Ratio (running)": sharpe,
+            "Sortino Ratio (running)": sortino,
+        }
 
     def realized_pnls(self, currency: Currency | None = None) -> pd.Series | None:
         """
@@ -214,14 +401,25 @@ class PortfolioAnalyzer:
             If `currency` is ``None`` when analyzing multi-currency portfolios.
 
         """
-        if not self._realized_pnls:
+        if not self._realized_pnls_index:
             return None
         if currency is None:
             if len(self._account_balances) > 1:
                 raise ValueError("`currency` was `None` for multi-currency portfolio")
             currency = next(iter(self._account_balances.keys()))
 
-        return self._realized_pnls.get(currency)
+        realized_pnls = self._realized_pnls_series.get(currency)
+        if realized_pnls is None:
+            index = self._realized_pnls_index.get(currency)
+            if index is None:
+                return None
+            realized_pnls = pd.Series(
+                self._realized_pnls_values[currency][: len(index)].copy(),
+                index=list(index),
+            )
+            self._realized_pnls_series[currency] = realized_pnls
+
+        return realized_pnls
 
     def total_pnl(
         self,
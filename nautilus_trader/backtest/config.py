@@ -265,6 +265,9 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
         The stdout log level for the node.
     loop_debug : bool, default False
         If the asyncio event loop should be in debug mode.
+    trusted_mode : bool, default False
+        If the message bus, cache and strategy order factories should skip
+        argument-level precondition checks on their hot paths.
     cache : CacheConfig, optional
         The cache configuration.
     data_engine : DataEngineConfig, optional
@@ -291,6 +294,9 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
         If logging should be bypassed.
     run_analysis : bool, default True
         If post backtest performance analysis should be run.
+    profile_handlers : bool, default False
+        If message handler, timer callback and simulated venue calls should be counted
+        and timed, with the report available on the `BacktestResult`.
 
     """
 
@@ -300,6 +306,7 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
     risk_engine: RiskEngineConfig = RiskEngineConfig()
     exec_engine: ExecEngineConfig = ExecEngineConfig()
     run_analysis: bool = True
+    profile_handlers: bool = False
 
 
 class BacktestRunConfig(NautilusConfig, frozen=True):
@@ -18,6 +18,7 @@ from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.common.component cimport Clock
+from nautilus_trader.common.component cimport HandlerProfiler
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.rust.backtest cimport TimeEventAccumulatorAPI
@@ -49,8 +50,11 @@ cdef class BacktestEngine:
     cdef uint64_t _data_len
     cdef uint64_t _index
     cdef uint64_t _iteration
+    cdef HandlerProfiler _profiler
+    cdef dict _exchange_profile_names
 
     cdef Data _next(self)
+    cdef SimulatedExchange _process_exchange_data(self, Data data)
     cdef CVec _advance_time(self, uint64_t ts_now)
     cdef void _process_raw_time_event_handlers(
         self,
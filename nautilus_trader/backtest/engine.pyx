@@ -50,6 +50,8 @@ from nautilus_trader.backtest.modules cimport SimulationModule
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.actor cimport Actor
 from nautilus_trader.common.component cimport LOGGING_PYO3
+from nautilus_trader.common.component cimport ClockTimerIndex
+from nautilus_trader.common.component cimport HandlerProfiler
 from nautilus_trader.common.component cimport LiveClock
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport LogGuard
@@ -57,6 +59,7 @@ from nautilus_trader.common.component cimport TestClock
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.common.component cimport TimeEventHandler
 from nautilus_trader.common.component cimport get_component_clocks
+from nautilus_trader.common.component cimport get_component_timer_index
 from nautilus_trader.common.component cimport log_level_from_str
 from nautilus_trader.common.component cimport log_sysinfo
 from nautilus_trader.common.component cimport set_logging_clock_realtime_mode
@@ -154,6 +157,13 @@ cdef class BacktestEngine:
 
         self._data_engine: DataEngine = self._kernel.data_engine
 
+        # Profiling (optional)
+        self._profiler: HandlerProfiler | None = None
+        self._exchange_profile_names: dict[Venue, tuple[str, str]] = {}
+        if config.profile_handlers:
+            self._profiler = HandlerProfiler()
+            self._kernel.msgbus.set_profiler(self._profiler)
+
     def __del__(self) -> None:
         if self._accumulator._0 != NULL:
             time_event_accumulator_drop(self._accumulator)
@@ -316,6 +326,18 @@ cdef class BacktestEngine:
         """
         return self._kernel.trader
 
+    @property
+    def profiler(self) -> HandlerProfiler | None:
+        """
+        Return the engines handler profiler (if `profile_handlers` is configured).
+
+        Returns
+        -------
+        HandlerProfiler or ``None``
+
+        """
+        return self._profiler
+
     @property
     def cache(self) -> CacheFacade:
         """
@@ -521,6 +543,7 @@ cdef class BacktestEngine:
 
         exchange.register_client(exec_client)
         self.kernel.exec_engine.register_client(exec_client)
+        self.kernel.risk_engine.register_venue_oms_type(venue, oms_type)
 
         self._log.info(f"Added {exchange}")
 
@@ -863,6 +886,9 @@ cdef class BacktestEngine:
         self._backtest_start = None
         self._backtest_end = None
 
+        if self._profiler is not None:
+            self._profiler.reset()
+
         self._log.info("Reset")
 
     def clear_data(self) -> None:
@@ -1026,6 +1052,7 @@ cdef class BacktestEngine:
             total_positions=self._kernel.cache.positions_total_count(),
             stats_pnls=stats_pnls,
             stats_returns=self._kernel.portfolio.analyzer.get_performance_stats_returns(),
+            profile=self._profiler.report() if self._profiler is not None else None,
         )
 
     def _run(
@@ -1117,6 +1144,14 @@ cdef class BacktestEngine:
         # Set data stream length
         self._data_len = len(self._data)
 
+        cdef HandlerProfiler profiler = self._profiler
+        if profiler is not None:
+            for exchange in self._venues.values():
+                self._exchange_profile_names[exchange.id] = (
+                    f"SimulatedExchange-{exchange.id}.process_data",
+                    f"SimulatedExchange-{exchange.id}.process",
+                )
+
         # Set starting index
         cdef uint64_t i
         for i in range(self._data_len):
@@ -1130,6 +1165,8 @@ cdef class BacktestEngine:
         cdef uint64_t raw_handlers_count = 0
         cdef Data data = self._next()
         cdef CVec raw_handlers
+        cdef uint64_t start_ns
+        cdef SimulatedExchange data_exchange
         try:
             while data is not None:
                 if data.ts_init > end_ns:
@@ -1140,34 +1177,39 @@ cdef class BacktestEngine:
                     raw_handlers = self._advance_time(data.ts_init)
                     raw_handlers_count = raw_handlers.len
 
-                # Process data through exchange
-                if isinstance(data, OrderBookDelta):
-                    exchange = self._venues[data.instrument_id.venue]
-                    exchange.process_order_book_delta(data)
-                elif isinstance(data, OrderBookDeltas):
-                    exchange = self._venues[data.instrument_id.venue]
-                    exchange.process_order_book_deltas(data)
-                elif isinstance(data, QuoteTick):
-                    exchange = self._venues[data.instrument_id.venue]
-                    exchange.process_quote_tick(data)
-                elif isinstance(data, TradeTick):
-                    exchange = self._venues[data.instrument_id.venue]
-                    exchange.process_trade_tick(data)
-                elif isinstance(data, Bar):
-                    exchange = self._venues[data.bar_type.instrument_id.venue]
-                    exchange.process_bar(data)
-                elif isinstance(data, InstrumentClose):
-                    exchange = self._venues[data.instrument_id.venue]
-                    exchange.process_instrument_close(data)
-                elif isinstance(data, InstrumentStatus):
-                    exchange = self._venues[data.instrument_id.venue]
-                    exchange.process_instrument_status(data)
-
-                self._data_engine.process(data)
-
-                # Process all exchange messages
-                for exchange in self._venues.values():
-                    exchange.process(data.ts_init)
+                if profiler is None:
+                    # Process data through exchange
+                    self._process_exchange_data(data)
+
+                    self._data_engine.process(data)
+
+                    # Process all exchange messages
+                    for exchange in self._venues.values():
+                        exchange.process(data.ts_init)
+                else:
+                    data_exchange = None
+                    start_ns = profiler.start()
+                    try:
+                        data_exchange = self._process_exchange_data(data)
+                    finally:
+                        profiler.stop(
+                            self._exchange_profile_names[data_exchange.id][0] if data_exchange is not None else "SimulatedExchange.process_data",
+                            type(data),
+                            start_ns,
+                        )
+
+                    start_ns = profiler.start()
+                    try:
+                        self._data_engine.process(data)
+                    finally:
+                        profiler.stop("DataEngine.process", type(data), start_ns)
+
+                    for exchange in self._venues.values():
+                        start_ns = profiler.start()
+                        try:
+                            exchange.process(data.ts_init)
+                        finally:
+                            profiler.stop(self._exchange_profile_names[exchange.id][1], type(data), start_ns)
 
                 last_ns = data.ts_init
                 data = self._next()
@@ -1211,8 +1253,36 @@ cdef class BacktestEngine:
         if cursor < self._data_len:
             return self._data[cursor]
 
+    cdef SimulatedExchange _process_exchange_data(self, Data data):
+        cdef SimulatedExchange exchange = None
+        if isinstance(data, OrderBookDelta):
+            exchange = self._venues[data.instrument_id.venue]
+            exchange.process_order_book_delta(data)
+        elif isinstance(data, OrderBookDeltas):
+            exchange = self._venues[data.instrument_id.venue]
+            exchange.process_order_book_deltas(data)
+        elif isinstance(data, QuoteTick):
+            exchange = self._venues[data.instrument_id.venue]
+            exchange.process_quote_tick(data)
+        elif isinstance(data, TradeTick):
+            exchange = self._venues[data.instrument_id.venue]
+            exchange.process_trade_tick(data)
+        elif isinstance(data, Bar):
+            exchange = self._venues[data.bar_type.instrument_id.venue]
+            exchange.process_bar(data)
+        elif isinstance(data, InstrumentClose):
+            exchange = self._venues[data.instrument_id.venue]
+            exchange.process_instrument_close(data)
+        elif isinstance(data, InstrumentStatus):
+            exchange = self._venues[data.instrument_id.venue]
+            exchange.process_instrument_status(data)
+
+        return exchange
+
     cdef CVec _advance_time(self, uint64_t ts_now):
-        cdef list[TestClock] clocks = get_component_clocks(self._instance_id)
+        # Only advance clocks with timers due (all component clocks share the kernel clocks time)
+        cdef ClockTimerIndex timer_index = get_component_timer_index(self._instance_id)
+        cdef list[TestClock] clocks = timer_index.pop_due(ts_now)
 
         cdef TestClock clock
         for clock in clocks:
@@ -1222,6 +1292,7 @@ cdef class BacktestEngine:
                 ts_now,
                 False,
             )
+            timer_index.reindex(clock)
 
         cdef CVec raw_handlers = time_event_accumulator_drain(&self._accumulator)
 
@@ -1237,8 +1308,7 @@ cdef class BacktestEngine:
         if LOGGING_PYO3:
             nautilus_pyo3.logging_clock_set_static_time(ts_now)
 
-        for clock in clocks:
-            clock.set_time(ts_now)
+        self._kernel.clock.set_time(ts_now)
 
         # Return all remaining events to be handled (at `ts_now`)
         return raw_handlers
@@ -1256,10 +1326,11 @@ cdef class BacktestEngine:
             uint64_t ts_last_init = 0
             TimeEventHandler_t raw_handler
             TimeEvent event
-            TestClock clock
             PyObject *raw_callback
             object callback
             SimulatedExchange exchange
+            HandlerProfiler profiler = self._profiler
+            uint64_t start_ns
         for i in range(raw_handler_vec.len):
             raw_handler = <TimeEventHandler_t>raw_handlers[i]
             ts_event_init = raw_handler.event.ts_init
@@ -1271,21 +1342,34 @@ cdef class BacktestEngine:
             if LOGGING_PYO3:
                 nautilus_pyo3.logging_clock_set_static_time(ts_event_init)
 
-            for clock in get_component_clocks(self._instance_id):
-                clock.set_time(ts_event_init)
+            self._kernel.clock.set_time(ts_event_init)
 
             event = TimeEvent.from_mem_c(raw_handler.event)
 
             # Cast raw `PyObject *` to a `PyObject`
             raw_callback = <PyObject *>raw_handler.callback_ptr
             callback = <object>raw_callback
-            callback(event)
+            if profiler is None:
+                callback(event)
+            else:
+                start_ns = profiler.start()
+                try:
+                    callback(event)
+                finally:
+                    profiler.stop(profiler.callback_name(callback), TimeEvent, start_ns)
 
             if ts_event_init != ts_last_init:
                 # Process exchange messages
                 ts_last_init = ts_event_init
                 for exchange in self._venues.values():
-                    exchange.process(ts_event_init)
+                    if profiler is None:
+                        exchange.process(ts_event_init)
+                    else:
+                        start_ns = profiler.start()
+                        try:
+                            exchange.process(ts_event_init)
+                        finally:
+                            profiler.stop(self._exchange_profile_names[exchange.id][1], TimeEvent, start_ns)
 
     def _get_log_color_code(self):
         return "\033[36m" if logging_is_colored() else ""
@@ -1326,6 +1410,26 @@ cdef class BacktestEngine:
         self._log.info(f"Batch end:      {end}")
         self._log.info(f"{color}-----------------------------------------------------------------")
 
+    def _log_profile(self, int limit = 10):
+        cdef str color = self._get_log_color_code()
+        cdef dict report = self._profiler.report()
+
+        self._log.info(f"{color}=================================================================")
+        self._log.info(f"{color} HANDLER PROFILE (by self time)")
+        self._log.info(f"{color}=================================================================")
+        for category, totals in report["categories"].items():
+            self._log.info(f"{category}: count={totals['count']:_}, self={totals['self_ns'] / 1e6:_.3f}ms")
+        self._log.info(f"{color}-----------------------------------------------------------------")
+        for stats in report["handlers"][:limit]:
+            self._log.info(
+                f"{stats['name']} [{stats['message_type']}]: "
+                f"count={stats['count']:_}, "
+                f"self={stats['self_ns'] / 1e6:_.3f}ms, "
+                f"total={stats['total_ns'] / 1e6:_.3f}ms, "
+                f"mean={stats['mean_ns'] / 1e3:_.3f}us, "
+                f"p99={stats['p99_ns'] / 1e3:_.3f}us",
+            )
+
     def _log_post_run(self):
         if self._run_finished and self._run_started:
             elapsed_time = self._run_finished - self._run_started
@@ -1361,6 +1465,9 @@ cdef class BacktestEngine:
 
         self._log.info(f"Total positions: {len(positions):_}")
 
+        if self._profiler is not None:
+            self._log_profile()
+
         if not self._config.run_analysis:
             return
 
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass
@@ -38,6 +39,7 @@ class BacktestResult:
     total_positions: int
     stats_pnls: dict[str, dict[str, float]]
     stats_returns: dict[str, float]
+    profile: dict[str, Any] | None = None
 
     # account_balances: pd.DataFrame
     # fills_report: pd.DataFrame
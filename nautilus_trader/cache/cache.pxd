@@ -108,6 +108,8 @@ cdef class Cache(CacheFacade):
 
     cdef readonly bint has_backing
     """If the cache has a database backing.\n\n:returns: `bool`"""
+    cdef readonly bint trusted
+    """If argument checks are skipped on the hot data and order paths.\n\n:returns: `bool`"""
     cdef readonly int tick_capacity
     """The caches tick capacity.\n\n:returns: `int`"""
     cdef readonly int bar_capacity
@@ -178,6 +180,12 @@ cdef class Cache(CacheFacade):
     cpdef void delete_actor(self, Actor actor)
     cpdef void delete_strategy(self, Strategy strategy)
 
+    cpdef void purge_closed_orders(self, uint64_t ts_now, uint64_t buffer_secs=*)
+    cpdef void purge_closed_positions(self, uint64_t ts_now, uint64_t buffer_secs=*)
+    cpdef void purge_order(self, ClientOrderId client_order_id)
+    cpdef void purge_position(self, PositionId position_id)
+    cpdef void purge_account_events(self, uint64_t ts_now, uint64_t lookback_secs=*)
+
     cpdef void heartbeat(self, datetime timestamp)
 
     cdef timedelta _get_timedelta(self, BarType bar_type)
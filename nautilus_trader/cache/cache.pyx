@@ -83,6 +83,9 @@ cdef class Cache(CacheFacade):
         The database adapter for the cache. If ``None`` then will bypass persistence.
     config : CacheConfig, optional
         The cache configuration.
+    trusted : bool, default False
+        If argument checks should be skipped on the hot market data and order
+        update paths. Only appropriate when all callers are validated system components.
 
     Raises
     ------
@@ -94,6 +97,7 @@ cdef class Cache(CacheFacade):
         self,
         CacheDatabaseFacade database: CacheDatabaseFacade | None = None,
         config: CacheConfig | None = None,
+        bint trusted = False,
     ) -> None:
         if config is None:
             config = CacheConfig()
@@ -106,6 +110,7 @@ cdef class Cache(CacheFacade):
         # Configuration
         self._drop_instruments_on_reset = config.drop_instruments_on_reset
         self.has_backing = database is not None
+        self.trusted = trusted
         self.tick_capacity = config.tick_capacity
         self.bar_capacity = config.bar_capacity
 
@@ -1121,7 +1126,8 @@ cdef class Cache(CacheFacade):
             The order book to add.
 
         """
-        Condition.not_none(order_book, "order_book")
+        if not self.trusted:
+            Condition.not_none(order_book, "order_book")
 
         self._order_books[order_book.instrument_id] = order_book
 
@@ -1135,7 +1141,8 @@ cdef class Cache(CacheFacade):
             The tick to add.
 
         """
-        Condition.not_none(tick, "tick")
+        if not self.trusted:
+            Condition.not_none(tick, "tick")
 
         cdef InstrumentId instrument_id = tick.instrument_id
         ticks = self._quote_ticks.get(instrument_id)
@@ -1157,7 +1164,8 @@ cdef class Cache(CacheFacade):
             The tick to add.
 
         """
-        Condition.not_none(tick, "tick")
+        if not self.trusted:
+            Condition.not_none(tick, "tick")
 
         cdef InstrumentId instrument_id = tick.instrument_id
         ticks = self._trade_ticks.get(instrument_id)
@@ -1179,7 +1187,8 @@ cdef class Cache(CacheFacade):
             The bar to add.
 
         """
-        Condition.not_none(bar, "bar")
+        if not self.trusted:
+            Condition.not_none(bar, "bar")
 
         bars = self._bars.get(bar.bar_type)
 
@@ -1422,8 +1431,9 @@ cdef class Cache(CacheFacade):
             If `overwrite` is False and the `client_order_id` is already indexed with a different `venue_order_id`.
 
         """
-        Condition.not_none(client_order_id, "client_order_id")
-        Condition.not_none(venue_order_id, "venue_order_id")
+        if not self.trusted:
+            Condition.not_none(client_order_id, "client_order_id")
+            Condition.not_none(venue_order_id, "venue_order_id")
 
         cdef VenueOrderId existing_venue_order_id = self._index_client_order_ids.get(client_order_id)
         if not overwrite and existing_venue_order_id is not None and venue_order_id != existing_venue_order_id:
@@ -1788,7 +1798,8 @@ cdef class Cache(CacheFacade):
         account : The account to update (from last event).
 
         """
-        Condition.not_none(account, "account")
+        if not self.trusted:
+            Condition.not_none(account, "account")
 
         # Update database
         if self._database is not None:
@@ -1804,7 +1815,8 @@ cdef class Cache(CacheFacade):
             The order to update (from last event).
 
         """
-        Condition.not_none(order, "order")
+        if not self.trusted:
+            Condition.not_none(order, "order")
 
         # Update venue order ID
         if order.venue_order_id is not None and order.venue_order_id not in self._index_venue_order_ids:
@@ -1867,7 +1879,8 @@ cdef class Cache(CacheFacade):
             The position to update (from last event).
 
         """
-        Condition.not_none(position, "position")
+        if not self.trusted:
+            Condition.not_none(position, "position")
 
         if position.is_open_c():
             self._index_positions_open.add(position.id)
@@ -1972,6 +1985,211 @@ cdef class Cache(CacheFacade):
             self._database.delete_strategy(strategy.id)
             self._log.debug(f"Deleted Strategy(id={strategy.id.value})")
 
+# -- PURGING --------------------------------------------------------------------------------------
+
+    cpdef void purge_closed_orders(self, uint64_t ts_now, uint64_t buffer_secs = 0):
+        """
+        Purge all closed orders from the cache which were closed before the
+        buffer window.
+
+        Orders which are still linked to an open position are retained.
+
+        Parameters
+        ----------
+        ts_now : uint64_t
+            UNIX timestamp (nanoseconds) for the current time.
+        buffer_secs : uint64_t, default 0
+            The minimum time (seconds) an order must have been closed before it is purged.
+
+        Warnings
+        --------
+        Purged orders are only removed from the in-memory cache, any backing
+        database is unaffected.
+
+        """
+        cdef uint64_t buffer_ns = buffer_secs * 1_000_000_000
+
+        self._log.debug(f"Purging closed orders{f' with {buffer_secs} sec buffer' if buffer_secs else ''}")
+
+        cdef:
+            ClientOrderId client_order_id
+            Order order
+            PositionId position_id
+            Position position
+        for client_order_id in list(self._index_orders_closed):
+            order = self._orders.get(client_order_id)
+            if order is None or order.ts_last + buffer_ns > ts_now:
+                continue
+
+            position_id = self._index_order_position.get(client_order_id)
+            if position_id is not None:
+                position = self._positions.get(position_id)
+                if position is not None and position.is_open_c():
+                    continue  # Order still contributes to an open position
+
+            self.purge_order(client_order_id)
+
+    cpdef void purge_closed_positions(self, uint64_t ts_now, uint64_t buffer_secs = 0):
+        """
+        Purge all closed positions from the cache which were closed before the
+        buffer window.
+
+        Parameters
+        ----------
+        ts_now : uint64_t
+            UNIX timestamp (nanoseconds) for the current time.
+        buffer_secs : uint64_t, default 0
+            The minimum time (seconds) a position must have been closed before it is purged.
+
+        Warnings
+        --------
+        Purged positions are only removed from the in-memory cache, any backing
+        database is unaffected.
+
+        """
+        cdef uint64_t buffer_ns = buffer_secs * 1_000_000_000
+
+        self._log.debug(f"Purging closed positions{f' with {buffer_secs} sec buffer' if buffer_secs else ''}")
+
+        cdef:
+            PositionId position_id
+            Position position
+        for position_id in list(self._index_positions_closed):
+            position = self._positions.get(position_id)
+            if position is None or position.ts_closed + buffer_ns > ts_now:
+                continue
+
+            self.purge_position(position_id)
+
+    cpdef void purge_order(self, ClientOrderId client_order_id):
+        """
+        Purge the order for the given client order ID from the cache, along
+        with all of its index entries.
+
+        Parameters
+        ----------
+        client_order_id : ClientOrderId
+            The client order ID to purge.
+
+        """
+        Condition.not_none(client_order_id, "client_order_id")
+
+        cdef Order order = self._orders.pop(client_order_id, None)
+        if order is None:
+            self._log.warning(f"Order {client_order_id!r} not found for purge")
+            return
+
+        self._index_orders.discard(client_order_id)
+        self._index_orders_open.discard(client_order_id)
+        self._index_orders_closed.discard(client_order_id)
+        self._index_orders_emulated.discard(client_order_id)
+        self._index_orders_inflight.discard(client_order_id)
+        self._index_orders_pending_cancel.discard(client_order_id)
+        self._index_order_strategy.pop(client_order_id, None)
+        self._index_order_client.pop(client_order_id, None)
+
+        cdef VenueOrderId venue_order_id = self._index_client_order_ids.pop(client_order_id, None)
+        if venue_order_id is not None and self._index_venue_order_ids.get(venue_order_id) == client_order_id:
+            del self._index_venue_order_ids[venue_order_id]
+
+        cdef set client_order_ids = self._index_venue_orders.get(order.instrument_id.venue)
+        if client_order_ids is not None:
+            client_order_ids.discard(client_order_id)
+
+        client_order_ids = self._index_instrument_orders.get(order.instrument_id)
+        if client_order_ids is not None:
+            client_order_ids.discard(client_order_id)
+
+        client_order_ids = self._index_strategy_orders.get(order.strategy_id)
+        if client_order_ids is not None:
+            client_order_ids.discard(client_order_id)
+
+        if order.exec_algorithm_id is not None:
+            client_order_ids = self._index_exec_algorithm_orders.get(order.exec_algorithm_id)
+            if client_order_ids is not None:
+                client_order_ids.discard(client_order_id)
+
+        if order.exec_spawn_id is not None:
+            client_order_ids = self._index_exec_spawn_orders.get(order.exec_spawn_id)
+            if client_order_ids is not None:
+                client_order_ids.discard(client_order_id)
+                if not client_order_ids:
+                    del self._index_exec_spawn_orders[order.exec_spawn_id]
+
+        cdef PositionId position_id = self._index_order_position.pop(client_order_id, None)
+        if position_id is not None:
+            client_order_ids = self._index_position_orders.get(position_id)
+            if client_order_ids is not None:
+                client_order_ids.discard(client_order_id)
+
+        self._log.debug(f"Purged order {client_order_id!r}")
+
+    cpdef void purge_position(self, PositionId position_id):
+        """
+        Purge the position for the given position ID from the cache, along
+        with all of its index entries and snapshots.
+
+        Parameters
+        ----------
+        position_id : PositionId
+            The position ID to purge.
+
+        """
+        Condition.not_none(position_id, "position_id")
+
+        cdef Position position = self._positions.pop(position_id, None)
+        if position is None:
+            self._log.warning(f"Position {position_id!r} not found for purge")
+            return
+
+        self._index_positions.discard(position_id)
+        self._index_positions_open.discard(position_id)
+        self._index_positions_closed.discard(position_id)
+        self._index_position_strategy.pop(position_id, None)
+        self._position_snapshots.pop(position_id, None)
+
+        cdef set position_ids = self._index_venue_positions.get(position.instrument_id.venue)
+        if position_ids is not None:
+            position_ids.discard(position_id)
+
+        position_ids = self._index_instrument_positions.get(position.instrument_id)
+        if position_ids is not None:
+            position_ids.discard(position_id)
+
+        position_ids = self._index_strategy_positions.get(position.strategy_id)
+        if position_ids is not None:
+            position_ids.discard(position_id)
+
+        cdef set client_order_ids = self._index_position_orders.pop(position_id, None)
+        cdef ClientOrderId client_order_id
+        if client_order_ids is not None:
+            for client_order_id in client_order_ids:
+                if self._index_order_position.get(client_order_id) == position_id:
+                    del self._index_order_position[client_order_id]
+
+        self._log.debug(f"Purged position {position_id!r}")
+
+    cpdef void purge_account_events(self, uint64_t ts_now, uint64_t lookback_secs = 0):
+        """
+        Purge all account state events which are outside the lookback window,
+        for every account in the cache.
+
+        The most recent event for each account is always retained.
+
+        Parameters
+        ----------
+        ts_now : uint64_t
+            UNIX timestamp (nanoseconds) for the current time.
+        lookback_secs : uint64_t, default 0
+            The lookback window (seconds) within which events are retained.
+
+        """
+        self._log.debug(f"Purging account events{f' with {lookback_secs} sec lookback' if lookback_secs else ''}")
+
+        cdef Account account
+        for account in self._accounts.values():
+            account.purge_account_events(ts_now, lookback_secs)
+
 # -- DATA QUERIES ---------------------------------------------------------------------------------
 
     cpdef bytes get(self, str key):
@@ -2065,7 +2283,8 @@ cdef class Cache(CacheFacade):
         Price or ``None``
 
         """
-        Condition.not_none(instrument_id, "instrument_id")
+        if not self.trusted:
+            Condition.not_none(instrument_id, "instrument_id")
 
         cdef TradeTick trade_tick
         cdef QuoteTick quote_tick
@@ -2125,7 +2344,8 @@ cdef class Cache(CacheFacade):
         Reverse indexed (most recent tick at index 0).
 
         """
-        Condition.not_none(instrument_id, "instrument_id")
+        if not self.trusted:
+            Condition.not_none(instrument_id, "instrument_id")
 
         ticks = self._quote_ticks.get(instrument_id)
         if not ticks:
@@ -2159,7 +2379,8 @@ cdef class Cache(CacheFacade):
         Reverse indexed (most recent tick at index 0).
 
         """
-        Condition.not_none(instrument_id, "instrument_id")
+        if not self.trusted:
+            Condition.not_none(instrument_id, "instrument_id")
 
         ticks = self._trade_ticks.get(instrument_id)
         if not ticks:
@@ -2193,7 +2414,8 @@ cdef class Cache(CacheFacade):
         Reverse indexed (most recent bar at index 0).
 
         """
-        Condition.not_none(bar_type, "bar_type")
+        if not self.trusted:
+            Condition.not_none(bar_type, "bar_type")
 
         bars = self._bars.get(bar_type)
         if not bars:
@@ -2452,7 +2674,8 @@ cdef class Cache(CacheFacade):
         Instrument or ``None``
 
         """
-        Condition.not_none(instrument_id, "instrument_id")
+        if not self.trusted:
+            Condition.not_none(instrument_id, "instrument_id")
 
         return self._instruments.get(instrument_id)
 
@@ -3049,7 +3272,8 @@ cdef class Cache(CacheFacade):
         Order or ``None``
 
         """
-        Condition.not_none(client_order_id, "client_order_id")
+        if not self.trusted:
+            Condition.not_none(client_order_id, "client_order_id")
 
         return self._orders.get(client_order_id)
 
@@ -3783,7 +4007,8 @@ cdef class Cache(CacheFacade):
         Position or ``None``
 
         """
-        Condition.not_none(position_id, "position_id")
+        if not self.trusted:
+            Condition.not_none(position_id, "position_id")
 
         return self._positions.get(position_id)
 
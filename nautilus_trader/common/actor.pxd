@@ -34,6 +34,7 @@ from nautilus_trader.data.messages cimport DataRequest
 from nautilus_trader.data.messages cimport DataResponse
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.model.book cimport OrderBook
+from nautilus_trader.model.book cimport OrderBookDepthSnapshot
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarType
 from nautilus_trader.model.data cimport DataType
@@ -56,6 +57,7 @@ cdef class Actor(Component):
     cdef set[type] _pyo3_conversion_types
     cdef dict[InstrumentId, list[GreeksData]] _future_greeks
     cdef dict[str, type] _signal_classes
+    cdef dict[tuple, int] _depth_snapshot_depths
     cdef list[Indicator] _indicators
     cdef dict[InstrumentId, list[Indicator]] _indicators_for_quotes
     cdef dict[InstrumentId, list[Indicator]] _indicators_for_trades
@@ -92,6 +94,7 @@ cdef class Actor(Component):
     cpdef void on_instrument(self, Instrument instrument)
     cpdef void on_order_book_deltas(self, deltas)
     cpdef void on_order_book(self, OrderBook order_book)
+    cpdef void on_order_book_depth_snapshot(self, OrderBookDepthSnapshot snapshot)
     cpdef void on_quote_tick(self, QuoteTick tick)
     cpdef void on_trade_tick(self, TradeTick tick)
     cpdef void on_bar(self, Bar bar)
@@ -158,6 +161,16 @@ cdef class Actor(Component):
         bint managed=*,
         dict[str, object] params=*,
     )
+    cpdef void subscribe_order_book_depth_snapshots(
+        self,
+        InstrumentId instrument_id,
+        BookType book_type=*,
+        int depth=*,
+        int interval_ms=*,
+        ClientId client_id=*,
+        bint managed=*,
+        dict[str, object] params=*,
+    )
     cpdef void subscribe_quote_ticks(self, InstrumentId instrument_id, ClientId client_id=*, dict[str, object] params=*)
     cpdef void subscribe_trade_ticks(self, InstrumentId instrument_id, ClientId client_id=*, dict[str, object] params=*)
     cpdef void subscribe_bars(self, BarType bar_type, ClientId client_id=*, bint await_partial=*, dict[str, object] params=*)
@@ -168,6 +181,7 @@ cdef class Actor(Component):
     cpdef void unsubscribe_instrument(self, InstrumentId instrument_id, ClientId client_id=*, dict[str, object] params=*)
     cpdef void unsubscribe_order_book_deltas(self, InstrumentId instrument_id, ClientId client_id=*, dict[str, object] params=*)
     cpdef void unsubscribe_order_book_at_interval(self, InstrumentId instrument_id, int interval_ms=*, ClientId client_id=*, dict[str, object] params=*)
+    cpdef void unsubscribe_order_book_depth_snapshots(self, InstrumentId instrument_id, int interval_ms=*, ClientId client_id=*, dict[str, object] params=*)
     cpdef void unsubscribe_quote_ticks(self, InstrumentId instrument_id, ClientId client_id=*, dict[str, object] params=*)
     cpdef void unsubscribe_trade_ticks(self, InstrumentId instrument_id, ClientId client_id=*, dict[str, object] params=*)
     cpdef void unsubscribe_bars(self, BarType bar_type, ClientId client_id=*, dict[str, object] params=*)
@@ -265,6 +279,7 @@ cdef class Actor(Component):
     cpdef void handle_instrument(self, Instrument instrument)
     cpdef void handle_instruments(self, list instruments)
     cpdef void handle_order_book(self, OrderBook order_book)
+    cpdef void handle_order_book_depth_snapshot(self, OrderBookDepthSnapshot snapshot)
     cpdef void handle_order_book_deltas(self, deltas)
     cpdef void handle_quote_tick(self, QuoteTick tick)
     cpdef void handle_quote_ticks(self, list ticks)
@@ -122,6 +122,7 @@ cdef class Actor(Component):
         self._pyo3_conversion_types = set()
         self._future_greeks: dict[InstrumentId, list[GreeksData]] = {}
         self._signal_classes: dict[str, type] = {}
+        self._depth_snapshot_depths: dict[tuple[InstrumentId, int], int] = {}
 
         # Indicators
         self._indicators: list[Indicator] = []
@@ -375,6 +376,22 @@ cdef class Actor(Component):
         """
         # Optionally override in subclass
 
+    cpdef void on_order_book_depth_snapshot(self, OrderBookDepthSnapshot snapshot):
+        """
+        Actions to be performed when running and receives an order book depth snapshot.
+
+        Parameters
+        ----------
+        snapshot : OrderBookDepthSnapshot
+            The order book depth snapshot received.
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        # Optionally override in subclass
+
     cpdef void on_order_book_deltas(self, deltas):
         """
         Actions to be performed when running and receives order book deltas.
@@ -1372,6 +1389,90 @@ cdef class Actor(Component):
 
         self._send_data_cmd(command)
 
+    cpdef void subscribe_order_book_depth_snapshots(
+        self,
+        InstrumentId instrument_id,
+        BookType book_type=BookType.L2_MBP,
+        int depth = 10,
+        int interval_ms = 1000,
+        ClientId client_id = None,
+        bint managed = True,
+        dict[str, object] params = None,
+    ):
+        """
+        Subscribe to `OrderBookDepthSnapshot` data at a specified interval for the given instrument ID.
+
+        The `DataEngine` produces one immutable snapshot of the top levels of the
+        book per interval, which is shared by all subscribers (at the deepest
+        depth requested for the interval).
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The order book instrument ID to subscribe to.
+        book_type : BookType {``L1_MBP``, ``L2_MBP``, ``L3_MBO``}
+            The order book type.
+        depth : int, default 10
+            The number of levels per side to include in each snapshot (must be positive).
+        interval_ms : int
+            The order book snapshot interval in milliseconds (must be positive).
+        client_id : ClientId, optional
+            The specific client ID for the command.
+            If ``None`` then will be inferred from the venue in the instrument ID.
+        managed : bool, default True
+            If an order book should be managed by the data engine based on the subscribed feed.
+        params : dict[str, Any], optional
+            Additional parameters potentially used by a specific client.
+
+        Raises
+        ------
+        ValueError
+            If `depth` is not positive (> 0).
+        ValueError
+            If `interval_ms` is not positive (> 0).
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+        Condition.positive_int(depth, "depth")
+        Condition.positive_int(interval_ms, "interval_ms")
+        Condition.is_true(self.trader_id is not None, "The actor has not been registered")
+
+        self._msgbus.subscribe(
+            topic=f"data.book.depth_snapshots"
+                  f".{instrument_id.venue}"
+                  f".{instrument_id.symbol.topic()}"
+                  f".{interval_ms}",
+            handler=self.handle_order_book_depth_snapshot,
+        )
+
+        params = params if params else {}
+        params["managed"] = managed
+        params["interval_ms"] = interval_ms
+        params["snapshot_depth"] = depth
+
+        # The data engine tracks the depth requested per subscription, so a
+        # resubscription must release the previously requested depth
+        key = (instrument_id, interval_ms)
+        previous_depth = self._depth_snapshot_depths.get(key)
+        if previous_depth is not None:
+            params["previous_snapshot_depth"] = previous_depth
+        self._depth_snapshot_depths[key] = depth
+
+        cdef Subscribe command = Subscribe(
+            client_id=client_id,
+            venue=instrument_id.venue,
+            data_type=DataType(OrderBook, metadata={
+                "instrument_id": instrument_id,
+                "book_type": book_type,
+                "depth": 0,
+            }),
+            command_id=UUID4(),
+            ts_init=self._clock.timestamp_ns(),
+            params=params,
+        )
+
+        self._send_data_cmd(command)
+
     cpdef void subscribe_quote_ticks(
         self,
         InstrumentId instrument_id,
@@ -1792,6 +1893,60 @@ cdef class Actor(Component):
 
         self._send_data_cmd(command)
 
+    cpdef void unsubscribe_order_book_depth_snapshots(
+        self,
+        InstrumentId instrument_id,
+        int interval_ms = 1000,
+        ClientId client_id = None,
+        dict[str, object] params = None,
+    ):
+        """
+        Unsubscribe from `OrderBookDepthSnapshot` data at a specified interval for the given instrument ID.
+
+        The interval must match the previously subscribed interval.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The order book instrument to unsubscribe from.
+        interval_ms : int
+            The order book snapshot interval in milliseconds.
+        client_id : ClientId, optional
+            The specific client ID for the command.
+            If ``None`` then will be inferred from the venue in the instrument ID.
+        params : dict[str, Any], optional
+            Additional parameters potentially used by a specific client.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+        Condition.is_true(self.trader_id is not None, "The actor has not been registered")
+
+        self._msgbus.unsubscribe(
+            topic=f"data.book.depth_snapshots"
+                  f".{instrument_id.venue}"
+                  f".{instrument_id.symbol.topic()}"
+                  f".{interval_ms}",
+            handler=self.handle_order_book_depth_snapshot,
+        )
+
+        params = params if params else {}
+        params["interval_ms"] = interval_ms
+
+        depth = self._depth_snapshot_depths.pop((instrument_id, interval_ms), None)
+        if depth is not None:
+            params["snapshot_depth"] = depth
+
+        cdef Unsubscribe command = Unsubscribe(
+            client_id=client_id,
+            venue=instrument_id.venue,
+            data_type=DataType(OrderBook, metadata={"instrument_id": instrument_id}),
+            command_id=UUID4(),
+            ts_init=self._clock.timestamp_ns(),
+            params=params,
+        )
+
+        self._send_data_cmd(command)
+
     cpdef void unsubscribe_quote_ticks(
         self,
         InstrumentId instrument_id,
@@ -2866,6 +3021,31 @@ cdef class Actor(Component):
                 self._log.exception(f"Error on handling {repr(order_book)}", e)
                 raise
 
+    cpdef void handle_order_book_depth_snapshot(self, OrderBookDepthSnapshot snapshot):
+        """
+        Handle the given order book depth snapshot.
+
+        Passes to `on_order_book_depth_snapshot` if state is ``RUNNING``.
+
+        Parameters
+        ----------
+        snapshot : OrderBookDepthSnapshot
+            The order book depth snapshot received.
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        Condition.not_none(snapshot, "snapshot")
+
+        if self._fsm.state == ComponentState.RUNNING:
+            try:
+                self.on_order_book_depth_snapshot(snapshot)
+            except Exception as e:
+                self._log.exception(f"Error on handling {repr(snapshot)}", e)
+                raise
+
     cpdef void handle_quote_tick(self, QuoteTick tick):
         """
         Handle the given quote tick.
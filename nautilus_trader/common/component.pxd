@@ -47,6 +47,7 @@ cdef class Clock:
     cpdef uint64_t timestamp_ns(self)
     cpdef datetime utc_now(self)
     cpdef datetime local_now(self, tzinfo tz=*)
+    cpdef bint has_timer(self, str name)
     cpdef uint64_t next_time_ns(self, str name)
     cpdef void register_default_handler(self, handler: Callable[[TimeEvent], None])
     cpdef void set_time_alert(
@@ -82,17 +83,27 @@ cdef class Clock:
     cpdef void cancel_timers(self)
 
 
+cdef class ClockTimerIndex
+
+
 cdef dict[UUID4, Clock] _COMPONENT_CLOCKS
+cdef dict[UUID4, ClockTimerIndex] _COMPONENT_TIMER_INDEXES
 
 cdef list[TestClock] get_component_clocks(UUID4 instance_id)
+cdef ClockTimerIndex get_component_timer_index(UUID4 instance_id)
 cpdef void register_component_clock(UUID4 instance_id, Clock clock)
 cpdef void deregister_component_clock(UUID4 instance_id, Clock clock)
 
 
 cdef class TestClock(Clock):
     cdef TestClock_API _mem
+    cdef ClockTimerIndex _timer_index
+    cdef uint64_t _timer_index_seq
+    cdef uint64_t _indexed_next_ns
 
     cpdef void set_time(self, uint64_t to_time_ns)
+    cpdef void share_time(self, TestClock source)
+    cpdef uint64_t next_timer_ns(self)
     cdef CVec advance_time_c(self, uint64_t to_time_ns, bint set_time=*)
     cpdef list advance_time(self, uint64_t to_time_ns, bint set_time=*)
 
@@ -101,6 +112,18 @@ cdef class LiveClock(Clock):
     cdef LiveClock_API _mem
 
 
+cdef class ClockTimerIndex:
+    cdef list _heap
+    cdef uint64_t _clock_count
+    cdef uint64_t _push_count
+
+    cdef void add_clock(self, TestClock clock)
+    cdef void remove_clock(self, TestClock clock)
+    cdef void push(self, TestClock clock, uint64_t next_time_ns)
+    cdef void reindex(self, TestClock clock)
+    cdef list pop_due(self, uint64_t ts_now)
+
+
 cdef class TimeEvent(Event):
     cdef TimeEvent_t _mem
 
@@ -248,6 +271,53 @@ cdef class Component:
     )
 
 
+cdef class HandlerStats:
+    cdef uint64_t _buckets[65]
+
+    cdef readonly str name
+    """The full name of the handler.\n\n:returns: `str`"""
+    cdef readonly str component
+    """The component (or owner) for the handler.\n\n:returns: `str`"""
+    cdef readonly str handler
+    """The handler (method) name.\n\n:returns: `str`"""
+    cdef readonly str message_type
+    """The message type handled.\n\n:returns: `str`"""
+    cdef readonly str category
+    """The category for the message type.\n\n:returns: `str`"""
+    cdef readonly uint64_t count
+    """The count of handler calls.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t total_ns
+    """The cumulative time in the handler (including nested handlers) in nanoseconds.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t self_ns
+    """The cumulative time in the handler (excluding nested handlers) in nanoseconds.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t min_ns
+    """The minimum time of a handler call in nanoseconds.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t max_ns
+    """The maximum time of a handler call in nanoseconds.\n\n:returns: `uint64_t`"""
+
+    cdef void record(self, uint64_t elapsed_ns, uint64_t self_ns)
+    cpdef uint64_t percentile_ns(self, double q)
+    cpdef dict to_dict(self)
+
+
+cdef class HandlerProfiler:
+    cdef LiveClock _clock
+    cdef dict _stats
+    cdef dict _callback_names
+    cdef uint64_t _child_ns[64]
+    cdef int _depth
+
+    cdef uint64_t start(self)
+    cdef void stop(self, str name, type msg_type, uint64_t start_ns)
+    cdef str callback_name(self, callback)
+    cpdef list stats(self)
+    cpdef dict report(self)
+    cpdef void reset(self)
+
+
+cpdef str handler_name(handler)
+
+
 cdef class MessageBus:
     cdef Clock _clock
     cdef Logger _log
@@ -259,6 +329,7 @@ cdef class MessageBus:
     cdef tuple[type] _publishable_types
     cdef set[type] _streaming_types
     cdef bint _resolved
+    cdef HandlerProfiler _profiler
 
     cdef readonly TraderId trader_id
     """The trader ID associated with the bus.\n\n:returns: `TraderId`"""
@@ -266,6 +337,8 @@ cdef class MessageBus:
     """The serializer for the bus.\n\n:returns: `Serializer`"""
     cdef readonly bint has_backing
     """If the message bus has a database backing.\n\n:returns: `bool`"""
+    cdef readonly bint trusted
+    """If argument checks are skipped on the hot messaging paths.\n\n:returns: `bool`"""
     cdef readonly uint64_t sent_count
     """The count of messages sent through the bus.\n\n:returns: `uint64_t`"""
     cdef readonly uint64_t req_count
@@ -287,6 +360,7 @@ cdef class MessageBus:
     cpdef void register(self, str endpoint, handler)
     cpdef void deregister(self, str endpoint, handler)
     cpdef void add_streaming_type(self, type cls)
+    cpdef void set_profiler(self, HandlerProfiler profiler)
     cpdef void send(self, str endpoint, msg)
     cpdef void request(self, str endpoint, Request request)
     cpdef void response(self, Response response)
@@ -307,6 +381,8 @@ cdef class Subscription:
     """The handler for the subscription.\n\n:returns: `Callable`"""
     cdef readonly int priority
     """The priority for the subscription.\n\n:returns: `int`"""
+    cdef readonly str handler_name
+    """The name of the handler (used for profiling).\n\n:returns: `str`"""
 
 
 cdef class Throttler:
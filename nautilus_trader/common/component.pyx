@@ -19,6 +19,10 @@ import socket
 import sys
 import traceback
 from collections import deque
+from heapq import heappop
+from heapq import heappush
+from operator import attrgetter
+from types import ModuleType
 from typing import Any
 from typing import Callable
 
@@ -26,7 +30,6 @@ import cython
 import msgspec
 import numpy as np
 import pandas as pd
-import pyarrow
 import pytz
 
 from nautilus_trader.common.config import InvalidConfiguration
@@ -41,17 +44,21 @@ from cpython.datetime cimport tzinfo
 from cpython.object cimport PyCallable_Check
 from cpython.object cimport PyObject
 from cpython.pycapsule cimport PyCapsule_GetPointer
+from libc.math cimport ceil
 from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 from libc.stdio cimport printf
 
 from nautilus_trader.common.messages cimport ComponentStateChanged
 from nautilus_trader.common.messages cimport ShutdownSystem
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
 from nautilus_trader.core.datetime cimport maybe_dt_to_unix_nanos
 from nautilus_trader.core.fsm cimport FiniteStateMachine
 from nautilus_trader.core.fsm cimport InvalidStateTrigger
+from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.rust.common cimport ComponentState
 from nautilus_trader.core.rust.common cimport ComponentTrigger
@@ -65,6 +72,7 @@ from nautilus_trader.core.rust.common cimport component_trigger_from_cstr
 from nautilus_trader.core.rust.common cimport component_trigger_to_cstr
 from nautilus_trader.core.rust.common cimport live_clock_cancel_timer
 from nautilus_trader.core.rust.common cimport live_clock_drop
+from nautilus_trader.core.rust.common cimport live_clock_has_timer
 from nautilus_trader.core.rust.common cimport live_clock_new
 from nautilus_trader.core.rust.common cimport live_clock_next_time
 from nautilus_trader.core.rust.common cimport live_clock_register_default_handler
@@ -95,12 +103,15 @@ from nautilus_trader.core.rust.common cimport test_clock_advance_time
 from nautilus_trader.core.rust.common cimport test_clock_cancel_timer
 from nautilus_trader.core.rust.common cimport test_clock_cancel_timers
 from nautilus_trader.core.rust.common cimport test_clock_drop
+from nautilus_trader.core.rust.common cimport test_clock_has_timer
 from nautilus_trader.core.rust.common cimport test_clock_new
 from nautilus_trader.core.rust.common cimport test_clock_next_time
+from nautilus_trader.core.rust.common cimport test_clock_next_timer_ns
 from nautilus_trader.core.rust.common cimport test_clock_register_default_handler
 from nautilus_trader.core.rust.common cimport test_clock_set_time
 from nautilus_trader.core.rust.common cimport test_clock_set_time_alert
 from nautilus_trader.core.rust.common cimport test_clock_set_timer
+from nautilus_trader.core.rust.common cimport test_clock_share_time
 from nautilus_trader.core.rust.common cimport test_clock_timer_count
 from nautilus_trader.core.rust.common cimport test_clock_timer_names
 from nautilus_trader.core.rust.common cimport test_clock_timestamp
@@ -271,6 +282,25 @@ cdef class Clock:
         """
         raise NotImplementedError("method `register_default_handler` must be implemented in the subclass")  # pragma: no cover
 
+    cpdef bint has_timer(self, str name):
+        """
+        Return whether an *active* timer with the given name exists in the clock.
+
+        Unlike checking membership of `timer_names`, this is a single keyed
+        lookup and does not materialize the names of all timers.
+
+        Parameters
+        ----------
+        name : str
+            The name of the timer.
+
+        Returns
+        -------
+        bool
+
+        """
+        raise NotImplementedError("method `has_timer` must be implemented in the subclass")  # pragma: no cover
+
     cpdef uint64_t next_time_ns(self, str name):
         """
         Find a particular timer.
@@ -334,7 +364,7 @@ cdef class Clock:
         time event will be generated (rather than being invalid and failing a condition check).
 
         """
-        if override and self.next_time_ns(name) > 0:
+        if override and self.has_timer(name):
             self.cancel_timer(name)
 
         self.set_time_alert_ns(
@@ -517,6 +547,9 @@ cdef class Clock:
 # Global map of clocks per kernel instance used when running a `BacktestEngine`
 _COMPONENT_CLOCKS = {}
 
+# Global map of next timer indexes (for test clocks) per kernel instance
+_COMPONENT_TIMER_INDEXES = {}
+
 
 cdef list[TestClock] get_component_clocks(UUID4 instance_id):
     # Create a shallow copy of the clocks list, in case a new
@@ -524,6 +557,10 @@ cdef list[TestClock] get_component_clocks(UUID4 instance_id):
     return _COMPONENT_CLOCKS[instance_id].copy()
 
 
+cdef ClockTimerIndex get_component_timer_index(UUID4 instance_id):
+    return _COMPONENT_TIMER_INDEXES.get(instance_id)
+
+
 cpdef void register_component_clock(UUID4 instance_id, Clock clock):
     Condition.not_none(instance_id, "instance_id")
     Condition.not_none(clock, "clock")
@@ -534,8 +571,24 @@ cpdef void register_component_clock(UUID4 instance_id, Clock clock):
         clocks = []
         _COMPONENT_CLOCKS[instance_id] = clocks
 
-    if clock not in clocks:
-        clocks.append(clock)
+    if clock in clocks:
+        return
+
+    cdef ClockTimerIndex timer_index
+    if isinstance(clock, TestClock):
+        # Test clocks for the same instance share a single time source
+        # (the first registered clock), and are indexed by their next timer
+        if clocks and isinstance(clocks[0], TestClock):
+            (<TestClock>clock).share_time(<TestClock>clocks[0])
+
+        timer_index = _COMPONENT_TIMER_INDEXES.get(instance_id)
+        if timer_index is None:
+            timer_index = ClockTimerIndex()
+            _COMPONENT_TIMER_INDEXES[instance_id] = timer_index
+
+        timer_index.add_clock(<TestClock>clock)
+
+    clocks.append(clock)
 
 
 cpdef void deregister_component_clock(UUID4 instance_id, Clock clock):
@@ -550,11 +603,24 @@ cpdef void deregister_component_clock(UUID4 instance_id, Clock clock):
     if clock in clocks:
         clocks.remove(clock)
 
+    cdef ClockTimerIndex timer_index = _COMPONENT_TIMER_INDEXES.get(instance_id)
+    if timer_index is not None and isinstance(clock, TestClock):
+        timer_index.remove_clock(<TestClock>clock)
+
 
 cpdef void remove_instance_component_clocks(UUID4 instance_id):
     Condition.not_none(instance_id, "instance_id")
 
-    _COMPONENT_CLOCKS.pop(instance_id, None)
+    cdef list[Clock] clocks = _COMPONENT_CLOCKS.pop(instance_id, None)
+    cdef ClockTimerIndex timer_index = _COMPONENT_TIMER_INDEXES.pop(instance_id, None)
+
+    if clocks is None or timer_index is None:
+        return
+
+    cdef Clock clock
+    for clock in clocks:
+        if isinstance(clock, TestClock):
+            timer_index.remove_clock(<TestClock>clock)
 
 
 cdef class TestClock(Clock):
@@ -580,6 +646,10 @@ cdef class TestClock(Clock):
     def timer_count(self) -> int:
         return test_clock_timer_count(&self._mem)
 
+    cpdef bint has_timer(self, str name):
+        Condition.valid_string(name, "name")
+        return <bint>test_clock_has_timer(&self._mem, pystr_to_cstr(name))
+
     cpdef double timestamp(self):
         return test_clock_timestamp(&self._mem)
 
@@ -604,7 +674,7 @@ cdef class TestClock(Clock):
         callback: Callable[[TimeEvent], None] | None = None,
     ):
         Condition.valid_string(name, "name")
-        Condition.not_in(name, self.timer_names, "name", "self.timer_names")
+        Condition.is_false(self.has_timer(name), f"\'name\' {name} already contained in \'self.timer_names\' collection", KeyError)
 
         test_clock_set_time_alert(
             &self._mem,
@@ -613,6 +683,9 @@ cdef class TestClock(Clock):
             <PyObject *>callback,
         )
 
+        if self._timer_index is not None:
+            self._timer_index.push(self, test_clock_next_time(&self._mem, pystr_to_cstr(name)))
+
     cpdef void set_timer_ns(
         self,
         str name,
@@ -622,7 +695,7 @@ cdef class TestClock(Clock):
         callback: Callable[[TimeEvent], None] | None = None,
     ):
         Condition.valid_string(name, "name")
-        Condition.not_in(name, self.timer_names, "name", "self.timer_names")
+        Condition.is_false(self.has_timer(name), f"\'name\' {name} already contained in \'self.timer_names\' collection", KeyError)
         Condition.positive_int(interval_ns, "interval_ns")
 
         cdef uint64_t ts_now = self.timestamp_ns()
@@ -642,13 +715,16 @@ cdef class TestClock(Clock):
             <PyObject *>callback,
         )
 
+        if self._timer_index is not None:
+            self._timer_index.push(self, test_clock_next_time(&self._mem, pystr_to_cstr(name)))
+
     cpdef uint64_t next_time_ns(self, str name):
         Condition.valid_string(name, "name")
         return test_clock_next_time(&self._mem, pystr_to_cstr(name))
 
     cpdef void cancel_timer(self, str name):
         Condition.valid_string(name, "name")
-        Condition.is_in(name, self.timer_names, "name", "self.timer_names")
+        Condition.is_true(self.has_timer(name), f"\'name\' {name} not contained in \'self.timer_names\' collection", KeyError)
 
         test_clock_cancel_timer(&self._mem, pystr_to_cstr(name))
 
@@ -667,6 +743,35 @@ cdef class TestClock(Clock):
         """
         test_clock_set_time(&self._mem, to_time_ns)
 
+    cpdef void share_time(self, TestClock source):
+        """
+        Share the time source of the given clock.
+
+        Setting the time of either clock (or any other clock sharing the
+        source) will then set the time for all of them.
+
+        Parameters
+        ----------
+        source : TestClock
+            The clock to share the time source of.
+
+        """
+        Condition.not_none(source, "source")
+
+        test_clock_share_time(&self._mem, &source._mem)
+
+    cpdef uint64_t next_timer_ns(self):
+        """
+        Return the earliest next time of all *active* timers in the clock.
+
+        Returns
+        -------
+        uint64_t
+            The UNIX timestamp (nanoseconds), or zero if there are no active timers.
+
+        """
+        return test_clock_next_timer_ns(&self._mem)
+
     cdef CVec advance_time_c(self, uint64_t to_time_ns, bint set_time=True):
         Condition.is_true(to_time_ns >= test_clock_timestamp_ns(&self._mem), "to_time_ns was < time_ns (not monotonic)")
 
@@ -748,6 +853,10 @@ cdef class LiveClock(Clock):
     def timer_count(self) -> int:
         return live_clock_timer_count(&self._mem)
 
+    cpdef bint has_timer(self, str name):
+        Condition.valid_string(name, "name")
+        return <bint>live_clock_has_timer(&self._mem, pystr_to_cstr(name))
+
     cpdef double timestamp(self):
         return live_clock_timestamp(&self._mem)
 
@@ -774,7 +883,7 @@ cdef class LiveClock(Clock):
         callback: Callable[[TimeEvent], None] | None = None,
     ):
         Condition.valid_string(name, "name")
-        Condition.not_in(name, self.timer_names, "name", "self.timer_names")
+        Condition.is_false(self.has_timer(name), f"\'name\' {name} already contained in \'self.timer_names\' collection", KeyError)
 
         if callback is not None:
             callback = create_pyo3_conversion_wrapper(callback)
@@ -795,7 +904,7 @@ cdef class LiveClock(Clock):
         callback: Callable[[TimeEvent], None] | None = None,
     ):
         Condition.valid_string(name, "name")
-        Condition.not_in(name, self.timer_names, "name", "self.timer_names")
+        Condition.is_false(self.has_timer(name), f"\'name\' {name} already contained in \'self.timer_names\' collection", KeyError)
         Condition.positive_int(interval_ns, "interval_ns")
 
         if callback is not None:
@@ -816,7 +925,7 @@ cdef class LiveClock(Clock):
 
     cpdef void cancel_timer(self, str name):
         Condition.valid_string(name, "name")
-        Condition.is_in(name, self.timer_names, "name", "self.timer_names")
+        Condition.is_true(self.has_timer(name), f"\'name\' {name} not contained in \'self.timer_names\' collection", KeyError)
 
         live_clock_cancel_timer(&self._mem, pystr_to_cstr(name))
 
@@ -829,6 +938,127 @@ cdef class LiveClock(Clock):
             self.cancel_timer(name)
 
 
+cdef class ClockTimerIndex:
+    """
+    Provides an index of the next timer time for a set of test clocks.
+
+    Used when running a `BacktestEngine` so that only clocks with timers due
+    are advanced, rather than every component clock for each timestamp.
+
+    Notes
+    -----
+    The index is maintained lazily with a heap of `(next_time_ns, push_id, clock)`.
+    A clock is pushed when a timer is set which is earlier than its currently
+    indexed time, and is re-indexed after being advanced. Entries superseded
+    by an earlier push, or for cancelled timers, are skipped (or at worst
+    result in advancing a clock with no events).
+
+    """
+
+    def __init__(self) -> None:
+        self._heap = []
+        self._clock_count = 0
+        self._push_count = 0
+
+    cdef void add_clock(self, TestClock clock):
+        """
+        Add the given clock to the index (including any timers already set).
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to add.
+
+        """
+        self._clock_count += 1
+        clock._timer_index = self
+        clock._timer_index_seq = self._clock_count
+        clock._indexed_next_ns = 0
+        self.reindex(clock)
+
+    cdef void remove_clock(self, TestClock clock):
+        """
+        Remove the given clock from the index.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to remove.
+
+        """
+        if clock._timer_index is not self:
+            return
+
+        clock._timer_index = None
+        clock._indexed_next_ns = 0
+
+    cdef void push(self, TestClock clock, uint64_t next_time_ns):
+        """
+        Index the given clock as having a timer due at `next_time_ns`.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock with the timer.
+        next_time_ns : uint64_t
+            The UNIX timestamp (nanoseconds) for the timers next time.
+
+        """
+        if next_time_ns == 0:
+            return  # No timer
+
+        if clock._indexed_next_ns != 0 and clock._indexed_next_ns <= next_time_ns:
+            return  # Already indexed at an earlier time
+
+        clock._indexed_next_ns = next_time_ns
+        self._push_count += 1
+        heappush(self._heap, (next_time_ns, self._push_count, clock))
+
+    cdef void reindex(self, TestClock clock):
+        """
+        Index the given clock by the earliest next time of its active timers.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to reindex.
+
+        """
+        self.push(clock, test_clock_next_timer_ns(&clock._mem))
+
+    cdef list pop_due(self, uint64_t ts_now):
+        """
+        Pop all clocks with timers due at or before `ts_now`.
+
+        Parameters
+        ----------
+        ts_now : uint64_t
+            The UNIX timestamp (nanoseconds) now.
+
+        Returns
+        -------
+        list[TestClock]
+            The clocks in registration order (should be reindexed once advanced).
+
+        """
+        cdef dict due = {}
+        cdef tuple entry
+        cdef TestClock clock
+        while self._heap and self._heap[0][0] <= ts_now:
+            entry = heappop(self._heap)
+            clock = entry[2]
+            if clock._timer_index is not self or clock._indexed_next_ns != entry[0]:
+                continue  # Stale entry
+
+            clock._indexed_next_ns = 0
+            due[clock._timer_index_seq] = clock
+
+        if len(due) <= 1:
+            return list(due.values())
+
+        return [due[seq] for seq in sorted(due)]
+
+
 def create_pyo3_conversion_wrapper(callback) -> Callable:
     def wrapper(capsule):
         callback(capsule_to_time_event(capsule))
@@ -2025,6 +2255,10 @@ cdef class MessageBus:
         The backing database for the message bus.
     config : MessageBusConfig, optional
         The configuration for the message bus.
+    trusted : bool, default False
+        If argument checks should be skipped on the hot messaging paths
+        (`send`, `request`, `response` and `publish`). Only appropriate when
+        all callers are validated system components.
 
     Raises
     ------
@@ -2046,6 +2280,7 @@ cdef class MessageBus:
         Serializer serializer = None,
         database: nautilus_pyo3.RedisMessageBusDatabase | None = None,
         config: Any | None = None,
+        bint trusted = False,
     ) -> None:
         # Temporary fix for import error
         from nautilus_trader.common.config import MessageBusConfig
@@ -2062,6 +2297,7 @@ cdef class MessageBus:
         self.trader_id = trader_id
         self.serializer = serializer
         self.has_backing = database is not None
+        self.trusted = trusted
 
         self._clock = clock
         self._log = Logger(name)
@@ -2100,6 +2336,7 @@ cdef class MessageBus:
             self._publishable_types = tuple(o for o in _EXTERNAL_PUBLISHABLE_TYPES if o not in types_filter)
         self._streaming_types = set()
         self._resolved = False
+        self._profiler = None
 
         # Counters
         self.sent_count = 0
@@ -2315,6 +2552,20 @@ cdef class MessageBus:
 
         self._log.debug(f"Added streaming type {cls}")
 
+    cpdef void set_profiler(self, HandlerProfiler profiler):
+        """
+        Set the profiler for timing endpoint and subscription handler calls.
+
+        Passing ``None`` disables profiling (the default).
+
+        Parameters
+        ----------
+        profiler : HandlerProfiler, optional
+            The profiler to record handler calls with.
+
+        """
+        self._profiler = profiler
+
     cpdef void send(self, str endpoint, msg: Any):
         """
         Send the given message to the given `endpoint` address.
@@ -2327,8 +2578,9 @@ cdef class MessageBus:
             The message to send.
 
         """
-        Condition.not_none(endpoint, "endpoint")
-        Condition.not_none(msg, "msg")
+        if not self.trusted:
+            Condition.not_none(endpoint, "endpoint")
+            Condition.not_none(msg, "msg")
 
         handler = self._endpoints.get(endpoint)
         if handler is None:
@@ -2337,7 +2589,16 @@ cdef class MessageBus:
             )
             return  # Cannot send
 
-        handler(msg)
+        cdef uint64_t start_ns
+        if self._profiler is None:
+            handler(msg)
+        else:
+            start_ns = self._profiler.start()
+            try:
+                handler(msg)
+            finally:
+                self._profiler.stop(endpoint, type(msg), start_ns)
+
         self.sent_count += 1
 
     cpdef void request(self, str endpoint, Request request):
@@ -2354,8 +2615,9 @@ cdef class MessageBus:
             The request to handle.
 
         """
-        Condition.not_none(endpoint, "endpoint")
-        Condition.not_none(request, "request")
+        if not self.trusted:
+            Condition.not_none(endpoint, "endpoint")
+            Condition.not_none(request, "request")
 
         if request.id in self._correlation_index:
             self._log.error(
@@ -2388,7 +2650,8 @@ cdef class MessageBus:
             The response to handle
 
         """
-        Condition.not_none(response, "response")
+        if not self.trusted:
+            Condition.not_none(response, "response")
 
         callback = self._correlation_index.pop(response.correlation_id, None)
         if callback is None:
@@ -2540,8 +2803,9 @@ cdef class MessageBus:
     @cython.boundscheck(False)
     @cython.wraparound(False)
     cdef void publish_c(self, str topic, msg: Any, bint external_pub = True):
-        Condition.not_none(topic, "topic")
-        Condition.not_none(msg, "msg")
+        if not self.trusted:
+            Condition.not_none(topic, "topic")
+            Condition.not_none(msg, "msg")
 
         # Get all subscriptions matching topic pattern
         # Note: cannot use truthiness on array
@@ -2555,9 +2819,21 @@ cdef class MessageBus:
         cdef:
             int i
             Subscription sub
-        for i in range(len(subs)):
-            sub = subs[i]
-            sub.handler(msg)
+            uint64_t start_ns
+        if self._profiler is None:
+            for i in range(len(subs)):
+                sub = subs[i]
+                sub.handler(msg)
+        else:
+            for i in range(len(subs)):
+                sub = subs[i]
+                if sub.handler_name is None:
+                    sub.handler_name = handler_name(sub.handler)
+                start_ns = self._profiler.start()
+                try:
+                    sub.handler(msg)
+                finally:
+                    self._profiler.stop(sub.handler_name, type(msg), start_ns)
 
         # Publish externally (if configured)
         cdef bytes payload_bytes
@@ -2675,6 +2951,7 @@ cdef class Subscription:
         self.topic = topic
         self.handler = handler
         self.priority = priority
+        self.handler_name = None  # Resolved when first profiled
 
     def __eq__(self, Subscription other) -> bool:
         return self.topic == other.topic and self.handler == other.handler
@@ -2884,7 +3161,7 @@ cdef class Throttler:
 
     cdef void _set_timer(self, handler: Callable[[TimeEvent], None]):
         # Cancel any existing timer
-        if self._timer_name in self._clock.timer_names:
+        if self._clock.has_timer(self._timer_name):
             self._clock.cancel_timer(self._timer_name)
 
         self._clock.set_time_alert_ns(
@@ -2921,6 +3198,323 @@ cdef class Throttler:
         self.sent_count += 1
 
 
+cdef inline uint8_t _bit_length(uint64_t value):
+    cdef uint8_t length = 0
+    while value:
+        value >>= 1
+        length += 1
+    return length
+
+
+cdef str _message_category(type msg_type):
+    if issubclass(msg_type, TimeEvent):
+        return "timer"
+    elif msg_type.__name__ == "OrderFilled":
+        return "fill"
+    elif issubclass(msg_type, Data):
+        return "data"
+    elif issubclass(msg_type, Command):
+        return "command"
+    elif issubclass(msg_type, Event):
+        return "event"
+    else:
+        return "other"
+
+
+cpdef str handler_name(handler):
+    """
+    Return a descriptive name for the given handler.
+
+    Bound methods are named by the ID of the owning component (where available),
+    otherwise by the type of the owner, e.g. 'EMACross-000.handle_quote_tick'.
+
+    Parameters
+    ----------
+    handler : Callable
+        The handler to name.
+
+    Returns
+    -------
+    str
+
+    """
+    name = getattr(handler, "__name__", None) or type(handler).__name__
+    owner = getattr(handler, "__self__", None)
+    if owner is None or isinstance(owner, (type, ModuleType)):
+        return str(getattr(handler, "__qualname__", name))
+
+    owner_id = getattr(owner, "id", None)
+    return f"{owner_id if owner_id is not None else type(owner).__name__}.{name}"
+
+
+cdef class HandlerStats:
+    """
+    Represents the call count and timing statistics for a handler and message type.
+
+    Call times are also counted in power of two nanosecond buckets, from which
+    percentiles are estimated (to within a factor of two).
+
+    Parameters
+    ----------
+    name : str
+        The full name of the handler.
+    message_type : type
+        The message type handled.
+
+    """
+
+    def __init__(self, str name not None, type message_type not None) -> None:
+        cdef list parts = name.rsplit(".", 1)
+        self.name = name
+        self.component = parts[0] if len(parts) == 2 else None
+        self.handler = parts[-1]
+        self.message_type = message_type.__name__
+        self.category = _message_category(message_type)
+        self.count = 0
+        self.total_ns = 0
+        self.self_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+        cdef int i
+        for i in range(65):
+            self._buckets[i] = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"name={self.name}, "
+            f"message_type={self.message_type}, "
+            f"count={self.count}, "
+            f"total_ns={self.total_ns}, "
+            f"self_ns={self.self_ns})"
+        )
+
+    cdef void record(self, uint64_t elapsed_ns, uint64_t self_ns):
+        if self.count == 0 or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.self_ns += self_ns
+        self._buckets[_bit_length(elapsed_ns)] += 1
+
+    cpdef uint64_t percentile_ns(self, double q):
+        """
+        Return the estimated call time percentile in nanoseconds.
+
+        Parameters
+        ----------
+        q : double
+            The percentile to estimate in the range [0, 1].
+
+        Returns
+        -------
+        uint64_t
+
+        Raises
+        ------
+        ValueError
+            If `q` is not in range [0, 1].
+
+        """
+        Condition.in_range(q, 0.0, 1.0, "q")
+
+        if self.count == 0:
+            return 0
+
+        cdef uint64_t target = max_uint64(<uint64_t>ceil(q * self.count), 1)
+        cdef uint64_t cumulative = 0
+        cdef uint64_t upper_ns
+        cdef int i
+        for i in range(65):
+            cumulative += self._buckets[i]
+            if cumulative >= target:
+                # Upper bound of the bucket, clamped to the observed range
+                upper_ns = self.max_ns if i == 64 else (<uint64_t>1 << i) - 1
+                return max_uint64(min(upper_ns, self.max_ns), self.min_ns)
+
+        return self.max_ns
+
+    cpdef dict to_dict(self):
+        """
+        Return a dictionary representation of the statistics.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return {
+            "name": self.name,
+            "component": self.component,
+            "handler": self.handler,
+            "message_type": self.message_type,
+            "category": self.category,
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "self_ns": self.self_ns,
+            "mean_ns": self.total_ns // self.count if self.count > 0 else 0,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "p50_ns": self.percentile_ns(0.50),
+            "p90_ns": self.percentile_ns(0.90),
+            "p99_ns": self.percentile_ns(0.99),
+        }
+
+
+cdef class HandlerProfiler:
+    """
+    Provides a profiler which counts and times handler calls.
+
+    Statistics are kept per handler name and message type. Nested handler calls
+    (e.g. a strategy handler sending a command) are tracked so that each handler
+    records both its total time and its self time, excluding nested handlers.
+
+    Notes
+    -----
+    Times are measured with the monotonic real-time clock, and so include the
+    (small) overhead of the profiler itself.
+
+    """
+
+    def __init__(self) -> None:
+        self._clock = LiveClock()
+        self._stats: dict[str, dict[type, HandlerStats]] = {}
+        self._callback_names: dict[object, str] = {}
+        self._depth = 0
+
+    cdef uint64_t start(self):
+        """
+        Start timing a handler call.
+
+        Returns
+        -------
+        uint64_t
+            The start timestamp to pass to `stop`.
+
+        """
+        if self._depth < 64:
+            self._child_ns[self._depth] = 0
+        self._depth += 1
+        return self._clock.timestamp_ns()
+
+    cdef void stop(self, str name, type msg_type, uint64_t start_ns):
+        """
+        Stop timing a handler call started with `start`.
+
+        Parameters
+        ----------
+        name : str
+            The handler name.
+        msg_type : type
+            The message type handled.
+        start_ns : uint64_t
+            The start timestamp returned from `start`.
+
+        """
+        cdef uint64_t now_ns = self._clock.timestamp_ns()
+        cdef uint64_t elapsed_ns = now_ns - start_ns if now_ns > start_ns else 0
+        cdef uint64_t child_ns = 0
+
+        self._depth -= 1
+        if self._depth < 64:
+            child_ns = self._child_ns[self._depth]
+        if 0 < self._depth <= 64:
+            self._child_ns[self._depth - 1] += elapsed_ns
+
+        cdef dict stats_by_type = self._stats.get(name)
+        if stats_by_type is None:
+            stats_by_type = {}
+            self._stats[name] = stats_by_type
+
+        cdef HandlerStats stats = stats_by_type.get(msg_type)
+        if stats is None:
+            stats = HandlerStats(name, msg_type)
+            stats_by_type[msg_type] = stats
+
+        stats.record(elapsed_ns, elapsed_ns - child_ns if elapsed_ns > child_ns else 0)
+
+    cdef str callback_name(self, callback):
+        """
+        Return the (cached) handler name for the given callback.
+
+        Parameters
+        ----------
+        callback : Callable
+            The callback to name.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef str name = self._callback_names.get(callback)
+        if name is None:
+            name = handler_name(callback)
+            self._callback_names[callback] = name
+
+        return name
+
+    cpdef list stats(self):
+        """
+        Return all handler statistics recorded.
+
+        Returns
+        -------
+        list[HandlerStats]
+
+        """
+        cdef list stats = []
+        cdef dict stats_by_type
+        for stats_by_type in self._stats.values():
+            stats.extend(stats_by_type.values())
+
+        return stats
+
+    cpdef dict report(self):
+        """
+        Return a report of the recorded handler statistics.
+
+        The report contains a 'handlers' list of statistics per handler and
+        message type (sorted by self time descending), and 'categories' with
+        the call count and self time summed per message category.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        cdef list stats = sorted(self.stats(), key=attrgetter("self_ns"), reverse=True)
+
+        cdef dict categories = {}
+        cdef dict category
+        cdef HandlerStats handler_stats
+        for handler_stats in stats:
+            category = categories.get(handler_stats.category)
+            if category is None:
+                category = {"count": 0, "self_ns": 0}
+                categories[handler_stats.category] = category
+            category["count"] += handler_stats.count
+            category["self_ns"] += handler_stats.self_ns
+
+        return {
+            "handlers": [handler_stats.to_dict() for handler_stats in stats],
+            "categories": categories,
+        }
+
+    cpdef void reset(self):
+        """
+        Reset the profiler by clearing all recorded statistics.
+
+        """
+        self._stats.clear()
+        self._callback_names.clear()
+        self._depth = 0
+
+
 cdef inline uint64_t max_uint64(uint64_t a, uint64_t b):
     if a > b:
         return a
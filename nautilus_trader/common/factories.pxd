@@ -57,6 +57,8 @@ cdef class OrderFactory:
     """The order factories trader ID.\n\n:returns: `TraderId`"""
     cdef readonly StrategyId strategy_id
     """The order factories trading strategy ID.\n\n:returns: `StrategyId`"""
+    cdef readonly bint trusted
+    """If the factories argument checks are skipped.\n\n:returns: `bool`"""
 
     cpdef void set_client_order_id_count(self, int count)
     cpdef void set_order_list_id_count(self, int count)
@@ -100,6 +102,19 @@ cdef class OrderFactory:
         ClientOrderId client_order_id=*,
     )
 
+    cpdef list limit_ladder(
+        self,
+        InstrumentId instrument_id,
+        OrderSide order_side,
+        list quantities,
+        list prices,
+        TimeInForce time_in_force=*,
+        datetime expire_time=*,
+        bint post_only=*,
+        bint reduce_only=*,
+        list[str] tags=*,
+    )
+
     cpdef StopMarketOrder stop_market(
         self,
         InstrumentId instrument_id,
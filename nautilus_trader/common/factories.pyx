@@ -15,6 +15,8 @@
 
 from cpython.datetime cimport datetime
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.generators cimport ClientOrderIdGenerator
@@ -67,6 +69,9 @@ cdef class OrderFactory:
         The initial order ID count for the factory.
     initial_order_list_id_count : int, optional
         The initial order list ID count for the factory.
+    trusted : bool, default False
+        If the factories own argument checks (in `create_list` and `limit_ladder`)
+        should be skipped. The orders created still validate their own arguments.
 
     Raises
     ------
@@ -84,11 +89,13 @@ cdef class OrderFactory:
         CacheFacade cache: CacheFacade | None = None,
         int initial_order_id_count=0,
         int initial_order_list_id_count=0,
+        bint trusted=False,
     ):
         self._clock = clock
         self._cache = cache
         self.trader_id = trader_id
         self.strategy_id = strategy_id
+        self.trusted = trusted
 
         self._order_id_generator = ClientOrderIdGenerator(
             trader_id=trader_id,
@@ -203,7 +210,8 @@ cdef class OrderFactory:
         The order at index 0 in the list will be considered the 'first' order.
 
         """
-        Condition.not_empty(orders, "orders")
+        if not self.trusted:
+            Condition.not_empty(orders, "orders")
 
         return OrderList(
             order_list_id=self._order_list_id_generator.generate(),
@@ -388,6 +396,115 @@ cdef class OrderFactory:
             tags=tags,
         )
 
+    cpdef list limit_ladder(
+        self,
+        InstrumentId instrument_id,
+        OrderSide order_side,
+        list quantities,
+        list prices,
+        TimeInForce time_in_force = TimeInForce.GTC,
+        datetime expire_time = None,
+        bint post_only = False,
+        bint reduce_only = False,
+        list[str] tags = None,
+    ):
+        """
+        Create a ladder of new ``LIMIT`` orders, one per price level.
+
+        Unless the factory is trusted, all arguments are validated before any
+        order is created (so no client order IDs are generated for an invalid
+        ladder). Every order is stamped with the same initialization timestamp.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The orders instrument ID.
+        order_side : OrderSide {``BUY``, ``SELL``}
+            The orders side.
+        quantities : list[Quantity]
+            The orders quantities (> 0), one per price level.
+        prices : list[Price]
+            The orders prices, one per price level.
+        time_in_force : TimeInForce {``GTC``, ``IOC``, ``FOK``, ``GTD``, ``DAY``, ``AT_THE_OPEN``, ``AT_THE_CLOSE``}, default ``GTC``
+            The orders time in force.
+        expire_time : datetime, optional
+            The orders expiration (for ``GTD`` orders).
+        post_only : bool, default False
+            If the orders will only provide liquidity (make a market).
+        reduce_only : bool, default False
+            If the orders carry the 'reduce-only' execution instruction.
+        tags : list[str], optional
+            The custom user tags for the orders.
+
+        Returns
+        -------
+        list[LimitOrder]
+
+        Raises
+        ------
+        ValueError
+            If `order_side` is ``NO_ORDER_SIDE``.
+        ValueError
+            If `prices` is empty.
+        ValueError
+            If `quantities` and `prices` are not equal in length.
+        TypeError
+            If any element of `quantities` is not a `Quantity` (including ``None``).
+        TypeError
+            If any element of `prices` is not a `Price` (including ``None``).
+        ValueError
+            If any quantity is not positive (> 0).
+        ValueError
+            If `time_in_force` is ``GTD`` and `expire_time` <= UNIX epoch.
+
+        """
+        cdef uint64_t expire_time_ns = 0 if expire_time is None else dt_to_unix_nanos(expire_time)
+
+        cdef Quantity quantity
+        if not self.trusted:
+            Condition.not_equal(order_side, OrderSide.NO_ORDER_SIDE, "order_side", "NO_ORDER_SIDE")
+            Condition.not_empty(prices, "prices")
+            Condition.equal(len(quantities), len(prices), "len(quantities)", "len(prices)")
+            Condition.list_type(quantities, Quantity, "quantities")
+            Condition.list_type(prices, Price, "prices")
+
+            if time_in_force == TimeInForce.GTD:
+                Condition.is_true(expire_time_ns > 0, "`expire_time` cannot be <= UNIX epoch.")
+            else:
+                Condition.is_true(expire_time_ns == 0, "`expire_time` was set when `time_in_force` not GTD.")
+
+            for quantity in quantities:
+                Condition.positive(quantity, "quantity")
+
+        cdef uint64_t ts_init = self._clock.timestamp_ns()
+        cdef list orders = []
+
+        cdef:
+            int i
+            ClientOrderId client_order_id
+        for i in range(len(prices)):
+            client_order_id = self._order_id_generator.generate()
+            orders.append(
+                LimitOrder(
+                    trader_id=self.trader_id,
+                    strategy_id=self.strategy_id,
+                    instrument_id=instrument_id,
+                    client_order_id=client_order_id,
+                    order_side=order_side,
+                    quantity=quantities[i],
+                    price=prices[i],
+                    init_id=UUID4(),
+                    ts_init=ts_init,
+                    time_in_force=time_in_force,
+                    expire_time_ns=expire_time_ns,
+                    post_only=post_only,
+                    reduce_only=reduce_only,
+                    tags=tags,
+                ),
+            )
+
+        return orders
+
     cpdef StopMarketOrder stop_market(
         self,
         InstrumentId instrument_id,
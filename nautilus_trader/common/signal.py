@@ -13,10 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import pyarrow as pa
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from nautilus_trader.core.data import Data
-from nautilus_trader.serialization.arrow.serializer import register_arrow
+
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 
 def generate_signal_class(name: str, value_type: type) -> type:
@@ -72,7 +77,11 @@ def generate_signal_class(name: str, value_type: type) -> type:
 
     SignalData.__name__ = f"Signal{name.title()}"
 
-    # Parquet serialization
+    # Parquet serialization (imported here as `pyarrow` is only required once a signal is published)
+    import pyarrow as pa
+
+    from nautilus_trader.serialization.arrow.serializer import register_arrow
+
     def serialize_signal(data: SignalData) -> pa.RecordBatch:
         return pa.RecordBatch.from_pylist(
             [
@@ -26,5 +26,13 @@ cdef class FiniteStateMachine:
     cdef readonly int state
     """The current state of the FSM.\n\n:returns: `int / C Enum`"""
 
+    @staticmethod
+    cdef FiniteStateMachine from_validated_c(
+        dict state_transition_table,
+        int initial_state,
+        object trigger_parser,
+        object state_parser,
+    )
+
     cdef str state_string_c(self)
     cpdef void trigger(self, int trigger)
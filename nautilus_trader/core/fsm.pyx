@@ -90,6 +90,49 @@ cdef class FiniteStateMachine:
 
         self.state = initial_state
 
+    @staticmethod
+    cdef FiniteStateMachine from_validated_c(
+        dict state_transition_table,
+        int initial_state,
+        object trigger_parser,
+        object state_parser,
+    ):
+        # Skips the table validation performed in `__init__`, the caller must
+        # guarantee the table was previously validated via `validate_table`.
+        cdef FiniteStateMachine fsm = FiniteStateMachine.__new__(FiniteStateMachine)
+        fsm._state_transition_table = state_transition_table
+        fsm._trigger_parser = trigger_parser
+        fsm._state_parser = state_parser
+        fsm.state = initial_state
+        return fsm
+
+    @staticmethod
+    def validate_table(dict state_transition_table) -> dict:
+        """
+        Validate the given state-transition table once, so that it may be shared
+        between many machines created without re-validation.
+
+        Parameters
+        ----------
+        state_transition_table : dict of tuples and states
+            The state-transition table to validate.
+
+        Returns
+        -------
+        dict
+
+        Raises
+        ------
+        ValueError
+            If `state_transition_table` is empty.
+        ValueError
+            If `state_transition_table` key not tuple.
+
+        """
+        Condition.not_empty(state_transition_table, "state_transition_table")
+        Condition.dict_types(state_transition_table, tuple, object, "state_transition_table")
+        return state_transition_table
+
     cdef str state_string_c(self):
         return self._state_parser(self.state)
 
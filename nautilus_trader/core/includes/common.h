@@ -360,6 +360,17 @@ PyObject *test_clock_timer_names(const struct TestClock_API *clock);
 
 uintptr_t test_clock_timer_count(struct TestClock_API *clock);
 
+void test_clock_share_time(struct TestClock_API *clock, const struct TestClock_API *other);
+
+uint64_t test_clock_next_timer_ns(const struct TestClock_API *clock);
+
+/**
+ * # Safety
+ *
+ * - Assumes `name_ptr` is a valid C string pointer.
+ */
+uint8_t test_clock_has_timer(const struct TestClock_API *clock, const char *name_ptr);
+
 /**
  * # Safety
  *
@@ -432,6 +443,13 @@ PyObject *live_clock_timer_names(const struct LiveClock_API *clock);
 
 uintptr_t live_clock_timer_count(struct LiveClock_API *clock);
 
+/**
+ * # Safety
+ *
+ * - Assumes `name_ptr` is a valid C string pointer.
+ */
+uint8_t live_clock_has_timer(const struct LiveClock_API *clock, const char *name_ptr);
+
 /**
  * # Safety
  *
@@ -2404,6 +2404,26 @@ CVec orderbook_bids(struct OrderBook_API *book);
 
 CVec orderbook_asks(struct OrderBook_API *book);
 
+CVec orderbook_bids_depth(struct OrderBook_API *book, uintptr_t depth);
+
+CVec orderbook_asks_depth(struct OrderBook_API *book, uintptr_t depth);
+
+/**
+ * Writes the price, size and order count for up to `depth` levels of the given `side` of
+ * the book, returning the number of levels written.
+ *
+ * # Safety
+ *
+ * - Assumes `prices_ptr` and `sizes_ptr` are valid pointers to arrays of `f64` of length `depth`.
+ * - Assumes `counts_ptr` is a valid pointer to an array of `u64` of length `depth`.
+ */
+uintptr_t orderbook_levels_to_arrays(const struct OrderBook_API *book,
+                                     enum OrderSide side,
+                                     uintptr_t depth,
+                                     double *prices_ptr,
+                                     double *sizes_ptr,
+                                     uint64_t *counts_ptr);
+
 uint8_t orderbook_has_bid(struct OrderBook_API *book);
 
 uint8_t orderbook_has_ask(struct OrderBook_API *book);
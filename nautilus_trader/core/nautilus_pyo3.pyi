@@ -4205,16 +4205,23 @@ class DatabentoDataLoader:
     def load_instruments(self, filepath: str, use_exchange_as_venue: bool) -> list[Instrument]: ...
     def load_order_book_deltas(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[OrderBookDelta]: ...  # noqa: E501
     def load_order_book_deltas_as_pycapsule(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None, include_trades: bool | None = None) -> object: ...  # noqa: E501
+    def load_order_book_deltas_as_arrow(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[bytes]: ...  # noqa: E501
     def load_order_book_depth10(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[OrderBookDepth10]: ...  # noqa: E501
     def load_order_book_depth10_as_pycapsule(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> object: ...  # noqa: E501
+    def load_order_book_depth10_as_arrow(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[bytes]: ...  # noqa: E501
     def load_quotes(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[QuoteTick]: ...
     def load_quotes_as_pycapsule(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None, include_trades: bool | None = None) -> object: ...  # noqa: E501
+    def load_quotes_as_arrow(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[bytes]: ...  # noqa: E501
     def load_bbo_quotes(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[QuoteTick]: ...
     def load_bbo_quotes_as_pycapsule(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> object: ...  # noqa: E501
+    def load_bbo_quotes_as_arrow(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[bytes]: ...  # noqa: E501
     def load_trades(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[TradeTick]: ...
     def load_trades_as_pycapsule(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> object: ...
+    def load_trades_as_arrow(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[bytes]: ...  # noqa: E501
+    def load_tbbo_trades_as_arrow(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[bytes]: ...  # noqa: E501
     def load_bars(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[Bar]: ...
     def load_bars_as_pycapsule(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> object: ...
+    def load_bars_as_arrow(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[bytes]: ...  # noqa: E501
     def load_status(self, filepath: str, instrument_id: InstrumentId | None = None) -> list[InstrumentStatus]: ...
     def load_imbalance(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[DatabentoImbalance]: ...  # noqa: E501
     def load_statistics(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[DatabentoStatistics]: ...  # noqa: E501
@@ -4328,10 +4335,13 @@ def load_tardis_depth10_from_snapshot25(filepath: str, price_precision: int, siz
 def load_tardis_quotes(filepath: str, price_precision: int, size_precision: int, instrument_id: InstrumentId | None, limit: int | None = None) -> list[QuoteTick]: ...  # noqa
 def load_tardis_trades(filepath: str, price_precision: int, size_precision: int, instrument_id: InstrumentId | None, limit: int | None = None) -> list[TradeTick]: ...  # noqa
 def load_tardis_deltas_as_pycapsule(filepath: str, price_precision: int, size_precision: int, instrument_id: InstrumentId | None, limit: int | None = None) -> object: ...  # noqa
+def load_tardis_deltas_as_arrow(filepath: str, price_precision: int, size_precision: int, instrument_id: InstrumentId | None, limit: int | None = None) -> list[bytes]: ...  # noqa
 def load_tardis_depth10_from_snapshot5_as_pycapsule(filepath: str, price_precision: int, size_precision: int,  instrument_id: InstrumentId | None, limit: int | None = None) -> object: ...  # noqa
 def load_tardis_depth10_from_snapshot25_as_pycapsule(filepath: str, price_precision: int, size_precision: int,  instrument_id: InstrumentId | None, limit: int | None = None) -> object: ...  # noqa
 def load_tardis_quotes_as_pycapsule(filepath: str, price_precision: int, size_precision: int, instrument_id: InstrumentId | None, limit: int | None = None) -> object: ...  # noqa
+def load_tardis_quotes_as_arrow(filepath: str, price_precision: int, size_precision: int, instrument_id: InstrumentId | None, limit: int | None = None) -> list[bytes]: ...  # noqa
 def load_tardis_trades_as_pycapsule(filepath: str, price_precision: int, size_precision: int, instrument_id: InstrumentId | None, limit: int | None = None) -> object: ...  # noqa
+def load_tardis_trades_as_arrow(filepath: str, price_precision: int, size_precision: int, instrument_id: InstrumentId | None, limit: int | None = None) -> list[bytes]: ...  # noqa
 
 class InstrumentMiniInfo:
     def __init__(
@@ -222,6 +222,15 @@ cdef extern from "../includes/common.h":
 
     uintptr_t test_clock_timer_count(TestClock_API *clock);
 
+    void test_clock_share_time(TestClock_API *clock, const TestClock_API *other);
+
+    uint64_t test_clock_next_timer_ns(const TestClock_API *clock);
+
+    # # Safety
+    #
+    # - Assumes `name_ptr` is a valid C string pointer.
+    uint8_t test_clock_has_timer(const TestClock_API *clock, const char *name_ptr);
+
     # # Safety
     #
     # - Assumes `name_ptr` is a valid C string pointer.
@@ -282,6 +291,11 @@ cdef extern from "../includes/common.h":
 
     uintptr_t live_clock_timer_count(LiveClock_API *clock);
 
+    # # Safety
+    #
+    # - Assumes `name_ptr` is a valid C string pointer.
+    uint8_t live_clock_has_timer(const LiveClock_API *clock, const char *name_ptr);
+
     # # Safety
     #
     # - Assumes `name_ptr` is a valid C string pointer.
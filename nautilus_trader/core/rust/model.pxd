@@ -1641,6 +1641,24 @@ cdef extern from "../includes/model.h":
 
     CVec orderbook_asks(OrderBook_API *book);
 
+    CVec orderbook_bids_depth(OrderBook_API *book, uintptr_t depth);
+
+    CVec orderbook_asks_depth(OrderBook_API *book, uintptr_t depth);
+
+    # Writes the price, size and order count for up to `depth` levels of the given `side` of
+    # the book, returning the number of levels written.
+    #
+    # # Safety
+    #
+    # - Assumes `prices_ptr` and `sizes_ptr` are valid pointers to arrays of `f64` of length `depth`.
+    # - Assumes `counts_ptr` is a valid pointer to an array of `u64` of length `depth`.
+    uintptr_t orderbook_levels_to_arrays(const OrderBook_API *book,
+                                         OrderSide side,
+                                         uintptr_t depth,
+                                         double *prices_ptr,
+                                         double *sizes_ptr,
+                                         uint64_t *counts_ptr);
+
     uint8_t orderbook_has_bid(OrderBook_API *book);
 
     uint8_t orderbook_has_ask(OrderBook_API *book);
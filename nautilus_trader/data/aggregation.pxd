@@ -15,12 +15,14 @@
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport TimeEvent
+from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarType
 from nautilus_trader.model.data cimport QuoteTick
@@ -59,6 +61,40 @@ cdef class BarBuilder:
     cpdef Bar build(self, uint64_t ts_event, uint64_t ts_init)
 
 
+cdef class RawBarBuilder:
+    cdef BarType _bar_type
+
+    cdef readonly uint8_t price_precision
+    """The price precision for the builders updates.\n\n:returns: `uint8`"""
+    cdef readonly uint8_t size_precision
+    """The size precision for the builders instrument.\n\n:returns: `uint8`"""
+    cdef readonly bint initialized
+    """If the builder is initialized.\n\n:returns: `bool`"""
+    cdef readonly uint64_t ts_last
+    """UNIX timestamp (nanoseconds) when the builder last updated.\n\n:returns: `uint64_t`"""
+    cdef readonly int count
+    """The builders current update count.\n\n:returns: `int`"""
+    cdef readonly uint64_t volume
+    """The builders current raw volume.\n\n:returns: `uint64_t`"""
+
+    cdef bint _has_open
+    cdef bint _has_last_close
+    cdef int64_t _open
+    cdef int64_t _high
+    cdef int64_t _low
+    cdef int64_t _close
+    cdef int64_t _last_close
+
+    cdef void update(self, int64_t price, uint64_t size, uint64_t ts_event)
+    cdef void reset(self)
+    cdef Bar build_now(self)
+    cdef Bar build(self, uint64_t ts_event, uint64_t ts_init)
+
+
+cpdef tuple quote_ticks_to_raw_arrays(list ticks, PriceType price_type)
+cpdef tuple trade_ticks_to_raw_arrays(list ticks)
+
+
 cdef class BarAggregator:
     cdef Logger _log
     cdef BarBuilder _builder
@@ -74,6 +110,7 @@ cdef class BarAggregator:
     cpdef void handle_trade_tick(self, TradeTick tick)
     cpdef void handle_bar(self, Bar bar)
     cpdef void set_partial(self, Bar partial_bar)
+    cpdef list aggregate_raw(self, int64_t[:] prices, uint64_t[:] sizes, uint64_t[:] ts_events, uint8_t price_prec)
     cdef void _apply_update(self, Price price, Quantity size, uint64_t ts_event)
     cdef void _apply_update_bar(self, Bar bar, Quantity volume, uint64_t ts_init)
     cdef void _build_now_and_send(self)
@@ -94,8 +131,12 @@ cdef class ValueBarAggregator(BarAggregator):
     cpdef object get_cumulative_value(self)
 
 
+cdef class TimeBarScheduler
+
+
 cdef class TimeBarAggregator(BarAggregator):
     cdef Clock _clock
+    cdef TimeBarScheduler _scheduler
     cdef bint _build_on_next_tick
     cdef uint64_t _stored_open_ns
     cdef uint64_t _stored_close_ns
@@ -124,3 +165,13 @@ cdef class TimeBarAggregator(BarAggregator):
     cdef void _batch_pre_update(self, uint64_t time_ns)
     cdef void _batch_post_update(self, uint64_t time_ns)
     cpdef void _build_bar(self, TimeEvent event)
+
+
+cdef class TimeBarScheduler:
+    cdef Clock _clock
+    cdef dict _aggregators
+
+    cpdef str register(self, TimeBarAggregator aggregator, uint64_t start_time_ns)
+    cpdef void deregister(self, TimeBarAggregator aggregator)
+    cpdef void reset(self)
+    cpdef void _on_timer(self, TimeEvent event)
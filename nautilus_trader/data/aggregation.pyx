@@ -16,10 +16,13 @@
 from decimal import Decimal
 from typing import Callable
 
+import numpy as np
 import pandas as pd
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.datetime import unix_nanos_to_dt
@@ -30,12 +33,14 @@ from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
 from nautilus_trader.core.rust.core cimport millis_to_nanos
 from nautilus_trader.core.rust.core cimport secs_to_nanos
+from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarAggregation
 from nautilus_trader.model.data cimport BarType
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
 from nautilus_trader.model.functions cimport bar_aggregation_to_str
+from nautilus_trader.model.functions cimport price_type_to_str
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
@@ -259,6 +264,223 @@ cdef class BarBuilder:
         return bar
 
 
+cdef class RawBarBuilder:
+    """
+    Provides a bar builder operating on raw fixed-point values.
+
+    The update and build semantics mirror `BarBuilder`, so that columnar
+    aggregation produces bars identical to streaming aggregation, without
+    allocating `Price` and `Quantity` objects per update.
+
+    Parameters
+    ----------
+    bar_type : BarType
+        The bar type for the builder.
+    price_precision : uint8_t
+        The precision of the update prices.
+    size_precision : uint8_t
+        The size precision for the builders instrument.
+    """
+
+    def __init__(
+        self,
+        BarType bar_type not None,
+        uint8_t price_precision,
+        uint8_t size_precision,
+    ):
+        self._bar_type = bar_type
+
+        self.price_precision = price_precision
+        self.size_precision = size_precision
+        self.initialized = False
+        self.ts_last = 0
+        self.count = 0
+        self.volume = 0
+
+        self._has_open = False
+        self._has_last_close = False
+        self._open = 0
+        self._high = 0
+        self._low = 0
+        self._close = 0
+        self._last_close = 0
+
+    cdef void update(self, int64_t price, uint64_t size, uint64_t ts_event):
+        if ts_event < self.ts_last:
+            return  # Not applicable
+
+        if not self._has_open:
+            # Initialize builder
+            self._open = price
+            self._high = price
+            self._low = price
+            self._has_open = True
+            self.initialized = True
+        elif price > self._high:
+            self._high = price
+        elif price < self._low:
+            self._low = price
+
+        self._close = price
+        self.volume += size
+        self.count += 1
+        self.ts_last = ts_event
+
+    cdef void reset(self):
+        self._has_open = False
+        self.volume = 0
+        self.count = 0
+
+    cdef Bar build_now(self):
+        return self.build(self.ts_last, self.ts_last)
+
+    cdef Bar build(self, uint64_t ts_event, uint64_t ts_init):
+        if not self._has_open:  # No update was received
+            Condition.is_true(self._has_last_close, "no updates or previous close to build bar from")
+            self._open = self._last_close
+            self._high = self._last_close
+            self._low = self._last_close
+            self._close = self._last_close
+
+        # Round trip the volume as `BarBuilder.build` does, so volumes of
+        # finer precision updates (e.g. mid sizes) round identically
+        cdef Quantity volume = Quantity(
+            Quantity.from_raw_c(self.volume, self.size_precision),
+            self.size_precision,
+        )
+
+        cdef Bar bar = Bar.from_raw_c(
+            self._bar_type,
+            self._open,
+            self._high,
+            self._low,
+            self._close,
+            self.price_precision,
+            volume._mem.raw,
+            self.size_precision,
+            ts_event,
+            ts_init,
+        )
+
+        self._last_close = self._close
+        self._has_last_close = True
+        self.reset()
+        return bar
+
+
+cpdef tuple quote_ticks_to_raw_arrays(list ticks, PriceType price_type):
+    """
+    Return the raw price, size and event timestamp columns extracted from the given quotes.
+
+    Parameters
+    ----------
+    ticks : list[QuoteTick]
+        The quotes to extract from (must not be empty).
+    price_type : PriceType
+        The price type to extract.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray, int]
+        The raw prices, raw sizes, event timestamps and price precision.
+
+    Raises
+    ------
+    ValueError
+        If `ticks` is empty.
+    ValueError
+        If `price_type` is not `BID`, `ASK` or `MID`.
+
+    """
+    Condition.not_empty(ticks, "ticks")
+
+    cdef int count = len(ticks)
+    prices_arr = np.empty(count, dtype=np.int64)
+    sizes_arr = np.empty(count, dtype=np.uint64)
+    ts_events_arr = np.empty(count, dtype=np.uint64)
+
+    cdef int64_t[:] prices = prices_arr
+    cdef uint64_t[:] sizes = sizes_arr
+    cdef uint64_t[:] ts_events = ts_events_arr
+
+    cdef QuoteTick first = ticks[0]
+    cdef uint8_t price_prec
+    if price_type == PriceType.MID:
+        price_prec = first._mem.bid_price.precision + 1
+    elif price_type == PriceType.BID:
+        price_prec = first._mem.bid_price.precision
+    elif price_type == PriceType.ASK:
+        price_prec = first._mem.ask_price.precision
+    else:
+        raise ValueError(f"Cannot extract with PriceType {price_type_to_str(price_type)}")
+
+    cdef:
+        int i
+        QuoteTick tick
+    for i in range(count):
+        tick = ticks[i]
+        # Same arithmetic as `QuoteTick.extract_price` and `QuoteTick.extract_size`
+        if price_type == PriceType.MID:
+            prices[i] = <int64_t>((tick._mem.bid_price.raw + tick._mem.ask_price.raw) / 2)
+            sizes[i] = <uint64_t>((tick._mem.bid_size.raw + tick._mem.ask_size.raw) / 2)
+        elif price_type == PriceType.BID:
+            prices[i] = tick._mem.bid_price.raw
+            sizes[i] = tick._mem.bid_size.raw
+        else:
+            prices[i] = tick._mem.ask_price.raw
+            sizes[i] = tick._mem.ask_size.raw
+
+        ts_events[i] = tick._mem.ts_event
+
+    return prices_arr, sizes_arr, ts_events_arr, price_prec
+
+
+cpdef tuple trade_ticks_to_raw_arrays(list ticks):
+    """
+    Return the raw price, size and event timestamp columns extracted from the given trades.
+
+    Parameters
+    ----------
+    ticks : list[TradeTick]
+        The trades to extract from (must not be empty).
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray, int]
+        The raw prices, raw sizes, event timestamps and price precision.
+
+    Raises
+    ------
+    ValueError
+        If `ticks` is empty.
+
+    """
+    Condition.not_empty(ticks, "ticks")
+
+    cdef int count = len(ticks)
+    prices_arr = np.empty(count, dtype=np.int64)
+    sizes_arr = np.empty(count, dtype=np.uint64)
+    ts_events_arr = np.empty(count, dtype=np.uint64)
+
+    cdef int64_t[:] prices = prices_arr
+    cdef uint64_t[:] sizes = sizes_arr
+    cdef uint64_t[:] ts_events = ts_events_arr
+
+    cdef TradeTick first = ticks[0]
+    cdef uint8_t price_prec = first._mem.price.precision
+
+    cdef:
+        int i
+        TradeTick tick
+    for i in range(count):
+        tick = ticks[i]
+        prices[i] = tick._mem.price.raw
+        sizes[i] = tick._mem.size.raw
+        ts_events[i] = tick._mem.ts_event
+
+    return prices_arr, sizes_arr, ts_events_arr, price_prec
+
+
 cdef class BarAggregator:
     """
     Provides a means of aggregating specified bars and sending to a registered handler.
@@ -387,6 +609,46 @@ cdef class BarAggregator:
         """
         self._builder.set_partial(partial_bar)
 
+    cpdef list aggregate_raw(
+        self,
+        int64_t[:] prices,
+        uint64_t[:] sizes,
+        uint64_t[:] ts_events,
+        uint8_t price_prec,
+    ):
+        """
+        Aggregate the given historical updates from raw columns and return the bars.
+
+        The bars are identical to those sent to the handler when the same updates are
+        processed one at a time between `start_batch_update` and `stop_batch_update`,
+        including the final partial bar being held back. The aggregators own builder
+        state is not modified.
+
+        Parameters
+        ----------
+        prices : int64_t[:]
+            The raw update prices.
+        sizes : uint64_t[:]
+            The raw update sizes.
+        ts_events : uint64_t[:]
+            UNIX timestamps (nanoseconds) of the updates.
+        price_prec : uint8_t
+            The precision of the update prices.
+
+        Returns
+        -------
+        list[Bar]
+
+        Raises
+        ------
+        ValueError
+            If the array lengths are not equal.
+        NotImplementedError
+            If the aggregator does not support columnar aggregation.
+
+        """
+        raise NotImplementedError("method `aggregate_raw` must be implemented in the subclass")  # pragma: no cover
+
     cdef void _apply_update(self, Price price, Quantity size, uint64_t ts_event):
         raise NotImplementedError("method `_apply_update` must be implemented in the subclass")
 
@@ -436,6 +698,35 @@ cdef class TickBarAggregator(BarAggregator):
             handler=handler,
         )
 
+    cpdef list aggregate_raw(
+        self,
+        int64_t[:] prices,
+        uint64_t[:] sizes,
+        uint64_t[:] ts_events,
+        uint8_t price_prec,
+    ):
+        Condition.is_true(
+            len(prices) == len(sizes) == len(ts_events),
+            "Array lengths must be equal",
+        )
+
+        cdef RawBarBuilder builder = RawBarBuilder(
+            bar_type=self.bar_type,
+            price_precision=price_prec,
+            size_precision=self._builder.size_precision,
+        )
+        cdef int step = self.bar_type.spec.step
+        cdef list bars = []
+
+        cdef int i
+        for i in range(ts_events.shape[0]):
+            builder.update(prices[i], sizes[i], ts_events[i])
+
+            if builder.count == step:
+                bars.append(builder.build_now())
+
+        return bars
+
     cdef void _apply_update(self, Price price, Quantity size, uint64_t ts_event):
         self._builder.update(price, size, ts_event)
 
@@ -483,6 +774,51 @@ cdef class VolumeBarAggregator(BarAggregator):
             handler=handler,
         )
 
+    cpdef list aggregate_raw(
+        self,
+        int64_t[:] prices,
+        uint64_t[:] sizes,
+        uint64_t[:] ts_events,
+        uint8_t price_prec,
+    ):
+        Condition.is_true(
+            len(prices) == len(sizes) == len(ts_events),
+            "Array lengths must be equal",
+        )
+
+        cdef RawBarBuilder builder = RawBarBuilder(
+            bar_type=self.bar_type,
+            price_precision=price_prec,
+            size_precision=self._builder.size_precision,
+        )
+        cdef uint64_t raw_step = int(self.bar_type.spec.step * 1e9)
+        cdef list bars = []
+
+        cdef:
+            int i
+            uint64_t raw_size_update
+            uint64_t raw_size_diff
+        for i in range(ts_events.shape[0]):
+            raw_size_update = sizes[i]
+
+            while raw_size_update > 0:  # While there is size to apply
+                if builder.volume + raw_size_update < raw_step:
+                    # Update and break
+                    builder.update(prices[i], raw_size_update, ts_events[i])
+                    break
+
+                raw_size_diff = raw_step - builder.volume
+                # Update builder to the step threshold
+                builder.update(prices[i], raw_size_diff, ts_events[i])
+
+                # Build a bar and reset builder
+                bars.append(builder.build_now())
+
+                # Decrement the update size
+                raw_size_update -= raw_size_diff
+
+        return bars
+
     cdef void _apply_update(self, Price price, Quantity size, uint64_t ts_event):
         cdef uint64_t raw_size_update = size._mem.raw
         cdef uint64_t raw_step = int(self.bar_type.spec.step * 1e9)
@@ -684,6 +1020,10 @@ cdef class TimeBarAggregator(BarAggregator):
         Determines the type of interval used for time aggregation.
         - 'left-open': start time is excluded and end time is included (default).
         - 'right-open': start time is included and end time is excluded.
+    scheduler : TimeBarScheduler, optional
+        The shared scheduler for the aggregators build timer. If ``None`` then
+        the aggregator will set its own timer on the `clock`. Monthly bars
+        always use their own time alerts.
 
     Raises
     ------
@@ -701,6 +1041,7 @@ cdef class TimeBarAggregator(BarAggregator):
         str interval_type = "left-open",
         object time_bars_origin=None, # pd.Timedelta or pd.DateOffset
         int composite_bar_build_delay=15, # in microsecond
+        TimeBarScheduler scheduler = None,
     ):
         super().__init__(
             instrument=instrument,
@@ -709,6 +1050,7 @@ cdef class TimeBarAggregator(BarAggregator):
         )
 
         self._clock = clock
+        self._scheduler = scheduler
         self.interval = self._get_interval()
         self.interval_ns = self._get_interval_ns()
         self._timer_name = None
@@ -848,7 +1190,10 @@ cdef class TimeBarAggregator(BarAggregator):
         """
         Stop the bar aggregator.
         """
-        self._clock.cancel_timer(str(self.bar_type))
+        if self._scheduler is not None and self.bar_type.spec.aggregation != BarAggregation.MONTH:
+            self._scheduler.deregister(self)
+        else:
+            self._clock.cancel_timer(self._timer_name)
 
     cdef timedelta _get_interval(self):
         cdef BarAggregation aggregation = self.bar_type.spec.aggregation
@@ -906,7 +1251,9 @@ cdef class TimeBarAggregator(BarAggregator):
         cdef datetime start_time = self.get_start_time(now)
         cdef int step = self.bar_type.spec.step
 
-        if self.bar_type.spec.aggregation != BarAggregation.MONTH:
+        if self.bar_type.spec.aggregation != BarAggregation.MONTH and self._scheduler is not None:
+            self._timer_name = self._scheduler.register(self, dt_to_unix_nanos(start_time))
+        elif self.bar_type.spec.aggregation != BarAggregation.MONTH:
             self._clock.set_timer(
                 name=self._timer_name,
                 interval=self.interval,
@@ -998,6 +1345,67 @@ cdef class TimeBarAggregator(BarAggregator):
         if not self._batch_mode:
             self._batch_next_close_ns = 0
 
+    cpdef list aggregate_raw(
+        self,
+        int64_t[:] prices,
+        uint64_t[:] sizes,
+        uint64_t[:] ts_events,
+        uint8_t price_prec,
+    ):
+        Condition.is_true(
+            len(prices) == len(sizes) == len(ts_events),
+            "Array lengths must be equal",
+        )
+        Condition.is_true(
+            self.bar_type.spec.aggregation != BarAggregation.MONTH,
+            "Columnar aggregation not supported for MONTH bars",
+        )
+
+        cdef list bars = []
+        cdef int count = ts_events.shape[0]
+        if count == 0:
+            return bars
+
+        # Align the first interval exactly as `start_batch_update` does
+        self._start_batch_time(ts_events[0])
+        cdef uint64_t open_ns = self._batch_open_ns
+        cdef uint64_t next_close_ns = self._batch_next_close_ns
+        self._batch_mode = False
+        self._batch_open_ns = 0
+        self._batch_next_close_ns = 0
+
+        cdef RawBarBuilder builder = RawBarBuilder(
+            bar_type=self.bar_type,
+            price_precision=price_prec,
+            size_precision=self._builder.size_precision,
+        )
+        cdef bint ts_on_close = self._is_left_open and self._timestamp_on_close
+        cdef uint64_t interval_ns = self.interval_ns
+
+        cdef:
+            int i
+            uint64_t ts
+        for i in range(count):
+            ts = ts_events[i]
+
+            # Equivalent to `_batch_pre_update`
+            if ts > next_close_ns and builder.initialized:
+                bars.append(builder.build(next_close_ns if ts_on_close else open_ns, next_close_ns))
+
+            builder.update(prices[i], sizes[i], ts)
+
+            # Equivalent to `_batch_post_update` while in batch mode
+            if ts > next_close_ns:
+                next_close_ns += ((ts - next_close_ns + interval_ns - 1) // interval_ns) * interval_ns
+                open_ns = next_close_ns - interval_ns
+
+            if ts == next_close_ns:
+                bars.append(builder.build(next_close_ns if ts_on_close else open_ns, ts))
+                open_ns = next_close_ns
+                next_close_ns += interval_ns
+
+        return bars
+
     cdef void _apply_update(self, Price price, Quantity size, uint64_t ts_event):
         if self._batch_next_close_ns != 0:
             self._batch_pre_update(ts_event)
@@ -1085,3 +1493,128 @@ cdef class TimeBarAggregator(BarAggregator):
             )
 
             self.next_close_ns = dt_to_unix_nanos(alert_time)
+
+
+cdef class TimeBarScheduler:
+    """
+    Provides shared build timers for time bar aggregators on a single clock.
+
+    Aggregators with the same interval and alignment (start time modulo the
+    interval) share one timer, and each timer event is fanned out to all of
+    them in registration order. This keeps the number of clock timers bounded
+    by the number of distinct intervals rather than the number of bar types.
+
+    Parameters
+    ----------
+    clock : Clock
+        The clock for the shared timers.
+
+    """
+
+    def __init__(self, Clock clock not None):
+        self._clock = clock
+        self._aggregators: dict[str, dict[TimeBarAggregator, None]] = {}
+
+    @property
+    def timer_names(self) -> list[str]:
+        """
+        Return the names of the shared timers.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        return list(self._aggregators.keys())
+
+    cpdef str register(self, TimeBarAggregator aggregator, uint64_t start_time_ns):
+        """
+        Register the given aggregator with the shared timer for its interval
+        and alignment, setting the timer if not already running.
+
+        Parameters
+        ----------
+        aggregator : TimeBarAggregator
+            The aggregator to register.
+        start_time_ns : uint64_t
+            The UNIX timestamp (nanoseconds) of the aggregators first bar open.
+
+        Returns
+        -------
+        str
+            The name of the shared timer.
+
+        Raises
+        ------
+        ValueError
+            If `aggregator.interval_ns` is not positive (> 0).
+
+        """
+        Condition.positive_int(aggregator.interval_ns, "aggregator.interval_ns")
+
+        cdef uint64_t interval_ns = aggregator.interval_ns
+        cdef str timer_name = f"TimeBars-{interval_ns}-{start_time_ns % interval_ns}"
+        cdef dict aggregators = self._aggregators.get(timer_name)
+
+        if aggregators is None or not self._clock.has_timer(timer_name):
+            # Timers may have been cancelled directly on the clock (e.g. on reset)
+            aggregators = {}
+            self._aggregators[timer_name] = aggregators
+            self._clock.set_timer_ns(
+                name=timer_name,
+                interval_ns=interval_ns,
+                start_time_ns=start_time_ns,
+                stop_time_ns=0,
+                callback=self._on_timer,
+            )
+
+        aggregators[aggregator] = None
+
+        return timer_name
+
+    cpdef void deregister(self, TimeBarAggregator aggregator):
+        """
+        Deregister the given aggregator from its shared timer, cancelling the
+        timer if no aggregators remain.
+
+        Parameters
+        ----------
+        aggregator : TimeBarAggregator
+            The aggregator to deregister.
+
+        """
+        cdef str timer_name = aggregator._timer_name
+        cdef dict aggregators = self._aggregators.get(timer_name)
+
+        if aggregators is None:
+            return
+
+        aggregators.pop(aggregator, None)
+
+        if not aggregators:
+            del self._aggregators[timer_name]
+
+            if self._clock.has_timer(timer_name):
+                self._clock.cancel_timer(timer_name)
+
+    cpdef void reset(self):
+        """
+        Reset the scheduler by cancelling all shared timers.
+        """
+        cdef str timer_name
+        for timer_name in self._aggregators:
+            if self._clock.has_timer(timer_name):
+                self._clock.cancel_timer(timer_name)
+
+        self._aggregators.clear()
+
+    cpdef void _on_timer(self, TimeEvent event):
+        cdef dict aggregators = self._aggregators.get(event.name)
+
+        if aggregators is None:
+            return
+
+        cdef TimeBarAggregator aggregator
+        # Iterate over a copy, in case a handler stops an aggregator
+        for aggregator in list(aggregators):
+            aggregator._build_bar(event)
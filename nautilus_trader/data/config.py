@@ -43,6 +43,11 @@ class DataEngineConfig(NautilusConfig, frozen=True):
     external_clients : list[ClientId], optional
         The client IDs declared for external stream processing.
         The data engine will not attempt to send data commands to these client IDs.
+    cache_aggregated_bars : bool, default False
+        If bars aggregated from quotes or trades for `request_aggregated_bars` are written
+        back to a registered catalog, keyed by a fingerprint of the source data and aggregation
+        settings, so that subsequent identical requests are served from the catalog.
+        The cached bars are invalidated when the source data in the catalog is extended.
     debug : bool, default False
         If debug mode is active (will provide extra debug logging).
 
@@ -55,4 +60,5 @@ class DataEngineConfig(NautilusConfig, frozen=True):
     validate_data_sequence: bool = False
     buffer_deltas: bool = False
     external_clients: list[ClientId] | None = None
+    cache_aggregated_bars: bool = False
     debug: bool = False
@@ -16,7 +16,7 @@
 from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
 
-from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.base import BaseDataCatalog
 
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.component cimport Component
@@ -25,6 +25,7 @@ from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.rust.model cimport BookType
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.aggregation cimport BarAggregator
+from nautilus_trader.data.aggregation cimport TimeBarScheduler
 from nautilus_trader.data.client cimport DataClient
 from nautilus_trader.data.client cimport MarketDataClient
 from nautilus_trader.data.messages cimport DataCommand
@@ -51,16 +52,20 @@ from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.instruments.synthetic cimport SyntheticInstrument
 
 
+cdef class SnapshotInfo
+
+
 cdef class DataEngine(Component):
     cdef readonly Cache _cache
     cdef readonly DataClient _default_client
     cdef readonly set[ClientId] _external_clients
-    cdef readonly dict[str, ParquetDataCatalog] _catalogs
+    cdef readonly dict[str, BaseDataCatalog] _catalogs
 
     cdef readonly dict[ClientId, DataClient] _clients
     cdef readonly dict[Venue, DataClient] _routing_map
     cdef readonly dict _order_book_intervals
     cdef readonly dict[BarType, BarAggregator] _bar_aggregators
+    cdef readonly TimeBarScheduler _time_bar_scheduler
     cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_quote_feeds
     cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_trade_feeds
     cdef readonly list[InstrumentId] _subscribed_synthetic_quotes
@@ -74,6 +79,7 @@ cdef class DataEngine(Component):
     cdef readonly bint _time_bars_timestamp_on_close
     cdef readonly str _time_bars_interval_type
     cdef readonly dict[BarAggregation, object] _time_bars_origins # pd.Timedelta or pd.DateOffset
+    cdef readonly bint _cache_aggregated_bars
     cdef readonly bint _validate_data_sequence
     cdef readonly bint _buffer_deltas
 
@@ -146,6 +152,7 @@ cdef class DataEngine(Component):
     cpdef void _handle_unsubscribe_instrument(self, MarketDataClient client, InstrumentId instrument_id, dict params)
     cpdef void _handle_unsubscribe_order_book_deltas(self, MarketDataClient client, InstrumentId instrument_id, dict params)  # noqa
     cpdef void _handle_unsubscribe_order_book(self, MarketDataClient client, InstrumentId instrument_id, dict params)  # noqa
+    cdef void _release_snapshot_depth(self, InstrumentId instrument_id, uint64_t interval_ms, int snapshot_depth)
     cpdef void _handle_unsubscribe_quote_ticks(self, MarketDataClient client, InstrumentId instrument_id, dict params)
     cpdef void _handle_unsubscribe_trade_ticks(self, MarketDataClient client, InstrumentId instrument_id, dict params)
     cpdef void _handle_unsubscribe_bars(self, MarketDataClient client, BarType bar_type, dict params)
@@ -162,6 +169,10 @@ cdef class DataEngine(Component):
     cpdef void _handle_request_trade_ticks(self, DataRequest request, DataClient client, datetime start, datetime end, datetime now, dict params)
     cpdef void _handle_request_bars(self, DataRequest request, DataClient client, datetime start, datetime end, datetime now, dict params)
     cpdef void _handle_request_data(self, DataRequest request, DataClient client, datetime start, datetime end, datetime now, dict params)
+    cpdef tuple _derived_bars_source_fingerprint(self, dict metadata)
+    cpdef dict _derived_bars_fingerprint(self, BarType bar_type, dict source_fingerprint)
+    cpdef bint _query_derived_bars(self, DataRequest request)
+    cpdef void _write_derived_bars(self, dict bars_result, dict metadata)
     cpdef void _query_catalog(self, DataRequest request)
 
 # -- DATA HANDLERS --------------------------------------------------------------------------------
@@ -191,13 +202,14 @@ cdef class DataEngine(Component):
     cpdef void _handle_bars(self, list bars, Bar partial)
     cpdef dict _handle_aggregated_bars(self, list ticks, dict metadata, dict params)
     cdef dict _handle_aggregated_bars_aux(self, list ticks, dict metadata, dict params)
+    cdef bint _is_columnar_aggregation_supported(self, BarType bar_type, str market_data_type)
 
 # -- INTERNAL -------------------------------------------------------------------------------------
 
     cpdef void _internal_update_instruments(self, list instruments)
     cpdef void _update_order_book(self, Data data)
     cpdef void _snapshot_order_book(self, TimeEvent snap_event)
-    cpdef void _publish_order_book(self, InstrumentId instrument_id, str topic)
+    cpdef void _publish_order_book(self, InstrumentId instrument_id, SnapshotInfo snap_info)
     cpdef void _start_bar_aggregator(self, MarketDataClient client, BarType bar_type, bint await_partial, dict params)
     cpdef void _stop_bar_aggregator(self, MarketDataClient client, BarType bar_type, dict params)
     cpdef void _update_synthetics_with_quote(self, list synthetics, QuoteTick update)
@@ -212,4 +224,7 @@ cdef class SnapshotInfo:
     cdef bint is_composite
     cdef str root
     cdef str topic
+    cdef str depth_topic
     cdef uint64_t interval_ms
+    cdef int snapshot_depth
+    cdef dict depth_counts
@@ -36,7 +36,7 @@ from nautilus_trader.core.datetime import max_date
 from nautilus_trader.core.datetime import time_object_to_dt
 from nautilus_trader.data.config import DataEngineConfig
 from nautilus_trader.model.enums import RecordFlag
-from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.base import BaseDataCatalog
 
 from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
@@ -63,8 +63,11 @@ from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.aggregation cimport BarAggregator
 from nautilus_trader.data.aggregation cimport TickBarAggregator
 from nautilus_trader.data.aggregation cimport TimeBarAggregator
+from nautilus_trader.data.aggregation cimport TimeBarScheduler
 from nautilus_trader.data.aggregation cimport ValueBarAggregator
 from nautilus_trader.data.aggregation cimport VolumeBarAggregator
+from nautilus_trader.data.aggregation cimport quote_ticks_to_raw_arrays
+from nautilus_trader.data.aggregation cimport trade_ticks_to_raw_arrays
 from nautilus_trader.data.client cimport DataClient
 from nautilus_trader.data.client cimport MarketDataClient
 from nautilus_trader.data.messages cimport DataCommand
@@ -133,9 +136,10 @@ cdef class DataEngine(Component):
         self._routing_map: dict[Venue, DataClient] = {}
         self._default_client: DataClient | None = None
         self._external_clients: set[ClientId] = set()
-        self._catalogs: dict[str, ParquetDataCatalog] = {}
+        self._catalogs: dict[str, BaseDataCatalog] = {}
         self._order_book_intervals: dict[tuple[InstrumentId, int], list[Callable[[OrderBook], None]]] = {}
         self._bar_aggregators: dict[BarType, BarAggregator] = {}
+        self._time_bar_scheduler = TimeBarScheduler(self._clock)
         self._synthetic_quote_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
         self._synthetic_trade_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
         self._subscribed_synthetic_quotes: list[InstrumentId] = []
@@ -151,6 +155,7 @@ cdef class DataEngine(Component):
         self._time_bars_timestamp_on_close = config.time_bars_timestamp_on_close
         self._time_bars_interval_type = config.time_bars_interval_type
         self._time_bars_origins = config.time_bars_origins or {}
+        self._cache_aggregated_bars = config.cache_aggregated_bars
         self._validate_data_sequence = config.validate_data_sequence
         self._buffer_deltas = config.buffer_deltas
 
@@ -241,13 +246,13 @@ cdef class DataEngine(Component):
 
 # --REGISTRATION ----------------------------------------------------------------------------------
 
-    def register_catalog(self, catalog: ParquetDataCatalog, name: str = "catalog_0") -> None:
+    def register_catalog(self, catalog: BaseDataCatalog, name: str = "catalog_0") -> None:
         """
         Register the given data catalog with the engine.
 
         Parameters
         ----------
-        catalog : ParquetDataCatalog
+        catalog : BaseDataCatalog
             The data catalog to register.
         name : str, default 'catalog_0'
             The name of the catalog to register.
@@ -540,6 +545,7 @@ cdef class DataEngine(Component):
 
         self._order_book_intervals.clear()
         self._bar_aggregators.clear()
+        self._time_bar_scheduler.reset()
         self._synthetic_quote_feeds.clear()
         self._synthetic_trade_feeds.clear()
         self._subscribed_synthetic_quotes.clear()
@@ -841,10 +847,10 @@ cdef class DataEngine(Component):
             uint64_t timestamp_ns
             SnapshotInfo snap_info
         key = (instrument_id, interval_ms)
+        timer_name = f"OrderBook|{instrument_id}|{interval_ms}"
         if key not in self._order_book_intervals:
             self._order_book_intervals[key] = []
 
-            timer_name = f"OrderBook|{instrument_id}|{interval_ms}"
             interval_ns = millis_to_nanos(interval_ms)
             timestamp_ns = self._clock.timestamp_ns()
             start_time_ns = timestamp_ns - (timestamp_ns % interval_ns)
@@ -858,7 +864,10 @@ cdef class DataEngine(Component):
             snap_info.is_composite = instrument_id.symbol.is_composite()
             snap_info.root = instrument_id.symbol.root()
             snap_info.topic = topic
+            snap_info.depth_topic = f"data.book.depth_snapshots.{instrument_id.venue}.{instrument_id.symbol}.{interval_ms}"
             snap_info.interval_ms = interval_ms
+            snap_info.snapshot_depth = 0  # Depth snapshots only published once requested
+            snap_info.depth_counts = {}
 
             self._snapshot_info[timer_name] = snap_info
 
@@ -874,6 +883,18 @@ cdef class DataEngine(Component):
             )
             self._log.debug(f"Set timer {timer_name}")
 
+        snapshot_depth = params.get("snapshot_depth")
+        if snapshot_depth is not None:
+            # One depth snapshot per interval is shared by all subscribers,
+            # so it is produced at the deepest requested depth.
+            previous_depth = params.get("previous_snapshot_depth")
+            if previous_depth is not None:
+                self._release_snapshot_depth(instrument_id, interval_ms, previous_depth)
+
+            snap_info = self._snapshot_info[timer_name]
+            snap_info.depth_counts[snapshot_depth] = snap_info.depth_counts.get(snapshot_depth, 0) + 1
+            snap_info.snapshot_depth = max(snap_info.depth_counts)
+
         self._setup_order_book(
             client,
             instrument_id,
@@ -1235,6 +1256,7 @@ cdef class DataEngine(Component):
         cdef str deltas_topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol.topic()}"
         cdef str depth_topic = f"data.book.depth.{instrument_id.venue}.{instrument_id.symbol.topic()}"
         cdef str snapshots_topic = f"data.book.snapshots.{instrument_id.venue}.{instrument_id.symbol.topic()}"
+        cdef str depth_snapshots_topic = f"data.book.depth_snapshots.{instrument_id.venue}.{instrument_id.symbol.topic()}.*"
 
         # Check the deltas and the depth subscription
         cdef list[str] topics = [deltas_topic, depth_topic]
@@ -1260,10 +1282,33 @@ cdef class DataEngine(Component):
             if instrument_id in client.subscribed_order_book_deltas():
                 client.unsubscribe_order_book_deltas(instrument_id, params)
 
-        if not self._msgbus.has_subscribers(snapshots_topic):
+        snapshot_depth = params.get("snapshot_depth")
+        if snapshot_depth is not None:
+            self._release_snapshot_depth(instrument_id, params.get("interval_ms", 1_000), snapshot_depth)
+
+        if not self._msgbus.has_subscribers(snapshots_topic) and not self._msgbus.has_subscribers(depth_snapshots_topic):
             if instrument_id in client.subscribed_order_book_snapshots():
                 client.unsubscribe_order_book_snapshots(instrument_id, params)
 
+    cdef void _release_snapshot_depth(
+        self,
+        InstrumentId instrument_id,
+        uint64_t interval_ms,
+        int snapshot_depth,
+    ):
+        cdef SnapshotInfo snap_info = self._snapshot_info.get(f"OrderBook|{instrument_id}|{interval_ms}")
+        if snap_info is None:
+            return
+
+        cdef int count = snap_info.depth_counts.get(snapshot_depth, 0)
+        if count <= 1:
+            snap_info.depth_counts.pop(snapshot_depth, None)
+        else:
+            snap_info.depth_counts[snapshot_depth] = count - 1
+
+        # Recompute so the remaining subscribers stop paying for a deeper snapshot
+        snap_info.snapshot_depth = max(snap_info.depth_counts) if snap_info.depth_counts else 0
+
     cpdef void _handle_unsubscribe_quote_ticks(
         self,
         MarketDataClient client,
@@ -1391,6 +1436,10 @@ cdef class DataEngine(Component):
         cdef datetime start = time_object_to_dt(metadata.get("start"))  # Can be None
         cdef datetime end = time_object_to_dt(metadata.get("end"))  # Can be None
 
+        if self._cache_aggregated_bars and bars_market_data_type in ("quote_ticks", "trade_ticks"):
+            if self._query_derived_bars(request):
+                return  # Served from previously aggregated bars
+
         if request.data_type.type == Instrument:
             instrument_id = request.data_type.metadata.get("instrument_id")
             if instrument_id is None:
@@ -1649,6 +1698,105 @@ cdef class DataEngine(Component):
         except NotImplementedError:
             self._log.error(f"Cannot handle request: unrecognized data type {request.data_type}")
 
+    cpdef tuple _derived_bars_source_fingerprint(self, dict metadata):
+        cdef str bars_market_data_type = metadata["bars_market_data_type"]
+        data_cls = QuoteTick if bars_market_data_type == "quote_ticks" else TradeTick
+        instrument_id = metadata["instrument_id"]
+
+        source_last_timestamp, source_catalog = self._catalogs_last_timestamp(data_cls, instrument_id)
+        start = time_object_to_dt(metadata.get("start"))
+        end = time_object_to_dt(metadata.get("end"))
+
+        cdef dict fingerprint = {
+            "source": bars_market_data_type,
+            "instrument_id": str(instrument_id),
+            "start": dt_to_unix_nanos(start) if start is not None else None,
+            "end": dt_to_unix_nanos(end) if end is not None else None,
+            "source_last_ts": dt_to_unix_nanos(source_last_timestamp) if source_last_timestamp is not None else None,
+            "build_with_no_updates": self._time_bars_build_with_no_updates,
+            "timestamp_on_close": self._time_bars_timestamp_on_close,
+            "interval_type": self._time_bars_interval_type,
+        }
+
+        return fingerprint, source_catalog
+
+    cpdef dict _derived_bars_fingerprint(self, BarType bar_type, dict source_fingerprint):
+        origin = self._time_bars_origins.get(bar_type.spec.aggregation)
+
+        cdef dict fingerprint = source_fingerprint.copy()
+        fingerprint["bar_type"] = str(bar_type.standard())
+        fingerprint["time_bars_origin"] = str(origin) if origin is not None else None
+
+        return fingerprint
+
+    cpdef bint _query_derived_bars(self, DataRequest request):
+        cdef dict metadata = request.data_type.metadata
+        cdef dict params = request.params
+
+        if not self._catalogs or metadata.get("end") is None:
+            return False  # Open ended requests are never cached
+
+        if params.get("include_external_data") or params.get("update_existing_subscriptions"):
+            return False  # Requires the source data
+
+        cdef dict source_fingerprint = self._derived_bars_source_fingerprint(metadata)[0]
+        cdef dict bars = {}
+        cdef dict fingerprint
+        for bar_type in metadata["bar_types"]:
+            if bar_type.is_composite():
+                return False
+
+            fingerprint = self._derived_bars_fingerprint(bar_type, source_fingerprint)
+
+            for catalog in self._catalogs.values():
+                if catalog.derived_bars_fingerprint(
+                    fingerprint["bar_type"],
+                    start=fingerprint["start"],
+                    end=fingerprint["end"],
+                ) == fingerprint:
+                    bars[bar_type.standard()] = catalog.derived_bars(
+                        fingerprint["bar_type"],
+                        start=fingerprint["start"],
+                        end=fingerprint["end"],
+                    )
+                    break
+            else:
+                return False  # Not cached, or source data has since changed
+
+        self._log.debug(f"Serving aggregated bars from catalog for {request}")
+
+        response = DataResponse(
+            client_id=request.client_id,
+            venue=request.venue,
+            data_type=request.data_type,
+            data={"bars": {bar_type: bars[bar_type] for bar_type in bars if len(bars[bar_type]) > 0}},
+            correlation_id=request.id,
+            response_id=UUID4(),
+            ts_init=self._clock.timestamp_ns(),
+            params=params,
+        )
+        self._msgbus.response(response)
+
+        return True
+
+    cpdef void _write_derived_bars(self, dict bars_result, dict metadata):
+        source_fingerprint, catalog = self._derived_bars_source_fingerprint(metadata)
+
+        if catalog is None:
+            catalog = next(iter(self._catalogs.values()))
+
+        cdef dict fingerprint
+        for bar_type in metadata["bar_types"]:
+            if bar_type.is_composite():
+                continue
+
+            bars = bars_result.get(bar_type.standard())
+            if not bars:
+                continue
+
+            fingerprint = self._derived_bars_fingerprint(bar_type, source_fingerprint)
+            catalog.write_derived_bars(fingerprint["bar_type"], bars, fingerprint)
+
     cpdef void _query_catalog(self, DataRequest request):
         cdef datetime start = request.data_type.metadata.get("start")
         cdef datetime end = request.data_type.metadata.get("end")
@@ -2122,13 +2270,19 @@ cdef class DataEngine(Component):
         if metadata["bars_market_data_type"] == "bars":
             bars_result[metadata["bar_type"]] = ticks
 
+        # Raw columns extracted once per price type, shared between bar types
+        cdef dict raw_columns = {}
+        cdef bint is_existing_aggregator
+
         for bar_type in metadata["bar_types"]:
             aggregated_bars = []
             handler = lambda bar: aggregated_bars.append(bar)
             aggregator = None
+            is_existing_aggregator = False
 
             if params["update_existing_subscriptions"] and bar_type.standard() in self._bar_aggregators:
                 aggregator = self._bar_aggregators.get(bar_type.standard())
+                is_existing_aggregator = True
             else:
                 instrument = self._cache.instrument(metadata["instrument_id"])
                 if instrument is None:
@@ -2168,6 +2322,22 @@ cdef class DataEngine(Component):
                         handler=handler,
                     )
 
+            if not is_existing_aggregator and self._is_columnar_aggregation_supported(bar_type, metadata["bars_market_data_type"]):
+                # Fresh aggregators are only used for this request, so the historical
+                # ticks can be aggregated from raw columns producing identical bars
+                if metadata["bars_market_data_type"] == "quote_ticks":
+                    price_type = bar_type.spec.price_type
+                    if price_type not in raw_columns:
+                        raw_columns[price_type] = quote_ticks_to_raw_arrays(ticks, price_type)
+                    prices, sizes, ts_events, price_prec = raw_columns[price_type]
+                else:
+                    if PriceType.LAST not in raw_columns:
+                        raw_columns[PriceType.LAST] = trade_ticks_to_raw_arrays(ticks)
+                    prices, sizes, ts_events, price_prec = raw_columns[PriceType.LAST]
+
+                bars_result[bar_type.standard()] = aggregator.aggregate_raw(prices, sizes, ts_events, price_prec)
+                continue
+
             if metadata["bars_market_data_type"] == "quote_ticks" and not bar_type.is_composite():
                 aggregator.start_batch_update(handler, ticks[0].ts_event)
 
@@ -2200,8 +2370,30 @@ cdef class DataEngine(Component):
             if len(bars_result[bar_type]) > 0:
                 result["bars"][bar_type] = bars_result[bar_type]
 
+        if (
+            self._cache_aggregated_bars
+            and self._catalogs
+            and metadata["bars_market_data_type"] != "bars"
+            and metadata.get("end") is not None
+            and not params["update_existing_subscriptions"]
+        ):
+            self._write_derived_bars(result["bars"], metadata)
+
         return result
 
+    cdef bint _is_columnar_aggregation_supported(self, BarType bar_type, str market_data_type):
+        if market_data_type != "quote_ticks" and market_data_type != "trade_ticks":
+            return False
+
+        if bar_type.is_composite():
+            return False
+
+        # Value bars accumulate `Decimal` values and monthly bars have no fixed interval
+        return (
+            bar_type.spec.aggregation != BarAggregation.VALUE
+            and bar_type.spec.aggregation != BarAggregation.MONTH
+        )
+
 # -- INTERNAL -------------------------------------------------------------------------------------
 
     # Python wrapper to enable callbacks
@@ -2234,11 +2426,11 @@ cdef class DataEngine(Component):
         if snap_info.is_composite:
             instruments = self._cache.instruments(venue=snap_info.venue, underlying=snap_info.root)
             for instrument in instruments:
-                self._publish_order_book(instrument.id, snap_info.topic)
+                self._publish_order_book(instrument.id, snap_info)
         else:
-            self._publish_order_book(snap_info.instrument_id, snap_info.topic)
+            self._publish_order_book(snap_info.instrument_id, snap_info)
 
-    cpdef void _publish_order_book(self, InstrumentId instrument_id, str topic):
+    cpdef void _publish_order_book(self, InstrumentId instrument_id, SnapshotInfo snap_info):
         cdef OrderBook order_book = self._cache.order_book(instrument_id)
         if order_book is None:
             self._log.error(
@@ -2252,10 +2444,16 @@ cdef class DataEngine(Component):
             return
 
         self._msgbus.publish_c(
-            topic=topic,
+            topic=snap_info.topic,
             msg=order_book,
         )
 
+        if snap_info.snapshot_depth > 0:
+            self._msgbus.publish_c(
+                topic=snap_info.depth_topic,
+                msg=order_book.to_depth_snapshot(self._clock.timestamp_ns(), snap_info.snapshot_depth),
+            )
+
     cpdef void _start_bar_aggregator(
         self,
         MarketDataClient client,
@@ -2281,6 +2479,7 @@ cdef class DataEngine(Component):
                 timestamp_on_close=self._time_bars_timestamp_on_close,
                 interval_type=self._time_bars_interval_type,
                 time_bars_origin=self._time_bars_origins.get(bar_type.spec.aggregation),
+                scheduler=self._time_bar_scheduler,
             )
         elif bar_type.spec.aggregation == BarAggregation.TICK:
             aggregator = TickBarAggregator(
@@ -311,7 +311,7 @@ class TWAPExecAlgorithm(ExecAlgorithm):
             The execution spawn ID to complete.
 
         """
-        if exec_spawn_id.value in self.clock.timer_names:
+        if self.clock.has_timer(exec_spawn_id.value):
             self.clock.cancel_timer(exec_spawn_id.value)
         self._scheduled_sizes.pop(exec_spawn_id, None)
         self.log.info(f"Completed TWAP execution for {exec_spawn_id}", LogColor.BLUE)
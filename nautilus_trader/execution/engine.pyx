@@ -545,7 +545,7 @@ cdef class ExecutionEngine(Component):
         for client in self._clients.values():
             client.start()
 
-        if self.snapshot_positions_interval_secs and self.snapshot_positions_timer_name not in self._clock.timer_names:
+        if self.snapshot_positions_interval_secs and not self._clock.has_timer(self.snapshot_positions_timer_name):
             self._log.info(
                 f"Starting position snapshots timer at {self.snapshot_positions_interval_secs} second intervals",
             )
@@ -565,7 +565,7 @@ cdef class ExecutionEngine(Component):
             if client.is_running:
                 client.stop()
 
-        if self.snapshot_positions_interval_secs and self.snapshot_positions_timer_name in self._clock.timer_names:
+        if self.snapshot_positions_interval_secs and self._clock.has_timer(self.snapshot_positions_timer_name):
             self._log.info(f"Canceling position snapshots timer")
             self._clock.cancel_timer(self.snapshot_positions_timer_name)
 
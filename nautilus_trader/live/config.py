@@ -78,6 +78,12 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     reconciliation_lookback_mins : NonNegativeInt, optional
         The maximum lookback minutes to reconcile state for.
         If ``None`` or 0 then will use the maximum lookback available from the venues.
+    reconciliation_incremental : bool, default False
+        If reconciliation should only request reports since the last reconciled
+        high-water mark (per venue and account), which is persisted in the cache.
+        If no high-water mark exists then the full lookback is used.
+    reconciliation_max_concurrency : PositiveInt, default 10
+        The maximum number of concurrent per-instrument report requests during reconciliation.
     filter_unclaimed_external_orders : bool, default False
         If unclaimed order events with an EXTERNAL strategy ID should be filtered/dropped.
     filter_position_reports : bool, default False
@@ -103,6 +109,22 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
         The interval (seconds) between checks to confirm if Nautilus open orders remain open on the venue.
         A recommended setting is between 5-10 seconds, consider API rate limits and the additional request
         weights imposed by the necessary order status requests.
+    purge_closed_orders_interval_mins : PositiveInt, optional
+        The interval (minutes) between purging closed orders from the in-memory cache.
+        If ``None`` then closed orders are never purged.
+    purge_closed_orders_buffer_mins : NonNegativeInt, optional
+        The time buffer (minutes) from when an order was closed before it can be purged.
+    purge_closed_positions_interval_mins : PositiveInt, optional
+        The interval (minutes) between purging closed positions from the in-memory cache.
+        If ``None`` then closed positions are never purged.
+    purge_closed_positions_buffer_mins : NonNegativeInt, optional
+        The time buffer (minutes) from when a position was closed before it can be purged.
+    purge_account_events_interval_mins : PositiveInt, optional
+        The interval (minutes) between purging account events from the in-memory cache.
+        If ``None`` then account events are never purged.
+    purge_account_events_lookback_mins : NonNegativeInt, optional
+        The lookback window (minutes) within which account events are retained.
+        The latest event for each account is always retained.
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
 
@@ -110,6 +132,8 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
 
     reconciliation: bool = True
     reconciliation_lookback_mins: NonNegativeInt | None = None
+    reconciliation_incremental: bool = False
+    reconciliation_max_concurrency: PositiveInt = 10
     filter_unclaimed_external_orders: bool = False
     filter_position_reports: bool = False
     generate_missing_orders: bool = True
@@ -117,6 +141,12 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     inflight_check_threshold_ms: NonNegativeInt = 5_000
     inflight_check_retries: NonNegativeInt = 5
     open_check_interval_secs: PositiveFloat | None = None
+    purge_closed_orders_interval_mins: PositiveInt | None = None
+    purge_closed_orders_buffer_mins: NonNegativeInt | None = None
+    purge_closed_positions_interval_mins: PositiveInt | None = None
+    purge_closed_positions_buffer_mins: NonNegativeInt | None = None
+    purge_account_events_interval_mins: PositiveInt | None = None
+    purge_account_events_lookback_mins: NonNegativeInt | None = None
     qsize: PositiveInt = 100_000
 
 
@@ -18,6 +18,7 @@ import math
 import uuid
 from asyncio import Queue
 from collections import Counter
+from collections.abc import Coroutine
 from decimal import Decimal
 from typing import Any, Final
 
@@ -39,6 +40,7 @@ from nautilus_trader.execution.reports import ExecutionReport
 from nautilus_trader.execution.reports import FillReport
 from nautilus_trader.execution.reports import OrderStatusReport
 from nautilus_trader.execution.reports import PositionStatusReport
+from nautilus_trader.live.execution_client import LiveExecutionClient
 from nautilus_trader.model.enums import LiquiditySide
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import OrderStatus
@@ -126,11 +128,22 @@ class LiveExecutionEngine(ExecutionEngine):
         self._evt_queue_task: asyncio.Task | None = None
         self._inflight_check_task: asyncio.Task | None = None
         self._open_check_task: asyncio.Task | None = None
+        self._purge_closed_orders_task: asyncio.Task | None = None
+        self._purge_closed_positions_task: asyncio.Task | None = None
+        self._purge_account_events_task: asyncio.Task | None = None
         self._kill: bool = False
 
+        # Reconciliation progress
+        self.reconciliation_clients_completed: int = 0
+        self.reconciliation_order_reports: int = 0
+        self.reconciliation_fill_reports: int = 0
+        self.reconciliation_position_reports: int = 0
+
         # Settings
         self._reconciliation: bool = config.reconciliation
         self.reconciliation_lookback_mins: int = config.reconciliation_lookback_mins or 0
+        self.reconciliation_incremental: bool = config.reconciliation_incremental
+        self.reconciliation_max_concurrency: int = config.reconciliation_max_concurrency
         self.filter_unclaimed_external_orders: bool = config.filter_unclaimed_external_orders
         self.filter_position_reports: bool = config.filter_position_reports
         self.generate_missing_orders: bool = config.generate_missing_orders
@@ -139,15 +152,29 @@ class LiveExecutionEngine(ExecutionEngine):
         self.inflight_check_max_retries: int = config.inflight_check_retries
         self.open_check_interval_secs: float | None = config.open_check_interval_secs
         self._inflight_check_threshold_ns: int = millis_to_nanos(self.inflight_check_threshold_ms)
+        self.purge_closed_orders_interval_mins: int | None = config.purge_closed_orders_interval_mins
+        self.purge_closed_orders_buffer_mins: int = config.purge_closed_orders_buffer_mins or 0
+        self.purge_closed_positions_interval_mins: int | None = config.purge_closed_positions_interval_mins
+        self.purge_closed_positions_buffer_mins: int = config.purge_closed_positions_buffer_mins or 0
+        self.purge_account_events_interval_mins: int | None = config.purge_account_events_interval_mins
+        self.purge_account_events_lookback_mins: int = config.purge_account_events_lookback_mins or 0
 
         self._log.info(f"{config.reconciliation=}", LogColor.BLUE)
         self._log.info(f"{config.reconciliation_lookback_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.reconciliation_incremental=}", LogColor.BLUE)
+        self._log.info(f"{config.reconciliation_max_concurrency=}", LogColor.BLUE)
         self._log.info(f"{config.filter_unclaimed_external_orders=}", LogColor.BLUE)
         self._log.info(f"{config.filter_position_reports=}", LogColor.BLUE)
         self._log.info(f"{config.inflight_check_interval_ms=}", LogColor.BLUE)
         self._log.info(f"{config.inflight_check_threshold_ms=}", LogColor.BLUE)
         self._log.info(f"{config.inflight_check_retries=}", LogColor.BLUE)
         self._log.info(f"{config.open_check_interval_secs=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_orders_interval_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_orders_buffer_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_positions_interval_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_positions_buffer_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_account_events_interval_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_account_events_lookback_mins=}", LogColor.BLUE)
 
         # Register endpoints
         self._msgbus.register(endpoint="ExecEngine.reconcile_report", handler=self.reconcile_report)
@@ -369,6 +396,27 @@ class LiveExecutionEngine(ExecutionEngine):
                 name="open_check",
             )
 
+        if self.purge_closed_orders_interval_mins and not self._purge_closed_orders_task:
+            self._purge_closed_orders_task = self._loop.create_task(
+                self._purge_closed_orders_loop(self.purge_closed_orders_interval_mins),
+                name="purge_closed_orders",
+            )
+            self._log.debug(f"Scheduled task '{self._purge_closed_orders_task.get_name()}'")
+
+        if self.purge_closed_positions_interval_mins and not self._purge_closed_positions_task:
+            self._purge_closed_positions_task = self._loop.create_task(
+                self._purge_closed_positions_loop(self.purge_closed_positions_interval_mins),
+                name="purge_closed_positions",
+            )
+            self._log.debug(f"Scheduled task '{self._purge_closed_positions_task.get_name()}'")
+
+        if self.purge_account_events_interval_mins and not self._purge_account_events_task:
+            self._purge_account_events_task = self._loop.create_task(
+                self._purge_account_events_loop(self.purge_account_events_interval_mins),
+                name="purge_account_events",
+            )
+            self._log.debug(f"Scheduled task '{self._purge_account_events_task.get_name()}'")
+
     def _on_stop(self) -> None:
         if self._inflight_check_task:
             self._log.debug(f"Canceling task '{self._inflight_check_task.get_name()}'")
@@ -380,6 +428,21 @@ class LiveExecutionEngine(ExecutionEngine):
             self._open_check_task.cancel()
             self._open_check_task = None
 
+        if self._purge_closed_orders_task:
+            self._log.debug(f"Canceling task '{self._purge_closed_orders_task.get_name()}'")
+            self._purge_closed_orders_task.cancel()
+            self._purge_closed_orders_task = None
+
+        if self._purge_closed_positions_task:
+            self._log.debug(f"Canceling task '{self._purge_closed_positions_task.get_name()}'")
+            self._purge_closed_positions_task.cancel()
+            self._purge_closed_positions_task = None
+
+        if self._purge_account_events_task:
+            self._log.debug(f"Canceling task '{self._purge_account_events_task.get_name()}'")
+            self._purge_account_events_task.cancel()
+            self._purge_account_events_task = None
+
         if self._kill:
             return  # Avoids enqueuing unnecessary sentinel messages when termination already signaled
 
@@ -496,6 +559,39 @@ class LiveExecutionEngine(ExecutionEngine):
             if not report.is_open and report.client_order_id in open_order_ids:
                 self._reconcile_order_report(report, trades=[])
 
+    async def _purge_closed_orders_loop(self, interval_mins: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval_mins * 60)
+                self._cache.purge_closed_orders(
+                    ts_now=self._clock.timestamp_ns(),
+                    buffer_secs=self.purge_closed_orders_buffer_mins * 60,
+                )
+        except asyncio.CancelledError:
+            self._log.debug("Purge closed orders loop task canceled")
+
+    async def _purge_closed_positions_loop(self, interval_mins: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval_mins * 60)
+                self._cache.purge_closed_positions(
+                    ts_now=self._clock.timestamp_ns(),
+                    buffer_secs=self.purge_closed_positions_buffer_mins * 60,
+                )
+        except asyncio.CancelledError:
+            self._log.debug("Purge closed positions loop task canceled")
+
+    async def _purge_account_events_loop(self, interval_mins: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval_mins * 60)
+                self._cache.purge_account_events(
+                    ts_now=self._clock.timestamp_ns(),
+                    lookback_secs=self.purge_account_events_lookback_mins * 60,
+                )
+        except asyncio.CancelledError:
+            self._log.debug("Purge account events loop task canceled")
+
     # -- RECONCILIATION -------------------------------------------------------------------------------
 
     def _log_reconciliation_result(self, value: ClientId | InstrumentId, result: bool) -> None:
@@ -532,18 +628,21 @@ class LiveExecutionEngine(ExecutionEngine):
             return True
 
         results: list[bool] = []
+        self.reconciliation_clients_completed = 0
+        self.reconciliation_order_reports = 0
+        self.reconciliation_fill_reports = 0
+        self.reconciliation_position_reports = 0
 
-        # Request execution mass status report from clients
-        reconciliation_lookback_mins: int | None = (
-            self.reconciliation_lookback_mins if self.reconciliation_lookback_mins > 0 else None
-        )
+        semaphore = asyncio.Semaphore(self.reconciliation_max_concurrency)
+
+        # Request execution mass status report from clients, reconciling each
+        # mass status as soon as it is available
         mass_status_coros = [
-            c.generate_mass_status(reconciliation_lookback_mins) for c in self._clients.values()
+            c.generate_mass_status(self._reconciliation_lookback_mins(c))
+            for c in self._clients.values()
         ]
-        mass_status_all = await asyncio.gather(*mass_status_coros)
-
-        # Reconcile each mass status with the execution engine
-        for mass_status in mass_status_all:
+        for mass_status_coro in asyncio.as_completed(mass_status_coros):
+            mass_status = await mass_status_coro
             if mass_status is None:
                 self._log.warning(
                     "No execution mass status available for reconciliation "
@@ -566,32 +665,97 @@ class LiveExecutionEngine(ExecutionEngine):
             client = self._clients[client_id]
 
             # Check internal and external position reconciliation
-            report_tasks: list[asyncio.Task] = []
+            report_coros: list[Coroutine] = []
             for position in self._cache.positions_open(venue):
                 instrument_id = position.instrument_id
                 if instrument_id in mass_status.position_reports:
                     self._log.debug(f"Position {instrument_id} for {client_id} already reconciled")
                     continue  # Already reconciled
                 self._log.info(f"{position} pending reconciliation")
-                report_tasks.append(client.generate_position_status_reports(instrument_id))
+                report_coros.append(
+                    self._generate_position_status_reports(client, instrument_id, semaphore),
+                )
 
-            if report_tasks:
+            if report_coros:
                 # Reconcile specific internal open positions
-                self._log.info(f"Awaiting {len(report_tasks)} position reports for {client_id}")
+                self._log.info(f"Awaiting {len(report_coros)} position reports for {client_id}")
                 position_results: list[bool] = []
-                for task_result in await asyncio.gather(*report_tasks):
+                for task_result in await asyncio.gather(*report_coros):
                     for report in task_result:
                         position_result = self._reconcile_position_report(report)
                         self._log_reconciliation_result(report.instrument_id, position_result)
                         position_results.append(position_result)
+                        self.reconciliation_position_reports += 1
 
                 result = all(position_results)
 
+            if result:
+                self._update_reconciliation_hwm(mass_status)
+
+            self.reconciliation_clients_completed += 1
+            self._log.info(
+                f"Reconciliation progress: {self.reconciliation_clients_completed}/{len(self._clients)} "
+                f"clients, {self.reconciliation_order_reports} order reports, "
+                f"{self.reconciliation_fill_reports} fill reports, "
+                f"{self.reconciliation_position_reports} position reports",
+            )
             self._log_reconciliation_result(client_id, result)
             results.append(result)
 
         return all(results)
 
+    async def _generate_position_status_reports(
+        self,
+        client: LiveExecutionClient,
+        instrument_id: InstrumentId,
+        semaphore: asyncio.Semaphore,
+    ) -> list[PositionStatusReport]:
+        async with semaphore:
+            return await client.generate_position_status_reports(instrument_id)
+
+    def _reconciliation_hwm_key(self, client: LiveExecutionClient) -> str:
+        return f"ExecEngine.reconciliation_hwm.{client.venue}.{client.account_id}"
+
+    def _reconciliation_lookback_mins(self, client: LiveExecutionClient) -> int | None:
+        lookback_mins: int | None = (
+            self.reconciliation_lookback_mins if self.reconciliation_lookback_mins > 0 else None
+        )
+        if not self.reconciliation_incremental:
+            return lookback_mins
+
+        hwm_bytes: bytes | None = self._cache.get(self._reconciliation_hwm_key(client))
+        if hwm_bytes is None:
+            return lookback_mins
+
+        # Round up to whole minutes to overlap the high-water mark (reports are idempotent)
+        elapsed_ns = max(self._clock.timestamp_ns() - int(hwm_bytes.decode()), 0)
+        hwm_lookback_mins = max(math.ceil(elapsed_ns / 60_000_000_000), 1)
+        self._log.info(
+            f"Reconciling {client.id} incrementally from high-water mark "
+            f"({hwm_lookback_mins} mins lookback)",
+            LogColor.BLUE,
+        )
+        if lookback_mins is None:
+            return hwm_lookback_mins
+        return min(lookback_mins, hwm_lookback_mins)
+
+    def _update_reconciliation_hwm(self, mass_status: ExecutionMassStatus) -> None:
+        if not self.reconciliation_incremental:
+            return
+
+        client = self._clients.get(mass_status.client_id)
+        if client is None:
+            return
+
+        hwm = mass_status.ts_init
+        for order_report in mass_status.order_reports.values():
+            hwm = max(hwm, order_report.ts_last)
+        for fill_reports in mass_status.fill_reports.values():
+            for fill_report in fill_reports:
+                hwm = max(hwm, fill_report.ts_event)
+
+        self._cache.add(self._reconciliation_hwm_key(client), str(hwm).encode())
+
     def reconcile_report(self, report: ExecutionReport) -> bool:
         """
         Reconcile the given execution report.
@@ -686,6 +850,8 @@ class LiveExecutionEngine(ExecutionEngine):
                 result = False
             results.append(result)
             reconciled_orders.add(order_report.client_order_id)
+            self.reconciliation_order_reports += 1
+            self.reconciliation_fill_reports += len(trades)
 
         if not self.filter_position_reports:
             position_reports: list[PositionStatusReport]
@@ -694,6 +860,7 @@ class LiveExecutionEngine(ExecutionEngine):
                 for report in position_reports:
                     result = self._reconcile_position_report(report)
                     results.append(result)
+                    self.reconciliation_position_reports += 1
 
         # Publish mass status
         self._msgbus.publish(
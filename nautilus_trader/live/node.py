@@ -73,6 +73,7 @@ class TradingNode:
             loop=loop,
             data_engine=self.kernel.data_engine,
             exec_engine=self.kernel.exec_engine,
+            risk_engine=self.kernel.risk_engine,
             portfolio=self.kernel.portfolio,
             msgbus=self.kernel.msgbus,
             cache=self.kernel.cache,
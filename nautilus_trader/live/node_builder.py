@@ -27,6 +27,7 @@ from nautilus_trader.live.data_engine import LiveDataEngine
 from nautilus_trader.live.execution_engine import LiveExecutionEngine
 from nautilus_trader.live.factories import LiveDataClientFactory
 from nautilus_trader.live.factories import LiveExecClientFactory
+from nautilus_trader.live.risk_engine import LiveRiskEngine
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.portfolio.portfolio import Portfolio
 
@@ -43,6 +44,8 @@ class TradingNodeBuilder:
         The data engine for the trading node.
     exec_engine : LiveExecutionEngine
         The execution engine for the trading node.
+    risk_engine : LiveRiskEngine
+        The risk engine for the trading node.
     portfolio : Portfolio
         The portfolio for the trading node.
     msgbus : MessageBus
@@ -63,6 +66,7 @@ class TradingNodeBuilder:
         loop: asyncio.AbstractEventLoop,
         data_engine: LiveDataEngine,
         exec_engine: LiveExecutionEngine,
+        risk_engine: LiveRiskEngine,
         portfolio: Portfolio,
         msgbus: MessageBus,
         cache: Cache,
@@ -77,6 +81,7 @@ class TradingNodeBuilder:
         self._loop = loop
         self._data_engine = data_engine
         self._exec_engine = exec_engine
+        self._risk_engine = risk_engine
         self._portfolio = portfolio
 
         self._data_factories: dict[str, type[LiveDataClientFactory]] = {}
@@ -247,6 +252,8 @@ class TradingNodeBuilder:
             client = factory.create(**factory_kws)
 
             self._exec_engine.register_client(client)
+            if client.venue is not None:
+                self._risk_engine.register_venue_oms_type(client.venue, client.oms_type)
 
             # Default client config
             if client_config.routing.default:
@@ -258,6 +265,7 @@ class TradingNodeBuilder:
                 if not isinstance(venue, Venue):
                     venue = Venue(venue)
                 self._exec_engine.register_venue_routing(client, venue)
+                self._risk_engine.register_venue_oms_type(venue, client.oms_type)
 
             # Temporary handling for setting specific 'venue' for portfolio
             if factory.__name__ == "InteractiveBrokersLiveExecClientFactory":
@@ -24,6 +24,7 @@ built around this domain model.
 from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.model.book import BookLevel
 from nautilus_trader.model.book import OrderBook
+from nautilus_trader.model.book import OrderBookDepthSnapshot
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarSpecification
 from nautilus_trader.model.data import BarType
@@ -100,6 +101,7 @@ __all__ = [
     "OrderBookDelta",
     "OrderBookDeltas",
     "OrderBookDepth10",
+    "OrderBookDepthSnapshot",
     "OrderListId",
     "Position",
     "PositionId",
@@ -17,6 +17,7 @@ from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.data cimport Data
+from nautilus_trader.core.rust.core cimport CVec
 from nautilus_trader.core.rust.model cimport BookLevel_API
 from nautilus_trader.core.rust.model cimport BookType
 from nautilus_trader.core.rust.model cimport OrderBook_API
@@ -27,14 +28,19 @@ from nautilus_trader.model.data cimport OrderBookDeltas
 from nautilus_trader.model.data cimport OrderBookDepth10
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
 
 
+cdef class OrderBookDepthSnapshot
+
+
 cdef class OrderBook(Data):
     cdef OrderBook_API _mem
     cdef BookType _book_type
+    cdef dict _metrics
 
     cpdef void reset(self)
     cpdef void add(self, BookOrder order, uint64_t ts_event, uint8_t flags=*, uint64_t sequence=*)
@@ -49,14 +55,22 @@ cdef class OrderBook(Data):
     cpdef void apply(self, Data data)
     cpdef void check_integrity(self)
 
-    cpdef list bids(self)
-    cpdef list asks(self)
+    cpdef list bids(self, depth=*)
+    cpdef list asks(self, depth=*)
+    cdef list _levels_from_vec(self, CVec raw_levels_vec)
+    cpdef tuple bids_to_arrays(self, int depth=*)
+    cpdef tuple asks_to_arrays(self, int depth=*)
+    cdef tuple _levels_to_arrays(self, OrderSide side, int depth)
+    cdef dict _get_metrics(self)
     cpdef best_bid_price(self)
     cpdef best_ask_price(self)
     cpdef best_bid_size(self)
     cpdef best_ask_size(self)
     cpdef spread(self)
     cpdef midpoint(self)
+    cpdef imbalance(self, int depth=*)
+    cpdef cumulative_depth(self, OrderSide side, int depth=*)
+    cpdef OrderBookDepthSnapshot to_depth_snapshot(self, uint64_t ts_init, int depth=*)
     cpdef double get_avg_px_for_quantity(self, Quantity quantity, OrderSide order_side)
     cpdef double get_quantity_for_price(self, Price price, OrderSide order_side)
     cpdef list simulate_fills(self, Order order, uint8_t price_prec, bint is_aggressive)
@@ -65,6 +79,35 @@ cdef class OrderBook(Data):
     cpdef str pprint(self, int num_levels=*)
 
 
+cdef class OrderBookDepthSnapshot(Data):
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the book.\n\n:returns: `InstrumentId`"""
+    cdef readonly object bid_prices
+    """The bid level prices (descending).\n\n:returns: `np.ndarray[float64]`"""
+    cdef readonly object bid_sizes
+    """The bid level sizes.\n\n:returns: `np.ndarray[float64]`"""
+    cdef readonly object bid_counts
+    """The bid level order counts.\n\n:returns: `np.ndarray[uint64]`"""
+    cdef readonly object ask_prices
+    """The ask level prices (ascending).\n\n:returns: `np.ndarray[float64]`"""
+    cdef readonly object ask_sizes
+    """The ask level sizes.\n\n:returns: `np.ndarray[float64]`"""
+    cdef readonly object ask_counts
+    """The ask level order counts.\n\n:returns: `np.ndarray[uint64]`"""
+    cdef readonly uint64_t sequence
+    """The books last sequence number.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t ts_event
+    """UNIX timestamp (nanoseconds) when the book was last updated.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t ts_init
+    """UNIX timestamp (nanoseconds) when the object was initialized.\n\n:returns: `uint64_t`"""
+
+    @staticmethod
+    cdef OrderBookDepthSnapshot from_dict_c(dict values)
+
+    @staticmethod
+    cdef dict to_dict_c(OrderBookDepthSnapshot obj)
+
+
 cdef class BookLevel:
     cdef BookLevel_API _mem
 
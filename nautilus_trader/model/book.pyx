@@ -16,6 +16,7 @@
 import pickle
 from operator import itemgetter
 
+import numpy as np
 import pandas as pd
 
 from libc.stdint cimport INT64_MAX
@@ -23,6 +24,7 @@ from libc.stdint cimport INT64_MIN
 from libc.stdint cimport int64_t
 from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
+from libc.stdint cimport uintptr_t
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
@@ -48,11 +50,13 @@ from nautilus_trader.core.rust.model cimport orderbook_apply_delta
 from nautilus_trader.core.rust.model cimport orderbook_apply_deltas
 from nautilus_trader.core.rust.model cimport orderbook_apply_depth
 from nautilus_trader.core.rust.model cimport orderbook_asks
+from nautilus_trader.core.rust.model cimport orderbook_asks_depth
 from nautilus_trader.core.rust.model cimport orderbook_best_ask_price
 from nautilus_trader.core.rust.model cimport orderbook_best_ask_size
 from nautilus_trader.core.rust.model cimport orderbook_best_bid_price
 from nautilus_trader.core.rust.model cimport orderbook_best_bid_size
 from nautilus_trader.core.rust.model cimport orderbook_bids
+from nautilus_trader.core.rust.model cimport orderbook_bids_depth
 from nautilus_trader.core.rust.model cimport orderbook_book_type
 from nautilus_trader.core.rust.model cimport orderbook_check_integrity
 from nautilus_trader.core.rust.model cimport orderbook_clear
@@ -66,6 +70,7 @@ from nautilus_trader.core.rust.model cimport orderbook_get_quantity_for_price
 from nautilus_trader.core.rust.model cimport orderbook_has_ask
 from nautilus_trader.core.rust.model cimport orderbook_has_bid
 from nautilus_trader.core.rust.model cimport orderbook_instrument_id
+from nautilus_trader.core.rust.model cimport orderbook_levels_to_arrays
 from nautilus_trader.core.rust.model cimport orderbook_midpoint
 from nautilus_trader.core.rust.model cimport orderbook_new
 from nautilus_trader.core.rust.model cimport orderbook_pprint_to_cstr
@@ -97,6 +102,9 @@ from nautilus_trader.model.objects cimport Quantity
 cdef class OrderBook(Data):
     """
     Provides an order book which can handle L1/L2/L3 granularity data.
+
+    Derived metrics (spread, midpoint, imbalance, cumulative depth and level
+    arrays) are cached until the next update to the book.
     """
 
     def __init__(
@@ -238,6 +246,7 @@ cdef class OrderBook(Data):
         Reset the order book (clear all stateful values).
         """
         orderbook_reset(&self._mem)
+        self._metrics = None
 
     cpdef void add(self, BookOrder order, uint64_t ts_event, uint8_t flags=0, uint64_t sequence=0):
         """
@@ -266,6 +275,7 @@ cdef class OrderBook(Data):
             raise RuntimeError("Invalid book operation: cannot add order for L1_MBP book")
 
         orderbook_add(&self._mem, order._mem, flags, sequence, ts_event)
+        self._metrics = None
 
     cpdef void update(self, BookOrder order, uint64_t ts_event, uint8_t flags=0, uint64_t sequence=0):
         """
@@ -286,6 +296,7 @@ cdef class OrderBook(Data):
         Condition.not_none(order, "order")
 
         orderbook_update(&self._mem, order._mem, flags, sequence, ts_event)
+        self._metrics = None
 
     cpdef void delete(self, BookOrder order, uint64_t ts_event, uint8_t flags=0, uint64_t sequence=0):
         """
@@ -306,24 +317,28 @@ cdef class OrderBook(Data):
         Condition.not_none(order, "order")
 
         orderbook_delete(&self._mem, order._mem, flags, sequence, ts_event)
+        self._metrics = None
 
     cpdef void clear(self, uint64_t ts_event, uint64_t sequence=0):
         """
         Clear the entire order book.
         """
         orderbook_clear(&self._mem, sequence, ts_event)
+        self._metrics = None
 
     cpdef void clear_bids(self, uint64_t ts_event, uint64_t sequence=0):
         """
         Clear the bids from the order book.
         """
         orderbook_clear_bids(&self._mem, sequence, ts_event)
+        self._metrics = None
 
     cpdef void clear_asks(self, uint64_t ts_event, uint64_t sequence=0):
         """
         Clear the asks from the order book.
         """
         orderbook_clear_asks(&self._mem, sequence, ts_event)
+        self._metrics = None
 
     cpdef void apply_delta(self, OrderBookDelta delta):
         """
@@ -343,6 +358,7 @@ cdef class OrderBook(Data):
         Condition.not_none(delta, "delta")
 
         orderbook_apply_delta(&self._mem, &delta._mem)
+        self._metrics = None
 
     cpdef void apply_deltas(self, OrderBookDeltas deltas):
         """
@@ -357,6 +373,7 @@ cdef class OrderBook(Data):
         Condition.not_none(deltas, "deltas")
 
         orderbook_apply_deltas(&self._mem, &deltas._mem)
+        self._metrics = None
 
     cpdef void apply_depth(self, OrderBookDepth10 depth):
         """
@@ -371,6 +388,7 @@ cdef class OrderBook(Data):
         Condition.not_none(depth, "depth")
 
         orderbook_apply_depth(&self._mem, &depth._mem)
+        self._metrics = None
 
     cpdef void apply(self, Data data):
         """
@@ -407,17 +425,65 @@ cdef class OrderBook(Data):
         if not orderbook_check_integrity(&self._mem):
             raise RuntimeError(f"Integrity error: orders in cross [{self.best_bid_price()} {self.best_ask_price()}]")
 
-    cpdef list bids(self):
+    cpdef list bids(self, depth=None):
         """
         Return the bid levels for the order book.
 
+        Parameters
+        ----------
+        depth : int, optional
+            The maximum number of levels to return (if ``None`` then returns all levels).
+
         Returns
         -------
         list[BookLevel]
             Sorted in descending order of price.
 
+        Raises
+        ------
+        ValueError
+            If `depth` is not positive (> 0).
+
+        """
+        cdef CVec raw_levels_vec
+        if depth is None:
+            raw_levels_vec = orderbook_bids(&self._mem)
+        else:
+            Condition.positive_int(depth, "depth")
+            raw_levels_vec = orderbook_bids_depth(&self._mem, depth)
+
+        return self._levels_from_vec(raw_levels_vec)
+
+    cpdef list asks(self, depth=None):
         """
-        cdef CVec raw_levels_vec = orderbook_bids(&self._mem)
+        Return the ask levels for the order book.
+
+        Parameters
+        ----------
+        depth : int, optional
+            The maximum number of levels to return (if ``None`` then returns all levels).
+
+        Returns
+        -------
+        list[BookLevel]
+            Sorted in ascending order of price.
+
+        Raises
+        ------
+        ValueError
+            If `depth` is not positive (> 0).
+
+        """
+        cdef CVec raw_levels_vec
+        if depth is None:
+            raw_levels_vec = orderbook_asks(&self._mem)
+        else:
+            Condition.positive_int(depth, "depth")
+            raw_levels_vec = orderbook_asks_depth(&self._mem, depth)
+
+        return self._levels_from_vec(raw_levels_vec)
+
+    cdef list _levels_from_vec(self, CVec raw_levels_vec):
         cdef BookLevel_API* raw_levels = <BookLevel_API*>raw_levels_vec.ptr
 
         cdef list levels = []
@@ -431,29 +497,93 @@ cdef class OrderBook(Data):
 
         return levels
 
-    cpdef list asks(self):
+    cpdef tuple bids_to_arrays(self, int depth=10):
         """
-        Return the bid levels for the order book.
+        Return the prices, sizes and order counts for the top bid levels as
+        read-only NumPy arrays (written directly from the book without creating
+        `BookLevel` objects).
+
+        Parameters
+        ----------
+        depth : int, default 10
+            The maximum number of levels to export.
 
         Returns
         -------
-        list[BookLevel]
-            Sorted in ascending order of price.
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The `float64` prices, `float64` sizes and `uint64` order counts,
+            sorted in descending order of price.
+
+        Raises
+        ------
+        ValueError
+            If `depth` is not positive (> 0).
 
         """
-        cdef CVec raw_levels_vec = orderbook_asks(&self._mem)
-        cdef BookLevel_API* raw_levels = <BookLevel_API*>raw_levels_vec.ptr
+        return self._levels_to_arrays(OrderSide.BUY, depth)
 
-        cdef list levels = []
+    cpdef tuple asks_to_arrays(self, int depth=10):
+        """
+        Return the prices, sizes and order counts for the top ask levels as
+        read-only NumPy arrays (written directly from the book without creating
+        `BookLevel` objects).
 
-        cdef:
-            uint64_t i
-        for i in range(raw_levels_vec.len):
-            levels.append(BookLevel.from_mem_c(raw_levels[i]))
+        Parameters
+        ----------
+        depth : int, default 10
+            The maximum number of levels to export.
 
-        vec_levels_drop(raw_levels_vec)
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The `float64` prices, `float64` sizes and `uint64` order counts,
+            sorted in ascending order of price.
 
-        return levels
+        Raises
+        ------
+        ValueError
+            If `depth` is not positive (> 0).
+
+        """
+        return self._levels_to_arrays(OrderSide.SELL, depth)
+
+    cdef tuple _levels_to_arrays(self, OrderSide side, int depth):
+        Condition.positive_int(depth, "depth")
+
+        cdef dict metrics = self._get_metrics()
+        cdef tuple key = ("arrays", side, depth)
+        cdef tuple arrays = metrics.get(key)
+        if arrays is not None:
+            return arrays
+
+        prices = np.empty(depth, dtype=np.float64)
+        sizes = np.empty(depth, dtype=np.float64)
+        counts = np.empty(depth, dtype=np.uint64)
+
+        cdef double[::1] prices_view = prices
+        cdef double[::1] sizes_view = sizes
+        cdef uint64_t[::1] counts_view = counts
+        cdef uintptr_t length = orderbook_levels_to_arrays(
+            &self._mem,
+            side,
+            depth,
+            &prices_view[0],
+            &sizes_view[0],
+            &counts_view[0],
+        )
+
+        arrays = (prices[:length], sizes[:length], counts[:length])
+        for array in arrays:
+            array.flags.writeable = False
+
+        metrics[key] = arrays
+        return arrays
+
+    cdef dict _get_metrics(self):
+        # Cleared on every update to the book
+        if self._metrics is None:
+            self._metrics = {}
+        return self._metrics
 
     cpdef best_bid_price(self):
         """
@@ -520,10 +650,16 @@ cdef class OrderBook(Data):
         double or ``None``
 
         """
-        if not orderbook_has_bid(&self._mem) or not orderbook_has_ask(&self._mem):
-            return None
+        cdef dict metrics = self._get_metrics()
+        if "spread" in metrics:
+            return metrics["spread"]
+
+        spread = None
+        if orderbook_has_bid(&self._mem) and orderbook_has_ask(&self._mem):
+            spread = orderbook_spread(&self._mem)
 
-        return orderbook_spread(&self._mem)
+        metrics["spread"] = spread
+        return spread
 
     cpdef midpoint(self):
         """
@@ -534,10 +670,130 @@ cdef class OrderBook(Data):
         double or ``None``
 
         """
-        if not orderbook_has_bid(&self._mem) or not orderbook_has_ask(&self._mem):
-            return None
+        cdef dict metrics = self._get_metrics()
+        if "midpoint" in metrics:
+            return metrics["midpoint"]
+
+        midpoint = None
+        if orderbook_has_bid(&self._mem) and orderbook_has_ask(&self._mem):
+            midpoint = orderbook_midpoint(&self._mem)
+
+        metrics["midpoint"] = midpoint
+        return midpoint
 
-        return orderbook_midpoint(&self._mem)
+    cpdef imbalance(self, int depth=1):
+        """
+        Return the size imbalance between the top bid and ask levels, calculated
+        as (bid size - ask size) / (bid size + ask size) in the range [-1, 1]
+        (if no bids or asks then returns ``None``).
+
+        Parameters
+        ----------
+        depth : int, default 1
+            The number of levels per side to include.
+
+        Returns
+        -------
+        double or ``None``
+
+        Raises
+        ------
+        ValueError
+            If `depth` is not positive (> 0).
+
+        """
+        Condition.positive_int(depth, "depth")
+
+        cdef dict metrics = self._get_metrics()
+        cdef tuple key = ("imbalance", depth)
+        if key in metrics:
+            return metrics[key]
+
+        cdef double bid_size = self._levels_to_arrays(OrderSide.BUY, depth)[1].sum()
+        cdef double ask_size = self._levels_to_arrays(OrderSide.SELL, depth)[1].sum()
+
+        imbalance = None
+        if bid_size > 0.0 and ask_size > 0.0:
+            imbalance = (bid_size - ask_size) / (bid_size + ask_size)
+
+        metrics[key] = imbalance
+        return imbalance
+
+    cpdef cumulative_depth(self, OrderSide side, int depth=10):
+        """
+        Return the cumulative size for the top levels on the given side of the
+        book as a read-only NumPy array.
+
+        Parameters
+        ----------
+        side : OrderSide {``BUY``, ``SELL``}
+            The side of the book (``BUY`` for bids, ``SELL`` for asks).
+        depth : int, default 10
+            The maximum number of levels to include.
+
+        Returns
+        -------
+        np.ndarray
+            The `float64` cumulative sizes from the top of the book.
+
+        Raises
+        ------
+        ValueError
+            If `side` is ``NO_ORDER_SIDE``.
+        ValueError
+            If `depth` is not positive (> 0).
+
+        """
+        Condition.not_equal(side, OrderSide.NO_ORDER_SIDE, "side", "NO_ORDER_SIDE")
+        Condition.positive_int(depth, "depth")
+
+        cdef dict metrics = self._get_metrics()
+        cdef tuple key = ("cumulative_depth", side, depth)
+        cumulative = metrics.get(key)
+        if cumulative is not None:
+            return cumulative
+
+        cumulative = np.cumsum(self._levels_to_arrays(side, depth)[1])
+        cumulative.flags.writeable = False
+
+        metrics[key] = cumulative
+        return cumulative
+
+    cpdef OrderBookDepthSnapshot to_depth_snapshot(self, uint64_t ts_init, int depth=10):
+        """
+        Return an immutable snapshot of the top levels of the book.
+
+        The level arrays are shared with the books cached metrics, so repeated
+        snapshots between updates do not copy any data.
+
+        Parameters
+        ----------
+        ts_init : uint64_t
+            UNIX timestamp (nanoseconds) when the snapshot was initialized.
+        depth : int, default 10
+            The maximum number of levels per side to include.
+
+        Returns
+        -------
+        OrderBookDepthSnapshot
+
+        Raises
+        ------
+        ValueError
+            If `depth` is not positive (> 0).
+
+        """
+        cdef tuple bids = self._levels_to_arrays(OrderSide.BUY, depth)
+        cdef tuple asks = self._levels_to_arrays(OrderSide.SELL, depth)
+
+        cdef OrderBookDepthSnapshot snapshot = OrderBookDepthSnapshot.__new__(OrderBookDepthSnapshot)
+        snapshot.instrument_id = InstrumentId.from_mem_c(orderbook_instrument_id(&self._mem))
+        snapshot.bid_prices, snapshot.bid_sizes, snapshot.bid_counts = bids
+        snapshot.ask_prices, snapshot.ask_sizes, snapshot.ask_counts = asks
+        snapshot.sequence = orderbook_sequence(&self._mem)
+        snapshot.ts_event = orderbook_ts_last(&self._mem)
+        snapshot.ts_init = ts_init
+        return snapshot
 
     cpdef double get_avg_px_for_quantity(self, Quantity quantity, OrderSide order_side):
         """
@@ -669,6 +925,7 @@ cdef class OrderBook(Data):
             )
 
         orderbook_update_quote_tick(&self._mem, &tick._mem)
+        self._metrics = None
 
     cpdef void update_trade_tick(self, TradeTick tick):
         """
@@ -694,6 +951,7 @@ cdef class OrderBook(Data):
             )
 
         orderbook_update_trade_tick(&self._mem, &tick._mem)
+        self._metrics = None
 
     cpdef str pprint(self, int num_levels=3):
         """
@@ -712,6 +970,163 @@ cdef class OrderBook(Data):
         return cstr_to_pystr(orderbook_pprint_to_cstr(&self._mem, num_levels))
 
 
+cdef object _readonly_array(values, dtype):
+    array = np.asarray(values, dtype=dtype)
+    if array.flags.writeable:
+        array = array.copy()
+        array.flags.writeable = False
+    return array
+
+
+cdef class OrderBookDepthSnapshot(Data):
+    """
+    Represents an immutable snapshot of the top levels of an order book.
+
+    Each side is held as contiguous read-only NumPy arrays of level prices, sizes
+    and order counts (sorted from the top of the book).
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the book.
+    bid_prices : array-like[float]
+        The bid level prices (descending).
+    bid_sizes : array-like[float]
+        The bid level sizes.
+    bid_counts : array-like[int]
+        The bid level order counts.
+    ask_prices : array-like[float]
+        The ask level prices (ascending).
+    ask_sizes : array-like[float]
+        The ask level sizes.
+    ask_counts : array-like[int]
+        The ask level order counts.
+    sequence : uint64_t
+        The books last sequence number.
+    ts_event : uint64_t
+        UNIX timestamp (nanoseconds) when the book was last updated.
+    ts_init : uint64_t
+        UNIX timestamp (nanoseconds) when the object was initialized.
+
+    Raises
+    ------
+    ValueError
+        If the bid arrays are not equal in length.
+    ValueError
+        If the ask arrays are not equal in length.
+
+    """
+
+    def __init__(
+        self,
+        InstrumentId instrument_id not None,
+        bid_prices,
+        bid_sizes,
+        bid_counts,
+        ask_prices,
+        ask_sizes,
+        ask_counts,
+        uint64_t sequence,
+        uint64_t ts_event,
+        uint64_t ts_init,
+    ) -> None:
+        self.instrument_id = instrument_id
+        self.bid_prices = _readonly_array(bid_prices, np.float64)
+        self.bid_sizes = _readonly_array(bid_sizes, np.float64)
+        self.bid_counts = _readonly_array(bid_counts, np.uint64)
+        self.ask_prices = _readonly_array(ask_prices, np.float64)
+        self.ask_sizes = _readonly_array(ask_sizes, np.float64)
+        self.ask_counts = _readonly_array(ask_counts, np.uint64)
+        self.sequence = sequence
+        self.ts_event = ts_event
+        self.ts_init = ts_init
+
+        Condition.is_true(
+            len(self.bid_prices) == len(self.bid_sizes) == len(self.bid_counts),
+            "bid arrays were not equal in length",
+        )
+        Condition.is_true(
+            len(self.ask_prices) == len(self.ask_sizes) == len(self.ask_counts),
+            "ask arrays were not equal in length",
+        )
+
+    def __eq__(self, OrderBookDepthSnapshot other) -> bool:
+        return OrderBookDepthSnapshot.to_dict_c(self) == OrderBookDepthSnapshot.to_dict_c(other)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument_id}, "
+            f"bid_levels={len(self.bid_prices)}, "
+            f"ask_levels={len(self.ask_prices)}, "
+            f"sequence={self.sequence}, "
+            f"ts_event={self.ts_event}, "
+            f"ts_init={self.ts_init})"
+        )
+
+    @staticmethod
+    cdef OrderBookDepthSnapshot from_dict_c(dict values):
+        Condition.not_none(values, "values")
+        return OrderBookDepthSnapshot(
+            instrument_id=InstrumentId.from_str_c(values["instrument_id"]),
+            bid_prices=values["bid_prices"],
+            bid_sizes=values["bid_sizes"],
+            bid_counts=values["bid_counts"],
+            ask_prices=values["ask_prices"],
+            ask_sizes=values["ask_sizes"],
+            ask_counts=values["ask_counts"],
+            sequence=values["sequence"],
+            ts_event=values["ts_event"],
+            ts_init=values["ts_init"],
+        )
+
+    @staticmethod
+    cdef dict to_dict_c(OrderBookDepthSnapshot obj):
+        Condition.not_none(obj, "obj")
+        return {
+            "type": "OrderBookDepthSnapshot",
+            "instrument_id": obj.instrument_id.to_str(),
+            "bid_prices": obj.bid_prices.tolist(),
+            "bid_sizes": obj.bid_sizes.tolist(),
+            "bid_counts": obj.bid_counts.tolist(),
+            "ask_prices": obj.ask_prices.tolist(),
+            "ask_sizes": obj.ask_sizes.tolist(),
+            "ask_counts": obj.ask_counts.tolist(),
+            "sequence": obj.sequence,
+            "ts_event": obj.ts_event,
+            "ts_init": obj.ts_init,
+        }
+
+    @staticmethod
+    def from_dict(dict values) -> OrderBookDepthSnapshot:
+        """
+        Return an order book depth snapshot from the given dict values.
+
+        Parameters
+        ----------
+        values : dict[str, object]
+            The values for initialization.
+
+        Returns
+        -------
+        OrderBookDepthSnapshot
+
+        """
+        return OrderBookDepthSnapshot.from_dict_c(values)
+
+    @staticmethod
+    def to_dict(OrderBookDepthSnapshot obj):
+        """
+        Return a dictionary representation of this object.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return OrderBookDepthSnapshot.to_dict_c(obj)
+
+
 cdef class BookLevel:
     """
     Represents an order book price level.
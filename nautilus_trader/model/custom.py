@@ -13,19 +13,67 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 import msgspec
-import pyarrow as pa
 
 from nautilus_trader.core.datetime import unix_nanos_to_dt
 from nautilus_trader.core.datetime import unix_nanos_to_str
 from nautilus_trader.model.identifiers import InstrumentId
-from nautilus_trader.serialization.arrow.serializer import register_arrow
+from nautilus_trader.serialization.arrow.registry import register_arrow_on_load
 from nautilus_trader.serialization.base import register_serializable_type
 
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+class _LazyArrowSchema:
+    # Builds the Arrow schema of a custom data class on first access, so that `pyarrow`
+    # is only imported once the class is serialized to Arrow (not at class definition)
+
+    def __init__(self, cls: type) -> None:
+        self._cls = cls
+
+    def __get__(self, obj: Any, owner: type) -> pa.Schema:
+        import pyarrow as pa
+
+        type_mapping = {
+            "InstrumentId": pa.string(),
+            "str": pa.string(),
+            "bool": pa.bool_(),
+            "float": pa.float64(),
+            "int": pa.int64(),
+            "bytes": pa.binary(),
+            "ndarray": pa.binary(),
+        }
+
+        schema = pa.schema(
+            {
+                attr: type_mapping[self._cls.__annotations__[attr].__name__]
+                for attr in self._cls.__annotations__
+            }
+            | {
+                "type": pa.string(),
+                "ts_event": pa.int64(),
+                "ts_init": pa.int64(),
+                "date": pa.int32(),
+            },
+        )
+        self._cls._schema = schema  # Replaces this descriptor
+        return schema
+
+
+def _register_arrow(cls: type) -> None:
+    from nautilus_trader.serialization.arrow.serializer import register_arrow
+
+    register_arrow(cls, cls._schema, cls.to_arrow, cls.from_arrow)
+
+
 def customdataclass(*args, **kwargs):  # noqa: C901 (too complex)
     def wrapper(cls):  # noqa: C901 (too complex)
         create_init = False
@@ -132,6 +180,8 @@ def customdataclass(*args, **kwargs):  # noqa: C901 (too complex)
         if "to_arrow" not in cls.__dict__:
 
             def to_arrow(self) -> pa.RecordBatch:
+                import pyarrow as pa
+
                 return pa.RecordBatch.from_pylist([self.to_dict(to_arrow=True)], schema=cls._schema)
 
             cls.to_arrow = to_arrow
@@ -145,31 +195,10 @@ def customdataclass(*args, **kwargs):  # noqa: C901 (too complex)
             cls.from_arrow = from_arrow
 
         if "_schema" not in cls.__dict__:
-            type_mapping = {
-                "InstrumentId": pa.string(),
-                "str": pa.string(),
-                "bool": pa.bool_(),
-                "float": pa.float64(),
-                "int": pa.int64(),
-                "bytes": pa.binary(),
-                "ndarray": pa.binary(),
-            }
-
-            cls._schema = pa.schema(
-                {
-                    attr: type_mapping[cls.__annotations__[attr].__name__]
-                    for attr in cls.__annotations__
-                }
-                | {
-                    "type": pa.string(),
-                    "ts_event": pa.int64(),
-                    "ts_init": pa.int64(),
-                    "date": pa.int32(),
-                },
-            )
+            cls._schema = _LazyArrowSchema(cls)
 
         register_serializable_type(cls, cls.to_dict, cls.from_dict)
-        register_arrow(cls, cls._schema, cls.to_arrow, cls.from_arrow)
+        register_arrow_on_load(partial(_register_arrow, cls))
 
         return cls
 
@@ -49,6 +49,8 @@ from nautilus_trader.model.objects cimport Quantity
 
 
 cpdef list capsule_to_list(capsule)
+cpdef list capsule_to_list_range(capsule, uint64_t start, uint64_t stop)
+cpdef uint64_t capsule_len(capsule)
 cpdef Data capsule_to_data(capsule)
 
 cdef inline void capsule_destructor(object capsule):
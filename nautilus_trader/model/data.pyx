@@ -190,12 +190,21 @@ cdef inline Bar bar_from_mem_c(Bar_t mem):
 
 # SAFETY: Do NOT deallocate the capsule here
 cpdef list capsule_to_list(capsule):
+    cdef CVec* data = <CVec*>PyCapsule_GetPointer(capsule, NULL)
+    return capsule_to_list_range(capsule, 0, data.len)
+
+
+# SAFETY: Do NOT deallocate the capsule here
+cpdef list capsule_to_list_range(capsule, uint64_t start, uint64_t stop):
     cdef CVec* data = <CVec*>PyCapsule_GetPointer(capsule, NULL)
     cdef Data_t* ptr = <Data_t*>data.ptr
     cdef list objects = []
 
+    if stop > data.len:
+        stop = data.len
+
     cdef uint64_t i
-    for i in range(0, data.len):
+    for i in range(start, stop):
         if ptr[i].tag == Data_t_Tag.DELTA:
             objects.append(delta_from_mem_c(ptr[i].delta))
         elif ptr[i].tag == Data_t_Tag.DELTAS:
@@ -212,6 +221,38 @@ cpdef list capsule_to_list(capsule):
     return objects
 
 
+# SAFETY: Do NOT deallocate the capsule here
+cpdef uint64_t capsule_len(capsule):
+    cdef CVec* data = <CVec*>PyCapsule_GetPointer(capsule, NULL)
+    return data.len
+
+
+def capsule_to_chunks(capsule, uint64_t chunk_size):
+    """
+    Return a generator of data object lists converted from the given capsule.
+
+    Objects are only created for the chunk being yielded, so the records held
+    in native memory are not all converted at once.
+
+    Parameters
+    ----------
+    capsule : PyCapsule
+        The capsule holding the `CVec` of data (not deallocated here).
+    chunk_size : uint64_t
+        The maximum number of objects per chunk.
+
+    Yields
+    ------
+    list[Data]
+
+    """
+    Condition.positive_int(chunk_size, "chunk_size")
+
+    length = capsule_len(capsule)
+    for start in range(0, length, chunk_size):
+        yield capsule_to_list_range(capsule, start, start + chunk_size)
+
+
 # SAFETY: Do NOT deallocate the capsule here
 cpdef Data capsule_to_data(capsule):
     cdef Data_t* ptr = <Data_t*>PyCapsule_GetPointer(capsule, NULL)
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport int64_t
+
 from nautilus_trader.core.rust.model cimport AccountId_t
 from nautilus_trader.core.rust.model cimport ClientId_t
 from nautilus_trader.core.rust.model cimport ClientOrderId_t
@@ -55,6 +57,7 @@ cdef class Venue(Identifier):
 
 cdef class InstrumentId(Identifier):
     cdef InstrumentId_t _mem
+    cdef int64_t _hash
 
     @staticmethod
     cdef InstrumentId from_mem_c(InstrumentId_t mem)
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport int64_t
 from libc.string cimport strcmp
 
 from nautilus_trader.core.correctness cimport Condition
@@ -61,6 +62,14 @@ from nautilus_trader.core.string cimport pystr_to_cstr
 from nautilus_trader.core.string cimport ustr_to_pystr
 
 
+# Interned identifiers keyed by precomputed hash (one Python object per distinct ID).
+# Only identifiers drawn from a bounded set of values are interned.
+cdef dict _SYMBOLS = {}
+cdef dict _VENUES = {}
+cdef dict _INSTRUMENT_IDS = {}
+cdef InstrumentId _LAST_INSTRUMENT_ID = None
+
+
 cdef class Identifier:
     """
     The abstract base class for all identifiers.
@@ -145,12 +154,18 @@ cdef class Symbol(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>symbol_hash(&self._mem)
 
     @staticmethod
     cdef Symbol from_mem_c(Symbol_t mem):
-        cdef Symbol symbol = Symbol.__new__(Symbol)
+        cdef int64_t key = <int64_t>symbol_hash(&mem)
+        cdef Symbol symbol = _SYMBOLS.get(key)
+        if symbol is not None and symbol._mem._0 == mem._0:
+            return symbol
+
+        symbol = Symbol.__new__(Symbol)
         symbol._mem = mem
+        _SYMBOLS[key] = symbol
         return symbol
 
     cdef str to_str(self):
@@ -229,15 +244,21 @@ cdef class Venue(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>venue_hash(&self._mem)
 
     cdef str to_str(self):
         return ustr_to_pystr(self._mem._0)
 
     @staticmethod
     cdef Venue from_mem_c(Venue_t mem):
-        cdef Venue venue = Venue.__new__(Venue)
+        cdef int64_t key = <int64_t>venue_hash(&mem)
+        cdef Venue venue = _VENUES.get(key)
+        if venue is not None and venue._mem._0 == mem._0:
+            return venue
+
+        venue = Venue.__new__(Venue)
         venue._mem = mem
+        _VENUES[key] = venue
         return venue
 
     @staticmethod
@@ -245,9 +266,7 @@ cdef class Venue(Identifier):
         cdef const char* code_ptr = pystr_to_cstr(code)
         if not venue_code_exists(code_ptr):
             return None
-        cdef Venue venue = Venue.__new__(Venue)
-        venue._mem = venue_from_cstr_code(code_ptr)
-        return venue
+        return Venue.from_mem_c(venue_from_cstr_code(code_ptr))
 
     cpdef bint is_synthetic(self):
         """
@@ -341,12 +360,36 @@ cdef class InstrumentId(Identifier):
         return strcmp(self._mem.symbol._0, other._mem.symbol._0) == 0 and strcmp(self._mem.venue._0, other._mem.venue._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        if self._hash == 0:
+            self._hash = <int64_t>instrument_id_hash(&self._mem)
+        return self._hash
 
     @staticmethod
     cdef InstrumentId from_mem_c(InstrumentId_t mem):
-        cdef InstrumentId instrument_id = InstrumentId.__new__(InstrumentId)
-        instrument_id._mem = mem
+        global _LAST_INSTRUMENT_ID
+
+        # Fast path for repeated access to the same instrument (allocation free)
+        cdef InstrumentId instrument_id = _LAST_INSTRUMENT_ID
+        if (
+            instrument_id is not None
+            and instrument_id._mem.symbol._0 == mem.symbol._0
+            and instrument_id._mem.venue._0 == mem.venue._0
+        ):
+            return instrument_id
+
+        cdef int64_t key = <int64_t>instrument_id_hash(&mem)
+        instrument_id = _INSTRUMENT_IDS.get(key)
+        if (
+            instrument_id is None
+            or instrument_id._mem.symbol._0 != mem.symbol._0
+            or instrument_id._mem.venue._0 != mem.venue._0
+        ):
+            instrument_id = InstrumentId.__new__(InstrumentId)
+            instrument_id._mem = mem
+            instrument_id._hash = key
+            _INSTRUMENT_IDS[key] = instrument_id
+
+        _LAST_INSTRUMENT_ID = instrument_id
         return instrument_id
 
     @staticmethod
@@ -357,9 +400,7 @@ cdef class InstrumentId(Identifier):
         if parse_err:
             raise ValueError(parse_err)
 
-        cdef InstrumentId instrument_id = InstrumentId.__new__(InstrumentId)
-        instrument_id._mem = instrument_id_from_cstr(pystr_to_cstr(value))
-        return instrument_id
+        return InstrumentId.from_mem_c(instrument_id_from_cstr(pystr_to_cstr(value)))
 
     cdef str to_str(self):
         return cstr_to_pystr(instrument_id_to_cstr(&self._mem))
@@ -437,7 +478,7 @@ cdef class ComponentId(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>component_id_hash(&self._mem)
 
     @staticmethod
     cdef ComponentId from_mem_c(ComponentId_t mem):
@@ -484,7 +525,7 @@ cdef class ClientId(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>client_id_hash(&self._mem)
 
     @staticmethod
     cdef ClientId from_mem_c(ClientId_t mem):
@@ -540,7 +581,7 @@ cdef class TraderId(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>trader_id_hash(&self._mem)
 
     @staticmethod
     cdef TraderId from_mem_c(TraderId_t mem):
@@ -613,7 +654,7 @@ cdef class StrategyId(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>strategy_id_hash(&self._mem)
 
     @staticmethod
     cdef StrategyId from_mem_c(StrategyId_t mem):
@@ -684,7 +725,7 @@ cdef class ExecAlgorithmId(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>exec_algorithm_id_hash(&self._mem)
 
     @staticmethod
     cdef ExecAlgorithmId from_mem_c(ExecAlgorithmId_t mem):
@@ -739,7 +780,7 @@ cdef class AccountId(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>account_id_hash(&self._mem)
 
     @staticmethod
     cdef AccountId from_mem_c(AccountId_t mem):
@@ -808,7 +849,7 @@ cdef class ClientOrderId(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>client_order_id_hash(&self._mem)
 
     @staticmethod
     cdef ClientOrderId from_mem_c(ClientOrderId_t mem):
@@ -851,7 +892,7 @@ cdef class VenueOrderId(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>venue_order_id_hash(&self._mem)
 
     @staticmethod
     cdef VenueOrderId from_mem_c(VenueOrderId_t mem):
@@ -894,7 +935,7 @@ cdef class OrderListId(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>order_list_id_hash(&self._mem)
 
     @staticmethod
     cdef OrderListId from_mem_c(OrderListId_t mem):
@@ -937,7 +978,7 @@ cdef class PositionId(Identifier):
         return strcmp(self._mem._0, other._mem._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>position_id_hash(&self._mem)
 
     @staticmethod
     cdef PositionId from_mem_c(PositionId_t mem):
@@ -998,7 +1039,7 @@ cdef class TradeId(Identifier):
         return strcmp(trade_id_to_cstr(&self._mem), trade_id_to_cstr(&other._mem)) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        return <int64_t>trade_id_hash(&self._mem)
 
     @staticmethod
     cdef TradeId from_mem_c(TradeId_t mem):
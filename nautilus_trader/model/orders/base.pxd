@@ -183,6 +183,7 @@ cdef class Order:
 
     cpdef void apply(self, OrderEvent event)
 
+    cdef void _add_venue_order_id(self, VenueOrderId venue_order_id)
     cdef void _denied(self, OrderDenied event)
     cdef void _submitted(self, OrderSubmitted event)
     cdef void _rejected(self, OrderRejected event)
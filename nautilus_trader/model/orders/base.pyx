@@ -142,6 +142,9 @@ cdef dict _ORDER_STATE_TABLE = {
     (OrderStatus.PARTIALLY_FILLED, OrderStatus.FILLED): OrderStatus.FILLED,
 }
 
+# Validated once at import so every order FSM can share the table unchecked
+FiniteStateMachine.validate_table(_ORDER_STATE_TABLE)
+
 
 cdef class Order:
     """
@@ -161,14 +164,14 @@ cdef class Order:
         Condition.positive(init.quantity, "init.quantity")
 
         self._events: list[OrderEvent] = [init]
-        self._venue_order_ids: list[VenueOrderId] = []
-        self._trade_ids: list[TradeId] = []
-        self._commissions: dict[Currency, Money] = {}
-        self._fsm = FiniteStateMachine(
-            state_transition_table=_ORDER_STATE_TABLE,
-            initial_state=OrderStatus.INITIALIZED,
-            trigger_parser=order_status_to_str,
-            state_parser=order_status_to_str,
+        self._venue_order_ids = None  # Allocated on first use
+        self._trade_ids = None  # Allocated on first fill
+        self._commissions = None  # Allocated on first fill
+        self._fsm = FiniteStateMachine.from_validated_c(
+            _ORDER_STATE_TABLE,
+            OrderStatus.INITIALIZED,
+            order_status_to_str,
+            order_status_to_str,
         )
         self._previous_status = OrderStatus.INITIALIZED
         self._triggered_price = None  # Can be None
@@ -330,9 +333,13 @@ cdef class Order:
         return self._events.copy()
 
     cdef list venue_order_ids_c(self):
+        if self._venue_order_ids is None:
+            return []
         return self._venue_order_ids.copy()
 
     cdef list trade_ids_c(self):
+        if self._trade_ids is None:
+            return []
         return self._trade_ids.copy()
 
     cdef int event_count_c(self):
@@ -926,6 +933,8 @@ cdef class Order:
         list[Money]
 
         """
+        if self._commissions is None:
+            return []
         return sorted(self._commissions.values())
 
     cpdef void apply(self, OrderEvent event):
@@ -1014,7 +1023,7 @@ cdef class Order:
             if self.venue_order_id is None:
                 self.venue_order_id = event.venue_order_id
             else:
-                Condition.not_in(event.trade_id, self._trade_ids, "event.trade_id", "_trade_ids")
+                Condition.not_in(event.trade_id, self._trade_ids or (), "event.trade_id", "_trade_ids")
             # Fill order
             self._filled(event)
         else:
@@ -1029,6 +1038,11 @@ cdef class Order:
         self._events.append(event)
         self.ts_last = event.ts_event
 
+    cdef void _add_venue_order_id(self, VenueOrderId venue_order_id):
+        if self._venue_order_ids is None:
+            self._venue_order_ids = []
+        self._venue_order_ids.append(venue_order_id)
+
     cdef void _denied(self, OrderDenied event):
         pass  # Do nothing else
 
@@ -1064,6 +1078,8 @@ cdef class Order:
         self.venue_order_id = fill.venue_order_id
         self.position_id = fill.position_id
         self.strategy_id = fill.strategy_id
+        if self._trade_ids is None:
+            self._trade_ids = []
         self._trade_ids.append(fill.trade_id)
         self.last_trade_id = fill.trade_id
         cdef uint64_t raw_filled_qty = self.filled_qty._mem.raw + fill.last_qty._mem.raw
@@ -1083,6 +1099,8 @@ cdef class Order:
         self._set_slippage()
 
         # Calculate cumulative commission
+        if self._commissions is None:
+            self._commissions = {}
         cdef Currency currency = fill.commission.currency
         cdef Money commissions = self._commissions.get(currency)
         cdef double total_commissions = commissions.as_f64_c() if commissions is not None else 0.0
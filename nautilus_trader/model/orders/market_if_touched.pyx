@@ -204,7 +204,7 @@ cdef class MarketIfTouchedOrder(Order):
 
     cdef void _updated(self, OrderUpdated event):
         if self.venue_order_id is not None and event.venue_order_id is not None and self.venue_order_id != event.venue_order_id:
-            self._venue_order_ids.append(self.venue_order_id)
+            self._add_venue_order_id(self.venue_order_id)
             self.venue_order_id = event.venue_order_id
         if event.quantity is not None:
             self.quantity = event.quantity
@@ -13,11 +13,25 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from typing import TYPE_CHECKING
+
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
-from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+
+if TYPE_CHECKING:
+    from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 
 
 __all__ = (
     "BaseDataCatalog",
     "ParquetDataCatalog",
 )
+
+
+def __getattr__(name: str) -> type:
+    # Import the `ParquetDataCatalog` (and so `pyarrow` and `fsspec`) on first use only
+    if name == "ParquetDataCatalog":
+        from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+        return ParquetDataCatalog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -21,12 +21,15 @@ import platform
 from collections import defaultdict
 from collections.abc import Callable
 from collections.abc import Generator
-from itertools import groupby
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from os import PathLike
 from pathlib import Path
 from typing import Any, NamedTuple, Union
 
 import fsspec
+import msgspec
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.dataset as pds
@@ -56,6 +59,7 @@ from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.data import capsule_to_list
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
+from nautilus_trader.persistence.funcs import check_ts_init_monotonic
 from nautilus_trader.persistence.funcs import class_to_filename
 from nautilus_trader.persistence.funcs import combine_filters
 from nautilus_trader.persistence.funcs import urisafe_instrument_id
@@ -214,17 +218,11 @@ class ParquetDataCatalog(BaseDataCatalog):
     def _objects_to_table(self, data: list[Data], data_cls: type) -> pa.Table:
         PyCondition.not_empty(data, "data")
         PyCondition.list_type(data, data_cls, "data")
-        sorted_data = sorted(data, key=lambda x: x.ts_init)
-
-        # Check data is strictly non-decreasing prior to write
-        for original, sorted_version in zip(data, sorted_data, strict=False):
-            if original.ts_init != sorted_version.ts_init:
-                raise ValueError(
-                    "Data should be monotonically increasing (or non-decreasing) based on `ts_init`: "
-                    f"found {original.ts_init} followed by {sorted_version.ts_init}. "
-                    "Consider sorting your data with something like "
-                    "`data.sort(key=lambda x: x.ts_init)` prior to writing to the catalog",
-                )
+
+        # Check data is non-decreasing prior to write
+        check_ts_init_monotonic(
+            np.fromiter((x.ts_init for x in data), dtype=np.uint64, count=len(data)),
+        )
 
         table_or_batch = self.serializer.serialize_batch(data, data_cls=data_cls)
         assert table_or_batch is not None
@@ -254,6 +252,24 @@ class ParquetDataCatalog(BaseDataCatalog):
         if isinstance(data[0], CustomData):
             data = [d.data for d in data]
         table = self._objects_to_table(data, data_cls=data_cls)
+        self._write_table(
+            table=table,
+            data_cls=data_cls,
+            instrument_id=instrument_id,
+            basename_template=basename_template,
+            mode=mode,
+            **kwargs,
+        )
+
+    def _write_table(
+        self,
+        table: pa.Table,
+        data_cls: type[Data],
+        instrument_id: str | None = None,
+        basename_template: str = "part-{i}",
+        mode: str = "overwrite",
+        **kwargs: Any,
+    ) -> None:
         path = self._make_path(data_cls=data_cls, instrument_id=instrument_id)
         kw = dict(**self.dataset_kwargs, **kwargs)
 
@@ -318,9 +334,11 @@ class ParquetDataCatalog(BaseDataCatalog):
 
     def write_data(
         self,
-        data: list[Data | Event] | list[NautilusRustDataType],
+        data: list[Data | Event] | list[NautilusRustDataType] | list[pa.RecordBatch | pa.Table],
         basename_template: str = "part-{i}",
         mode: str = "overwrite",
+        data_cls: type | None = None,
+        max_workers: int = 1,
         **kwargs: Any,
     ) -> None:
         """
@@ -328,12 +346,17 @@ class ParquetDataCatalog(BaseDataCatalog):
 
         The function categorizes the data based on their class name and, when applicable, their
         associated instrument ID. It then delegates the actual writing process to the
-        `write_chunk` method.
+        `write_chunk` method, writing the chunks concurrently on a thread pool when
+        `max_workers` is greater than 1 (Arrow and Parquet I/O release the GIL).
+
+        Arrow record batches (or tables) already in the Nautilus schema, such as those returned
+        by the `*_as_arrow` loader methods, are written directly via `write_arrow` without
+        instantiating any data objects, in which case `data_cls` must be provided.
 
         Parameters
         ----------
-        data : list[Data | Event]
-            The data or event objects to be written to the catalog.
+        data : list[Data | Event] | list[pa.RecordBatch | pa.Table]
+            The data or event objects (or Arrow record batches) to be written to the catalog.
         basename_template : str, default 'part-{i}'
             A template string used to generate basenames of written data files.
             The token '{i}' will be replaced with an automatically incremented
@@ -346,6 +369,11 @@ class ParquetDataCatalog(BaseDataCatalog):
             - "prepend": Prepends the data to the existing data.
             - "overwrite": Overwrites the existing data.
             If not specified, it defaults to 'overwrite'.
+        data_cls : type, optional
+            The data type for Arrow record batch `data` (ignored for data objects).
+        max_workers : int, default 1
+            The maximum number of threads writing chunks for different data types and
+            instrument IDs concurrently (1 writes sequentially on the calling thread).
         kwargs : Any
             Additional keyword arguments to be passed to the `write_chunk` method.
 
@@ -368,8 +396,26 @@ class ParquetDataCatalog(BaseDataCatalog):
         ------
         ValueError
             If data of the same type is not monotonically increasing (or non-decreasing) based on `ts_init`.
+        ValueError
+            If `data` contains Arrow record batches and `data_cls` is ``None``.
+        ValueError
+            If `max_workers` is not positive (> 0).
 
         """
+        PyCondition.positive_int(max_workers, "max_workers")
+
+        if data and isinstance(data[0], pa.RecordBatch | pa.Table):
+            if data_cls is None:
+                raise ValueError("`data_cls` must be provided when writing Arrow record batches")
+            self.write_arrow(
+                data=data,  # type: ignore [arg-type]
+                data_cls=data_cls,
+                basename_template=basename_template,
+                mode=mode,
+                max_workers=max_workers,
+                **kwargs,
+            )
+            return
 
         def key(obj: Any) -> tuple[str, str | None]:
             name = type(obj).__name__
@@ -387,18 +433,251 @@ class ParquetDataCatalog(BaseDataCatalog):
         def obj_to_type(obj: Data) -> type:
             return type(obj) if not isinstance(obj, CustomData) else obj.data.__class__
 
-        name_to_cls = {cls.__name__: cls for cls in {obj_to_type(d) for d in data}}
-        for (cls_name, instrument_id), single_type in groupby(sorted(data, key=key), key=key):
-            chunk = list(single_type)
-            self.write_chunk(
-                data=chunk,
-                data_cls=name_to_cls[cls_name],
-                instrument_id=instrument_id,
-                basename_template=basename_template,
-                mode=mode,
-                **kwargs,
+        # Group in a single pass, preserving the order of the data within each chunk
+        chunks: dict[tuple[str, str | None], list[Any]] = defaultdict(list)
+        name_to_cls: dict[str, type] = {}
+        for obj in data:
+            obj_key = key(obj)
+            chunks[obj_key].append(obj)
+            if obj_key[0] not in name_to_cls:
+                name_to_cls[obj_key[0]] = obj_to_type(obj)
+
+        self._run_writes(
+            [
+                partial(
+                    self.write_chunk,
+                    data=chunk,
+                    data_cls=name_to_cls[cls_name],
+                    instrument_id=instrument_id,
+                    basename_template=basename_template,
+                    mode=mode,
+                    **kwargs,
+                )
+                for (cls_name, instrument_id), chunk in chunks.items()
+            ],
+            max_workers=max_workers,
+        )
+
+    def write_arrow(
+        self,
+        data: list[pa.RecordBatch | pa.Table],
+        data_cls: type,
+        basename_template: str = "part-{i}",
+        mode: str = "overwrite",
+        max_workers: int = 1,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Write the given Arrow record batches (in the Nautilus schema) to the catalog.
+
+        Batches are grouped by the instrument ID (or bar type for bars) held in their schema
+        metadata, and each group is written without converting any rows to data objects.
+
+        Parameters
+        ----------
+        data : list[pa.RecordBatch | pa.Table]
+            The record batches to write, each for a single instrument (or bar type).
+        data_cls : type
+            The data type for the record batches.
+        basename_template : str, default 'part-{i}'
+            A template string used to generate basenames of written data files.
+        mode : str, optional
+            The mode to use when writing data ('append', 'prepend' or 'overwrite').
+        max_workers : int, default 1
+            The maximum number of threads writing groups concurrently.
+        kwargs : Any
+            Additional keyword arguments to be passed to the dataset writer.
+
+        Raises
+        ------
+        ValueError
+            If `data` is empty.
+        ValueError
+            If a group of batches is not monotonically increasing (or non-decreasing) based on `ts_init`.
+
+        """
+        PyCondition.not_empty(data, "data")
+
+        metadata_key = b"bar_type" if data_cls in (Bar, nautilus_pyo3.Bar) else b"instrument_id"
+        grouped: dict[str | None, list[pa.Table]] = {}
+        for batch in data:
+            if batch.num_rows == 0:
+                continue
+            if isinstance(batch, pa.RecordBatch):
+                batch = pa.Table.from_batches([batch])
+            metadata = batch.schema.metadata or {}
+            instrument_id = metadata.get(metadata_key)
+            grouped.setdefault(
+                instrument_id.decode() if instrument_id is not None else None,
+                [],
+            ).append(batch)
+
+        writes: list[Callable[[], None]] = []
+        for instrument_id, tables in grouped.items():
+            table = pa.concat_tables(tables) if len(tables) > 1 else tables[0]
+            check_ts_init_monotonic(table.column("ts_init"))
+            writes.append(
+                partial(
+                    self._write_table,
+                    table=table,
+                    data_cls=data_cls,
+                    instrument_id=instrument_id,
+                    basename_template=basename_template,
+                    mode=mode,
+                    **kwargs,
+                ),
             )
 
+        self._run_writes(writes, max_workers=max_workers)
+
+    def _run_writes(self, writes: list[Callable[[], None]], max_workers: int) -> None:
+        if max_workers == 1 or len(writes) <= 1:
+            for write in writes:
+                write()
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(writes))) as executor:
+            futures = [executor.submit(write) for write in writes]
+            for future in futures:
+                future.result()  # Propagate the first write error (if any)
+
+    # -- DERIVED DATA -----------------------------------------------------------------------------
+
+    def _make_derived_bars_path(
+        self,
+        bar_type: str,
+        start: TimestampLike | None,
+        end: TimestampLike | None,
+    ) -> str:
+        # One entry per requested range, so different ranges never overwrite each other
+        start_key = pd.Timestamp(start).value if start is not None else "none"
+        end_key = pd.Timestamp(end).value if end is not None else "none"
+        return (
+            f"{self.path}/derived/{class_to_filename(Bar)}/"
+            f"{urisafe_instrument_id(bar_type)}/{start_key}_{end_key}"
+        )
+
+    def _make_derived_bars_fingerprint_path(
+        self,
+        bar_type: str,
+        start: TimestampLike | None,
+        end: TimestampLike | None,
+    ) -> str:
+        return f"{self._make_derived_bars_path(bar_type, start, end)}.json"
+
+    def write_derived_bars(
+        self,
+        bar_type: str,
+        bars: list[Bar],
+        fingerprint: dict[str, Any],
+    ) -> None:
+        """
+        Write the given bars aggregated from source data, along with the
+        fingerprint of the source data and aggregation settings they were derived
+        from.
+
+        Derived bars are stored separately from the catalog data, so bars written
+        with `write_data` are never modified. One entry is kept per bar type and
+        requested range (the fingerprint `start` and `end`), any entry previously
+        written for the same range is overwritten.
+
+        Parameters
+        ----------
+        bar_type : str
+            The bar type of the derived bars.
+        bars : list[Bar]
+            The derived bars to write (must not be empty).
+        fingerprint : dict[str, Any]
+            The source data fingerprint (must be JSON serializable).
+
+        Raises
+        ------
+        ValueError
+            If `bars` is empty.
+
+        """
+        PyCondition.not_empty(bars, "bars")
+
+        start = fingerprint.get("start")
+        end = fingerprint.get("end")
+
+        table = self._objects_to_table(bars, data_cls=Bar)
+        self._fast_write(
+            table=table,
+            path=self._make_derived_bars_path(bar_type, start, end),
+            fs=self.fs,
+            basename_template="part-{i}",
+            mode="overwrite",
+        )
+
+        path = self._make_derived_bars_fingerprint_path(bar_type, start, end)
+        with self.fs.open(path, "wb") as f:
+            f.write(msgspec.json.encode(fingerprint))
+
+    def derived_bars_fingerprint(
+        self,
+        bar_type: str,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Return the source data fingerprint for the derived bars of the given bar
+        type and range.
+
+        Parameters
+        ----------
+        bar_type : str
+            The bar type of the derived bars.
+        start : TimestampLike, optional
+            The start of the range the bars were derived for.
+        end : TimestampLike, optional
+            The end of the range the bars were derived for.
+
+        Returns
+        -------
+        dict[str, Any] or ``None``
+
+        """
+        path = self._make_derived_bars_fingerprint_path(bar_type, start, end)
+        if not self.fs.exists(path):
+            return None
+
+        with self.fs.open(path, "rb") as f:
+            return msgspec.json.decode(f.read())
+
+    def derived_bars(
+        self,
+        bar_type: str,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> list[Bar]:
+        """
+        Return the derived bars written for the given bar type and range.
+
+        Parameters
+        ----------
+        bar_type : str
+            The bar type of the derived bars.
+        start : TimestampLike, optional
+            The start time (inclusive) of the range the bars were derived for.
+        end : TimestampLike, optional
+            The end time (inclusive) of the range the bars were derived for.
+
+        Returns
+        -------
+        list[Bar]
+
+        """
+        path = self._make_derived_bars_path(bar_type, start, end)
+        if not self.fs.exists(path):
+            return []
+
+        table = self._load_pyarrow_table(path=path, start=start, end=end)
+        if table is None or table.num_rows == 0:
+            return []
+
+        return self._handle_table_nautilus(table, data_cls=Bar)
+
     # -- QUERIES ----------------------------------------------------------------------------------
 
     def query(
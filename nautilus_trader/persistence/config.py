@@ -17,11 +17,11 @@ from __future__ import annotations
 
 from datetime import time
 
-import fsspec
 import pandas as pd
 
 from nautilus_trader.common.config import NautilusConfig
-from nautilus_trader.persistence.writer import RotationMode
+from nautilus_trader.persistence.enums import QueueOverflowPolicy
+from nautilus_trader.persistence.enums import RotationMode
 
 
 class StreamingConfig(NautilusConfig, frozen=True):
@@ -38,6 +38,9 @@ class StreamingConfig(NautilusConfig, frozen=True):
         The `fsspec` storage options.
     flush_interval_ms : int, optional
         The flush interval (milliseconds) for writing chunks.
+    max_buffer_rows : int, default 1
+        The maximum number of rows buffered per table before they are written
+        as a single record batch. The default of 1 writes every object immediately.
     replace_existing: bool, default False
         If any existing feather files should be replaced.
     include_types : list[type], optional
@@ -53,6 +56,15 @@ class StreamingConfig(NautilusConfig, frozen=True):
         The time of day for file rotation (for SCHEDULED_DATES mode).
     rotation_timezone : str, default 'UTC'
         The timezone for rotation calculations (for SCHEDULED_DATES mode).
+    use_thread : bool, default False
+        If objects should be serialized and written on a dedicated writer thread
+        (via a bounded queue), rather than on the calling thread. Intended for live nodes.
+    queue_size : int, default 100_000
+        The maximum number of objects waiting to be written (when `use_thread`).
+    overflow_policy : QueueOverflowPolicy, default QueueOverflowPolicy.BLOCK
+        The policy when the writer queue is full (when `use_thread`).
+    fsync_interval_ms : int, optional
+        The interval (milliseconds) between syncing files to disk (when `use_thread`).
 
     """
 
@@ -60,6 +72,7 @@ class StreamingConfig(NautilusConfig, frozen=True):
     fs_protocol: str | None = None
     fs_storage_options: dict | None = None
     flush_interval_ms: int | None = None
+    max_buffer_rows: int = 1
     replace_existing: bool = False
     include_types: list[type] | None = None
     rotation_mode: RotationMode = RotationMode.NO_ROTATION
@@ -67,9 +80,15 @@ class StreamingConfig(NautilusConfig, frozen=True):
     rotation_interval: pd.Timedelta = pd.Timedelta(days=1)
     rotation_time: time = time(0, 0, 0, 0)
     rotation_timezone: str = "UTC"
+    use_thread: bool = False
+    queue_size: int = 100_000
+    overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK
+    fsync_interval_ms: int | None = None
 
     @property
     def fs(self):
+        import fsspec
+
         return fsspec.filesystem(protocol=self.fs_protocol, **(self.fs_storage_options or {}))
 
     def as_catalog(self):
@@ -13,11 +13,21 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
 from nautilus_trader.core.inspect import is_nautilus_class
 from nautilus_trader.core.nautilus_pyo3 import convert_to_snake_case
 from nautilus_trader.model.identifiers import InstrumentId
 
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
 CUSTOM_DATA_PREFIX = "custom_"
 
 
@@ -52,3 +62,28 @@ def combine_filters(*filters):
         for f in filters[1:]:
             expr = expr & f
         return expr
+
+
+def check_ts_init_monotonic(ts_init: pa.Array | pa.ChunkedArray | np.ndarray) -> None:
+    """
+    Check the given `ts_init` values are monotonically increasing (or non-decreasing).
+
+    The check is vectorized, so no per-row Python objects are created.
+
+    Raises
+    ------
+    ValueError
+        If any value is less than its predecessor.
+
+    """
+    if not isinstance(ts_init, np.ndarray):
+        ts_init = ts_init.to_numpy()
+    decreasing = np.flatnonzero(ts_init[1:] < ts_init[:-1])
+    if decreasing.size:
+        i = decreasing[0]
+        raise ValueError(
+            "Data should be monotonically increasing (or non-decreasing) based on `ts_init`: "
+            f"found {ts_init[i]} followed by {ts_init[i + 1]}. "
+            "Consider sorting your data with something like "
+            "`data.sort(key=lambda x: x.ts_init)` prior to writing to the catalog",
+        )
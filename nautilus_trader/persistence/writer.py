@@ -14,7 +14,11 @@
 # -------------------------------------------------------------------------------------------------
 
 import datetime as dt
-from enum import Enum
+import io
+import os
+import queue
+import threading
+import time
 from io import TextIOWrapper
 from typing import Any, BinaryIO
 
@@ -35,19 +39,14 @@ from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
+from nautilus_trader.persistence.enums import QueueOverflowPolicy
+from nautilus_trader.persistence.enums import RotationMode
 from nautilus_trader.persistence.funcs import class_to_filename
 from nautilus_trader.persistence.funcs import urisafe_instrument_id
 from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 from nautilus_trader.serialization.arrow.serializer import list_schemas
 
 
-class RotationMode(Enum):
-    SIZE = 0
-    INTERVAL = 1
-    SCHEDULED_DATES = 2
-    NO_ROTATION = 3
-
-
 class StreamingFeatherWriter:
     """
     Provides a stream writer of Nautilus objects into feather files with rotation
@@ -64,7 +63,11 @@ class StreamingFeatherWriter:
     fs_protocol : str, default 'file'
         The `fsspec` file system protocol.
     flush_interval_ms : int, optional
-        The flush interval (milliseconds) for writing chunks.
+        The flush interval (milliseconds) for writing chunks. Any rows buffered
+        for longer than this interval are written on the next call to `write`.
+    max_buffer_rows : int, default 1
+        The maximum number of rows buffered per table before they are written to
+        the stream as a single record batch. The default of 1 writes every object immediately.
     replace : bool, default False
         If existing files at the given `path` should be replaced.
     include_types : list[type], optional
@@ -90,6 +93,7 @@ class StreamingFeatherWriter:
         clock: Clock,
         fs_protocol: str | None = "file",
         flush_interval_ms: int | None = None,
+        max_buffer_rows: int = 1,
         replace: bool = False,
         include_types: list[type] | None = None,
         rotation_mode: RotationMode = RotationMode.NO_ROTATION,
@@ -98,6 +102,8 @@ class StreamingFeatherWriter:
         rotation_time: dt.time = dt.time(0, 0, 0, 0),
         rotation_timezone: str = "UTC",
     ) -> None:
+        PyCondition.positive_int(max_buffer_rows, "max_buffer_rows")
+
         self.path = path
         self.cache = cache
         self.clock = clock
@@ -137,11 +143,15 @@ class StreamingFeatherWriter:
         self._file_sizes: dict[str | tuple[str, str], int] = {}
         self._file_creation_times: dict[str | tuple[str, str], pd.Timestamp] = {}
         self._next_rotation_times: dict[str | tuple[str, str], pd.Timestamp | None] = {}
+        self._buffers: dict[str | tuple[str, str], list[Any]] = {}
+        self._buffer_classes: dict[str | tuple[str, str], type] = {}
 
         self._create_writers()
 
         self.flush_interval_ms = flush_interval_ms or 1000
-        self._last_flush = self.clock.utc_now()
+        self.max_buffer_rows = max_buffer_rows
+        self._flush_interval_ns = self.flush_interval_ms * 1_000_000
+        self._last_flush_ns = self.clock.timestamp_ns()
         self.missing_writers: set[type] = set()
 
     def _update_next_rotation_time(self, table_name: str | tuple[str, str]) -> None:
@@ -377,9 +387,9 @@ class StreamingFeatherWriter:
             elif table.startswith(("bar", "binance_bar")):
                 self._create_writer(cls=cls, table_name=table)
             elif table in self._per_instrument_writers:
-                key = (table, obj.instrument_id.value)  # type: ignore
+                instrument_key = (table, obj.instrument_id.value)  # type: ignore
                 instrument = self.cache.instrument(obj.instrument_id)  # type: ignore
-                if key not in self._instrument_writers and instrument is not None:
+                if instrument_key not in self._instrument_writers and instrument is not None:
                     self._create_instrument_writer(cls=cls, obj=obj)
             elif cls not in self.missing_writers:
                 self.logger.warning(f"Can't find writer for cls: {cls}")
@@ -388,45 +398,106 @@ class StreamingFeatherWriter:
             else:
                 return
 
+        key: str | tuple[str, str]
         if table in self._per_instrument_writers:
             key = (table, obj.instrument_id.value)  # type: ignore
-            if key in self._instrument_writers:
-                writer: RecordBatchStreamWriter = self._instrument_writers[key]
-            else:
+            if key not in self._instrument_writers:
                 return
+        elif table in self._writers:
+            key = table
         else:
-            writer: RecordBatchStreamWriter = self._writers[table]  # type: ignore
+            return
+
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = []
+            self._buffers[key] = buffer
+            self._buffer_classes[key] = cls
+        elif self._buffer_classes[key] is not cls:
+            # A single record batch must be serialized from one class
+            self._write_buffer(key)
+            buffer = []
+            self._buffers[key] = buffer
+            self._buffer_classes[key] = cls
+
+        buffer.append(obj)
+        if len(buffer) >= self.max_buffer_rows:
+            self._write_buffer(key)
+
+        self.check_flush()
+
+    def _write_buffer(self, key: str | tuple[str, str]) -> None:
+        """
+        Write the rows buffered for the given table key as a single record batch.
+
+        Parameters
+        ----------
+        key : str | tuple[str, str]
+            The table key (table name, or table name and instrument ID for
+            per-instrument tables).
 
-        serialized = ArrowSerializer.serialize_batch([obj], data_cls=cls)
-        if not serialized:
+        """
+        buffer = self._buffers.pop(key, None)
+        cls = self._buffer_classes.pop(key, None)
+        if not buffer or cls is None:
             return
+
+        if isinstance(key, tuple):
+            writer: RecordBatchStreamWriter | None = self._instrument_writers.get(key)
+        else:
+            writer = self._writers.get(key)
+        if writer is None:
+            return
+
         try:
+            serialized = ArrowSerializer.serialize_batch(buffer, data_cls=cls)
+            if not serialized:
+                return
             writer.write_table(serialized)
-            self._file_sizes[table] = self._file_sizes.get(table, 0) + serialized.nbytes
-            self.check_flush()
-            if self._check_file_rotation(table):
-                if table in self._per_instrument_writers:
-                    self._rotate_per_instrument_file(cls=cls, obj=obj)
+            self._file_sizes[key] = self._file_sizes.get(key, 0) + serialized.nbytes
+            if self._check_file_rotation(key):
+                if isinstance(key, tuple):
+                    self._rotate_per_instrument_file(cls=cls, obj=buffer[-1])
                 else:
-                    self._rotate_regular_file(table, cls)
+                    self._rotate_regular_file(key, cls)
         except Exception as e:
             self.logger.error(f"Failed to serialize {cls=}")
             self.logger.error(f"ERROR = `{e}`")
-            self.logger.debug(f"data = {obj}")
+            self.logger.debug(f"data = {buffer}")
+
+    def _write_buffers(self) -> None:
+        for key in tuple(self._buffers):
+            self._write_buffer(key)
+
+    @property
+    def buffered_rows(self) -> int:
+        """
+        Return the total count of rows buffered and not yet written to the streams.
+
+        Returns
+        -------
+        int
+
+        """
+        return sum(len(buffer) for buffer in self._buffers.values())
 
     def check_flush(self) -> None:
         """
         Flush all stream writers if current time greater than the next flush interval.
         """
-        now = self.clock.utc_now()
-        if (now - self._last_flush).total_seconds() * 1000 > self.flush_interval_ms:
-            self.flush()
-            self._last_flush = now
+        now_ns = self.clock.timestamp_ns()
+        if now_ns - self._last_flush_ns > self._flush_interval_ns:
+            self._flush()
+            self._last_flush_ns = now_ns
 
     def flush(self) -> None:
         """
-        Flush all stream writers.
+        Write all buffered rows and flush all stream writers.
         """
+        self._flush()
+
+    def _flush(self) -> None:
+        self._write_buffers()
         for stream in self._files.values():
             if not stream.closed:
                 stream.flush()
@@ -435,10 +506,13 @@ class StreamingFeatherWriter:
         """
         Flush and close all stream writers.
         """
-        self.flush()
+        self._flush()
         for wcls in tuple(self._writers):
             self._writers[wcls].close()
             del self._writers[wcls]
+        for key in tuple(self._instrument_writers):
+            self._instrument_writers[key].close()
+            del self._instrument_writers[key]
         for fcls in self._files:
             self._files[fcls].close()
 
@@ -492,3 +566,284 @@ class StreamingFeatherWriter:
 
         """
         return all(self._files[table_name].closed for table_name in self._files)
+
+
+class ThreadedStreamingFeatherWriter(StreamingFeatherWriter):
+    """
+    Provides a stream writer of Nautilus objects into feather files, with the Arrow
+    serialization and file I/O performed on a dedicated writer thread.
+
+    Objects passed to `write` are handed to a bounded queue, so that disk stalls do
+    not delay the calling (event loop) thread.
+
+    Parameters
+    ----------
+    path : str
+        The path to persist the stream to. Must be a directory.
+    cache : Cache
+        The cache for the query info.
+    clock : Clock
+        The clock to use for time-related operations.
+    fs_protocol : str, default 'file'
+        The `fsspec` file system protocol.
+    flush_interval_ms : int, optional
+        The flush interval (milliseconds) for writing chunks.
+    max_buffer_rows : int, default 1
+        The maximum number of rows buffered per table before they are written to
+        the stream as a single record batch. The default of 1 writes every object immediately.
+    replace : bool, default False
+        If existing files at the given `path` should be replaced.
+    include_types : list[type], optional
+        A list of Arrow serializable types to write.
+        If this is specified then **only** the included types will be written.
+    rotation_mode : RotationMode, default `RotationMode.NO_ROTATION`
+        The mode for file rotation.
+    max_file_size : int, default 1GB
+        The maximum file size in bytes before rotation (for `SIZE` mode).
+    rotation_interval : pd.Timedelta, default 1 day
+        The time interval for file rotation (for `INTERVAL` mode and `SCHEDULED_DATES` mode).
+    rotation_time : datetime.time, default 00:00
+        The time of day for file rotation (for `SCHEDULED_DATES` mode).
+    rotation_timezone : str, default 'UTC'
+        The timezone for rotation calculations(for `SCHEDULED_DATES` mode).
+    queue_size : int, default 100_000
+        The maximum number of objects waiting to be written.
+    overflow_policy : QueueOverflowPolicy, default `QueueOverflowPolicy.BLOCK`
+        The policy when the queue is full: block the caller, drop the newest
+        object, or drop the oldest queued object. Pending flush and close
+        requests are never dropped.
+    fsync_interval_ms : int, optional
+        The interval (milliseconds) between flushing and `fsync` of the files
+        to disk. If ``None`` then files are only synced on an explicit flush or close.
+
+    Raises
+    ------
+    ValueError
+        If `queue_size` is not positive (> 0).
+    ValueError
+        If `fsync_interval_ms` is not positive (> 0).
+
+    """
+
+    _FLUSH = object()
+    _STOP = object()
+
+    def __init__(
+        self,
+        path: str,
+        cache: Cache,
+        clock: Clock,
+        fs_protocol: str | None = "file",
+        flush_interval_ms: int | None = None,
+        max_buffer_rows: int = 1,
+        replace: bool = False,
+        include_types: list[type] | None = None,
+        rotation_mode: RotationMode = RotationMode.NO_ROTATION,
+        max_file_size: int = 1024 * 1024 * 1024,  # 1GB
+        rotation_interval: pd.Timedelta = pd.Timedelta(days=1),
+        rotation_time: dt.time = dt.time(0, 0, 0, 0),
+        rotation_timezone: str = "UTC",
+        queue_size: int = 100_000,
+        overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+        fsync_interval_ms: int | None = None,
+    ) -> None:
+        PyCondition.positive_int(queue_size, "queue_size")
+        if fsync_interval_ms is not None:
+            PyCondition.positive_int(fsync_interval_ms, "fsync_interval_ms")
+
+        super().__init__(
+            path=path,
+            cache=cache,
+            clock=clock,
+            fs_protocol=fs_protocol,
+            flush_interval_ms=flush_interval_ms,
+            max_buffer_rows=max_buffer_rows,
+            replace=replace,
+            include_types=include_types,
+            rotation_mode=rotation_mode,
+            max_file_size=max_file_size,
+            rotation_interval=rotation_interval,
+            rotation_time=rotation_time,
+            rotation_timezone=rotation_timezone,
+        )
+
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.fsync_interval_ms = fsync_interval_ms
+        self._fsync_interval_ns = fsync_interval_ms * 1_000_000 if fsync_interval_ms else 0
+        self._last_fsync_ns = time.monotonic_ns()
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+
+        # Metrics
+        self.dropped_count = 0
+        self.write_count = 0
+        self.max_queue_depth = 0
+        self._total_write_latency_ns = 0
+        self.max_write_latency_ns = 0
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name=type(self).__name__,
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Return the current count of objects waiting to be written.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._queue.qsize()
+
+    @property
+    def avg_write_latency_ns(self) -> float:
+        """
+        Return the average serialization and write latency (nanoseconds) per object.
+
+        Returns
+        -------
+        float
+
+        """
+        if self.write_count == 0:
+            return 0.0
+        return self._total_write_latency_ns / self.write_count
+
+    def get_metrics(self) -> dict[str, int | float]:
+        """
+        Get the queue and write latency metrics for the writer.
+
+        Returns
+        -------
+        dict[str, int | float]
+
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "dropped_count": self.dropped_count,
+            "write_count": self.write_count,
+            "avg_write_latency_ns": self.avg_write_latency_ns,
+            "max_write_latency_ns": self.max_write_latency_ns,
+        }
+
+    def write(self, obj: object) -> None:
+        """
+        Queue the object to be written to the stream on the writer thread.
+
+        Parameters
+        ----------
+        obj : object
+            The object to write.
+
+        Raises
+        ------
+        ValueError
+            If `obj` is ``None``.
+
+        """
+        PyCondition.not_none(obj, "obj")
+
+        if self.overflow_policy == QueueOverflowPolicy.BLOCK:
+            self._queue.put(obj)
+        else:
+            try:
+                self._queue.put_nowait(obj)
+            except queue.Full:
+                self.dropped_count += 1
+                if self.overflow_policy == QueueOverflowPolicy.DROP_NEWEST:
+                    return
+                if not self._drop_oldest():
+                    return  # Only flush or stop requests queued, drop the newest
+                self._queue.put(obj)
+
+        depth = self._queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+    def _drop_oldest(self) -> bool:
+        # Flush and stop requests must never be dropped (otherwise `flush` would
+        # return without flushing and `close` would never return), so these are
+        # requeued behind the objects still waiting to be written.
+        for _ in range(self._queue.qsize()):
+            try:
+                oldest = self._queue.get_nowait()
+            except queue.Empty:
+                return True  # Writer thread has drained the queue
+            if oldest is self._FLUSH or oldest is self._STOP:
+                self._queue.put(oldest)
+                self._queue.task_done()
+                continue
+            self._queue.task_done()
+            return True
+
+        return False
+
+    def flush(self) -> None:
+        """
+        Wait for all queued objects to be written, then flush and sync all stream
+        writers.
+        """
+        if not self._thread.is_alive():
+            self._flush()
+            return
+
+        self._queue.put(self._FLUSH)
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Wait for all queued objects to be written, stop the writer thread, then flush
+        and close all stream writers.
+        """
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+
+        super().close()
+        self.logger.info(f"Closed with metrics {self.get_metrics()}")
+
+    def _run(self) -> None:
+        while True:
+            obj = self._queue.get()
+            try:
+                if obj is self._STOP:
+                    return
+                elif obj is self._FLUSH:
+                    self._flush()
+                    self._fsync()
+                    continue
+
+                start_ns = time.perf_counter_ns()
+                StreamingFeatherWriter.write(self, obj)
+                latency_ns = time.perf_counter_ns() - start_ns
+
+                self.write_count += 1
+                self._total_write_latency_ns += latency_ns
+                if latency_ns > self.max_write_latency_ns:
+                    self.max_write_latency_ns = latency_ns
+
+                if self._fsync_interval_ns:
+                    now_ns = time.monotonic_ns()
+                    if now_ns - self._last_fsync_ns >= self._fsync_interval_ns:
+                        self._flush()
+                        self._fsync()
+                        self._last_fsync_ns = now_ns
+            except Exception as e:
+                self.logger.error(f"Error on writer thread: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _fsync(self) -> None:
+        for stream in self._files.values():
+            if stream.closed:
+                continue
+            try:
+                os.fsync(stream.fileno())
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                pass  # File system does not support `fsync` (e.g. memory or remote)
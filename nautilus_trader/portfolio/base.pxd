@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.accounting.accounts.base cimport Account
+from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.objects cimport Money
@@ -47,3 +48,6 @@ cdef class PortfolioFacade:
     cpdef bint is_net_short(self, InstrumentId instrument_id)
     cpdef bint is_flat(self, InstrumentId instrument_id)
     cpdef bint is_completely_flat(self)
+
+    cpdef object position_aggregate(self, InstrumentId instrument_id, AccountId account_id=*)
+    cpdef dict position_aggregates(self, AccountId account_id)
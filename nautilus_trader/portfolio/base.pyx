@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.accounting.accounts.base cimport Account
+from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.objects cimport Money
@@ -85,3 +86,11 @@ cdef class PortfolioFacade:
     cpdef bint is_completely_flat(self):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `is_completely_flat` must be implemented in the subclass")  # pragma: no cover
+
+    cpdef object position_aggregate(self, InstrumentId instrument_id, AccountId account_id = None):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `position_aggregate` must be implemented in the subclass")  # pragma: no cover
+
+    cpdef dict position_aggregates(self, AccountId account_id):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `position_aggregates` must be implemented in the subclass")  # pragma: no cover
@@ -20,19 +20,55 @@ from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.core.rust.model cimport OrderSide
+from nautilus_trader.core.rust.model cimport PositionSide
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderEvent
 from nautilus_trader.model.events.position cimport PositionEvent
+from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.objects cimport Currency
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
 
+cdef class PositionAggregate:
+    cdef double _multiplier
+    cdef dict[PositionId, tuple] _positions
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the aggregate.\n\n:returns: `InstrumentId`"""
+    cdef readonly Currency quote_currency
+    """The instrument quote currency.\n\n:returns: `Currency`"""
+    cdef readonly bint is_inverse
+    """If the instrument is inverse.\n\n:returns: `bool`"""
+    cdef readonly double long_qty
+    """The total quantity of the open long positions.\n\n:returns: `double`"""
+    cdef readonly double short_qty
+    """The total quantity of the open short positions.\n\n:returns: `double`"""
+    cdef readonly double long_value
+    """The total open value of the long positions (quantity weighted by open price, or by inverse open price for inverse instruments).\n\n:returns: `double`"""
+    cdef readonly double short_value
+    """The total open value of the short positions (quantity weighted by open price, or by inverse open price for inverse instruments).\n\n:returns: `double`"""
+
+    cpdef void update(self, PositionId position_id, PositionSide side, double quantity, double avg_px_open)
+    cpdef void clear(self)
+    cpdef bint is_flat(self)
+    cpdef double net_qty(self)
+    cpdef double quantity(self, PositionSide side)
+    cpdef double avg_px_open(self, PositionSide side)
+    cpdef double unrealized_pnl(self, PositionSide side, double last)
+    cpdef double notional_value(self, PositionSide side, double last)
+    cpdef double net_open_notional(self)
+
+    cdef void _apply(self, PositionSide side, double quantity, double value)
+
+
 cdef class Portfolio(PortfolioFacade):
     cdef Clock _clock
     cdef Logger _log
@@ -44,6 +80,8 @@ cdef class Portfolio(PortfolioFacade):
     cdef dict[InstrumentId, Money] _unrealized_pnls
     cdef dict[InstrumentId, Money] _realized_pnls
     cdef dict[InstrumentId, Decimal] _net_positions
+    cdef dict[InstrumentId, PositionAggregate] _aggregates
+    cdef dict[AccountId, dict] _account_aggregates
     cdef set[InstrumentId] _pending_calcs
 
 # -- COMMANDS -------------------------------------------------------------------------------------
@@ -60,7 +98,9 @@ cdef class Portfolio(PortfolioFacade):
 
     cdef object _net_position(self, InstrumentId instrument_id)
     cdef void _update_net_position(self, InstrumentId instrument_id, list positions_open)
+    cdef PositionAggregate _get_aggregate(self, Instrument instrument)
+    cdef dict _get_account_aggregates(self, AccountId account_id)
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id)
     cdef Money _calculate_realized_pnl(self, InstrumentId instrument_id)
-    cdef Price _get_last_price(self, Position position)
+    cdef Price _get_last_price(self, InstrumentId instrument_id, PositionSide side)
     cdef double _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side)
@@ -51,9 +51,12 @@ from nautilus_trader.model.events.order cimport OrderEvent
 from nautilus_trader.model.events.order cimport OrderFilled
 from nautilus_trader.model.events.order cimport OrderRejected
 from nautilus_trader.model.events.order cimport OrderUpdated
+from nautilus_trader.model.events.position cimport PositionClosed
 from nautilus_trader.model.events.position cimport PositionEvent
 from nautilus_trader.model.functions cimport position_side_to_str
+from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Currency
@@ -72,6 +75,248 @@ cdef tuple _UPDATE_ORDER_EVENTS = (
 )
 
 
+cdef class PositionAggregate:
+    """
+    Provides running aggregates of the open positions for a single instrument.
+
+    Long and short positions are aggregated separately (they are marked against
+    opposite sides of the market), so that the unrealized PnL and notional value
+    of all open positions are O(1) functions of the latest prices.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the aggregate.
+
+    """
+
+    def __init__(self, Instrument instrument not None) -> None:
+        self._multiplier = instrument.multiplier.as_f64_c()
+        self._positions: dict[PositionId, tuple] = {}
+
+        self.instrument_id = instrument.id
+        self.quote_currency = instrument.quote_currency
+        self.is_inverse = instrument.is_inverse
+        self.long_qty = 0.0
+        self.short_qty = 0.0
+        self.long_value = 0.0
+        self.short_value = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument_id}, "
+            f"long_qty={self.long_qty}, "
+            f"short_qty={self.short_qty})"
+        )
+
+    cpdef void update(
+        self,
+        PositionId position_id,
+        PositionSide side,
+        double quantity,
+        double avg_px_open,
+    ):
+        """
+        Update the aggregate with the given position state.
+
+        Any previous state for the position is replaced, so applying the same
+        state more than once has no further effect. A flat position is removed.
+
+        Parameters
+        ----------
+        position_id : PositionId
+            The position ID for the update.
+        side : PositionSide {``FLAT``, ``LONG``, ``SHORT``}
+            The current position side.
+        quantity : double
+            The current position quantity.
+        avg_px_open : double
+            The current position average open price.
+
+        """
+        cdef PositionSide prior_side
+        cdef tuple prior = self._positions.pop(position_id, None)
+        if prior is not None:
+            prior_side = prior[0]
+            self._apply(prior_side, -prior[1], -prior[2])
+
+        if not self._positions:
+            # Reset to exact zero to avoid accumulating floating point error
+            self.clear()
+
+        if side == PositionSide.FLAT or quantity == 0.0:
+            return  # Nothing further to aggregate
+
+        cdef double value
+        if self.is_inverse:
+            value = quantity / avg_px_open
+        else:
+            value = quantity * avg_px_open
+
+        self._positions[position_id] = (side, quantity, value)
+        self._apply(side, quantity, value)
+
+    cpdef void clear(self):
+        """
+        Clear all positions from the aggregate.
+
+        """
+        self._positions.clear()
+        self.long_qty = 0.0
+        self.short_qty = 0.0
+        self.long_value = 0.0
+        self.short_value = 0.0
+
+    cpdef bint is_flat(self):
+        """
+        Return whether there are no open positions in the aggregate.
+
+        Returns
+        -------
+        bool
+
+        """
+        return not self._positions
+
+    cpdef double net_qty(self):
+        """
+        Return the net (signed) quantity of the open positions.
+
+        Returns
+        -------
+        double
+
+        """
+        return self.long_qty - self.short_qty
+
+    cpdef double quantity(self, PositionSide side):
+        """
+        Return the total quantity of the open positions for the given side.
+
+        Parameters
+        ----------
+        side : PositionSide {``LONG``, ``SHORT``}
+            The position side.
+
+        Returns
+        -------
+        double
+
+        """
+        if side == PositionSide.LONG:
+            return self.long_qty
+        elif side == PositionSide.SHORT:
+            return self.short_qty
+        else:
+            return 0.0
+
+    cpdef double avg_px_open(self, PositionSide side):
+        """
+        Return the average open price of the open positions for the given side.
+
+        Parameters
+        ----------
+        side : PositionSide {``LONG``, ``SHORT``}
+            The position side.
+
+        Returns
+        -------
+        double
+            Zero if there are no open positions for the side.
+
+        """
+        cdef double quantity = self.quantity(side)
+        if quantity == 0.0:
+            return 0.0
+
+        cdef double value = self.long_value if side == PositionSide.LONG else self.short_value
+        if self.is_inverse:
+            return quantity / value
+        else:
+            return value / quantity
+
+    cpdef double unrealized_pnl(self, PositionSide side, double last):
+        """
+        Return the unrealized PnL of the open positions for the given side.
+
+        Result will be in quote currency for standard instruments, or base
+        currency for inverse instruments.
+
+        Parameters
+        ----------
+        side : PositionSide {``LONG``, ``SHORT``}
+            The position side.
+        last : double
+            The last price to mark the positions against.
+
+        Returns
+        -------
+        double
+
+        """
+        if side == PositionSide.LONG:
+            if self.is_inverse:
+                return self._multiplier * (self.long_value - self.long_qty / last)
+            return self._multiplier * (self.long_qty * last - self.long_value)
+        elif side == PositionSide.SHORT:
+            if self.is_inverse:
+                return self._multiplier * (self.short_qty / last - self.short_value)
+            return self._multiplier * (self.short_value - self.short_qty * last)
+        else:
+            return 0.0
+
+    cpdef double notional_value(self, PositionSide side, double last):
+        """
+        Return the notional value of the open positions for the given side.
+
+        Result will be in quote currency for standard instruments, or base
+        currency for inverse instruments.
+
+        Parameters
+        ----------
+        side : PositionSide {``LONG``, ``SHORT``}
+            The position side.
+        last : double
+            The last price for the calculation.
+
+        Returns
+        -------
+        double
+
+        """
+        cdef double quantity = self.quantity(side)
+        if self.is_inverse:
+            return quantity * self._multiplier * (1.0 / last)
+        else:
+            return quantity * self._multiplier * last
+
+    cpdef double net_open_notional(self):
+        """
+        Return the net (signed) notional value of the open positions at their open prices.
+
+        Result will be in quote currency (for inverse instruments the notional
+        is the quantity multiplied by the multiplier).
+
+        Returns
+        -------
+        double
+
+        """
+        if self.is_inverse:
+            return self._multiplier * (self.long_qty - self.short_qty)
+        else:
+            return self._multiplier * (self.long_value - self.short_value)
+
+    cdef void _apply(self, PositionSide side, double quantity, double value):
+        if side == PositionSide.LONG:
+            self.long_qty += quantity
+            self.long_value += value
+        elif side == PositionSide.SHORT:
+            self.short_qty += quantity
+            self.short_value += value
+
+
 cdef class Portfolio(PortfolioFacade):
     """
     Provides a trading portfolio.
@@ -109,6 +354,8 @@ cdef class Portfolio(PortfolioFacade):
         self._unrealized_pnls: dict[InstrumentId, Money] = {}
         self._realized_pnls: dict[InstrumentId, Money] = {}
         self._net_positions: dict[InstrumentId, Decimal] = {}
+        self._aggregates: dict[InstrumentId, PositionAggregate] = {}
+        self._account_aggregates: dict[AccountId, dict[InstrumentId, PositionAggregate]] = {}
         self._pending_calcs: set[InstrumentId] = set()
 
         self.analyzer = PortfolioAnalyzer()
@@ -228,6 +475,8 @@ cdef class Portfolio(PortfolioFacade):
         # Clean slate
         self._unrealized_pnls.clear()
         self._realized_pnls.clear()
+        self._aggregates.clear()
+        self._account_aggregates.clear()
 
         cdef list all_positions_open = self._cache.positions_open()
 
@@ -510,6 +759,28 @@ cdef class Portfolio(PortfolioFacade):
             positions_open=positions_open
         )
 
+        cdef Instrument instrument = self._cache.instrument(event.instrument_id)
+        cdef dict account_aggregates
+        cdef PositionAggregate account_aggregate
+        if instrument is not None:
+            self._get_aggregate(instrument).update(
+                position_id=event.position_id,
+                side=event.side,
+                quantity=event.quantity.as_f64_c(),
+                avg_px_open=event.avg_px_open,
+            )
+            account_aggregates = self._get_account_aggregates(event.account_id)
+            account_aggregate = account_aggregates.get(instrument.id)
+            if account_aggregate is None:
+                account_aggregate = PositionAggregate(instrument)
+                account_aggregates[instrument.id] = account_aggregate
+            account_aggregate.update(
+                position_id=event.position_id,
+                side=event.side,
+                quantity=event.quantity.as_f64_c(),
+                avg_px_open=event.avg_px_open,
+            )
+
         self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
             instrument_id=event.instrument_id,
         )
@@ -517,6 +788,9 @@ cdef class Portfolio(PortfolioFacade):
             instrument_id=event.instrument_id,
         )
 
+        if isinstance(event, PositionClosed) and event.realized_pnl is not None:
+            self.analyzer.update_running_statistics(event.realized_pnl, event.realized_return)
+
         cdef Account account = self._cache.account(event.account_id)
         if account is None:
             self._log.error(
@@ -528,7 +802,6 @@ cdef class Portfolio(PortfolioFacade):
         if account.type != AccountType.MARGIN or not account.calculate_account_state:
             return  # Nothing to calculate
 
-        cdef Instrument instrument = self._cache.instrument(event.instrument_id)
         if instrument is None:
             self._log.error(
                 f"Cannot update position: "
@@ -545,6 +818,8 @@ cdef class Portfolio(PortfolioFacade):
 
     def _reset(self) -> None:
         self._net_positions.clear()
+        self._aggregates.clear()
+        self._account_aggregates.clear()
         self._unrealized_pnls.clear()
         self._realized_pnls.clear()
         self._pending_calcs.clear()
@@ -706,18 +981,15 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(venue, "venue")
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
-            return {}  # Nothing to calculate
-
-        cdef set[InstrumentId] instrument_ids = {p.instrument_id for p in positions_open}
-
         cdef dict[Currency, double] unrealized_pnls = {}  # type: dict[Currency, 0.0]
 
         cdef:
             InstrumentId instrument_id
+            PositionAggregate aggregate
             Money pnl
-        for instrument_id in instrument_ids:
+        for instrument_id, aggregate in self._aggregates.items():
+            if instrument_id.venue != venue or aggregate.is_flat():
+                continue  # Nothing to calculate
             pnl = self._unrealized_pnls.get(instrument_id)
             if pnl is not None:
                 # PnL already calculated
@@ -796,52 +1068,26 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
-            return {}  # Nothing to calculate
-
         cdef dict net_exposures = {}  # type: dict[Currency, float]
 
         cdef:
-            Position position
+            InstrumentId instrument_id
+            PositionAggregate aggregate
             Instrument instrument
+            PositionSide side
             Price last
             Currency settlement_currency
             double xrate
-        for position in positions_open:
-            instrument = self._cache.instrument(position.instrument_id)
-            if instrument is None:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"no instrument for {position.instrument_id}"
-                )
-                return None  # Cannot calculate
-
-            if position.side == PositionSide.FLAT:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"position is flat for {position.instrument_id}"
-                )
+            double net_exposure
+        for instrument_id, aggregate in self._aggregates.items():
+            if instrument_id.venue != venue or aggregate.is_flat():
                 continue  # Nothing to calculate
 
-            last = self._get_last_price(position)
-            if last is None:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"no prices for {position.instrument_id}"
-                )
-                continue  # Cannot calculate
-
-            xrate = self._calculate_xrate_to_base(
-                instrument=instrument,
-                account=account,
-                side=position.entry,
-            )
-
-            if xrate == 0.0:
+            instrument = self._cache.instrument(instrument_id)
+            if instrument is None:
                 self._log.error(
                     f"Cannot calculate net exposures: "
-                    f"insufficient data for {instrument.get_settlement_currency()}/{account.base_currency}"
+                    f"no instrument for {instrument_id}"
                 )
                 return None  # Cannot calculate
 
@@ -850,16 +1096,35 @@ cdef class Portfolio(PortfolioFacade):
             else:
                 settlement_currency = instrument.get_settlement_currency()
 
-            net_exposure = instrument.notional_value(
-                position.quantity,
-                last,
-            ).as_f64_c()
-            net_exposure = round(net_exposure * xrate, settlement_currency._mem.precision)
+            for side in (PositionSide.LONG, PositionSide.SHORT):
+                if aggregate.quantity(side) == 0.0:
+                    continue  # Nothing to calculate
+
+                last = self._get_last_price(instrument_id, side)
+                if last is None:
+                    self._log.error(
+                        f"Cannot calculate net exposures: "
+                        f"no prices for {instrument_id}"
+                    )
+                    continue  # Cannot calculate
+
+                xrate = self._calculate_xrate_to_base(
+                    instrument=instrument,
+                    account=account,
+                    side=OrderSide.BUY if side == PositionSide.LONG else OrderSide.SELL,
+                )
+
+                if xrate == 0.0:
+                    self._log.error(
+                        f"Cannot calculate net exposures: "
+                        f"insufficient data for {instrument.get_settlement_currency()}/{account.base_currency}"
+                    )
+                    return None  # Cannot calculate
 
-            total_net_exposure = net_exposures.get(settlement_currency, 0.0)
-            total_net_exposure += net_exposure
+                net_exposure = aggregate.notional_value(side, last.as_f64_c())
+                net_exposure = round(net_exposure * xrate, settlement_currency._mem.precision)
 
-            net_exposures[settlement_currency] = total_net_exposure
+                net_exposures[settlement_currency] = net_exposures.get(settlement_currency, 0.0) + net_exposure
 
         return {k: Money(v, k) for k, v in net_exposures.items()}
 
@@ -937,7 +1202,7 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
-        cdef instrument = self._cache.instrument(instrument_id)
+        cdef Instrument instrument = self._cache.instrument(instrument_id)
         if instrument is None:
             self._log.error(
                 f"Cannot calculate net exposure: "
@@ -945,33 +1210,32 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
-        cdef list positions_open = self._cache.positions_open(
-            venue=None,  # Faster query filtering
-            instrument_id=instrument_id,
-        )
-        if not positions_open:
+        cdef PositionAggregate aggregate = self._get_aggregate(instrument)
+        if aggregate.is_flat():
             return Money(0, instrument.get_settlement_currency())
 
         cdef double net_exposure = 0.0
 
         cdef:
-            Position position
+            PositionSide side
             Price last
             double xrate
-            Money notional_value
-        for position in positions_open:
-            last = self._get_last_price(position)
+        for side in (PositionSide.LONG, PositionSide.SHORT):
+            if aggregate.quantity(side) == 0.0:
+                continue  # Nothing to calculate
+
+            last = self._get_last_price(instrument_id, side)
             if last is None:
                 self._log.error(
                     f"Cannot calculate net exposure: "
-                    f"no prices for {position.instrument_id}"
+                    f"no prices for {instrument_id}"
                 )
                 continue  # Cannot calculate
 
             xrate = self._calculate_xrate_to_base(
                 instrument=instrument,
                 account=account,
-                side=position.entry,
+                side=OrderSide.BUY if side == PositionSide.LONG else OrderSide.SELL,
             )
 
             if xrate == 0.0:
@@ -981,11 +1245,7 @@ cdef class Portfolio(PortfolioFacade):
                 )
                 return None  # Cannot calculate
 
-            notional_value = instrument.notional_value(
-                position.quantity,
-                last,
-            )
-            net_exposure += notional_value.as_f64_c() * xrate
+            net_exposure += aggregate.notional_value(side, last.as_f64_c()) * xrate
 
         if account.base_currency is not None:
             return Money(net_exposure, account.base_currency)
@@ -1087,6 +1347,61 @@ cdef class Portfolio(PortfolioFacade):
 
         return True
 
+    cpdef object position_aggregate(self, InstrumentId instrument_id, AccountId account_id = None):
+        """
+        Return the aggregate of the open positions for the given instrument ID.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument for the query.
+        account_id : AccountId, optional
+            The account query filter (if ``None`` then aggregates across all accounts).
+
+        Returns
+        -------
+        PositionAggregate or ``None``
+            ``None`` if no instrument is found.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        cdef Instrument instrument = self._cache.instrument(instrument_id)
+        if instrument is None:
+            return None
+
+        if account_id is None:
+            return self._get_aggregate(instrument)
+
+        cdef dict account_aggregates = self._get_account_aggregates(account_id)
+        cdef PositionAggregate aggregate = account_aggregates.get(instrument_id)
+        if aggregate is None:
+            aggregate = PositionAggregate(instrument)
+            account_aggregates[instrument_id] = aggregate
+
+        return aggregate
+
+    cpdef dict position_aggregates(self, AccountId account_id):
+        """
+        Return the aggregates of the open positions for the given account ID.
+
+        The aggregates are maintained from position events, and should be
+        treated as read-only.
+
+        Parameters
+        ----------
+        account_id : AccountId
+            The account for the query.
+
+        Returns
+        -------
+        dict[InstrumentId, PositionAggregate]
+
+        """
+        Condition.not_none(account_id, "account_id")
+
+        return self._get_account_aggregates(account_id)
+
 # -- INTERNAL -------------------------------------------------------------------------------------
 
     cdef object _net_position(self, InstrumentId instrument_id):
@@ -1127,28 +1442,22 @@ cdef class Portfolio(PortfolioFacade):
         else:
             currency = instrument.get_settlement_currency()
 
-        cdef list positions_open = self._cache.positions_open(
-            venue=None,  # Faster query filtering
-            instrument_id=instrument_id,
-        )
-        if not positions_open:
+        cdef PositionAggregate aggregate = self._get_aggregate(instrument)
+        if aggregate.is_flat():
             return Money(0, currency)
 
         cdef double total_pnl = 0.0
 
         cdef:
-            Position position
+            PositionSide side
             Price last
             double pnl
             double xrate
-        for position in positions_open:
-            if position.instrument_id != instrument_id:
+        for side in (PositionSide.LONG, PositionSide.SHORT):
+            if aggregate.quantity(side) == 0.0:
                 continue  # Nothing to calculate
 
-            if position.side == PositionSide.FLAT:
-                continue  # Nothing to calculate
-
-            last = self._get_last_price(position)
+            last = self._get_last_price(instrument_id, side)
             if last is None:
                 self._log.debug(
                     f"Cannot calculate unrealized PnL: no prices for {instrument_id}"
@@ -1156,13 +1465,13 @@ cdef class Portfolio(PortfolioFacade):
                 self._pending_calcs.add(instrument.id)
                 return None  # Cannot calculate
 
-            pnl = position.unrealized_pnl(last).as_f64_c()
+            pnl = aggregate.unrealized_pnl(side, last.as_f64_c())
 
             if account.base_currency is not None:
                 xrate = self._calculate_xrate_to_base(
                     instrument=instrument,
                     account=account,
-                    side=position.entry,
+                    side=OrderSide.BUY if side == PositionSide.LONG else OrderSide.SELL,
                 )
 
                 if xrate == 0.0:
@@ -1246,23 +1555,82 @@ cdef class Portfolio(PortfolioFacade):
 
         return Money(total_pnl, currency)
 
-    cdef Price _get_last_price(self, Position position):
+    cdef PositionAggregate _get_aggregate(self, Instrument instrument):
+        cdef PositionAggregate aggregate = self._aggregates.get(instrument.id)
+        if aggregate is not None:
+            return aggregate
+
+        # Build the aggregate from the cached open positions (maintained from position events thereafter)
+        aggregate = PositionAggregate(instrument)
+
+        cdef list positions_open = self._cache.positions_open(
+            venue=None,  # Faster query filtering
+            instrument_id=instrument.id,
+        )
+
+        cdef Position position
+        for position in positions_open:
+            aggregate.update(
+                position_id=position.id,
+                side=position.side,
+                quantity=position.quantity.as_f64_c(),
+                avg_px_open=position.avg_px_open,
+            )
+
+        self._aggregates[instrument.id] = aggregate
+        return aggregate
+
+    cdef dict _get_account_aggregates(self, AccountId account_id):
+        cdef dict aggregates = self._account_aggregates.get(account_id)
+        if aggregates is not None:
+            return aggregates
+
+        # Build the aggregates from the cached open positions (maintained from position events thereafter)
+        aggregates = {}
+
+        cdef:
+            Position position
+            Instrument instrument
+            PositionAggregate aggregate
+        for position in self._cache.positions_open():
+            if position.account_id != account_id:
+                continue
+
+            aggregate = aggregates.get(position.instrument_id)
+            if aggregate is None:
+                instrument = self._cache.instrument(position.instrument_id)
+                if instrument is None:
+                    continue  # Cannot aggregate
+
+                aggregate = PositionAggregate(instrument)
+                aggregates[position.instrument_id] = aggregate
+
+            aggregate.update(
+                position_id=position.id,
+                side=position.side,
+                quantity=position.quantity.as_f64_c(),
+                avg_px_open=position.avg_px_open,
+            )
+
+        self._account_aggregates[account_id] = aggregates
+        return aggregates
+
+    cdef Price _get_last_price(self, InstrumentId instrument_id, PositionSide side):
         cdef PriceType price_type
-        if position.side == PositionSide.LONG:
+        if side == PositionSide.LONG:
             price_type = PriceType.BID
-        elif position.side == PositionSide.SHORT:
+        elif side == PositionSide.SHORT:
             price_type = PriceType.ASK
         else:  # pragma: no cover (design-time error)
             raise RuntimeError(
-                f"invalid `PositionSide`, was {position_side_to_str(position.side)}",
+                f"invalid `PositionSide`, was {position_side_to_str(side)}",
             )
 
-        cdef Price price
         return self._cache.price(
-            instrument_id=position.instrument_id,
+            instrument_id=instrument_id,
             price_type=price_type,
         ) or self._cache.price(
-            instrument_id=position.instrument_id,
+            instrument_id=instrument_id,
             price_type=PriceType.LAST,
         )
 
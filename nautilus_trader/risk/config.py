@@ -33,6 +33,14 @@ class RiskEngineConfig(NautilusConfig, frozen=True):
     max_notional_per_order : dict[str, int], default empty dict
         The maximum notional value of an order per instrument ID.
         The value should be a valid decimal format.
+    max_exposure_per_instrument : dict[str, int], default empty dict
+        The maximum projected net notional exposure per instrument ID (in the
+        instrument quote currency), checked for orders on margin accounts.
+        The value should be a valid decimal format.
+    max_exposure_per_account : dict[str, int], default empty dict
+        The maximum projected total net notional exposure per account ID
+        (summed per quote currency), checked for orders on margin accounts.
+        The value should be a valid decimal format.
     debug : bool, default False
         If debug mode is active (will provide extra debug logging).
 
@@ -42,4 +50,6 @@ class RiskEngineConfig(NautilusConfig, frozen=True):
     max_order_submit_rate: str = "100/00:00:01"
     max_order_modify_rate: str = "100/00:00:01"
     max_notional_per_order: dict[str, int] = {}
+    max_exposure_per_instrument: dict[str, int] = {}
+    max_exposure_per_account: dict[str, int] = {}
     debug: bool = False
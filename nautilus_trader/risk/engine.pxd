@@ -15,11 +15,17 @@
 
 from decimal import Decimal
 
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.accounting.accounts.margin cimport MarginAccount
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport Throttler
 from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
+from nautilus_trader.core.rust.model cimport OmsType
 from nautilus_trader.core.rust.model cimport TradingState
 from nautilus_trader.execution.messages cimport CancelAllOrders
 from nautilus_trader.execution.messages cimport CancelOrder
@@ -27,19 +33,63 @@ from nautilus_trader.execution.messages cimport ModifyOrder
 from nautilus_trader.execution.messages cimport SubmitOrder
 from nautilus_trader.execution.messages cimport SubmitOrderList
 from nautilus_trader.execution.messages cimport TradingCommand
+from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.portfolio.base cimport PortfolioFacade
+from nautilus_trader.trading.strategy cimport Strategy
+
+
+cdef class InstrumentRiskLimits:
+    cdef readonly Instrument instrument
+    """The instrument the limits were compiled from.\n\n:returns: `Instrument`"""
+    cdef readonly uint8_t price_precision
+    """The maximum price precision.\n\n:returns: `uint8`"""
+    cdef readonly uint8_t size_precision
+    """The maximum size precision.\n\n:returns: `uint8`"""
+    cdef readonly bint check_price_positive
+    """If prices must be positive (not the case for options).\n\n:returns: `bool`"""
+    cdef readonly uint64_t max_quantity_raw
+    """The raw maximum order quantity (zero if unlimited).\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t min_quantity_raw
+    """The raw minimum order quantity (zero if unlimited).\n\n:returns: `uint64_t`"""
+    cdef readonly bint has_max_notional_per_order
+    """If a maximum notional per order is set.\n\n:returns: `bool`"""
+    cdef readonly int64_t max_notional_per_order_raw
+    """The raw maximum notional per order in the quote currency.\n\n:returns: `int64_t`"""
+    cdef readonly Money max_notional_per_order
+    """The maximum notional per order in the quote currency.\n\n:returns: `Money` or ``None``"""
+    cdef readonly bint has_min_notional
+    """If the instrument minimum notional applies.\n\n:returns: `bool`"""
+    cdef readonly int64_t min_notional_raw
+    """The raw instrument minimum notional in the quote currency.\n\n:returns: `int64_t`"""
+    cdef readonly bint has_max_notional
+    """If the instrument maximum notional applies.\n\n:returns: `bool`"""
+    cdef readonly int64_t max_notional_raw
+    """The raw instrument maximum notional in the quote currency.\n\n:returns: `int64_t`"""
+    cdef readonly bint has_max_exposure
+    """If a maximum exposure for the instrument is set.\n\n:returns: `bool`"""
+    cdef readonly double max_exposure
+    """The maximum exposure for the instrument in the quote currency.\n\n:returns: `double`"""
 
 
 cdef class RiskEngine(Component):
     cdef readonly PortfolioFacade _portfolio
     cdef readonly Cache _cache
     cdef readonly dict _max_notional_per_order
+    cdef readonly dict _max_exposure_per_instrument
+    cdef readonly dict _max_exposure_per_account
+    cdef dict _account_exposure_limits
+    cdef dict _risk_limits
+    cdef dict _oms_overrides
+    cdef dict _venue_oms_types
     cdef readonly Throttler _order_submit_throttler
     cdef readonly Throttler _order_modify_throttler
 
@@ -60,6 +110,10 @@ cdef class RiskEngine(Component):
     cpdef void process(self, Event event)
     cpdef void set_trading_state(self, TradingState state)
     cpdef void set_max_notional_per_order(self, InstrumentId instrument_id, new_value: Decimal)
+    cpdef void set_max_exposure_per_instrument(self, InstrumentId instrument_id, new_value: Decimal)
+    cpdef void set_max_exposure_per_account(self, AccountId account_id, new_value: Decimal)
+    cpdef void register_oms_type(self, Strategy strategy)
+    cpdef void register_venue_oms_type(self, Venue venue, OmsType oms_type)
     cpdef void _log_state(self)
 
 # -- RISK SETTINGS --------------------------------------------------------------------------------
@@ -68,6 +122,14 @@ cdef class RiskEngine(Component):
     cpdef tuple max_order_modify_rate(self)
     cpdef dict max_notionals_per_order(self)
     cpdef object max_notional_per_order(self, InstrumentId instrument_id)
+    cpdef dict max_exposures_per_instrument(self)
+    cpdef object max_exposure_per_instrument(self, InstrumentId instrument_id)
+    cpdef dict max_exposures_per_account(self)
+    cpdef object max_exposure_per_account(self, AccountId account_id)
+    cpdef double instrument_exposure(self, InstrumentId instrument_id)
+    cpdef double account_exposure(self, AccountId account_id, Currency currency)
+    cpdef InstrumentRiskLimits risk_limits(self, InstrumentId instrument_id)
+    cdef InstrumentRiskLimits _get_risk_limits(self, Instrument instrument)
 
 # -- ABSTRACT METHODS -----------------------------------------------------------------------------
 
@@ -83,12 +145,16 @@ cdef class RiskEngine(Component):
 
 # -- PRE-TRADE CHECKS -----------------------------------------------------------------------------
 
-    cpdef bint _check_order(self, Instrument instrument, Order order)
-    cpdef bint _check_order_price(self, Instrument instrument, Order order)
-    cpdef bint _check_order_quantity(self, Instrument instrument, Order order)
-    cpdef bint _check_orders_risk(self, Instrument instrument, list orders)
-    cpdef str _check_price(self, Instrument instrument, Price price)
-    cpdef str _check_quantity(self, Instrument instrument, Quantity quantity)
+    cpdef bint _check_order(self, InstrumentRiskLimits limits, Order order)
+    cpdef bint _check_order_price(self, InstrumentRiskLimits limits, Order order)
+    cpdef bint _check_order_quantity(self, InstrumentRiskLimits limits, Order order)
+    cpdef bint _check_orders_risk(self, InstrumentRiskLimits limits, list orders)
+    cpdef bint _check_orders_risk_margin(self, InstrumentRiskLimits limits, MarginAccount account, list orders)
+    cpdef bint _check_order_notional(self, InstrumentRiskLimits limits, Order order, Money notional)
+    cdef OmsType _determine_oms_type(self, Order order)
+    cdef Price _get_risk_price(self, Instrument instrument, Order order, Price last_px)
+    cpdef str _check_price(self, InstrumentRiskLimits limits, Price price)
+    cpdef str _check_quantity(self, InstrumentRiskLimits limits, Quantity quantity)
 
 # -- DENIALS --------------------------------------------------------------------------------------
 
@@ -106,4 +172,5 @@ cdef class RiskEngine(Component):
 
 # -- EVENT HANDLERS -------------------------------------------------------------------------------
 
+    cpdef void _handle_instrument(self, Instrument instrument)
     cpdef void _handle_event(self, Event event)
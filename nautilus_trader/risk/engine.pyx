@@ -19,9 +19,13 @@ import pandas as pd
 
 from nautilus_trader.risk.config import RiskEngineConfig
 
+from libc.math cimport fabs
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
+from nautilus_trader.accounting.accounts.margin cimport MarginAccount
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.component cimport CMD
 from nautilus_trader.common.component cimport EVT
@@ -37,9 +41,11 @@ from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.rust.model cimport AccountType
 from nautilus_trader.core.rust.model cimport InstrumentClass
+from nautilus_trader.core.rust.model cimport OmsType
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport OrderStatus
 from nautilus_trader.core.rust.model cimport OrderType
+from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.core.rust.model cimport TradingState
 from nautilus_trader.core.rust.model cimport TriggerType
 from nautilus_trader.core.uuid cimport UUID4
@@ -54,10 +60,14 @@ from nautilus_trader.model.data cimport TradeTick
 from nautilus_trader.model.events.order cimport OrderCancelRejected
 from nautilus_trader.model.events.order cimport OrderDenied
 from nautilus_trader.model.events.order cimport OrderModifyRejected
+from nautilus_trader.model.functions cimport oms_type_to_str
 from nautilus_trader.model.functions cimport order_type_to_str
 from nautilus_trader.model.functions cimport trading_state_to_str
+from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport ComponentId
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport StrategyId
+from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.instruments.currency_pair cimport CurrencyPair
 from nautilus_trader.model.objects cimport Currency
@@ -68,6 +78,70 @@ from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.portfolio.base cimport PortfolioFacade
+from nautilus_trader.portfolio.portfolio cimport PositionAggregate
+from nautilus_trader.trading.strategy cimport Strategy
+
+
+cdef class InstrumentRiskLimits:
+    """
+    Represents the pre-trade risk limits for an instrument, compiled once into
+    raw fixed-point values so that per-order checks are integer comparisons.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the limits.
+    max_notional_per_order : Decimal, optional
+        The maximum notional per order in the instrument quote currency.
+    max_exposure : Decimal, optional
+        The maximum projected net exposure in the instrument quote currency.
+
+    """
+
+    def __init__(
+        self,
+        Instrument instrument not None,
+        max_notional_per_order: Decimal | None = None,
+        max_exposure: Decimal | None = None,
+    ) -> None:
+        self.instrument = instrument
+        self.price_precision = instrument.price_precision
+        self.size_precision = instrument.size_precision
+        self.check_price_positive = instrument.instrument_class != InstrumentClass.OPTION
+        self.max_quantity_raw = instrument.max_quantity._mem.raw if instrument.max_quantity is not None else 0
+        self.min_quantity_raw = instrument.min_quantity._mem.raw if instrument.min_quantity is not None else 0
+
+        self.has_max_notional_per_order = bool(max_notional_per_order)
+        if self.has_max_notional_per_order:
+            self.max_notional_per_order = Money(float(max_notional_per_order), instrument.quote_currency)
+            self.max_notional_per_order_raw = self.max_notional_per_order._mem.raw
+
+        # Notionals are checked in the quote currency (including inverse instruments)
+        self.has_min_notional = (
+            instrument.min_notional is not None
+            and instrument.min_notional.currency == instrument.quote_currency
+        )
+        if self.has_min_notional:
+            self.min_notional_raw = instrument.min_notional._mem.raw
+
+        self.has_max_notional = (
+            instrument.max_notional is not None
+            and instrument.max_notional.currency == instrument.quote_currency
+        )
+        if self.has_max_notional:
+            self.max_notional_raw = instrument.max_notional._mem.raw
+
+        self.has_max_exposure = bool(max_exposure)
+        if self.has_max_exposure:
+            self.max_exposure = float(max_exposure)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument.id}, "
+            f"max_notional_per_order={self.max_notional_per_order}, "
+            f"max_exposure={self.max_exposure if self.has_max_exposure else None})"
+        )
 
 
 cdef class RiskEngine(Component):
@@ -172,6 +246,16 @@ cdef class RiskEngine(Component):
 
         # Risk settings
         self._max_notional_per_order: dict[InstrumentId, Decimal] = {}
+        self._max_exposure_per_instrument: dict[InstrumentId, Decimal] = {}
+        self._max_exposure_per_account: dict[AccountId, Decimal] = {}
+        self._account_exposure_limits: dict[AccountId, float] = {}
+
+        # Compiled per instrument limits (invalidated when settings change)
+        self._risk_limits: dict[InstrumentId, InstrumentRiskLimits] = {}
+
+        # OMS types (to determine whether orders can reduce existing positions)
+        self._oms_overrides: dict[StrategyId, OmsType] = {}
+        self._venue_oms_types: dict[Venue, OmsType] = {}
 
         # Configure
         self._initialize_risk_checks(config)
@@ -183,12 +267,21 @@ cdef class RiskEngine(Component):
         # Required subscriptions
         self._msgbus.subscribe(topic="events.order.*", handler=self._handle_event, priority=10)
         self._msgbus.subscribe(topic="events.position.*", handler=self._handle_event, priority=10)
+        self._msgbus.subscribe(topic="data.instrument.*", handler=self._handle_instrument, priority=10)
 
     def _initialize_risk_checks(self, config: RiskEngineConfig):
         cdef dict max_notional_config = config.max_notional_per_order
         for instrument_id, value in max_notional_config.items():
             self.set_max_notional_per_order(InstrumentId.from_str_c(instrument_id), Decimal(value))
 
+        cdef dict max_exposure_instrument_config = config.max_exposure_per_instrument
+        for instrument_id, value in max_exposure_instrument_config.items():
+            self.set_max_exposure_per_instrument(InstrumentId.from_str_c(instrument_id), Decimal(value))
+
+        cdef dict max_exposure_account_config = config.max_exposure_per_account
+        for account_id, value in max_exposure_account_config.items():
+            self.set_max_exposure_per_account(AccountId(account_id), Decimal(value))
+
 # -- COMMANDS -------------------------------------------------------------------------------------
 
     cpdef void execute(self, Command command):
@@ -297,6 +390,7 @@ cdef class RiskEngine(Component):
 
         old_value: Decimal = self._max_notional_per_order.get(instrument_id)
         self._max_notional_per_order[instrument_id] = new_value
+        self._risk_limits.pop(instrument_id, None)  # Recompile on next check
 
         cdef str new_value_str = f"{new_value:,}" if new_value is not None else str(None)
         self._log.info(
@@ -304,6 +398,119 @@ cdef class RiskEngine(Component):
             color=LogColor.BLUE,
         )
 
+    cpdef void set_max_exposure_per_instrument(self, InstrumentId instrument_id, new_value):
+        """
+        Set the maximum projected net notional exposure for the given instrument ID.
+
+        The exposure is in the instrument quote currency, and is checked for
+        orders on margin accounts. Passing a new_value of ``None`` will disable
+        the check.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the max exposure.
+        new_value : integer, float, string or Decimal
+            The max exposure value to set.
+
+        Raises
+        ------
+        decimal.InvalidOperation
+            If `new_value` not a valid input for `decimal.Decimal`.
+        ValueError
+            If `new_value` is not ``None`` and not positive.
+
+        """
+        if new_value is not None:
+            new_value = Decimal(new_value)
+            Condition.type(new_value, Decimal, "new_value")
+            Condition.positive(new_value, "new_value")
+
+        self._max_exposure_per_instrument[instrument_id] = new_value
+        self._risk_limits.pop(instrument_id, None)  # Recompile on next check
+
+        cdef str new_value_str = f"{new_value:,}" if new_value is not None else str(None)
+        self._log.info(
+            f"Set MAX_EXPOSURE_PER_INSTRUMENT: {instrument_id} {new_value_str}",
+            color=LogColor.BLUE,
+        )
+
+    cpdef void set_max_exposure_per_account(self, AccountId account_id, new_value):
+        """
+        Set the maximum projected total net notional exposure for the given account ID.
+
+        The exposure is summed per quote currency, and is checked for orders on
+        margin accounts. Passing a new_value of ``None`` will disable the check.
+
+        Parameters
+        ----------
+        account_id : AccountId
+            The account ID for the max exposure.
+        new_value : integer, float, string or Decimal
+            The max exposure value to set.
+
+        Raises
+        ------
+        decimal.InvalidOperation
+            If `new_value` not a valid input for `decimal.Decimal`.
+        ValueError
+            If `new_value` is not ``None`` and not positive.
+
+        """
+        if new_value is not None:
+            new_value = Decimal(new_value)
+            Condition.type(new_value, Decimal, "new_value")
+            Condition.positive(new_value, "new_value")
+
+        self._max_exposure_per_account[account_id] = new_value
+        if new_value:
+            self._account_exposure_limits[account_id] = float(new_value)
+        else:
+            self._account_exposure_limits.pop(account_id, None)
+
+        cdef str new_value_str = f"{new_value:,}" if new_value is not None else str(None)
+        self._log.info(
+            f"Set MAX_EXPOSURE_PER_ACCOUNT: {account_id} {new_value_str}",
+            color=LogColor.BLUE,
+        )
+
+    cpdef void register_oms_type(self, Strategy strategy):
+        """
+        Register the given trading strategies OMS (Order Management System) type.
+
+        Parameters
+        ----------
+        strategy : Strategy
+            The strategy for the registration.
+
+        """
+        Condition.not_none(strategy, "strategy")
+
+        self._oms_overrides[strategy.id] = strategy.oms_type
+
+        self._log.info(
+            f"Registered OMS.{oms_type_to_str(strategy.oms_type)} "
+            f"for Strategy {strategy}",
+        )
+
+    cpdef void register_venue_oms_type(self, Venue venue, OmsType oms_type):
+        """
+        Register the native OMS (Order Management System) type for the given venue.
+
+        Parameters
+        ----------
+        venue : Venue
+            The venue for the registration.
+        oms_type : OmsType {``HEDGING``, ``NETTING``}
+            The venues OMS type.
+
+        """
+        Condition.not_none(venue, "venue")
+
+        self._venue_oms_types[venue] = oms_type
+
+        self._log.info(f"Registered OMS.{oms_type_to_str(oms_type)} for {venue}")
+
 # -- RISK SETTINGS --------------------------------------------------------------------------------
 
     cpdef tuple max_order_submit_rate(self):
@@ -358,6 +565,127 @@ cdef class RiskEngine(Component):
         """
         return self._max_notional_per_order.get(instrument_id)
 
+    cpdef dict max_exposures_per_instrument(self):
+        """
+        Return the current maximum exposures per instrument settings.
+
+        Returns
+        -------
+        dict[InstrumentId, Decimal]
+
+        """
+        return self._max_exposure_per_instrument.copy()
+
+    cpdef object max_exposure_per_instrument(self, InstrumentId instrument_id):
+        """
+        Return the current maximum exposure for the given instrument ID.
+
+        Returns
+        -------
+        Decimal or ``None``
+
+        """
+        return self._max_exposure_per_instrument.get(instrument_id)
+
+    cpdef dict max_exposures_per_account(self):
+        """
+        Return the current maximum exposures per account settings.
+
+        Returns
+        -------
+        dict[AccountId, Decimal]
+
+        """
+        return self._max_exposure_per_account.copy()
+
+    cpdef object max_exposure_per_account(self, AccountId account_id):
+        """
+        Return the current maximum exposure for the given account ID.
+
+        Returns
+        -------
+        Decimal or ``None``
+
+        """
+        return self._max_exposure_per_account.get(account_id)
+
+    cpdef double instrument_exposure(self, InstrumentId instrument_id):
+        """
+        Return the current signed net notional exposure for the given instrument ID.
+
+        The exposure is valued at the open prices of the positions, in the
+        instrument quote currency.
+
+        Returns
+        -------
+        double
+
+        """
+        cdef PositionAggregate aggregate = self._portfolio.position_aggregate(instrument_id)
+        if aggregate is None:
+            return 0.0
+
+        return aggregate.net_open_notional()
+
+    cpdef double account_exposure(self, AccountId account_id, Currency currency):
+        """
+        Return the current total net notional exposure for the given account ID and currency.
+
+        The exposure is the sum of the absolute net exposures of each instrument
+        quoted in the currency, valued at the open prices of the positions.
+
+        Returns
+        -------
+        double
+
+        """
+        cdef double exposure = 0.0
+        cdef PositionAggregate aggregate
+        for aggregate in self._portfolio.position_aggregates(account_id).values():
+            if aggregate.quote_currency == currency:
+                exposure += fabs(aggregate.net_open_notional())
+
+        return exposure
+
+    cpdef InstrumentRiskLimits risk_limits(self, InstrumentId instrument_id):
+        """
+        Return the compiled pre-trade risk limits for the given instrument ID.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the limits.
+
+        Returns
+        -------
+        InstrumentRiskLimits or ``None``
+            ``None`` if the instrument is not in the cache.
+
+        """
+        cdef Instrument instrument = self._cache.instrument(instrument_id)
+        if instrument is None:
+            return None
+
+        return self._get_risk_limits(instrument)
+
+    cdef InstrumentRiskLimits _get_risk_limits(self, Instrument instrument):
+        cdef InstrumentRiskLimits limits = self._risk_limits.get(instrument.id)
+        if limits is not None and limits.instrument is instrument:
+            return limits
+
+        # Compile (first use, changed settings, or instrument was updated)
+        limits = InstrumentRiskLimits(
+            instrument=instrument,
+            max_notional_per_order=self._max_notional_per_order.get(instrument.id),
+            max_exposure=self._max_exposure_per_instrument.get(instrument.id),
+        )
+        self._risk_limits[instrument.id] = limits
+
+        if self.debug:
+            self._log.debug(f"Compiled {limits!r}", LogColor.MAGENTA)
+
+        return limits
+
 # -- ABSTRACT METHODS -----------------------------------------------------------------------------
 
     cpdef void _on_start(self):
@@ -434,10 +762,11 @@ cdef class RiskEngine(Component):
         ########################################################################
         # PRE-TRADE ORDER(S) CHECKS
         ########################################################################
-        if not self._check_order(instrument, order):
+        cdef InstrumentRiskLimits limits = self._get_risk_limits(instrument)
+        if not self._check_order(limits, order):
             return  # Denied
 
-        if not self._check_orders_risk(instrument, [order]):
+        if not self._check_orders_risk(limits, [order]):
             return # Denied
 
         self._execution_gateway(instrument, command)
@@ -460,11 +789,12 @@ cdef class RiskEngine(Component):
         ########################################################################
         # PRE-TRADE ORDER(S) CHECKS
         ########################################################################
+        cdef InstrumentRiskLimits limits = self._get_risk_limits(instrument)
         for order in command.order_list.orders:
-            if not self._check_order(instrument, order):
+            if not self._check_order(limits, order):
                 return  # Denied
 
-        if not self._check_orders_risk(instrument, command.order_list.orders):
+        if not self._check_orders_risk(limits, command.order_list.orders):
             # Deny all orders in list
             self._deny_order_list(command.order_list, "OrderList {command.order_list.id.to_str()} DENIED")
             return # Denied
@@ -503,22 +833,23 @@ cdef class RiskEngine(Component):
             )
             return  # Denied
 
+        cdef InstrumentRiskLimits limits = self._get_risk_limits(instrument)
         cdef str risk_msg = None
 
         # Check price
-        risk_msg = self._check_price(instrument, command.price)
+        risk_msg = self._check_price(limits, command.price)
         if risk_msg:
             self._reject_modify_order(order=order, reason=risk_msg)
             return  # Denied
 
         # Check trigger
-        risk_msg = self._check_price(instrument, command.trigger_price)
+        risk_msg = self._check_price(limits, command.trigger_price)
         if risk_msg:
             self._reject_modify_order(order=order, reason=risk_msg)
             return  # Denied
 
         # Check quantity
-        risk_msg = self._check_quantity(instrument, command.quantity)
+        risk_msg = self._check_quantity(limits, command.quantity)
         if risk_msg:
             self._reject_modify_order(order=order, reason=risk_msg)
             return  # Denied
@@ -549,24 +880,24 @@ cdef class RiskEngine(Component):
 
 # -- PRE-TRADE CHECKS -----------------------------------------------------------------------------
 
-    cpdef bint _check_order(self, Instrument instrument, Order order):
+    cpdef bint _check_order(self, InstrumentRiskLimits limits, Order order):
         ########################################################################
         # VALIDATION CHECKS
         ########################################################################
-        if not self._check_order_price(instrument, order):
+        if not self._check_order_price(limits, order):
             return False  # Denied
-        if not self._check_order_quantity(instrument, order):
+        if not self._check_order_quantity(limits, order):
             return False  # Denied
 
         return True  # Check passed
 
-    cpdef bint _check_order_price(self, Instrument instrument, Order order):
+    cpdef bint _check_order_price(self, InstrumentRiskLimits limits, Order order):
         ########################################################################
         # CHECK PRICE
         ########################################################################
         cdef str risk_msg = None
         if order.has_price_c():
-            risk_msg = self._check_price(instrument, order.price)
+            risk_msg = self._check_price(limits, order.price)
             if risk_msg:
                 self._deny_order(order=order, reason=risk_msg)
                 return False  # Denied
@@ -575,37 +906,29 @@ cdef class RiskEngine(Component):
         # CHECK TRIGGER
         ########################################################################
         if order.has_trigger_price_c():
-            risk_msg = self._check_price(instrument, order.trigger_price)
+            risk_msg = self._check_price(limits, order.trigger_price)
             if risk_msg:
                 self._deny_order(order=order, reason=f"trigger {risk_msg}")
                 return False  # Denied
 
         return True  # Passed
 
-    cpdef bint _check_order_quantity(self, Instrument instrument, Order order):
-        cdef str risk_msg = self._check_quantity(instrument, order.quantity)
+    cpdef bint _check_order_quantity(self, InstrumentRiskLimits limits, Order order):
+        cdef str risk_msg = self._check_quantity(limits, order.quantity)
         if risk_msg:
             self._deny_order(order=order, reason=risk_msg)
             return False  # Denied
 
         return True  # Passed
 
-    cpdef bint _check_orders_risk(self, Instrument instrument, list orders):
+    cpdef bint _check_orders_risk(self, InstrumentRiskLimits limits, list orders):
         ########################################################################
         # RISK CHECKS
         ########################################################################
-        cdef QuoteTick last_quote = None
-        cdef TradeTick last_trade = None
+        cdef Instrument instrument = limits.instrument
         cdef Price last_px = None
         cdef Money free
 
-        # Determine max notional
-        cdef Money max_notional = None
-        max_notional_setting: Decimal | None = self._max_notional_per_order.get(instrument.id)
-        if max_notional_setting:
-            # TODO: Improve efficiency of this
-            max_notional = Money(float(max_notional_setting), instrument.quote_currency)
-
         # Get account for risk checks
         cdef Account account = self._cache.account_for_venue(instrument.id.venue)
         if account is None:
@@ -613,7 +936,7 @@ cdef class RiskEngine(Component):
             return True  # TODO: Temporary early return until handling routing/multiple venues
 
         if account.is_margin_account:
-            return True  # TODO: Determine risk controls for margin
+            return self._check_orders_risk_margin(limits, <MarginAccount>account, orders)
 
         free = account.balance_free(instrument.quote_currency)
         if self.debug:
@@ -629,73 +952,15 @@ cdef class RiskEngine(Component):
             Currency base_currency = None
             double xrate
         for order in orders:
-            if order.order_type == OrderType.MARKET or order.order_type == OrderType.MARKET_TO_LIMIT:
-                if last_px is None:
-                    # Determine entry price
-                    last_quote = self._cache.quote_tick(instrument.id)
-                    if last_quote is not None:
-                        if order.side == OrderSide.BUY:
-                            last_px = last_quote.ask_price
-                        elif order.side == OrderSide.SELL:
-                            last_px = last_quote.bid_price
-                        else:  # pragma: no cover (design-time error)
-                            raise RuntimeError(f"invalid `OrderSide`")
-                    else:
-                        last_trade = self._cache.trade_tick(instrument.id)
-                        if last_trade is not None:
-                            last_px = last_trade.price
-                        else:
-                            self._log.warning(
-                                f"Cannot check MARKET order risk: no prices for {instrument.id}",
-                            )
-                            continue  # Cannot check order risk
-            elif order.order_type == OrderType.STOP_MARKET or order.order_type == OrderType.MARKET_IF_TOUCHED:
-                last_px = order.trigger_price
-            elif order.order_type == OrderType.TRAILING_STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_LIMIT:
-                if order.trigger_price is None:
-                    self._log.warning(
-                        f"Cannot check {order_type_to_str(order.order_type)} order risk: "
-                        f"no trigger price was set",  # TODO: Use last_trade += offset
-                    )
-                    continue  # Cannot assess risk
-                else:
-                    last_px = order.trigger_price
-            else:
-                last_px = order.price
+            last_px = self._get_risk_price(instrument, order, last_px)
+            if last_px is None:
+                continue  # Cannot assess risk
 
             notional = instrument.notional_value(order.quantity, last_px, use_quote_for_inverse=True)
             if self.debug:
-                self._log.debug(f"Notional: {order_balance_impact!r}", LogColor.MAGENTA)
+                self._log.debug(f"Notional: {notional!r}", LogColor.MAGENTA)
 
-            if max_notional and notional._mem.raw > max_notional._mem.raw:
-                self._deny_order(
-                    order=order,
-                    reason=f"NOTIONAL_EXCEEDS_MAX_PER_ORDER: max_notional={max_notional}, notional={notional}",
-                )
-                return False  # Denied
-
-            # Check MIN notional instrument limit
-            if (
-                instrument.min_notional is not None
-                and instrument.min_notional.currency == notional.currency
-                and notional._mem.raw < instrument.min_notional._mem.raw
-            ):
-                self._deny_order(
-                    order=order,
-                    reason=f"NOTIONAL_LESS_THAN_MIN_FOR_INSTRUMENT: min_notional={instrument.min_notional} , notional={notional}",
-                )
-                return False  # Denied
-
-            # Check MAX notional instrument limit
-            if (
-                instrument.max_notional is not None
-                and instrument.max_notional.currency == notional.currency
-                and notional._mem.raw > instrument.max_notional._mem.raw
-            ):
-                self._deny_order(
-                    order=order,
-                    reason=f"NOTIONAL_GREATER_THAN_MAX_FOR_INSTRUMENT: max_notional={instrument.max_notional}, notional={notional}",
-                )
+            if not self._check_order_notional(limits, order, notional):
                 return False  # Denied
 
             order_balance_impact = account.balance_impact(instrument, order.quantity, last_px, order.side)
@@ -769,31 +1034,265 @@ cdef class RiskEngine(Component):
         # Finally
         return True  # Passed
 
-    cpdef str _check_price(self, Instrument instrument, Price price):
+    cpdef bint _check_orders_risk_margin(
+        self,
+        InstrumentRiskLimits limits,
+        MarginAccount account,
+        list orders,
+    ):
+        cdef Instrument instrument = limits.instrument
+
+        # Margin currency follows the account margin calculation
+        cdef Currency margin_currency = instrument.get_base_currency() if instrument.is_inverse else instrument.quote_currency
+        cdef Money free = account.balance_free(margin_currency)
+        cdef double xrate = 1.0
+        if free is None and account.base_currency is not None:
+            # Convert margin to the account base currency
+            free = account.balance_free(account.base_currency)
+            xrate = self._cache.get_xrate(
+                venue=instrument.id.venue,
+                from_currency=margin_currency,
+                to_currency=account.base_currency,
+                price_type=PriceType.MID,
+            )
+            if xrate == 0.0:
+                free = None  # Cannot convert margin
+        if free is None:
+            self._log.warning(
+                f"Cannot check margin for {instrument.id}: "
+                f"no free balance or exchange rate for {margin_currency}",
+            )
+        if self.debug:
+            self._log.debug(f"Free: {free!r}", LogColor.MAGENTA)
+
+        cdef object max_account_setting = self._account_exposure_limits.get(account.id)
+        cdef bint has_max_account_exposure = max_account_setting is not None
+        cdef double max_account_exposure = max_account_setting if has_max_account_exposure else 0.0
+
+        # Running state from the portfolio, projected forward by each order in the batch
+        cdef PositionAggregate aggregate = self._portfolio.position_aggregate(instrument.id)
+        cdef double instrument_exposure = aggregate.net_open_notional() if aggregate is not None else 0.0
+        aggregate = self._portfolio.position_aggregate(instrument.id, account.id)
+        cdef double net_qty = aggregate.net_qty() if aggregate is not None else 0.0
+        cdef double account_instrument_exposure = aggregate.net_open_notional() if aggregate is not None else 0.0
+        cdef double account_exposure = 0.0
+        if has_max_account_exposure:
+            account_exposure = self.account_exposure(account.id, instrument.quote_currency)
+        cdef double multiplier = instrument.multiplier.as_f64_c()
+
+        cdef:
+            Order order
+            Price last_px = None
+            Money notional
+            Money margin_init
+            double cum_margin = 0.0
+            double signed_qty
+            double signed_notional
+            double projected_qty
+            double projected_exposure
+            double projected_account_exposure
+            double opening_qty
+        for order in orders:
+            last_px = self._get_risk_price(instrument, order, last_px)
+            if last_px is None:
+                continue  # Cannot assess risk
+
+            notional = instrument.notional_value(order.quantity, last_px, use_quote_for_inverse=True)
+            if self.debug:
+                self._log.debug(f"Notional: {notional!r}", LogColor.MAGENTA)
+
+            if not self._check_order_notional(limits, order, notional):
+                return False  # Denied
+
+            if order.is_reduce_only or order.parent_order_id is not None:
+                # Reduce-only and contingent child orders cannot increase exposure
+                continue
+
+            signed_qty = order.quantity.as_f64_c() if order.is_buy_c() else -order.quantity.as_f64_c()
+            if instrument.is_inverse:
+                signed_notional = signed_qty * multiplier
+            else:
+                signed_notional = signed_qty * multiplier * last_px.as_f64_c()
+
+            projected_qty = net_qty + signed_qty
+            projected_exposure = instrument_exposure + signed_notional
+            projected_account_exposure = (
+                account_exposure
+                - fabs(account_instrument_exposure)
+                + fabs(account_instrument_exposure + signed_notional)
+            )
+            if self.debug:
+                self._log.debug(f"Projected exposure: {projected_exposure:,}", LogColor.MAGENTA)
+
+            if (
+                limits.has_max_exposure
+                and fabs(projected_exposure) > limits.max_exposure
+                and fabs(projected_exposure) > fabs(instrument_exposure)
+            ):
+                self._deny_order(
+                    order=order,
+                    reason=(
+                        f"EXPOSURE_EXCEEDS_MAX_PER_INSTRUMENT: "
+                        f"max_exposure={self._max_exposure_per_instrument[instrument.id]:,} {instrument.quote_currency}, "
+                        f"exposure={fabs(projected_exposure):,.{instrument.quote_currency.get_precision()}f} {instrument.quote_currency}"
+                    ),
+                )
+                return False  # Denied
+
+            if (
+                has_max_account_exposure
+                and projected_account_exposure > max_account_exposure
+                and projected_account_exposure > account_exposure
+            ):
+                self._deny_order(
+                    order=order,
+                    reason=(
+                        f"EXPOSURE_EXCEEDS_MAX_PER_ACCOUNT: "
+                        f"max_exposure={self._max_exposure_per_account[account.id]:,} {instrument.quote_currency}, "
+                        f"exposure={projected_account_exposure:,.{instrument.quote_currency.get_precision()}f} {instrument.quote_currency}"
+                    ),
+                )
+                return False  # Denied
+
+            if self._determine_oms_type(order) == OmsType.HEDGING:
+                # Opens a new position (or adds to one) rather than netting against the account
+                opening_qty = order.quantity.as_f64_c()
+            else:
+                # Only the part of the order which opens (or flips) the account net position requires margin
+                opening_qty = fabs(projected_qty) - fabs(net_qty)
+            if opening_qty > 0 and free is not None:
+                margin_init = account.calculate_margin_init(
+                    instrument,
+                    instrument.make_qty(opening_qty),
+                    last_px,
+                    use_quote_for_inverse=False,
+                )
+                cum_margin += margin_init.as_f64_c() * xrate
+                if self.debug:
+                    self._log.debug(f"Margin init: {margin_init!r}", LogColor.MAGENTA)
+
+                if cum_margin > free.as_f64_c():
+                    self._deny_order(
+                        order=order,
+                        reason=(
+                            f"MARGIN_INIT_EXCEEDS_FREE_BALANCE: free={free}, "
+                            f"margin_init={Money(cum_margin, free.currency)}"
+                        ),
+                    )
+                    return False  # Denied
+
+            net_qty = projected_qty
+            account_exposure = projected_account_exposure
+            account_instrument_exposure += signed_notional
+            instrument_exposure = projected_exposure
+
+        # Finally
+        return True  # Passed
+
+    cpdef bint _check_order_notional(
+        self,
+        InstrumentRiskLimits limits,
+        Order order,
+        Money notional,
+    ):
+        # Notional is in the quote currency, as are all compiled notional limits
+        if limits.has_max_notional_per_order and notional._mem.raw > limits.max_notional_per_order_raw:
+            self._deny_order(
+                order=order,
+                reason=f"NOTIONAL_EXCEEDS_MAX_PER_ORDER: max_notional={limits.max_notional_per_order}, notional={notional}",
+            )
+            return False  # Denied
+
+        # Check MIN notional instrument limit
+        if limits.has_min_notional and notional._mem.raw < limits.min_notional_raw:
+            self._deny_order(
+                order=order,
+                reason=f"NOTIONAL_LESS_THAN_MIN_FOR_INSTRUMENT: min_notional={limits.instrument.min_notional} , notional={notional}",
+            )
+            return False  # Denied
+
+        # Check MAX notional instrument limit
+        if limits.has_max_notional and notional._mem.raw > limits.max_notional_raw:
+            self._deny_order(
+                order=order,
+                reason=f"NOTIONAL_GREATER_THAN_MAX_FOR_INSTRUMENT: max_notional={limits.instrument.max_notional}, notional={notional}",
+            )
+            return False  # Denied
+
+        return True  # Passed
+
+    cdef OmsType _determine_oms_type(self, Order order):
+        # Check for strategy OMS override (as the execution engine determines for fills)
+        cdef OmsType oms_type = self._oms_overrides.get(order.strategy_id, OmsType.UNSPECIFIED)
+        if oms_type == OmsType.UNSPECIFIED:
+            # Use native venue OMS
+            return self._venue_oms_types.get(order.instrument_id.venue, OmsType.NETTING)
+
+        return oms_type
+
+    cdef Price _get_risk_price(self, Instrument instrument, Order order, Price last_px):
+        cdef QuoteTick last_quote
+        cdef TradeTick last_trade
+        if order.order_type == OrderType.MARKET or order.order_type == OrderType.MARKET_TO_LIMIT:
+            if last_px is not None:
+                return last_px
+
+            # Determine entry price
+            last_quote = self._cache.quote_tick(instrument.id)
+            if last_quote is not None:
+                if order.side == OrderSide.BUY:
+                    return last_quote.ask_price
+                elif order.side == OrderSide.SELL:
+                    return last_quote.bid_price
+                else:  # pragma: no cover (design-time error)
+                    raise RuntimeError(f"invalid `OrderSide`")
+
+            last_trade = self._cache.trade_tick(instrument.id)
+            if last_trade is not None:
+                return last_trade.price
+
+            self._log.warning(
+                f"Cannot check MARKET order risk: no prices for {instrument.id}",
+            )
+            return None  # Cannot check order risk
+        elif order.order_type == OrderType.STOP_MARKET or order.order_type == OrderType.MARKET_IF_TOUCHED:
+            return order.trigger_price
+        elif order.order_type == OrderType.TRAILING_STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_LIMIT:
+            if order.trigger_price is None:
+                self._log.warning(
+                    f"Cannot check {order_type_to_str(order.order_type)} order risk: "
+                    f"no trigger price was set",  # TODO: Use last_trade += offset
+                )
+                return None  # Cannot assess risk
+
+            return order.trigger_price
+        else:
+            return order.price
+
+    cpdef str _check_price(self, InstrumentRiskLimits limits, Price price):
         if price is None:
             # Nothing to check
             return None
-        if price.precision > instrument.price_precision:
+        if price._mem.precision > limits.price_precision:
             # Check failed
-            return f"price {price} invalid (precision {price.precision} > {instrument.price_precision})"
-        if instrument.instrument_class != InstrumentClass.OPTION:
-            if price.raw_int64_c() <= 0:
-                # Check failed
-                return f"price {price} invalid (not positive)"
+            return f"price {price} invalid (precision {price._mem.precision} > {limits.price_precision})"
+        if limits.check_price_positive and price._mem.raw <= 0:
+            # Check failed
+            return f"price {price} invalid (not positive)"
 
-    cpdef str _check_quantity(self, Instrument instrument, Quantity quantity):
+    cpdef str _check_quantity(self, InstrumentRiskLimits limits, Quantity quantity):
         if quantity is None:
             # Nothing to check
             return None
-        if quantity._mem.precision > instrument.size_precision:
+        if quantity._mem.precision > limits.size_precision:
             # Check failed
-            return f"quantity {quantity} invalid (precision {quantity._mem.precision} > {instrument.size_precision})"
-        if instrument.max_quantity and quantity > instrument.max_quantity:
+            return f"quantity {quantity} invalid (precision {quantity._mem.precision} > {limits.size_precision})"
+        if limits.max_quantity_raw and quantity._mem.raw > limits.max_quantity_raw:
             # Check failed
-            return f"quantity {quantity} invalid (> maximum trade size of {instrument.max_quantity})"
-        if instrument.min_quantity and quantity < instrument.min_quantity:
+            return f"quantity {quantity} invalid (> maximum trade size of {limits.instrument.max_quantity})"
+        if limits.min_quantity_raw and quantity._mem.raw < limits.min_quantity_raw:
             # Check failed
-            return f"quantity {quantity} invalid (< minimum trade size of {instrument.min_quantity})"
+            return f"quantity {quantity} invalid (< minimum trade size of {limits.instrument.min_quantity})"
 
 # -- DENIALS --------------------------------------------------------------------------------------
 
@@ -932,3 +1431,7 @@ cdef class RiskEngine(Component):
         if self.debug:
             self._log.debug(f"{RECV}{EVT} {event}", LogColor.MAGENTA)
         self.event_count += 1
+
+    cpdef void _handle_instrument(self, Instrument instrument):
+        # Compile limits eagerly for new or updated instruments
+        self._get_risk_limits(instrument)
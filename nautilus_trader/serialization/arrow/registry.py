@@ -0,0 +1,52 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from collections.abc import Callable
+
+
+_PENDING_REGISTRATIONS: list[Callable[[], None]] = []
+_SERIALIZER_LOADED: bool = False
+
+
+def register_arrow_on_load(register: Callable[[], None]) -> None:
+    """
+    Register the given Arrow serialization `register` callable to be called once the
+    Arrow serializer is loaded.
+
+    If the serializer is already loaded then `register` is called immediately. This
+    allows modules defining data types to register Arrow serialization without
+    importing `pyarrow` (and the serializer) at import time.
+
+    Parameters
+    ----------
+    register : Callable[[], None]
+        The callable which registers the type (typically via `register_arrow`).
+
+    """
+    if _SERIALIZER_LOADED:
+        register()
+    else:
+        _PENDING_REGISTRATIONS.append(register)
+
+
+def load_pending_registrations() -> None:
+    """
+    Call all pending Arrow serialization registrations (called by the serializer on load).
+    """
+    global _SERIALIZER_LOADED
+    _SERIALIZER_LOADED = True
+
+    while _PENDING_REGISTRATIONS:
+        _PENDING_REGISTRATIONS.pop(0)()
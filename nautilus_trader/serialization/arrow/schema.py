@@ -21,6 +21,7 @@ from nautilus_trader.common.messages import ComponentStateChanged
 from nautilus_trader.common.messages import ShutdownSystem
 from nautilus_trader.common.messages import TradingStateChanged
 from nautilus_trader.core import nautilus_pyo3
+from nautilus_trader.model.book import OrderBookDepthSnapshot
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import InstrumentClose
 from nautilus_trader.model.data import InstrumentStatus
@@ -85,6 +86,21 @@ NAUTILUS_ARROW_SCHEMA = {
         },
         metadata={"type": "InstrumentClose"},
     ),
+    OrderBookDepthSnapshot: pa.schema(
+        {
+            "instrument_id": pa.dictionary(pa.int64(), pa.string()),
+            "bid_prices": pa.list_(pa.float64()),
+            "bid_sizes": pa.list_(pa.float64()),
+            "bid_counts": pa.list_(pa.uint64()),
+            "ask_prices": pa.list_(pa.float64()),
+            "ask_sizes": pa.list_(pa.float64()),
+            "ask_counts": pa.list_(pa.uint64()),
+            "sequence": pa.uint64(),
+            "ts_event": pa.uint64(),
+            "ts_init": pa.uint64(),
+        },
+        metadata={"type": "OrderBookDepthSnapshot"},
+    ),
     InstrumentStatus: pa.schema(
         {
             "instrument_id": pa.dictionary(pa.int64(), pa.string()),
@@ -48,6 +48,7 @@ from nautilus_trader.serialization.arrow.implementations import component_events
 from nautilus_trader.serialization.arrow.implementations import instruments
 from nautilus_trader.serialization.arrow.implementations import order_events
 from nautilus_trader.serialization.arrow.implementations import position_events
+from nautilus_trader.serialization.arrow.registry import load_pending_registrations
 from nautilus_trader.serialization.arrow.schema import NAUTILUS_ARROW_SCHEMA
 
 
@@ -297,6 +298,27 @@ def make_dict_deserializer(data_cls):
     return inner
 
 
+def record_batches_from_bytes(batches_bytes: list[bytes]) -> list[pa.RecordBatch]:
+    """
+    Return the Arrow record batches read from the given IPC stream `batches_bytes`.
+
+    Parameters
+    ----------
+    batches_bytes : list[bytes]
+        The Arrow IPC stream bytes (as returned by the Rust `*_as_arrow` loaders).
+
+    Returns
+    -------
+    list[pa.RecordBatch]
+
+    """
+    batches: list[pa.RecordBatch] = []
+    for batch_bytes in batches_bytes:
+        reader = pa.ipc.open_stream(BytesIO(batch_bytes))
+        batches.extend(reader)
+    return batches
+
+
 def dicts_to_record_batch(data: list[dict], schema: pa.Schema) -> pa.RecordBatch:
     try:
         return pa.RecordBatch.from_pylist(data, schema=schema)
@@ -399,3 +421,7 @@ for position_cls in PositionEvent.__subclasses__():
         encoder=position_events.serialize,
         decoder=position_events.deserialize(position_cls),
     )
+
+
+# Register types deferred until the serializer was loaded
+load_pending_registrations()
@@ -16,6 +16,10 @@
 cdef dict _OBJECT_TO_DICT_MAP
 cdef dict _OBJECT_FROM_DICT_MAP
 cdef set[type] _EXTERNAL_PUBLISHABLE_TYPES
+cdef dict _LAZY_SERIALIZABLE_TYPES
+
+
+cdef bint _load_lazy_serializable_type(str type_name)
 
 
 cdef class Serializer:
@@ -16,9 +16,7 @@
 from typing import Any
 from typing import Callable
 
-from nautilus_trader.adapters.binance.common.types import BinanceBar
-from nautilus_trader.adapters.binance.common.types import BinanceTicker
-
+import importlib
 from nautilus_trader.common.messages cimport ComponentStateChanged
 from nautilus_trader.common.messages cimport ShutdownSystem
 from nautilus_trader.common.messages cimport TradingStateChanged
@@ -27,6 +25,7 @@ from nautilus_trader.execution.messages cimport CancelOrder
 from nautilus_trader.execution.messages cimport ModifyOrder
 from nautilus_trader.execution.messages cimport SubmitOrder
 from nautilus_trader.execution.messages cimport SubmitOrderList
+from nautilus_trader.model.book cimport OrderBookDepthSnapshot
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport InstrumentClose
 from nautilus_trader.model.data cimport InstrumentStatus
@@ -118,8 +117,7 @@ _OBJECT_TO_DICT_MAP: dict[str, Callable[[None], dict]] = {
     Bar.__name__: Bar.to_dict_c,
     InstrumentStatus.__name__: InstrumentStatus.to_dict_c,
     InstrumentClose.__name__: InstrumentClose.to_dict_c,
-    BinanceBar.__name__: BinanceBar.to_dict,
-    BinanceTicker.__name__: BinanceTicker.to_dict,
+    OrderBookDepthSnapshot.__name__: OrderBookDepthSnapshot.to_dict_c,
 }
 
 
@@ -172,8 +170,7 @@ _OBJECT_FROM_DICT_MAP: dict[str, Callable[[dict], Any]] = {
     Bar.__name__: Bar.from_dict_c,
     InstrumentStatus.__name__: InstrumentStatus.from_dict_c,
     InstrumentClose.__name__: InstrumentClose.from_dict_c,
-    BinanceBar.__name__: BinanceBar.from_dict,
-    BinanceTicker.__name__: BinanceTicker.from_dict,
+    OrderBookDepthSnapshot.__name__: OrderBookDepthSnapshot.from_dict_c,
 }
 
 
@@ -226,8 +223,15 @@ _EXTERNAL_PUBLISHABLE_TYPES = {
     Bar,
     InstrumentStatus,
     InstrumentClose,
-    BinanceBar,
-    BinanceTicker,
+    OrderBookDepthSnapshot,
+}
+
+
+# Types provided by other modules (such as adapters), keyed by type name to the module
+# which registers them with `register_serializable_type` when imported (on first use)
+_LAZY_SERIALIZABLE_TYPES: dict[str, str] = {
+    "BinanceBar": "nautilus_trader.adapters.binance.common.types",
+    "BinanceTicker": "nautilus_trader.adapters.binance.common.types",
 }
 
 
@@ -270,6 +274,44 @@ cpdef void register_serializable_type(
     _EXTERNAL_PUBLISHABLE_TYPES.add(cls)
 
 
+cpdef void register_lazy_serializable_type(str type_name, str module_name):
+    """
+    Register the given type name to be loaded from the given module on first use.
+
+    The module is only imported when an object with the type name is first
+    serialized or deserialized, and must register the type with
+    `register_serializable_type` at import.
+
+    Parameters
+    ----------
+    type_name : str
+        The type name to register.
+    module_name : str
+        The fully qualified name of the module which registers the type.
+
+    Raises
+    ------
+    ValueError
+        If `type_name` or `module_name` is not a valid string.
+
+    """
+    Condition.valid_string(type_name, "type_name")
+    Condition.valid_string(module_name, "module_name")
+
+    _LAZY_SERIALIZABLE_TYPES[type_name] = module_name
+
+
+cdef bint _load_lazy_serializable_type(str type_name):
+    # Import the module registering the given type name (if any), returning
+    # whether the type is now registered with the global type maps
+    cdef str module_name = _LAZY_SERIALIZABLE_TYPES.pop(type_name, None)
+    if module_name is None:
+        return False
+
+    importlib.import_module(module_name)
+    return type_name in _OBJECT_FROM_DICT_MAP
+
+
 cdef class Serializer:
     """
     The base class for all serializers.
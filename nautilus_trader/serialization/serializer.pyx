@@ -13,7 +13,6 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import re
 from typing import Any
 
 from libc.stdint cimport uint64_t
@@ -25,11 +24,52 @@ from msgspec import msgpack
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.serialization.base cimport _OBJECT_FROM_DICT_MAP
 from nautilus_trader.serialization.base cimport _OBJECT_TO_DICT_MAP
+from nautilus_trader.serialization.base cimport _load_lazy_serializable_type
 from nautilus_trader.serialization.base cimport Serializer
 
 
 cdef tuple[str, int, float, bool] _PRIMITIVES = (str, int, float, bool)
 
+# Timestamp key classifications memoized per registered serializable type name.
+# Untyped payloads (raw dicts, custom data) are never memoized and each type's memo
+# is bounded, so dynamic keys cannot grow the memo for the life of the process.
+cdef dict _TIMESTAMP_KEYS_BY_TYPE = {}
+cdef int _MAX_MEMOIZED_KEYS_PER_TYPE = 256
+
+
+cdef inline bint _is_timestamp_key(str key):
+    return key in "expire_time_ns" or key.startswith("ts_")
+
+
+cdef list _timestamp_keys(dict obj_dict, str type_name):
+    cdef dict memo = None
+    if type_name is not None and (type_name in _OBJECT_TO_DICT_MAP or type_name in _OBJECT_FROM_DICT_MAP):
+        memo = _TIMESTAMP_KEYS_BY_TYPE.get(type_name)
+        if memo is None:
+            memo = {}
+            _TIMESTAMP_KEYS_BY_TYPE[type_name] = memo
+
+    if memo is None:
+        return [k for k in obj_dict if _is_timestamp_key(k)]
+
+    cdef list timestamp_keys = []
+    cdef object is_timestamp
+    for key in obj_dict:
+        is_timestamp = memo.get(key)
+        if is_timestamp is None:
+            is_timestamp = _is_timestamp_key(key)
+            if len(memo) < _MAX_MEMOIZED_KEYS_PER_TYPE:
+                memo[key] = is_timestamp
+        if is_timestamp:
+            timestamp_keys.append(key)
+
+    return timestamp_keys
+
+
+cdef inline str _timestamp_to_iso8601(object value):
+    timestamp = pd.Timestamp(value, unit="ns", tz=pytz.utc)
+    return timestamp.isoformat().replace("+00:00", "Z")
+
 
 cdef class MsgSpecSerializer(Serializer):
     """
@@ -53,8 +93,9 @@ cdef class MsgSpecSerializer(Serializer):
         bint timestamps_as_str = False,
         bint timestamps_as_iso8601 = False,
     ):
-        self._encode = encoding.encode
-        self._decode = encoding.decode
+        # Reuse encoder and decoder instances rather than the module level functions
+        self._encode = encoding.Encoder().encode
+        self._decode = encoding.Decoder().decode
         self.timestamps_as_str = timestamps_as_str
         self.timestamps_as_iso8601 = timestamps_as_iso8601
 
@@ -80,10 +121,14 @@ cdef class MsgSpecSerializer(Serializer):
         Condition.not_none(obj, "obj")
 
         cdef dict obj_dict
+        cdef str type_name = None
         if isinstance(obj, dict):
             obj_dict = obj
         else:
-            delegate = _OBJECT_TO_DICT_MAP.get(type(obj).__name__)
+            type_name = type(obj).__name__
+            delegate = _OBJECT_TO_DICT_MAP.get(type_name)
+            if delegate is None and _load_lazy_serializable_type(type_name):
+                delegate = _OBJECT_TO_DICT_MAP.get(type_name)
             if delegate is None:
                 if isinstance(obj, _PRIMITIVES):
                     return self._encode(obj)
@@ -91,19 +136,20 @@ cdef class MsgSpecSerializer(Serializer):
                     raise RuntimeError(f"cannot serialize object: unrecognized type {type(obj)}")
             obj_dict = delegate(obj)
 
-        cdef dict timestamp_kvs = {
-            k: v for k, v in obj_dict.items() if k in ("expire_time_ns") or re.match(r"^ts_", k)
-        }
+        if not (self.timestamps_as_iso8601 or self.timestamps_as_str):
+            return self._encode(obj_dict)
+
+        cdef list timestamp_keys = _timestamp_keys(obj_dict, type_name)
 
         cdef str key
         if self.timestamps_as_iso8601:
-            for key, value in timestamp_kvs.items():
-                if value is None:
-                    continue
-                timestamp = pd.Timestamp(value, unit="ns", tz=pytz.utc)
-                obj_dict[key] = timestamp.isoformat().replace("+00:00", "Z")
-        elif self.timestamps_as_str:
-            for key, value in timestamp_kvs.items():
+            for key in timestamp_keys:
+                value = obj_dict[key]
+                if value is not None:
+                    obj_dict[key] = _timestamp_to_iso8601(value)
+        else:
+            for key in timestamp_keys:
+                value = obj_dict[key]
                 if value is not None:
                     obj_dict[key] = str(value)
 
@@ -131,29 +177,31 @@ cdef class MsgSpecSerializer(Serializer):
         Condition.not_none(obj_bytes, "obj_bytes")
 
         cdef dict obj_dict = self._decode(obj_bytes)  # type: dict[str, Any]
-        cdef dict timestamp_kvs = {
-            k: v for k, v in obj_dict.items() if k in ("expire_time_ns") or re.match(r"^ts_", k)
-        }
+        cdef str obj_type = obj_dict.get("type")
 
         cdef:
+            list timestamp_keys
             str key
             uint64_t value_uint64
         if self.timestamps_as_iso8601 or self.timestamps_as_str:
-            for key, value in timestamp_kvs.items():
+            timestamp_keys = _timestamp_keys(obj_dict, obj_type)
+            for key in timestamp_keys:
+                value = obj_dict[key]
                 if value is None:
                     continue
-                if re.match(r"^\d+$", value):  # Check if value is an integer-like string
+                if value.isdigit():  # Check if value is an integer-like string
                     value_uint64 = int(value)
                     obj_dict[key] = value_uint64
                 else:  # Else assume the value is ISO 8601 format
                     value_uint64 = pd.Timestamp(value, tz=pytz.utc).value
                     obj_dict[key] = value_uint64
 
-        cdef str obj_type = obj_dict.get("type")
         if obj_type is None:
             return obj_dict
 
         delegate = _OBJECT_FROM_DICT_MAP.get(obj_type)
+        if delegate is None and _load_lazy_serializable_type(obj_type):
+            delegate = _OBJECT_FROM_DICT_MAP.get(obj_type)
         if delegate is None:
             return obj_dict
 
@@ -76,6 +76,11 @@ class NautilusKernelConfig(NautilusConfig, frozen=True):
         If trading strategy state should be saved to the database on stop.
     loop_debug : bool, default False
         If the asyncio event loop should be in debug mode.
+    trusted_mode : bool, default False
+        If the message bus, cache and strategy order factories should skip
+        argument-level precondition checks on their hot paths (state invariant
+        checks are always kept). Only enable for
+        validated configurations where all messages originate from system components.
     logging : LoggingConfig, optional
         The logging config for the kernel.
     timeout_connection : PositiveFloat
@@ -109,6 +114,7 @@ class NautilusKernelConfig(NautilusConfig, frozen=True):
     load_state: bool = False
     save_state: bool = False
     loop_debug: bool = False
+    trusted_mode: bool = False
     logging: LoggingConfig | None = None
 
     timeout_connection: PositiveFloat = 10.0
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from __future__ import annotations
+
 import asyncio
 import concurrent.futures
 import os
@@ -24,6 +26,7 @@ from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import msgspec
 
@@ -70,12 +73,7 @@ from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.execution.algorithm import ExecAlgorithm
 from nautilus_trader.execution.emulator import OrderEmulator
 from nautilus_trader.execution.engine import ExecutionEngine
-from nautilus_trader.live.data_engine import LiveDataEngine
-from nautilus_trader.live.execution_engine import LiveExecutionEngine
-from nautilus_trader.live.risk_engine import LiveRiskEngine
 from nautilus_trader.model.identifiers import TraderId
-from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
-from nautilus_trader.persistence.writer import StreamingFeatherWriter
 from nautilus_trader.portfolio.base import PortfolioFacade
 from nautilus_trader.portfolio.portfolio import Portfolio
 from nautilus_trader.risk.engine import RiskEngine
@@ -85,6 +83,11 @@ from nautilus_trader.trading.strategy import Strategy
 from nautilus_trader.trading.trader import Trader
 
 
+if TYPE_CHECKING:
+    from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+    from nautilus_trader.persistence.writer import StreamingFeatherWriter
+
+
 try:
     import uvloop
 
@@ -321,6 +324,7 @@ class NautilusKernel:
             serializer=self._msgbus_serializer,
             database=self._msgbus_db,
             config=config.message_bus,
+            trusted=config.trusted_mode,
         )
 
         self._setup_shutdown_handling()
@@ -328,6 +332,7 @@ class NautilusKernel:
         self._cache = Cache(
             database=cache_db,
             config=config.cache,
+            trusted=config.trusted_mode,
         )
 
         self._portfolio = Portfolio(
@@ -345,6 +350,8 @@ class NautilusKernel:
                     f"Cannot use `LiveDataEngineConfig` in a '{config.environment.value}' environment. "
                     "Try using a `DataEngineConfig`.",
                 )
+            from nautilus_trader.live.data_engine import LiveDataEngine
+
             self._data_engine = LiveDataEngine(
                 loop=self.loop,
                 msgbus=self._msgbus,
@@ -374,6 +381,8 @@ class NautilusKernel:
                     f"Cannot use `LiveRiskEngineConfig` in a '{config.environment.value}' environment. "
                     "Try using a `RiskEngineConfig`.",
                 )
+            from nautilus_trader.live.risk_engine import LiveRiskEngine
+
             self._risk_engine = LiveRiskEngine(
                 loop=self.loop,
                 portfolio=self._portfolio,
@@ -405,6 +414,8 @@ class NautilusKernel:
                     f"Cannot use `LiveExecEngineConfig` in a '{config.environment.value}' environment. "
                     "Try using an `ExecEngineConfig`.",
                 )
+            from nautilus_trader.live.execution_engine import LiveExecutionEngine
+
             self._exec_engine = LiveExecutionEngine(
                 loop=self.loop,
                 msgbus=self._msgbus,
@@ -479,6 +490,8 @@ class NautilusKernel:
         # Set up data catalog
         self._catalogs: dict[str, ParquetDataCatalog] = {}
         if config.catalogs:
+            from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
             catalog_name_index = 0
             for catalog_config in config.catalogs:
                 catalog = ParquetDataCatalog(
@@ -547,19 +560,33 @@ class NautilusKernel:
     def _setup_streaming(self, config: StreamingConfig) -> None:
         # Set up persistence
         path = f"{config.catalog_path}/{self._environment.value}/{self.instance_id}"
-        self._writer = StreamingFeatherWriter(
-            path=path,
-            cache=self._cache,
-            clock=self._clock,
-            fs_protocol=config.fs_protocol,
-            flush_interval_ms=config.flush_interval_ms,
-            include_types=config.include_types,
-            rotation_mode=config.rotation_mode,
-            max_file_size=config.max_file_size,
-            rotation_interval=config.rotation_interval,
-            rotation_time=config.rotation_time,
-            rotation_timezone=config.rotation_timezone,
-        )
+        writer_kwargs: dict[str, Any] = {
+            "path": path,
+            "cache": self._cache,
+            "clock": self._clock,
+            "fs_protocol": config.fs_protocol,
+            "flush_interval_ms": config.flush_interval_ms,
+            "max_buffer_rows": config.max_buffer_rows,
+            "include_types": config.include_types,
+            "rotation_mode": config.rotation_mode,
+            "max_file_size": config.max_file_size,
+            "rotation_interval": config.rotation_interval,
+            "rotation_time": config.rotation_time,
+            "rotation_timezone": config.rotation_timezone,
+        }
+        if config.use_thread:
+            from nautilus_trader.persistence.writer import ThreadedStreamingFeatherWriter
+
+            self._writer = ThreadedStreamingFeatherWriter(
+                **writer_kwargs,
+                queue_size=config.queue_size,
+                overflow_policy=config.overflow_policy,
+                fsync_interval_ms=config.fsync_interval_ms,
+            )
+        else:
+            from nautilus_trader.persistence.writer import StreamingFeatherWriter
+
+            self._writer = StreamingFeatherWriter(**writer_kwargs)
         self._trader.subscribe("*", self._writer.write)
         self._log.info(f"Writing data & events to {path}")
 
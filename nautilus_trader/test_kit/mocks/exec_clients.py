@@ -306,10 +306,10 @@ class MockLiveExecutionClient(LiveExecutionClient):
             reports = [r for r in reports if r.instrument_id == instrument_id]
 
         if start is not None:
-            reports = [r for r in reports if r.ts_accepted >= start]
+            reports = [r for r in reports if r.ts_accepted >= start.value]
 
         if end is not None:
-            reports = [r for r in reports if r.ts_accepted <= end]
+            reports = [r for r in reports if r.ts_accepted <= end.value]
 
         return reports
 
@@ -335,10 +335,10 @@ class MockLiveExecutionClient(LiveExecutionClient):
             trades = [t for t in trades if t.instrument_id == instrument_id]
 
         if start is not None:
-            trades = [t for t in trades if t.ts_event >= start]
+            trades = [t for t in trades if t.ts_event >= start.value]
 
         if end is not None:
-            trades = [t for t in trades if t.ts_event <= end]
+            trades = [t for t in trades if t.ts_event <= end.value]
 
         return trades
 
@@ -360,9 +360,9 @@ class MockLiveExecutionClient(LiveExecutionClient):
                 reports = [*reports, *p_list]
 
         if start is not None:
-            reports = [r for r in reports if r.ts_event >= start]
+            reports = [r for r in reports if r.ts_last >= start.value]
 
         if end is not None:
-            reports = [r for r in reports if r.ts_event <= end]
+            reports = [r for r in reports if r.ts_last <= end.value]
 
         return reports
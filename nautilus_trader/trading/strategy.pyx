@@ -281,6 +281,7 @@ cdef class Strategy(Actor):
             strategy_id=self.id,
             clock=clock,
             cache=cache,
+            trusted=msgbus.trusted,  # Kernel trusted mode
         )
 
         self._manager = OrderManager(
@@ -1462,7 +1463,7 @@ cdef class Strategy(Actor):
         cdef str timer_name = self._get_gtd_expiry_timer_name(order.client_order_id)
         cdef str expire_time_str = f" @ {order.expire_time.isoformat()}" if hasattr(order, "expire_time") else ""
 
-        if timer_name not in self._clock.timer_names:
+        if not self._clock.has_timer(timer_name):
             self._log.error(f"Cannot find managed GTD timer for order {order.client_order_id!r}")
             return
 
@@ -1477,7 +1478,7 @@ cdef class Strategy(Actor):
 
     cdef bint _has_gtd_expiry_timer(self, ClientOrderId client_order_id):
         cdef str timer_name = self._get_gtd_expiry_timer_name(client_order_id)
-        return timer_name in self._clock.timer_names
+        return self._clock.has_timer(timer_name)
 
     cdef void _set_gtd_expiry(self, Order order):
         cdef str timer_name = self._get_gtd_expiry_timer_name(order.client_order_id)
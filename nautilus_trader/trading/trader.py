@@ -417,6 +417,7 @@ class Trader(Component):
         )
 
         self._exec_engine.register_oms_type(strategy)
+        self._risk_engine.register_oms_type(strategy)
         self._exec_engine.register_external_order_claims(strategy)
         self._strategies[strategy.id] = strategy
 
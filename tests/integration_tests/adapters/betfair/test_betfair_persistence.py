@@ -13,20 +13,30 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader import TEST_DATA_DIR
 from nautilus_trader.adapters.betfair.data_types import BetfairStartingPrice
 from nautilus_trader.adapters.betfair.data_types import BetfairTicker
 from nautilus_trader.adapters.betfair.data_types import BSPOrderBookDelta
+from nautilus_trader.adapters.betfair.parsing.core import load_betfair_files_to_catalog
+from nautilus_trader.adapters.betfair.parsing.core import parse_betfair_file
 from nautilus_trader.core.rust.model import BookAction
 from nautilus_trader.core.rust.model import OrderSide
 from nautilus_trader.model.data import BookOrder
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.instruments import BettingInstrument
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 from nautilus_trader.test_kit.mocks.data import setup_catalog
 from tests.integration_tests.adapters.betfair.test_kit import betting_instrument
 from tests.integration_tests.adapters.betfair.test_kit import load_betfair_data
 
 
+BETFAIR_FILE_1 = TEST_DATA_DIR / "betfair" / "1-166564490.bz2"
+BETFAIR_FILE_2 = TEST_DATA_DIR / "betfair" / "1-166811431.bz2"
+
+
 class TestBetfairPersistence:
     def setup(self):
         self.catalog = setup_catalog(protocol="memory", path="/catalog")
@@ -106,3 +116,69 @@ class TestBetfairPersistence:
 
         # Assert
         assert len(data) == 210
+
+    def test_load_betfair_files_to_catalog(self):
+        # Arrange
+        parsed = list(parse_betfair_file(BETFAIR_FILE_1, currency="GBP"))
+        instrument_ids = {x.id for x in parsed if isinstance(x, BettingInstrument)}
+
+        # Act
+        count = load_betfair_files_to_catalog(
+            [BETFAIR_FILE_1],
+            catalog=self.catalog,
+            currency="GBP",
+            max_workers=1,
+        )
+
+        # Assert
+        assert count == len(parsed) - len([x for x in parsed if isinstance(x, BettingInstrument)])
+        assert len(self.catalog.instruments()) == len(instrument_ids)
+        assert len(self.catalog.query(BetfairTicker)) == 210
+
+    def test_load_betfair_files_to_catalog_resumes_from_progress(self):
+        # Arrange
+        load_betfair_files_to_catalog(
+            [BETFAIR_FILE_1],
+            catalog=self.catalog,
+            currency="GBP",
+            max_workers=1,
+        )
+        parsed = list(parse_betfair_file(BETFAIR_FILE_2, currency="GBP"))
+        expected = len([x for x in parsed if not isinstance(x, BettingInstrument)])
+
+        # Act
+        count = load_betfair_files_to_catalog(
+            [BETFAIR_FILE_1, BETFAIR_FILE_2],
+            catalog=self.catalog,
+            currency="GBP",
+            max_workers=1,
+        )
+
+        # Assert
+        assert count == expected
+        assert load_betfair_files_to_catalog(
+            [BETFAIR_FILE_1, BETFAIR_FILE_2],
+            catalog=self.catalog,
+            currency="GBP",
+            max_workers=1,
+        ) == 0
+
+    def test_load_betfair_files_to_catalog_process_pool(self, tmp_path):
+        # Arrange
+        catalog = ParquetDataCatalog(path=tmp_path / "catalog", fs_protocol="file")
+        expected = sum(
+            isinstance(x, TradeTick)
+            for uri in (BETFAIR_FILE_1, BETFAIR_FILE_2)
+            for x in parse_betfair_file(uri, currency="GBP")
+        )
+
+        # Act
+        load_betfair_files_to_catalog(
+            [BETFAIR_FILE_1, BETFAIR_FILE_2],
+            catalog=catalog,
+            currency="GBP",
+            max_workers=2,
+        )
+
+        # Assert
+        assert len(catalog.query(TradeTick)) == expected
@@ -966,3 +966,70 @@ def test_load_status_pyo3_large() -> None:
 
     # Assert
     assert len(data) == 4_673_675
+
+
+def test_stream_dbn_file_mbo_chunks() -> None:
+    # Arrange
+    loader = DatabentoDataLoader()
+    path = DATABENTO_TEST_DATA_DIR / "mbo.dbn.zst"
+
+    # Act
+    chunks = list(loader.stream_dbn_file(path, chunk_size=1))
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [1, 1]
+    assert [chunk[0] for chunk in chunks] == loader.from_dbn_file(path)
+
+
+def test_stream_dbn_file_mbo_chunks_pyo3() -> None:
+    # Arrange
+    loader = DatabentoDataLoader()
+    path = DATABENTO_TEST_DATA_DIR / "mbo.dbn.zst"
+
+    # Act
+    chunks = list(loader.stream_dbn_file(path, chunk_size=1, as_legacy_cython=False))
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [1, 1]
+    assert isinstance(chunks[0][0], nautilus_pyo3.OrderBookDelta)
+    assert chunks[0][0].ts_event == 1609160400000704060
+
+
+def test_stream_dbn_file_definition_chunks() -> None:
+    # Arrange
+    loader = DatabentoDataLoader()
+    path = DATABENTO_TEST_DATA_DIR / "definition-glbx-es-fut.dbn.zst"
+    expected = loader.from_dbn_file(path)
+
+    # Act
+    chunks = list(loader.stream_dbn_file(path, chunk_size=1))
+
+    # Assert
+    assert len(chunks) == len(expected)
+    assert [chunk[0] for chunk in chunks] == expected
+
+
+def test_from_dbn_file_as_arrow_mbo() -> None:
+    # Arrange
+    loader = DatabentoDataLoader()
+    path = DATABENTO_TEST_DATA_DIR / "mbo.dbn.zst"
+    expected = loader.from_dbn_file(path)
+
+    # Act
+    batches = loader.from_dbn_file_as_arrow(path)
+
+    # Assert
+    assert len(batches) == 1
+    assert batches[0].num_rows == len(expected)
+    assert batches[0].schema.metadata[b"instrument_id"] == expected[0].instrument_id.value.encode()
+    assert batches[0].column("ts_init").to_pylist() == [d.ts_init for d in expected]
+
+
+def test_from_dbn_file_as_arrow_definition_raises() -> None:
+    # Arrange
+    loader = DatabentoDataLoader()
+    path = DATABENTO_TEST_DATA_DIR / "definition.dbn.zst"
+
+    # Act, Assert
+    with pytest.raises(RuntimeError):
+        loader.from_dbn_file_as_arrow(path)
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.adapters.tardis.loaders import TardisCSVDataLoader
+from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import BookAction
 from nautilus_trader.model.enums import OrderSide
@@ -149,3 +150,47 @@ def test_tardis_load_trades():
     assert trades[0].trade_id == TradeId("ccc3c1fa-212c-e8b0-1706-9b9c4f3d5ecf")
     assert trades[0].ts_event == 1583020803145000000
     assert trades[0].ts_init == 1583020803307160000
+
+
+def test_tardis_stream_trades():
+    # Arrange
+    filepath = ensure_data_exists_tardis_bitmex_trades()
+    loader = TardisCSVDataLoader(price_precision=1, size_precision=0)
+
+    # Act
+    chunks = list(loader.stream_trades(filepath, chunk_size=40_000, limit=100_000))
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [40_000, 40_000, 20_000]
+    assert chunks[0][0] == loader.load_trades(filepath, limit=1)[0]
+    assert chunks[0][0].trade_id == TradeId("ccc3c1fa-212c-e8b0-1706-9b9c4f3d5ecf")
+
+
+def test_tardis_stream_deltas_pyo3():
+    # Arrange
+    filepath = ensure_data_exists_tardis_deribit_book_l2()
+    loader = TardisCSVDataLoader(price_precision=1, size_precision=0)
+
+    # Act
+    chunks = list(
+        loader.stream_deltas(filepath, chunk_size=50_000, as_legacy_cython=False, limit=100_000),
+    )
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [50_000, 50_000]
+    assert isinstance(chunks[0][0], nautilus_pyo3.OrderBookDelta)
+    assert chunks[0][0].ts_event == 1585699200245000000
+
+
+def test_tardis_load_trades_as_arrow():
+    # Arrange
+    filepath = ensure_data_exists_tardis_bitmex_trades()
+    loader = TardisCSVDataLoader(price_precision=1, size_precision=0)
+
+    # Act
+    batches = loader.load_trades_as_arrow(filepath, limit=100_000)
+
+    # Assert
+    assert sum(batch.num_rows for batch in batches) == 100_000
+    assert batches[0].schema.metadata[b"instrument_id"] == b"XBTUSD.BITMEX"
+    assert batches[0].column("ts_init")[0].as_py() == 1583020803307160000
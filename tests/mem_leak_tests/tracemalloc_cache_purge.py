@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
+from tests.mem_leak_tests.conftest import snapshot_memory
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+cache = Cache()
+cache.add_account(TestExecStubs.cash_account())
+
+
+@snapshot_memory(4000)
+def run_add_close_and_purge_orders(*args, **kwargs):
+    # Memory should remain flat as closed orders and account events are purged
+    order = TestExecStubs.limit_order(instrument=AUDUSD_SIM)
+    cache.add_order(order)
+    order.apply(TestEventStubs.order_submitted(order))
+    order.apply(TestEventStubs.order_accepted(order))
+    order.apply(TestEventStubs.order_canceled(order))
+    cache.update_order(order)
+
+    account = cache.accounts()[0]
+    account.apply(TestEventStubs.cash_account_state())
+
+    cache.purge_closed_orders(ts_now=0)
+    cache.purge_account_events(ts_now=0)
+
+
+if __name__ == "__main__":
+    run_add_close_and_purge_orders()
@@ -26,6 +26,8 @@ from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.backtest.modules import FXRolloverInterestConfig
 from nautilus_trader.backtest.modules import FXRolloverInterestModule
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.config import ActorConfig
 from nautilus_trader.config import LoggingConfig
 from nautilus_trader.examples.strategies.ema_cross import EMACross
 from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
@@ -164,3 +166,84 @@ def test_run_with_ema_cross_strategy(benchmark):
     end = datetime(2013, 3, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
 
     benchmark(engine.run, start, end)
+
+
+@pytest.mark.skip
+@pytest.mark.benchmark(min_rounds=1)
+def test_run_with_many_actors(benchmark):
+    config = BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True))
+    engine = BacktestEngine(config=config)
+
+    engine.add_venue(
+        venue=Venue("SIM"),
+        oms_type=OmsType.HEDGING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+
+    engine.add_instrument(USDJPY_SIM)
+
+    # Set up data
+    wrangler = QuoteTickDataWrangler(USDJPY_SIM)
+    provider = TestDataProvider()
+    ticks = wrangler.process_bar_data(
+        bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv"),
+        ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv"),
+    )
+    engine.add_data(ticks)
+
+    # Idle actors (no timers) only add per-timestamp cost if all clocks are advanced
+    engine.add_actors([Actor(ActorConfig(component_id=f"Actor-{i:03d}")) for i in range(250)])
+
+    start = datetime(2013, 2, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
+    end = datetime(2013, 2, 10, 0, 0, 0, 0, tzinfo=pytz.utc)
+
+    benchmark(engine.run, start, end)
+
+
+@pytest.mark.parametrize("profile_handlers", [False, True])
+@pytest.mark.benchmark(group="backtest_profile_handlers", min_rounds=1)
+def test_run_with_ema_cross_strategy_profile_handlers(benchmark, profile_handlers):
+    # Compare both runs in the group to measure handler profiling overhead
+    config = BacktestEngineConfig(
+        logging=LoggingConfig(bypass_logging=True),
+        profile_handlers=profile_handlers,
+    )
+    engine = BacktestEngine(config=config)
+
+    engine.add_venue(
+        venue=Venue("SIM"),
+        oms_type=OmsType.HEDGING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+
+    engine.add_instrument(USDJPY_SIM)
+
+    # Set up data
+    wrangler = QuoteTickDataWrangler(USDJPY_SIM)
+    provider = TestDataProvider()
+    ticks = wrangler.process_bar_data(
+        bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv"),
+        ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv"),
+    )
+    engine.add_data(ticks)
+
+    config = EMACrossConfig(
+        instrument_id=USDJPY_SIM.id,
+        bar_type=TestDataStubs.bartype_usdjpy_1min_bid(),
+        trade_size=Decimal(1_000_000),
+        fast_ema_period=10,
+        slow_ema_period=20,
+    )
+    strategy = EMACross(config=config)
+    engine.add_strategy(strategy)
+
+    start = datetime(2013, 2, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
+    end = datetime(2013, 2, 10, 0, 0, 0, 0, tzinfo=pytz.utc)
+
+    benchmark(engine.run, start, end)
+
+    assert (engine.profiler is not None) == profile_handlers
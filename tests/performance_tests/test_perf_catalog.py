@@ -20,7 +20,11 @@ import pytest
 from nautilus_trader import PACKAGE_ROOT
 from nautilus_trader.core.nautilus_pyo3 import DataBackendSession
 from nautilus_trader.core.nautilus_pyo3 import NautilusDataType
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
 from nautilus_trader.model.data import capsule_to_list
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_quote_ticks_audusd
 from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_trade_ticks_ethusdt
 from nautilus_trader.test_kit.mocks.data import setup_catalog
@@ -78,6 +82,31 @@ def test_load_trade_ticks(benchmark) -> None:
     benchmark(run)
 
 
+@pytest.mark.skip
+@pytest.mark.benchmark(min_rounds=1)
+def test_write_bars_many_instruments_parallel(benchmark) -> None:
+    catalog = setup_catalog("file")
+    bars = [
+        Bar(
+            bar_type=BarType.from_str(f"SYM{i}.SIM-1-DAY-LAST-EXTERNAL"),
+            open=Price.from_str("1.00002"),
+            high=Price.from_str("1.00004"),
+            low=Price.from_str("1.00001"),
+            close=Price.from_str("1.00003"),
+            volume=Quantity.from_int(1_000_000),
+            ts_event=day,
+            ts_init=day,
+        )
+        for i in range(5_000)
+        for day in range(10)
+    ]
+
+    def run():
+        catalog.write_data(bars, max_workers=8)
+
+    benchmark(run)
+
+
 @pytest.mark.skip(reason="development_only")
 def test_load_single_stream(benchmark) -> None:
     file_path = PACKAGE_ROOT / "bench_data" / "quotes_0005.parquet"
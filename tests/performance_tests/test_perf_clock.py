@@ -71,3 +71,12 @@ def test_iteratively_advance_time(benchmark) -> None:
         _TEST_CLOCK.advance_time(to_time_ns=test_time)
 
     benchmark(_iteratively_advance_time)
+
+
+def test_set_many_timers(benchmark) -> None:
+    def _set_many_timers():
+        clock = TestClock()
+        for i in range(5_000):
+            clock.set_timer_ns(f"timer-{i}", 60_000_000_000, 0, 0, callback=print)
+
+    benchmark(_set_many_timers)
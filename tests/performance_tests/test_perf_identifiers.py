@@ -13,8 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
 
 def test_symbol_equality(benchmark):
@@ -33,3 +35,23 @@ def test_venue_equality(benchmark):
         return venue == venue
 
     benchmark(venue_equality)
+
+
+def test_instrument_id_dict_lookup(benchmark):
+    instrument_id = InstrumentId.from_str("AUD/USD.SIM")
+    mapping = {instrument_id: 1}
+
+    def instrument_id_dict_lookup() -> int:
+        return mapping[instrument_id]
+
+    benchmark(instrument_id_dict_lookup)
+
+
+def test_quote_tick_instrument_id_dict_lookup(benchmark):
+    quote = TestDataStubs.quote_tick()
+    mapping = {quote.instrument_id: 1}
+
+    def quote_tick_instrument_id_dict_lookup() -> int:
+        return mapping[quote.instrument_id]
+
+    benchmark(quote_tick_instrument_id_dict_lookup)
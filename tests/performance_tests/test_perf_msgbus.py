@@ -0,0 +1,43 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+def _msgbus(trusted: bool) -> MessageBus:
+    msgbus = MessageBus(
+        trader_id=TestIdStubs.trader_id(),
+        clock=TestClock(),
+        trusted=trusted,
+    )
+    msgbus.subscribe(topic="data.quotes.*", handler=lambda msg: None)
+    msgbus.register(endpoint="mailbox", handler=lambda msg: None)
+    return msgbus
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_msgbus_publish(benchmark, trusted):
+    msgbus = _msgbus(trusted)
+    benchmark(msgbus.publish, "data.quotes.SIM.AUD/USD", "MESSAGE")
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_msgbus_send(benchmark, trusted):
+    msgbus = _msgbus(trusted)
+    benchmark(msgbus.send, "mailbox", "MESSAGE")
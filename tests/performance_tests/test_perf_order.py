@@ -22,6 +22,7 @@ from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
@@ -58,3 +59,28 @@ class TestOrderPerformance:
             Quantity.from_int(100_000),
             Price.from_str("0.80010"),
         )
+
+    def test_limit_ladder_creation(self, benchmark):
+        quantities = [Quantity.from_int(100_000)] * 10
+        prices = [Price(0.80000 - i * 0.00010, precision=5) for i in range(10)]
+
+        benchmark(
+            self.order_factory.limit_ladder,
+            TestIdStubs.audusd_id(),
+            OrderSide.BUY,
+            quantities,
+            prices,
+        )
+
+    def test_order_apply_submitted_accepted(self, benchmark):
+        def create_and_apply():
+            order = self.order_factory.limit(
+                TestIdStubs.audusd_id(),
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+                Price.from_str("0.80010"),
+            )
+            order.apply(TestEventStubs.order_submitted(order))
+            order.apply(TestEventStubs.order_accepted(order))
+
+        benchmark(create_and_apply)
@@ -17,9 +17,12 @@ import pytest
 
 from nautilus_trader import TEST_DATA_DIR
 from nautilus_trader.adapters.databento.loaders import DatabentoDataLoader
+from nautilus_trader.model.data import BookOrder
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
@@ -52,3 +55,35 @@ def test_orderbook_spy_xnas_itch_mbo_l3(benchmark) -> None:
     assert len(book.asks()) == 38
     assert book.best_bid_price() == Price.from_str("454.84")
     assert book.best_ask_price() == Price.from_str("454.90")
+
+
+def _make_deep_book():
+    instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    return TestDataStubs.make_book(
+        instrument=instrument,
+        book_type=BookType.L2_MBP,
+        bids=[(0.80000 - i * 0.00001, 100_000.0) for i in range(500)],
+        asks=[(0.80010 + i * 0.00001, 100_000.0) for i in range(500)],
+    )
+
+
+def test_orderbook_bids_top_5_levels(benchmark) -> None:
+    book = _make_deep_book()
+
+    benchmark(book.bids, 5)
+
+
+def test_orderbook_update_and_imbalance_top_5_levels(benchmark) -> None:
+    book = _make_deep_book()
+    order = BookOrder(
+        price=Price(0.80000, 5),
+        size=Quantity(200_000.0, 0),
+        side=OrderSide.BUY,
+        order_id=0,
+    )
+
+    def _update_and_imbalance():
+        book.update(order, 0)
+        book.imbalance(5)
+
+    benchmark(_update_and_imbalance)
@@ -0,0 +1,78 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.accounting.factory import AccountFactory
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.position import Position
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+def test_unrealized_pnl_per_quote_with_many_open_positions(benchmark):
+    clock = TestClock()
+    cache = TestComponentStubs.cache()
+    cache.add_instrument(AUDUSD_SIM)
+    msgbus = MessageBus(trader_id=TestIdStubs.trader_id(), clock=clock)
+    portfolio = Portfolio(msgbus=msgbus, cache=cache, clock=clock)
+    order_factory = OrderFactory(
+        trader_id=TestIdStubs.trader_id(),
+        strategy_id=StrategyId("S-001"),
+        clock=clock,
+    )
+
+    AccountFactory.register_calculated_account("SIM")
+    account_id = TestIdStubs.account_id()
+    portfolio.update_account(TestEventStubs.margin_account_state(account_id))
+
+    for i in range(1_000):
+        order = order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY if i % 2 == 0 else OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            account_id=account_id,
+            position_id=PositionId(f"P-{i}"),
+            last_px=Price.from_str("1.00000"),
+        )
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        cache.add_position(position, OmsType.HEDGING)
+        portfolio.update_position(TestEventStubs.position_opened(position))
+
+    quote = TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=1.00010, ask_price=1.00020)
+    cache.add_quote_tick(quote)
+
+    def update_and_query():
+        portfolio.update_quote_tick(quote)
+        portfolio.unrealized_pnl(AUDUSD_SIM.id)
+
+    benchmark(update_and_query)
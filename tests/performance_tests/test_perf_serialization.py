@@ -60,3 +60,24 @@ class TestSerializationPerformance:
 
     def test_serialize_submit_order(self, benchmark):
         benchmark(self.serializer.serialize, self.command)
+
+    def test_deserialize_submit_order(self, benchmark):
+        serialized = self.serializer.serialize(self.command)
+
+        benchmark(self.serializer.deserialize, serialized)
+
+    def test_serialize_submit_order_timestamps_as_str(self, benchmark):
+        serializer = MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True)
+
+        benchmark(serializer.serialize, self.command)
+
+    def test_deserialize_submit_order_timestamps_as_str(self, benchmark):
+        serializer = MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True)
+        serialized = serializer.serialize(self.command)
+
+        benchmark(serializer.deserialize, serialized)
+
+    def test_serialize_order_initialized_timestamps_as_str(self, benchmark):
+        serializer = MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True)
+
+        benchmark(serializer.serialize, self.order.last_event)
@@ -172,6 +172,51 @@ class TestCashAccount:
             ETH: Money(0.00000000, ETH),
         }
 
+    def test_purge_account_events_retains_events_within_lookback_and_latest(self):
+        # Arrange
+        account = TestExecStubs.cash_account()
+        for ts_event in (1_000_000_000, 2_000_000_000, 3_000_000_000):
+            account.apply(
+                AccountState(
+                    account_id=account.id,
+                    account_type=AccountType.CASH,
+                    base_currency=USD,
+                    reported=True,
+                    balances=[
+                        AccountBalance(
+                            Money(1_000_000, USD),
+                            Money(0, USD),
+                            Money(1_000_000, USD),
+                        ),
+                    ],
+                    margins=[],
+                    info={},
+                    event_id=UUID4(),
+                    ts_event=ts_event,
+                    ts_init=ts_event,
+                ),
+            )
+
+        # Act
+        account.purge_account_events(ts_now=3_500_000_000, lookback_secs=2)
+
+        # Assert
+        assert account.event_count == 2
+        assert [e.ts_event for e in account.events] == [2_000_000_000, 3_000_000_000]
+        assert account.balance_total(USD) == Money(1_000_000, USD)
+
+    def test_purge_account_events_always_retains_latest_event(self):
+        # Arrange
+        account = TestExecStubs.cash_account()
+        last_event = account.last_event
+
+        # Act
+        account.purge_account_events(ts_now=10_000_000_000)
+
+        # Assert
+        assert account.event_count == 1
+        assert account.last_event == last_event
+
     def test_apply_given_new_state_event_updates_correctly(self):
         # Arrange
         event1 = AccountState(
@@ -17,6 +17,7 @@ from decimal import Decimal
 
 import pytest
 
+from nautilus_trader.accounting.error import AccountMarginExceeded
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.model.currencies import BTC
@@ -24,6 +25,7 @@ from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.enums import PositionSide
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.objects import MarginBalance
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
@@ -135,6 +137,58 @@ class TestMarginAccount:
         assert account.margin_maint(AUDUSD_SIM.id) == margin
         assert account.margins_maint() == {AUDUSD_SIM.id: margin}
 
+    def test_margin_updates_maintain_running_totals(self):
+        # Arrange
+        account = TestExecStubs.margin_account()  # Initial margins of 60,000 USD for AUD/USD
+
+        # Act
+        account.update_margin_init(USDJPY_SIM.id, Money(1_000.00, USD))
+        account.update_margin_maint(USDJPY_SIM.id, Money(2_000.00, USD))
+        account.update_margin_init(USDJPY_SIM.id, Money(500.00, USD))
+        account.update_margin_init(AUDUSD_SIM.id, Money(20_000.00, USD))
+        account.clear_margin_maint(AUDUSD_SIM.id)
+
+        # Assert
+        assert account.check_margin_totals()
+        assert account.balance_locked(USD) == Money(22_500.00, USD)
+        assert account.balance_free(USD) == Money(977_500.00, USD)
+
+    def test_clear_margins_maintain_running_totals(self):
+        # Arrange
+        account = TestExecStubs.margin_account()
+        account.update_margin_init(USDJPY_SIM.id, Money(1_000.00, USD))
+        account.update_margin_maint(USDJPY_SIM.id, Money(2_000.00, USD))
+
+        # Act
+        account.clear_margin(AUDUSD_SIM.id)
+        account.clear_margin_init(USDJPY_SIM.id)
+
+        # Assert
+        assert account.check_margin_totals()
+        assert account.margins() == {USDJPY_SIM.id: account.margin(USDJPY_SIM.id)}
+        assert account.balance_locked(USD) == Money(2_000.00, USD)
+        assert account.balance_free(USD) == Money(998_000.00, USD)
+
+    def test_update_margin_replaces_running_total(self):
+        # Arrange
+        account = TestExecStubs.margin_account()
+
+        # Act
+        account.update_margin(MarginBalance(Money(1_000, USD), Money(3_000, USD), AUDUSD_SIM.id))
+
+        # Assert
+        assert account.check_margin_totals()
+        assert account.balance_locked(USD) == Money(4_000.00, USD)
+        assert account.balance_free(USD) == Money(996_000.00, USD)
+
+    def test_update_margin_init_when_exceeding_balance_raises(self):
+        # Arrange
+        account = TestExecStubs.margin_account()
+
+        # Act, Assert
+        with pytest.raises(AccountMarginExceeded):
+            account.update_margin_init(USDJPY_SIM.id, Money(1_000_000.00, USD))
+
     def test_calculate_margin_init_with_leverage(self):
         # Arrange
         account = TestExecStubs.margin_account()
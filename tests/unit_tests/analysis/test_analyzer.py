@@ -15,6 +15,10 @@
 
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+import pytest
+
 from nautilus_trader.analysis.analyzer import PortfolioAnalyzer
 from nautilus_trader.analysis.statistics.sharpe_ratio import SharpeRatio
 from nautilus_trader.common.component import TestClock
@@ -25,6 +29,7 @@ from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.position import Position
@@ -198,3 +203,121 @@ class TestPortfolioAnalyzer:
         assert len(result) == 2
         assert result["P-1"] == 6.0
         assert result["P-2"] == 16.0
+
+    def test_analyzer_sums_returns_with_same_timestamp(self):
+        # Arrange
+        t1 = datetime(year=2010, month=1, day=1)
+        t2 = datetime(year=2010, month=1, day=2)
+
+        # Act
+        self.analyzer.add_return(t1, 0.05)
+        self.analyzer.add_return(t2, -0.10)
+        self.analyzer.add_return(t1, 0.05)
+        result = self.analyzer.returns()
+
+        # Assert
+        expected = pd.Series([0.10, -0.10], index=pd.DatetimeIndex([t1, t2]))
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_analyzer_tracks_returns_beyond_initial_capacity(self):
+        # Arrange
+        timestamps = pd.date_range("2010-01-01", periods=5_000, freq="1min")
+
+        # Act
+        for timestamp in timestamps:
+            self.analyzer.add_return(timestamp.to_pydatetime(), 0.01)
+        result = self.analyzer.returns()
+
+        # Assert
+        assert len(result) == 5_000
+        assert result.sum() == pytest.approx(50.0)
+
+    def test_add_trade_with_same_position_id_replaces_value(self):
+        # Arrange
+        self.analyzer.add_trade(PositionId("P-1"), Money(10.00, USD))
+        self.analyzer.add_trade(PositionId("P-2"), Money(-5.00, USD))
+
+        # Act
+        self.analyzer.add_trade(PositionId("P-1"), Money(20.00, USD))
+        result = self.analyzer.realized_pnls(USD)
+
+        # Assert
+        stats = self.analyzer.running_statistics(USD)
+        assert list(result.index) == ["P-1", "P-2"]
+        assert list(result) == [20.0, -5.0]
+        assert stats["Trades"] == 2
+        assert stats["Win Rate"] == 0.5
+        assert stats["PnL (realized)"] == 15.0
+        assert stats["Max Drawdown"] == -5.0
+
+    def test_add_trade_with_same_position_id_counts_trade_once(self):
+        # Arrange
+        self.analyzer.add_trade(PositionId("P-1"), Money(10.00, USD))
+
+        # Act
+        self.analyzer.add_trade(PositionId("P-1"), Money(20.00, USD))
+
+        # Assert
+        stats = self.analyzer.running_statistics(USD)
+        assert stats["Trades"] == 1
+        assert stats["PnL (realized)"] == 20.0
+
+    def test_running_statistics_when_no_data(self):
+        # Arrange, Act
+        result = self.analyzer.running_statistics()
+
+        # Assert
+        assert result["Trades"] == 0
+        assert result["Win Rate"] == 0.0
+        assert result["PnL (realized)"] == 0.0
+        assert result["Max Drawdown"] == 0.0
+        assert np.isnan(result["Sharpe Ratio (running)"])
+        assert np.isnan(result["Sortino Ratio (running)"])
+
+    def test_running_statistics_match_batch_calculations(self):
+        # Arrange
+        pnls = [10.0, -5.0, 20.0, -15.0, -10.0, 30.0]
+        returns = [0.01, -0.005, 0.02, -0.015, -0.01, 0.03]
+
+        # Act
+        for pnl, value in zip(pnls, returns, strict=True):
+            self.analyzer.update_running_statistics(Money(pnl, USD), value)
+        result = self.analyzer.running_statistics()
+
+        # Assert
+        returns_array = np.asarray(returns)
+        downside = np.sqrt((returns_array[returns_array < 0] ** 2).sum() / len(returns_array))
+        assert result["Trades"] == 6
+        assert result["Win Rate"] == 0.5
+        assert result["PnL (realized)"] == 30.0
+        assert result["Max Drawdown"] == -25.0
+        assert result["Returns Average"] == pytest.approx(returns_array.mean())
+        assert result["Sharpe Ratio (running)"] == pytest.approx(
+            returns_array.mean() / returns_array.std(ddof=1),
+        )
+        assert result["Sortino Ratio (running)"] == pytest.approx(returns_array.mean() / downside)
+        assert self.analyzer.realized_pnls(USD) is None  # Trade data not retained
+
+    def test_running_statistics_for_multi_currency_without_currency_raises(self):
+        # Arrange
+        self.analyzer.update_running_statistics(Money(10.00, USD), 0.01)
+        self.analyzer.update_running_statistics(Money(10.00, AUD), 0.01)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.analyzer.running_statistics()
+
+        assert self.analyzer.running_statistics(AUD)["Trades"] == 1
+
+    def test_reset_clears_running_statistics(self):
+        # Arrange
+        self.analyzer.add_trade(PositionId("P-1"), Money(10.00, USD))
+        self.analyzer.add_return(datetime(year=2010, month=1, day=1), 0.01)
+
+        # Act
+        self.analyzer.reset()
+
+        # Assert
+        assert self.analyzer.running_statistics()["Trades"] == 0
+        assert self.analyzer.returns().empty
+        assert self.analyzer.realized_pnls() is None
@@ -25,6 +25,7 @@ from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.common.actor import Actor
+from nautilus_trader.config import ActorConfig
 from nautilus_trader.config import ImportableControllerConfig
 from nautilus_trader.config import InvalidConfiguration
 from nautilus_trader.config import LoggingConfig
@@ -79,6 +80,26 @@ GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
 
+class TimerActor(Actor):
+    def __init__(self, config: ActorConfig, interval: pd.Timedelta | None) -> None:
+        super().__init__(config)
+        self.interval = interval
+        self.start_ns = 0
+        self.event_times: list[tuple[int, int]] = []
+
+    def on_start(self) -> None:
+        self.start_ns = self.clock.timestamp_ns()
+        if self.interval is not None:
+            self.clock.set_timer(
+                name=f"{self.id}-TIMER",
+                interval=self.interval,
+                callback=self.on_timer,
+            )
+
+    def on_timer(self, event) -> None:
+        self.event_times.append((event.ts_event, self.clock.timestamp_ns()))
+
+
 class TestBacktestEngine:
     def setup(self):
         # Fixture Setup
@@ -197,6 +218,50 @@ class TestBacktestEngine:
         # Assert
         assert len(self.engine.trader.strategy_states()) == 1
 
+    def test_run_without_profile_handlers_has_no_profile(self):
+        # Arrange, Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.profiler is None
+        assert self.engine.get_result().profile is None
+
+    def test_run_with_profile_handlers_reports_handler_stats(self):
+        # Arrange
+        engine = self.create_engine(
+            BacktestEngineConfig(
+                logging=LoggingConfig(bypass_logging=True),
+                profile_handlers=True,
+            ),
+        )
+        config = EMACrossConfig(
+            instrument_id=USDJPY_SIM.id,
+            bar_type=BarType.from_str("USD/JPY.SIM-1-MINUTE-BID-INTERNAL"),
+            trade_size=Decimal(100_000),
+            fast_ema_period=10,
+            slow_ema_period=20,
+            subscribe_quote_ticks=True,
+        )
+        engine.add_strategy(EMACross(config=config))
+
+        # Act
+        engine.run()
+        profile = engine.get_result().profile
+
+        # Assert
+        handlers = {(h["name"], h["message_type"]): h for h in profile["handlers"]}
+        assert handlers[("DataEngine.process", "QuoteTick")]["count"] == 8000
+        assert handlers[("SimulatedExchange-SIM.process_data", "QuoteTick")]["count"] == 8000
+        assert handlers[("EMACross-000.handle_quote_tick", "QuoteTick")]["count"] == 8000
+        assert {"data", "timer"} <= set(profile["categories"])
+        for stats in profile["handlers"]:
+            assert stats["self_ns"] <= stats["total_ns"]
+            assert stats["min_ns"] <= stats["p50_ns"] <= stats["p99_ns"] <= stats["max_ns"]
+
+        engine.reset()
+        assert engine.profiler.stats() == []
+        engine.dispose()
+
     def test_change_fill_model(self):
         # Arrange, Act
         self.engine.change_fill_model(Venue("SIM"), FillModel())
@@ -301,6 +366,29 @@ class TestBacktestEngine:
         assert msg.ts_init == 1359676800000000000
         assert msg.ts_event == 1359676800000000000
 
+    def test_run_advances_only_actor_clocks_with_timers_due(self):
+        # Arrange
+        hourly = TimerActor(ActorConfig(component_id="TimerActor-001"), pd.Timedelta(hours=1))
+        half_hourly = TimerActor(ActorConfig(component_id="TimerActor-002"), pd.Timedelta(minutes=30))
+        idle = TimerActor(ActorConfig(component_id="TimerActor-003"), None)
+        self.engine.add_actors([hourly, half_hourly, idle])
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        end_ns = self.engine.kernel.clock.timestamp_ns()
+        for actor in (hourly, half_hourly):
+            interval_ns = actor.interval.value
+            expected_count = (end_ns - actor.start_ns) // interval_ns
+            assert len(actor.event_times) == expected_count
+            for i, (ts_event, ts_clock) in enumerate(actor.event_times):
+                assert ts_event == actor.start_ns + (i + 1) * interval_ns
+                assert ts_clock == ts_event  # Clock time is the event time when handled
+
+        assert idle.event_times == []
+        assert idle.clock.timestamp_ns() == end_ns  # Shares the engine time source
+
     def test_set_instance_id(self):
         # Arrange
         instance_id = UUID4()
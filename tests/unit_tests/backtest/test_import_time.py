@@ -0,0 +1,77 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import subprocess
+import sys
+
+import pytest
+
+
+# Generous ceiling for the cumulative import time of the backtest engine, intended to
+# catch regressions such as heavy modules or adapters being imported eagerly
+IMPORT_TIME_CEILING_US = 3_000_000
+
+# Modules which should only be imported on first use (not by the backtest engine)
+LAZY_MODULES = (
+    "nautilus_trader.adapters",
+    "nautilus_trader.live.data_engine",
+    "nautilus_trader.live.execution_engine",
+    "nautilus_trader.live.risk_engine",
+    "nautilus_trader.persistence.catalog.parquet",
+    "nautilus_trader.persistence.writer",
+    "nautilus_trader.serialization.arrow.serializer",
+)
+
+
+def _import_in_subprocess(module: str) -> tuple[int, list[str]]:
+    code = (
+        f"import sys; import {module}; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines are formatted as 'import time: <self us> | <cumulative us> | <module>'
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() == module:
+            cumulative_us = int(cumulative)
+
+    imported = [m for m in result.stdout.strip().split(",") if m]
+    return cumulative_us, imported
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Timing unreliable on Windows CI")
+def test_import_backtest_engine_within_import_time_budget() -> None:
+    # Arrange, Act
+    cumulative_us, _ = _import_in_subprocess("nautilus_trader.backtest.engine")
+
+    # Assert
+    assert 0 < cumulative_us < IMPORT_TIME_CEILING_US
+
+
+def test_import_backtest_engine_does_not_import_lazy_modules() -> None:
+    # Arrange, Act
+    _, imported = _import_in_subprocess("nautilus_trader.backtest.engine")
+
+    # Assert
+    assert imported == []
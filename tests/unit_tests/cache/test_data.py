@@ -17,6 +17,7 @@ from decimal import Decimal
 
 import pytest
 
+from nautilus_trader.cache.cache import Cache
 from nautilus_trader.core.rust.model import AggregationSource
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import JPY
@@ -539,6 +540,26 @@ class TestCache:
         assert self.cache.quote_tick_count(AUDUSD_SIM.id) == 2
         assert result.ts_init == 1
 
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_trusted_mode_behaves_identically_on_valid_input(self, trusted):
+        # Arrange
+        cache = Cache(trusted=trusted)
+        quote = TestDataStubs.quote_tick()
+        trade = TestDataStubs.trade_tick()
+        bar = TestDataStubs.bar_5decimal()
+
+        # Act
+        cache.add_quote_tick(quote)
+        cache.add_trade_tick(trade)
+        cache.add_bar(bar)
+
+        # Assert
+        assert cache.trusted == trusted
+        assert cache.quote_tick(AUDUSD_SIM.id) == quote
+        assert cache.trade_tick(AUDUSD_SIM.id) == trade
+        assert cache.bar(bar.bar_type) == bar
+        assert cache.price(AUDUSD_SIM.id, PriceType.LAST) == trade.price
+
     def test_trade_tick_when_index_out_of_range_returns_none(self):
         # Arrange
         tick = TestDataStubs.trade_tick()
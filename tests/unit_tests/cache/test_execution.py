@@ -1308,6 +1308,168 @@ class TestCache:
         assert True  # No exception raised
 
 
+    def _add_closed_position(self, position_id: PositionId) -> tuple[Position, list]:
+        orders = []
+        position = None
+        for side in (OrderSide.BUY, OrderSide.SELL):
+            order = self.strategy.order_factory.market(
+                AUDUSD_SIM.id,
+                side,
+                Quantity.from_int(100_000),
+            )
+            self.cache.add_order(order, position_id)
+
+            order.apply(TestEventStubs.order_submitted(order))
+            self.cache.update_order(order)
+
+            order.apply(
+                TestEventStubs.order_accepted(
+                    order,
+                    venue_order_id=VenueOrderId(f"V-{order.client_order_id.value}"),
+                ),
+            )
+            self.cache.update_order(order)
+
+            fill = TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                last_px=Price.from_str("1.00000"),
+            )
+            order.apply(fill)
+            self.cache.update_order(order)
+
+            if position is None:
+                position = Position(instrument=AUDUSD_SIM, fill=fill)
+                self.cache.add_position(position, OmsType.HEDGING)
+            else:
+                position.apply(fill)
+                self.cache.update_position(position)
+
+            orders.append(order)
+
+        return position, orders
+
+    def test_purge_closed_orders_removes_orders_from_all_indexes(self):
+        # Arrange
+        position, orders = self._add_closed_position(PositionId("P-1"))
+        self.cache.purge_closed_positions(ts_now=0)
+
+        # Act
+        self.cache.purge_closed_orders(ts_now=0)
+
+        # Assert
+        for order in orders:
+            assert not self.cache.order_exists(order.client_order_id)
+            assert self.cache.venue_order_id(order.client_order_id) is None
+            assert self.cache.client_order_id(order.venue_order_id) is None
+            assert self.cache.strategy_id_for_order(order.client_order_id) is None
+            assert self.cache.position_id(order.client_order_id) is None
+        assert self.cache.client_order_ids() == set()
+        assert self.cache.client_order_ids(instrument_id=AUDUSD_SIM.id) == set()
+        assert self.cache.client_order_ids(strategy_id=self.strategy.id) == set()
+        assert self.cache.orders_closed_count() == 0
+        assert self.cache.orders_total_count() == 0
+        assert self.cache.check_integrity()
+
+    def test_purge_closed_orders_within_buffer_retains_orders(self):
+        # Arrange
+        position, orders = self._add_closed_position(PositionId("P-1"))
+
+        # Act
+        self.cache.purge_closed_orders(ts_now=0, buffer_secs=60)
+
+        # Assert
+        assert self.cache.orders_closed_count() == 2
+        assert self.cache.check_integrity()
+
+    def test_purge_closed_orders_retains_orders_for_open_position(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        position_id = PositionId("P-1")
+        self.cache.add_order(order, position_id)
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=position_id,
+            last_px=Price.from_str("1.00000"),
+        )
+        order.apply(fill)
+        self.cache.update_order(order)
+        self.cache.add_position(Position(instrument=AUDUSD_SIM, fill=fill), OmsType.HEDGING)
+
+        # Act
+        self.cache.purge_closed_orders(ts_now=0)
+
+        # Assert
+        assert self.cache.order_exists(order.client_order_id)
+        assert order in self.cache.orders_for_position(position_id)
+
+    def test_purge_closed_positions_removes_positions_and_snapshots(self):
+        # Arrange
+        position, orders = self._add_closed_position(PositionId("P-1"))
+        self.cache.snapshot_position(position)
+
+        # Act
+        self.cache.purge_closed_positions(ts_now=0)
+
+        # Assert
+        assert not self.cache.position_exists(position.id)
+        assert self.cache.position_ids() == set()
+        assert self.cache.position_closed_ids() == set()
+        assert self.cache.position_ids(instrument_id=AUDUSD_SIM.id) == set()
+        assert self.cache.position_ids(strategy_id=self.strategy.id) == set()
+        assert self.cache.position_snapshots(position.id) == []
+        assert self.cache.orders_for_position(position.id) == []
+        assert self.cache.strategy_id_for_position(position.id) is None
+        assert self.cache.positions_total_count() == 0
+        assert self.cache.orders_closed_count() == 2  # Orders purged separately
+        assert self.cache.check_integrity()
+
+    def test_purge_closed_positions_within_buffer_retains_positions(self):
+        # Arrange
+        position, orders = self._add_closed_position(PositionId("P-1"))
+
+        # Act
+        self.cache.purge_closed_positions(ts_now=0, buffer_secs=60)
+
+        # Assert
+        assert self.cache.position_exists(position.id)
+        assert self.cache.positions_closed_count() == 1
+
+    def test_purge_closed_orders_and_positions_bounds_index_sizes(self):
+        # Arrange, Act
+        for i in range(100):
+            self._add_closed_position(PositionId(f"P-{i}"))
+            self.cache.purge_closed_positions(ts_now=0)
+            self.cache.purge_closed_orders(ts_now=0)
+
+        # Assert
+        assert self.cache.orders_total_count() == 0
+        assert self.cache.positions_total_count() == 0
+        assert self.cache.client_order_ids_closed() == set()
+        assert self.cache.position_closed_ids() == set()
+        assert self.cache.check_integrity()
+
+    def test_purge_account_events(self):
+        # Arrange
+        account = TestExecStubs.cash_account()
+        self.cache.add_account(account)
+        account.apply(TestEventStubs.cash_account_state())
+
+        # Act
+        self.cache.purge_account_events(ts_now=0)
+
+        # Assert
+        assert account.event_count == 1
+
+
 class TestExecutionCacheIntegrityCheck:
     def setup(self):
         # Fixture Setup
@@ -1619,6 +1619,65 @@ class TestActor:
         # Assert
         assert self.data_engine.command_count == 2
 
+    def test_subscribe_order_book_depth_snapshots(self) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        # Act
+        actor.subscribe_order_book_depth_snapshots(AUDUSD_SIM.id, depth=5, interval_ms=100)
+
+        # Assert
+        assert self.data_engine.command_count == 1
+        assert self.msgbus.has_subscribers("data.book.depth_snapshots.SIM.AUD/USD.100")
+
+    def test_unsubscribe_order_book_depth_snapshots(self) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        actor.subscribe_order_book_depth_snapshots(AUDUSD_SIM.id, interval_ms=100)
+
+        # Act
+        actor.unsubscribe_order_book_depth_snapshots(AUDUSD_SIM.id, interval_ms=100)
+
+        # Assert
+        assert self.data_engine.command_count == 2
+        assert not self.msgbus.has_subscribers("data.book.depth_snapshots.SIM.AUD/USD.100")
+
+    def test_unsubscribe_order_book_depth_snapshots_releases_subscribed_depth(self) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        commands = []
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.data_engine.execute)
+        self.msgbus.register(endpoint="DataEngine.execute", handler=commands.append)
+
+        actor.subscribe_order_book_depth_snapshots(AUDUSD_SIM.id, depth=5, interval_ms=100)
+        actor.subscribe_order_book_depth_snapshots(AUDUSD_SIM.id, depth=8, interval_ms=100)
+
+        # Act
+        actor.unsubscribe_order_book_depth_snapshots(AUDUSD_SIM.id, interval_ms=100)
+
+        # Assert
+        assert commands[1].params["previous_snapshot_depth"] == 5
+        assert commands[2].params["snapshot_depth"] == 8
+
     def test_subscribe_order_book_data(self) -> None:
         # Arrange
         actor = MockActor()
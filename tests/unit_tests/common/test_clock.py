@@ -24,8 +24,11 @@ import pytz
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.component import TimeEventHandler
+from nautilus_trader.common.component import register_component_clock
+from nautilus_trader.common.component import remove_instance_component_clocks
 from nautilus_trader.common.events import TimeEvent
 from nautilus_trader.core.datetime import millis_to_nanos
+from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.test_kit.stubs.data import UNIX_EPOCH
 
 
@@ -395,6 +398,77 @@ class TestTestClock:
         # Assert
         assert clock.timer_count == 0
 
+    def test_has_timer_for_active_and_expired_timers(self):
+        # Arrange
+        clock = TestClock()
+        handler = []
+
+        clock.set_time_alert_ns("TEST_ALERT", millis_to_nanos(100), handler.append)
+        clock.set_timer_ns("TEST_TIMER", millis_to_nanos(100), 0, 0, handler.append)
+
+        # Act
+        has_timers_before = (clock.has_timer("TEST_ALERT"), clock.has_timer("TEST_TIMER"))
+        clock.advance_time(millis_to_nanos(200))
+        has_timers_after = (clock.has_timer("TEST_ALERT"), clock.has_timer("TEST_TIMER"))
+
+        # Assert
+        assert has_timers_before == (True, True)
+        assert has_timers_after == (False, True)
+        assert not clock.has_timer("BOGUS_TIMER")
+
+    def test_next_timer_ns_returns_earliest_active_timer_time(self):
+        # Arrange
+        clock = TestClock()
+        handler = []
+
+        # Act
+        next_timer_ns_before = clock.next_timer_ns()
+        clock.set_time_alert_ns("TEST_ALERT", millis_to_nanos(200), handler.append)
+        clock.set_timer_ns("TEST_TIMER", millis_to_nanos(150), 0, 0, handler.append)
+
+        # Assert
+        assert next_timer_ns_before == 0
+        assert clock.next_timer_ns() == millis_to_nanos(150)
+
+    def test_share_time_sets_time_for_both_clocks(self):
+        # Arrange
+        source = TestClock()
+        clock = TestClock()
+        clock.share_time(source)
+
+        # Act
+        source.set_time(1_000)
+
+        # Assert
+        assert clock.timestamp_ns() == 1_000
+
+    def test_register_component_clock_shares_time_with_first_clock(self):
+        # Arrange
+        instance_id = UUID4()
+        kernel_clock = TestClock()
+        component_clock = TestClock()
+        register_component_clock(instance_id, kernel_clock)
+        register_component_clock(instance_id, component_clock)
+
+        # Act
+        kernel_clock.set_time(1_000)
+
+        # Assert
+        assert component_clock.timestamp_ns() == 1_000
+
+        remove_instance_component_clocks(instance_id)
+
+    def test_set_timer_with_existing_name_raises_key_error(self):
+        # Arrange
+        clock = TestClock()
+        handler = []
+
+        clock.set_timer_ns("TEST_TIMER", millis_to_nanos(100), 0, 0, handler.append)
+
+        # Act, Assert
+        with pytest.raises(KeyError):
+            clock.set_timer_ns("TEST_TIMER", millis_to_nanos(100), 0, 0, handler.append)
+
     def test_set_time_alert2(self):
         # Arrange
         clock = TestClock()
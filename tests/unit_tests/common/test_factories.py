@@ -13,11 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pytest
+
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import OrderType
 from nautilus_trader.model.identifiers import ClientOrderId
 from nautilus_trader.model.identifiers import OrderListId
+from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
@@ -96,3 +100,129 @@ class TestOrderFactory:
 
         # Assert
         assert len(order_list) == 3
+
+    def test_limit_ladder(self):
+        # Arrange
+        quantities = [Quantity.from_str("1.0"), Quantity.from_str("2.0"), Quantity.from_str("3.0")]
+        prices = [Price.from_str("100.00"), Price.from_str("99.00"), Price.from_str("98.00")]
+
+        # Act
+        orders = self.order_factory.limit_ladder(
+            ETHUSDT_PERP_BINANCE.id,
+            OrderSide.BUY,
+            quantities,
+            prices,
+            post_only=True,
+        )
+
+        # Assert
+        assert len(orders) == 3
+        assert [o.price for o in orders] == prices
+        assert [o.quantity for o in orders] == quantities
+        assert all(o.order_type == OrderType.LIMIT for o in orders)
+        assert all(o.is_post_only for o in orders)
+        assert len({o.client_order_id for o in orders}) == 3
+        assert orders[0].client_order_id == ClientOrderId("O-19700101-000000-000-001-1")
+        assert orders[2].client_order_id == ClientOrderId("O-19700101-000000-000-001-3")
+
+    def test_limit_ladder_with_mismatched_lengths_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.order_factory.limit_ladder(
+                ETHUSDT_PERP_BINANCE.id,
+                OrderSide.BUY,
+                [Quantity.from_str("1.0")],
+                [Price.from_str("100.00"), Price.from_str("99.00")],
+            )
+
+    def test_limit_ladder_with_empty_prices_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.order_factory.limit_ladder(
+                ETHUSDT_PERP_BINANCE.id,
+                OrderSide.BUY,
+                [],
+                [],
+            )
+
+    def test_limit_ladder_with_invalid_quantity_raises_before_creating_orders(self):
+        # Arrange, Act
+        with pytest.raises(ValueError):
+            self.order_factory.limit_ladder(
+                ETHUSDT_PERP_BINANCE.id,
+                OrderSide.BUY,
+                [Quantity.from_str("1.0"), Quantity.from_str("0.0")],
+                [Price.from_str("100.00"), Price.from_str("99.00")],
+            )
+
+        order = self.order_factory.limit(
+            ETHUSDT_PERP_BINANCE.id,
+            OrderSide.BUY,
+            Quantity.from_str("1.0"),
+            Price.from_str("100.00"),
+        )
+
+        # Assert
+        assert order.client_order_id == ClientOrderId("O-19700101-000000-000-001-1")
+
+    def test_limit_ladder_with_none_price_raises_before_creating_orders(self):
+        # Arrange, Act
+        with pytest.raises(TypeError):
+            self.order_factory.limit_ladder(
+                ETHUSDT_PERP_BINANCE.id,
+                OrderSide.BUY,
+                [Quantity.from_str("1.0"), Quantity.from_str("2.0"), Quantity.from_str("3.0")],
+                [Price.from_str("100.00"), None, Price.from_str("98.00")],
+            )
+
+        order = self.order_factory.limit(
+            ETHUSDT_PERP_BINANCE.id,
+            OrderSide.BUY,
+            Quantity.from_str("1.0"),
+            Price.from_str("100.00"),
+        )
+
+        # Assert
+        assert order.client_order_id == ClientOrderId("O-19700101-000000-000-001-1")
+
+    def test_trusted_factory_creates_same_orders_for_valid_input(self):
+        # Arrange
+        trusted_factory = OrderFactory(
+            trader_id=self.trader_id,
+            strategy_id=self.strategy_id,
+            clock=TestClock(),
+            trusted=True,
+        )
+        quantities = [Quantity.from_str("1.0"), Quantity.from_str("2.0")]
+        prices = [Price.from_str("100.00"), Price.from_str("99.00")]
+
+        # Act
+        orders = self.order_factory.limit_ladder(
+            ETHUSDT_PERP_BINANCE.id,
+            OrderSide.SELL,
+            quantities,
+            prices,
+            reduce_only=True,
+        )
+        trusted_orders = trusted_factory.limit_ladder(
+            ETHUSDT_PERP_BINANCE.id,
+            OrderSide.SELL,
+            quantities,
+            prices,
+            reduce_only=True,
+        )
+        order_list = self.order_factory.create_list(orders)
+        trusted_order_list = trusted_factory.create_list(trusted_orders)
+
+        # Assert
+        assert trusted_factory.trusted
+        assert not self.order_factory.trusted
+        for order, trusted_order in zip(orders, trusted_orders, strict=True):
+            assert trusted_order.client_order_id == order.client_order_id
+            assert trusted_order.side == order.side
+            assert trusted_order.quantity == order.quantity
+            assert trusted_order.price == order.price
+            assert trusted_order.is_reduce_only == order.is_reduce_only
+            assert trusted_order.ts_init == order.ts_init
+        assert trusted_order_list.id == order_list.id
+        assert trusted_order_list.orders == trusted_orders
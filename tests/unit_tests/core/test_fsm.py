@@ -57,3 +57,18 @@ class TestFiniteStateMachine:
         # Assert
         assert self.fsm.state == ComponentState.STARTING
         assert self.fsm.state_string == "STARTING"
+
+    def test_validate_table_returns_table(self):
+        # Arrange
+        table = ComponentFSMFactory.get_state_transition_table()
+
+        # Act
+        result = FiniteStateMachine.validate_table(table)
+
+        # Assert
+        assert result is table
+
+    def test_validate_table_with_empty_table_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            FiniteStateMachine.validate_table({})
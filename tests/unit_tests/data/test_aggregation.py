@@ -17,6 +17,7 @@ from datetime import timedelta
 from decimal import ROUND_HALF_UP
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -26,8 +27,11 @@ from nautilus_trader.core.datetime import dt_to_unix_nanos
 from nautilus_trader.data.aggregation import BarBuilder
 from nautilus_trader.data.aggregation import TickBarAggregator
 from nautilus_trader.data.aggregation import TimeBarAggregator
+from nautilus_trader.data.aggregation import TimeBarScheduler
 from nautilus_trader.data.aggregation import ValueBarAggregator
 from nautilus_trader.data.aggregation import VolumeBarAggregator
+from nautilus_trader.data.aggregation import quote_ticks_to_raw_arrays
+from nautilus_trader.data.aggregation import trade_ticks_to_raw_arrays
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarSpecification
 from nautilus_trader.model.data import BarType
@@ -54,6 +58,7 @@ NANOSECONDS_IN_SECOND = 1_000_000_000
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
 ETHUSDT_BITMEX = TestInstrumentProvider.ethusd_bitmex()
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
 
 class TestBarBuilder:
@@ -2430,3 +2435,355 @@ class TestTimeBarAggregator:
         assert len(handler) == 2
         assert handler[0].ts_event == ts_event1
         assert handler[1].ts_event == ts_event2
+
+
+class TestTimeBarScheduler:
+    def test_aggregators_with_same_interval_share_one_timer(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+        handler = []
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+
+        # Act
+        aggregator1 = TimeBarAggregator(
+            AUDUSD_SIM,
+            BarType(AUDUSD_SIM.id, bar_spec),
+            handler.append,
+            clock,
+            scheduler=scheduler,
+        )
+        aggregator2 = TimeBarAggregator(
+            USDJPY_SIM,
+            BarType(USDJPY_SIM.id, bar_spec),
+            handler.append,
+            clock,
+            scheduler=scheduler,
+        )
+
+        # Assert
+        assert clock.timer_count == 1
+        assert scheduler.timer_names == clock.timer_names
+        assert aggregator1.next_close_ns == 60 * NANOSECONDS_IN_SECOND
+        assert aggregator2.next_close_ns == 60 * NANOSECONDS_IN_SECOND
+
+    def test_aggregators_with_different_intervals_use_separate_timers(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+        handler = []
+
+        # Act
+        TimeBarAggregator(
+            AUDUSD_SIM,
+            BarType(AUDUSD_SIM.id, BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)),
+            handler.append,
+            clock,
+            scheduler=scheduler,
+        )
+        TimeBarAggregator(
+            AUDUSD_SIM,
+            BarType(AUDUSD_SIM.id, BarSpecification(5, BarAggregation.MINUTE, PriceType.MID)),
+            handler.append,
+            clock,
+            scheduler=scheduler,
+        )
+
+        # Assert
+        assert clock.timer_count == 2
+
+    def test_shared_timer_event_builds_bars_for_all_aggregators(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+        handler = []
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+        bar_type1 = BarType(AUDUSD_SIM.id, bar_spec)
+        bar_type2 = BarType(USDJPY_SIM.id, bar_spec)
+        aggregator1 = TimeBarAggregator(AUDUSD_SIM, bar_type1, handler.append, clock, scheduler=scheduler)
+        aggregator2 = TimeBarAggregator(USDJPY_SIM, bar_type2, handler.append, clock, scheduler=scheduler)
+
+        aggregator1.handle_quote_tick(
+            TestDataStubs.quote_tick(instrument=AUDUSD_SIM, bid_price=1.00001, ask_price=1.00003),
+        )
+        aggregator2.handle_quote_tick(
+            TestDataStubs.quote_tick(instrument=USDJPY_SIM, bid_price=110.001, ask_price=110.003),
+        )
+
+        # Act
+        events = clock.advance_time(2 * 60 * NANOSECONDS_IN_SECOND)
+        for event in events:
+            event.handle()
+
+        # Assert
+        assert len(events) == 2
+        assert [bar.bar_type for bar in handler] == [bar_type1, bar_type2, bar_type1, bar_type2]
+        assert [bar.ts_event for bar in handler] == [
+            60 * NANOSECONDS_IN_SECOND,
+            60 * NANOSECONDS_IN_SECOND,
+            120 * NANOSECONDS_IN_SECOND,
+            120 * NANOSECONDS_IN_SECOND,
+        ]
+        assert aggregator1.next_close_ns == 180 * NANOSECONDS_IN_SECOND
+        assert aggregator2.next_close_ns == 180 * NANOSECONDS_IN_SECOND
+
+    def test_stop_cancels_shared_timer_only_when_last_aggregator_stopped(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+        handler = []
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+        aggregator1 = TimeBarAggregator(
+            AUDUSD_SIM,
+            BarType(AUDUSD_SIM.id, bar_spec),
+            handler.append,
+            clock,
+            scheduler=scheduler,
+        )
+        aggregator2 = TimeBarAggregator(
+            USDJPY_SIM,
+            BarType(USDJPY_SIM.id, bar_spec),
+            handler.append,
+            clock,
+            scheduler=scheduler,
+        )
+
+        # Act
+        aggregator1.stop()
+        timer_count_after_first_stop = clock.timer_count
+        aggregator2.stop()
+
+        # Assert
+        assert timer_count_after_first_stop == 1
+        assert clock.timer_count == 0
+        assert scheduler.timer_names == []
+
+    def test_register_after_timers_cancelled_on_clock_sets_new_timer(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+        handler = []
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+        TimeBarAggregator(
+            AUDUSD_SIM,
+            BarType(AUDUSD_SIM.id, bar_spec),
+            handler.append,
+            clock,
+            scheduler=scheduler,
+        )
+        clock.cancel_timers()
+
+        # Act
+        aggregator = TimeBarAggregator(
+            USDJPY_SIM,
+            BarType(USDJPY_SIM.id, bar_spec),
+            handler.append,
+            clock,
+            scheduler=scheduler,
+        )
+
+        # Assert
+        assert clock.timer_count == 1
+        assert aggregator.next_close_ns == 60 * NANOSECONDS_IN_SECOND
+
+
+class TestColumnarAggregation:
+    @staticmethod
+    def _stream_quote_ticks(aggregator, ticks):
+        handler: list[Bar] = []
+        aggregator.start_batch_update(handler.append, ticks[0].ts_event)
+        for tick in ticks:
+            aggregator.handle_quote_tick(tick)
+        aggregator.stop_batch_update()
+        return handler
+
+    @staticmethod
+    def _stream_trade_ticks(aggregator, ticks):
+        handler: list[Bar] = []
+        aggregator.start_batch_update(handler.append, ticks[0].ts_event)
+        for tick in ticks:
+            aggregator.handle_trade_tick(tick)
+        aggregator.stop_batch_update()
+        return handler
+
+    @staticmethod
+    def _assert_bars_equal(columnar: list[Bar], streamed: list[Bar]) -> None:
+        assert len(columnar) == len(streamed)
+        for bar1, bar2 in zip(columnar, streamed, strict=True):
+            assert bar1 == bar2
+            assert bar1.open == bar2.open
+            assert bar1.high == bar2.high
+            assert bar1.low == bar2.low
+            assert bar1.close == bar2.close
+            assert bar1.volume == bar2.volume
+            assert bar1.ts_event == bar2.ts_event
+            assert bar1.ts_init == bar2.ts_init
+
+    def test_quote_ticks_to_raw_arrays_mid_matches_extracted_values(self):
+        # Arrange
+        tick = TestDataStubs.quote_tick(
+            bid_price=1.00001,
+            ask_price=1.00004,
+            bid_size=1,
+            ask_size=2,
+        )
+
+        # Act
+        prices, sizes, ts_events, price_prec = quote_ticks_to_raw_arrays([tick], PriceType.MID)
+
+        # Assert
+        assert prices[0] == tick.extract_price(PriceType.MID).raw
+        assert sizes[0] == tick.extract_size(PriceType.MID).raw
+        assert ts_events[0] == tick.ts_event
+        assert price_prec == tick.extract_price(PriceType.MID).precision
+
+    def test_trade_ticks_to_raw_arrays(self):
+        # Arrange
+        tick = TestDataStubs.trade_tick()
+
+        # Act
+        prices, sizes, ts_events, price_prec = trade_ticks_to_raw_arrays([tick])
+
+        # Assert
+        assert prices[0] == tick.price.raw
+        assert sizes[0] == tick.size.raw
+        assert ts_events[0] == tick.ts_event
+        assert price_prec == tick.price.precision
+
+    @pytest.mark.parametrize(
+        "price_type",
+        [PriceType.BID, PriceType.ASK, PriceType.MID],
+    )
+    def test_tick_bars_from_quote_ticks_match_streaming(self, price_type):
+        # Arrange
+        instrument = AUDUSD_SIM
+        bar_type = BarType(instrument.id, BarSpecification(100, BarAggregation.TICK, price_type))
+        wrangler = QuoteTickDataWrangler(instrument)
+        provider = TestDataProvider()
+        ticks = wrangler.process(provider.read_csv_ticks("truefx/audusd-ticks.csv")[:1000])
+
+        # Act
+        streamed = self._stream_quote_ticks(TickBarAggregator(instrument, bar_type, print), ticks)
+        columnar = TickBarAggregator(instrument, bar_type, print).aggregate_raw(
+            *quote_ticks_to_raw_arrays(ticks, price_type),
+        )
+
+        # Assert
+        assert len(columnar) == 10
+        self._assert_bars_equal(columnar, streamed)
+
+    @pytest.mark.parametrize("step", [1, 1000, 10_000])
+    def test_volume_bars_from_trade_ticks_match_streaming(self, step):
+        # Arrange
+        instrument = ETHUSDT_BITMEX
+        bar_type = BarType(instrument.id, BarSpecification(step, BarAggregation.VOLUME, PriceType.LAST))
+        wrangler = TradeTickDataWrangler(instrument=instrument)
+        provider = TestDataProvider()
+        ticks = wrangler.process(provider.read_csv_ticks("binance/ethusdt-trades.csv")[:10000])
+
+        # Act
+        streamed = self._stream_trade_ticks(VolumeBarAggregator(instrument, bar_type, print), ticks)
+        columnar = VolumeBarAggregator(instrument, bar_type, print).aggregate_raw(
+            *trade_ticks_to_raw_arrays(ticks),
+        )
+
+        # Assert
+        assert len(columnar) > 0
+        self._assert_bars_equal(columnar, streamed)
+
+    @pytest.mark.parametrize(
+        ("step", "aggregation"),
+        [
+            (1, BarAggregation.SECOND),
+            (15, BarAggregation.SECOND),
+            (1, BarAggregation.MINUTE),
+            (5, BarAggregation.MINUTE),
+            (1, BarAggregation.HOUR),
+        ],
+    )
+    @pytest.mark.parametrize(
+        ("timestamp_on_close", "interval_type"),
+        [
+            (True, "left-open"),
+            (False, "left-open"),
+            (True, "right-open"),
+        ],
+    )
+    def test_time_bars_from_quote_ticks_match_streaming(
+        self,
+        step,
+        aggregation,
+        timestamp_on_close,
+        interval_type,
+    ):
+        # Arrange
+        instrument = BTCUSDT_BINANCE
+        bar_type = BarType(instrument.id, BarSpecification(step, aggregation, PriceType.MID))
+        df_ticks = ParquetTickDataLoader.load(TEST_DATA_DIR / "binance/btcusdt-quotes.parquet")
+        ticks = QuoteTickDataWrangler(instrument).process(df_ticks)
+
+        def make_aggregator():
+            return TimeBarAggregator(
+                instrument,
+                bar_type,
+                print,
+                TestClock(),
+                timestamp_on_close=timestamp_on_close,
+                interval_type=interval_type,
+            )
+
+        # Act
+        streamed = self._stream_quote_ticks(make_aggregator(), ticks)
+        columnar = make_aggregator().aggregate_raw(*quote_ticks_to_raw_arrays(ticks, PriceType.MID))
+
+        # Assert
+        assert len(columnar) > 0
+        self._assert_bars_equal(columnar, streamed)
+
+    def test_time_bars_with_ticks_on_interval_boundaries_match_streaming(self):
+        # Arrange
+        instrument = ETHUSDT_BITMEX
+        bar_type = BarType(instrument.id, BarSpecification(1, BarAggregation.MINUTE, PriceType.LAST))
+        minute = 60 * NANOSECONDS_IN_SECOND
+        timestamps = [
+            30 * NANOSECONDS_IN_SECOND,
+            minute,  # Exactly on the close
+            minute,  # Duplicate on the close
+            3 * minute + 1,  # Skips an interval
+            3 * minute + 2,
+            7 * minute,
+        ]
+        ticks = [
+            TestDataStubs.trade_tick(
+                instrument=instrument,
+                price=100.0 + i,
+                size=i + 1,
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for i, ts in enumerate(timestamps)
+        ]
+
+        # Act
+        streamed = self._stream_trade_ticks(TimeBarAggregator(instrument, bar_type, print, TestClock()), ticks)
+        columnar = TimeBarAggregator(instrument, bar_type, print, TestClock()).aggregate_raw(
+            *trade_ticks_to_raw_arrays(ticks),
+        )
+
+        # Assert
+        assert len(columnar) > 0
+        self._assert_bars_equal(columnar, streamed)
+
+    def test_aggregate_raw_with_unequal_array_lengths_raises_value_error(self):
+        # Arrange
+        bar_type = TestDataStubs.bartype_btcusdt_binance_100tick_last()
+        aggregator = TickBarAggregator(BTCUSDT_BINANCE, bar_type, print)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            aggregator.aggregate_raw(
+                np.zeros(2, dtype=np.int64),
+                np.zeros(1, dtype=np.uint64),
+                np.zeros(2, dtype=np.uint64),
+                2,
+            )
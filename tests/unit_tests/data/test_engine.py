@@ -34,6 +34,7 @@ from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.data.messages import Subscribe
 from nautilus_trader.data.messages import Unsubscribe
 from nautilus_trader.model.book import OrderBook
+from nautilus_trader.model.book import OrderBookDepthSnapshot
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarSpecification
 from nautilus_trader.model.data import BarType
@@ -1023,6 +1024,118 @@ class TestDataEngine:
         # Assert
         assert isinstance(handler[0], OrderBook)
 
+    def test_process_order_book_depth_snapshots_shares_one_snapshot_between_subscribers(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.start()
+
+        self.data_engine.process(ETHUSDT_BINANCE)  # <-- add necessary instrument for test
+
+        handler1 = []
+        handler2 = []
+        topic = "data.book.depth_snapshots.BINANCE.ETHUSDT.1000"
+        self.msgbus.subscribe(topic=topic, handler=handler1.append)
+        self.msgbus.subscribe(topic=topic, handler=handler2.append)
+
+        for depth in (5, 3):
+            subscribe = Subscribe(
+                client_id=ClientId(BINANCE.value),
+                venue=BINANCE,
+                data_type=DataType(
+                    OrderBook,
+                    {
+                        "instrument_id": ETHUSDT_BINANCE.id,
+                        "book_type": BookType.L2_MBP,
+                        "depth": 0,
+                    },
+                ),
+                command_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+                params={"interval_ms": 1000, "snapshot_depth": depth},
+            )
+            self.data_engine.execute(subscribe)
+
+        snapshot = TestDataStubs.order_book_snapshot(
+            instrument=ETHUSDT_BINANCE,
+            bid_levels=10,
+            ask_levels=10,
+            ts_event=1,
+        )
+
+        # Act
+        self.data_engine.process(snapshot)
+
+        events = self.clock.advance_time(2_000_000_000)
+        events[0].handle()
+
+        # Assert
+        assert len(handler1) == 1
+        assert isinstance(handler1[0], OrderBookDepthSnapshot)
+        assert handler1[0] is handler2[0]
+        assert handler1[0].instrument_id == ETHUSDT_BINANCE.id
+        assert len(handler1[0].bid_prices) == 5  # Deepest requested depth
+        assert handler1[0].ts_event == 1
+
+    def test_order_book_depth_snapshot_depth_lowered_when_deepest_subscriber_unsubscribes(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.start()
+
+        self.data_engine.process(ETHUSDT_BINANCE)  # <-- add necessary instrument for test
+
+        handler1 = []
+        handler2 = []
+        topic = "data.book.depth_snapshots.BINANCE.ETHUSDT.1000"
+        self.msgbus.subscribe(topic=topic, handler=handler1.append)
+        self.msgbus.subscribe(topic=topic, handler=handler2.append)
+
+        for depth in (5, 3):
+            subscribe = Subscribe(
+                client_id=ClientId(BINANCE.value),
+                venue=BINANCE,
+                data_type=DataType(
+                    OrderBook,
+                    {
+                        "instrument_id": ETHUSDT_BINANCE.id,
+                        "book_type": BookType.L2_MBP,
+                        "depth": 0,
+                    },
+                ),
+                command_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+                params={"interval_ms": 1000, "snapshot_depth": depth},
+            )
+            self.data_engine.execute(subscribe)
+
+        self.msgbus.unsubscribe(topic=topic, handler=handler1.append)
+        unsubscribe = Unsubscribe(
+            client_id=ClientId(BINANCE.value),
+            venue=BINANCE,
+            data_type=DataType(OrderBook, {"instrument_id": ETHUSDT_BINANCE.id}),
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+            params={"interval_ms": 1000, "snapshot_depth": 5},
+        )
+        self.data_engine.execute(unsubscribe)
+
+        snapshot = TestDataStubs.order_book_snapshot(
+            instrument=ETHUSDT_BINANCE,
+            bid_levels=10,
+            ask_levels=10,
+            ts_event=1,
+        )
+
+        # Act
+        self.data_engine.process(snapshot)
+
+        events = self.clock.advance_time(2_000_000_000)
+        events[0].handle()
+
+        # Assert
+        assert handler1 == []
+        assert len(handler2) == 1
+        assert len(handler2[0].bid_prices) == 3  # Deepest remaining depth
+
     def test_process_order_book_delta_then_sends_to_registered_handler(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
@@ -2953,6 +3066,168 @@ class TestDataEngine:
         assert handler[0].data["bars"][bar_type_1.standard()][-1] == last_1_minute_bar
         assert handler[0].data["bars"][bar_type_2.standard()][-1] == last_2_minute_bar
 
+    def test_request_aggregated_bars_with_cache_aggregated_bars_serves_from_catalog(self):
+        # Arrange
+        msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+        )
+        data_engine = DataEngine(
+            msgbus=msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=DataEngineConfig(cache_aggregated_bars=True),
+        )
+
+        loader = DatabentoDataLoader()
+        catalog_dir = TEST_DATA_DIR / "databento" / "historical_bars_catalog" / "databento"
+        data = loader.from_dbn_file(
+            catalog_dir / "futures_mbp-1_2024-07-01T23h58_2024-07-02T00h02.dbn.zst",
+            as_legacy_cython=True,
+        )
+        definition = loader.from_dbn_file(
+            catalog_dir / "futures_definition.dbn.zst",
+            as_legacy_cython=True,
+        )
+
+        catalog = setup_catalog(protocol="file")
+        catalog.write_data(data)
+        catalog.write_data(definition)
+
+        data_engine.register_catalog(catalog)
+        data_engine.process(definition[0])
+
+        symbol_id = InstrumentId.from_str("ESU4.GLBX")
+        utc_now = pd.Timestamp("2024-07-02T00:00:01")
+        self.clock.advance_time(utc_now.value)
+
+        bar_type = BarType.from_str("ESU4.GLBX-1-MINUTE-BID-INTERNAL")
+        handler = []
+
+        def make_request() -> DataRequest:
+            return DataRequest(
+                client_id=None,
+                venue=symbol_id.venue,
+                data_type=DataType(
+                    Bar,
+                    metadata={
+                        "bar_types": (bar_type,),
+                        "bars_market_data_type": "quote_ticks",
+                        "instrument_id": symbol_id,
+                        "bar_type": bar_type.composite(),
+                        "start": utc_now - pd.Timedelta(minutes=2, seconds=1),
+                        "end": utc_now - pd.Timedelta(seconds=1),
+                    },
+                ),
+                callback=handler.append,
+                request_id=UUID4(),
+                ts_init=utc_now.value,
+                params={
+                    "include_external_data": False,
+                    "update_existing_subscriptions": False,
+                    "update_catalog": False,
+                },
+            )
+
+        msgbus.request(endpoint="DataEngine.request", request=make_request())
+
+        # Source ticks must no longer be read once the bars are cached
+        def fail_quote_ticks(*args, **kwargs):
+            raise AssertionError("quote ticks queried")
+
+        catalog.quote_ticks = fail_quote_ticks
+
+        # Act
+        msgbus.request(endpoint="DataEngine.request", request=make_request())
+
+        # Assert
+        assert len(handler) == 2
+        assert catalog.derived_bars_fingerprint(
+            str(bar_type),
+            start=utc_now - pd.Timedelta(minutes=2, seconds=1),
+            end=utc_now - pd.Timedelta(seconds=1),
+        ) is not None
+        assert handler[1].data["bars"][bar_type] == handler[0].data["bars"][bar_type]
+
+    def test_cached_aggregated_bars_invalidated_when_source_extended(self):
+        # Arrange
+        msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+        )
+        data_engine = DataEngine(
+            msgbus=msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=DataEngineConfig(cache_aggregated_bars=True),
+        )
+
+        loader = DatabentoDataLoader()
+        catalog_dir = TEST_DATA_DIR / "databento" / "historical_bars_catalog" / "databento"
+        data = loader.from_dbn_file(
+            catalog_dir / "futures_mbp-1_2024-07-01T23h58_2024-07-02T00h02.dbn.zst",
+            as_legacy_cython=True,
+        )
+        definition = loader.from_dbn_file(
+            catalog_dir / "futures_definition.dbn.zst",
+            as_legacy_cython=True,
+        )
+
+        catalog = setup_catalog(protocol="file")
+        catalog.write_data(data)
+        catalog.write_data(definition)
+
+        data_engine.register_catalog(catalog)
+        data_engine.process(definition[0])
+
+        symbol_id = InstrumentId.from_str("ESU4.GLBX")
+        utc_now = pd.Timestamp("2024-07-02T00:00:01")
+        self.clock.advance_time(utc_now.value)
+
+        bar_type = BarType.from_str("ESU4.GLBX-1-MINUTE-BID-INTERNAL")
+        request = DataRequest(
+            client_id=None,
+            venue=symbol_id.venue,
+            data_type=DataType(
+                Bar,
+                metadata={
+                    "bar_types": (bar_type,),
+                    "bars_market_data_type": "quote_ticks",
+                    "instrument_id": symbol_id,
+                    "bar_type": bar_type.composite(),
+                    "start": utc_now - pd.Timedelta(minutes=2, seconds=1),
+                    "end": utc_now - pd.Timedelta(seconds=1),
+                },
+            ),
+            callback=lambda x: None,
+            request_id=UUID4(),
+            ts_init=utc_now.value,
+            params={
+                "include_external_data": False,
+                "update_existing_subscriptions": False,
+                "update_catalog": False,
+            },
+        )
+        msgbus.request(endpoint="DataEngine.request", request=request)
+        assert data_engine._query_derived_bars(request)
+
+        last_quote = [d for d in data if isinstance(d, QuoteTick)][-1]
+        extended_quote = QuoteTick(
+            instrument_id=last_quote.instrument_id,
+            bid_price=last_quote.bid_price,
+            ask_price=last_quote.ask_price,
+            bid_size=last_quote.bid_size,
+            ask_size=last_quote.ask_size,
+            ts_event=last_quote.ts_event + 1,
+            ts_init=last_quote.ts_init + 1,
+        )
+
+        # Act
+        catalog.write_data([extended_quote], mode="append")
+
+        # Assert
+        assert not data_engine._query_derived_bars(request)
+
     def test_request_aggregated_bars_with_trades(self):
         # Arrange
         loader = DatabentoDataLoader()
@@ -206,6 +206,112 @@ class TestLiveExecutionReconciliation:
         assert len(self.cache.orders_open()) == 1
         assert self.cache.orders()[0].status == OrderStatus.ACCEPTED
 
+    @pytest.mark.asyncio()
+    async def test_reconcile_state_updates_progress_metrics(self):
+        # Arrange
+        report = OrderStatusReport(
+            account_id=self.account_id,
+            instrument_id=AUDUSD_SIM.id,
+            client_order_id=ClientOrderId("O-123456"),
+            venue_order_id=VenueOrderId("1"),
+            order_side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            time_in_force=TimeInForce.GTC,
+            order_status=OrderStatus.ACCEPTED,
+            price=Price.from_str("1.00000"),
+            quantity=Quantity.from_int(10_000),
+            filled_qty=Quantity.from_int(0),
+            post_only=True,
+            report_id=UUID4(),
+            ts_accepted=0,
+            ts_last=0,
+            ts_init=0,
+        )
+
+        self.client.add_order_status_report(report)
+
+        # Act
+        result = await self.exec_engine.reconcile_state()
+
+        # Assert
+        assert result
+        assert self.exec_engine.reconciliation_clients_completed == 1
+        assert self.exec_engine.reconciliation_order_reports == 1
+        assert self.exec_engine.reconciliation_fill_reports == 0
+
+    @pytest.mark.asyncio()
+    async def test_reconcile_state_incremental_persists_high_water_mark(self):
+        # Arrange
+        self.exec_engine.reconciliation_incremental = True
+        ts_now = self.clock.timestamp_ns()
+        report = OrderStatusReport(
+            account_id=self.account_id,
+            instrument_id=AUDUSD_SIM.id,
+            client_order_id=ClientOrderId("O-123456"),
+            venue_order_id=VenueOrderId("1"),
+            order_side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            time_in_force=TimeInForce.GTC,
+            order_status=OrderStatus.ACCEPTED,
+            price=Price.from_str("1.00000"),
+            quantity=Quantity.from_int(10_000),
+            filled_qty=Quantity.from_int(0),
+            post_only=True,
+            report_id=UUID4(),
+            ts_accepted=ts_now,
+            ts_last=ts_now,
+            ts_init=ts_now,
+        )
+
+        self.client.add_order_status_report(report)
+
+        # Act
+        result = await self.exec_engine.reconcile_state()
+
+        # Assert
+        assert result
+        hwm = self.cache.get(f"ExecEngine.reconciliation_hwm.{SIM}.{self.client.account_id}")
+        assert hwm is not None
+        assert int(hwm.decode()) >= ts_now
+
+    @pytest.mark.asyncio()
+    async def test_reconcile_state_incremental_skips_reports_before_high_water_mark(self):
+        # Arrange
+        self.exec_engine.reconciliation_incremental = True
+        hwm = self.clock.timestamp_ns() - 30_000_000_000  # 30 seconds ago
+        self.cache.add(
+            f"ExecEngine.reconciliation_hwm.{SIM}.{self.client.account_id}",
+            str(hwm).encode(),
+        )
+        report = OrderStatusReport(
+            account_id=self.account_id,
+            instrument_id=AUDUSD_SIM.id,
+            client_order_id=ClientOrderId("O-123456"),
+            venue_order_id=VenueOrderId("1"),
+            order_side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            time_in_force=TimeInForce.GTC,
+            order_status=OrderStatus.ACCEPTED,
+            price=Price.from_str("1.00000"),
+            quantity=Quantity.from_int(10_000),
+            filled_qty=Quantity.from_int(0),
+            post_only=True,
+            report_id=UUID4(),
+            ts_accepted=0,  # Long before the high-water mark
+            ts_last=0,
+            ts_init=0,
+        )
+
+        self.client.add_order_status_report(report)
+
+        # Act
+        result = await self.exec_engine.reconcile_state()
+
+        # Assert
+        assert result
+        assert len(self.cache.orders()) == 0
+        assert self.exec_engine.reconciliation_order_reports == 0
+
     @pytest.mark.asyncio()
     async def test_reconcile_state_no_cached_with_canceled_order(self):
         # Arrange
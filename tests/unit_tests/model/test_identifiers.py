@@ -253,6 +253,43 @@ def test_instrument_id_from_str() -> None:
     assert result == instrument_id
 
 
+def test_instrument_id_from_str_returns_interned_instance() -> None:
+    # Arrange, Act
+    instrument_id1 = InstrumentId.from_str("AUD/USD.SIM")
+    instrument_id2 = InstrumentId.from_str("AUD/USD.SIM")
+    instrument_id3 = InstrumentId.from_str("GBP/USD.SIM")
+
+    # Assert
+    assert instrument_id1 is instrument_id2
+    assert instrument_id1 is not instrument_id3
+    assert instrument_id1.symbol is instrument_id2.symbol
+    assert instrument_id1.venue is instrument_id3.venue
+
+
+def test_instrument_id_hash_consistent_for_constructed_and_interned() -> None:
+    # Arrange
+    constructed = InstrumentId(Symbol("AUD/USD"), Venue("SIM"))
+    interned = InstrumentId.from_str("AUD/USD.SIM")
+
+    # Act
+    mapping = {constructed: 1}
+
+    # Assert
+    assert constructed is not interned
+    assert hash(constructed) == hash(interned)
+    assert mapping[interned] == 1
+
+
+def test_identifier_hashes_consistent_for_equal_values() -> None:
+    # Arrange, Act, Assert
+    assert hash(Symbol("AUD/USD")) == hash(Symbol("AUD/USD"))
+    assert hash(Venue("SIM")) == hash(Venue("SIM"))
+    assert hash(TraderId("TESTER-000")) == hash(TraderId("TESTER-000"))
+    assert hash(AccountId("SIM-000")) == hash(AccountId("SIM-000"))
+    assert hash(TradeId("123456")) == hash(TradeId("123456"))
+    assert hash(Symbol("AUD/USD")) != hash(Symbol("GBP/USD"))
+
+
 @pytest.mark.parametrize(
     ("input", "expected_err"),
     [
@@ -22,6 +22,7 @@ import pytest
 from nautilus_trader import TEST_DATA_DIR
 from nautilus_trader.adapters.databento.loaders import DatabentoDataLoader
 from nautilus_trader.model.book import OrderBook
+from nautilus_trader.model.book import OrderBookDepthSnapshot
 from nautilus_trader.model.data import BookOrder
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
@@ -518,6 +519,146 @@ class TestOrderBook:
     def test_orderbook_midpoint_empty(self):
         assert self.empty_book.midpoint() is None
 
+    def test_bids_and_asks_with_depth(self):
+        # Arrange, Act
+        bids = self.sample_book.bids(depth=1)
+        asks = self.sample_book.asks(depth=2)
+
+        # Assert
+        assert [level.price for level in bids] == [Price(0.83000, 5)]
+        assert [level.price for level in asks] == [Price(0.88600, 5), Price(0.88700, 5)]
+        assert len(self.sample_book.bids(depth=10)) == 2
+
+    def test_bids_with_invalid_depth_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.sample_book.bids(depth=0)
+
+    def test_bids_and_asks_to_arrays(self):
+        # Arrange, Act
+        bid_prices, bid_sizes, bid_counts = self.sample_book.bids_to_arrays(depth=5)
+        ask_prices, ask_sizes, ask_counts = self.sample_book.asks_to_arrays(depth=2)
+
+        # Assert
+        assert bid_prices.tolist() == pytest.approx([0.83, 0.82])
+        assert bid_sizes.tolist() == [4.0, 1.0]
+        assert bid_counts.tolist() == [1, 1]
+        assert ask_prices.tolist() == pytest.approx([0.886, 0.887])
+        assert ask_sizes.tolist() == [5.0, 10.0]
+        assert ask_counts.tolist() == [1, 1]
+        assert not bid_prices.flags.writeable
+
+    def test_to_arrays_when_empty_returns_empty_arrays(self):
+        # Arrange, Act
+        prices, sizes, counts = self.empty_book.bids_to_arrays()
+
+        # Assert
+        assert len(prices) == 0
+        assert len(sizes) == 0
+        assert len(counts) == 0
+
+    def test_imbalance(self):
+        # Arrange, Act, Assert
+        assert self.sample_book.imbalance() == pytest.approx((4.0 - 5.0) / (4.0 + 5.0))
+        assert self.sample_book.imbalance(depth=2) == pytest.approx((5.0 - 15.0) / (5.0 + 15.0))
+        assert self.empty_book.imbalance() is None
+
+    def test_cumulative_depth(self):
+        # Arrange, Act
+        result = self.sample_book.cumulative_depth(OrderSide.SELL, depth=3)
+
+        # Assert
+        assert result.tolist() == [5.0, 15.0, 35.0]
+
+    def test_cached_metrics_invalidated_on_update(self):
+        # Arrange
+        assert self.sample_book.spread() == pytest.approx(0.056)
+        assert self.sample_book.imbalance() == pytest.approx(-1.0 / 9.0)
+        bid_prices, _, _ = self.sample_book.bids_to_arrays()
+
+        # Act
+        self.sample_book.add(
+            BookOrder(
+                price=Price(0.85000, 5),
+                size=Quantity(5.0, 0),
+                side=OrderSide.BUY,
+                order_id=100,
+            ),
+            0,
+        )
+
+        # Assert
+        assert self.sample_book.spread() == pytest.approx(0.036)
+        assert self.sample_book.midpoint() == pytest.approx(0.868)
+        assert self.sample_book.imbalance() == pytest.approx(0.0)
+        assert self.sample_book.bids_to_arrays()[0].tolist() == pytest.approx([0.85, 0.83, 0.82])
+        assert bid_prices.tolist() == pytest.approx([0.83, 0.82])
+
+    def test_to_depth_snapshot(self):
+        # Arrange, Act
+        snapshot = self.sample_book.to_depth_snapshot(ts_init=1, depth=2)
+
+        # Assert
+        assert isinstance(snapshot, OrderBookDepthSnapshot)
+        assert snapshot.instrument_id == self.instrument.id
+        assert snapshot.bid_prices.tolist() == pytest.approx([0.83, 0.82])
+        assert snapshot.bid_sizes.tolist() == [4.0, 1.0]
+        assert snapshot.bid_counts.tolist() == [1, 1]
+        assert snapshot.ask_prices.tolist() == pytest.approx([0.886, 0.887])
+        assert snapshot.ask_sizes.tolist() == [5.0, 10.0]
+        assert snapshot.ask_counts.tolist() == [1, 1]
+        assert snapshot.sequence == self.sample_book.sequence
+        assert snapshot.ts_event == self.sample_book.ts_last
+        assert snapshot.ts_init == 1
+
+    def test_depth_snapshot_is_immutable(self):
+        # Arrange
+        snapshot = self.sample_book.to_depth_snapshot(ts_init=0)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            snapshot.bid_prices[0] = 1.0
+        with pytest.raises(AttributeError):
+            snapshot.sequence = 1
+
+    def test_depth_snapshot_unchanged_by_book_update(self):
+        # Arrange
+        snapshot = self.sample_book.to_depth_snapshot(ts_init=0)
+
+        # Act
+        self.sample_book.clear(ts_event=1)
+
+        # Assert
+        assert snapshot.bid_sizes.tolist() == [4.0, 1.0]
+        assert self.sample_book.to_depth_snapshot(ts_init=1).bid_sizes.tolist() == []
+
+    def test_depth_snapshot_dict_round_trip(self):
+        # Arrange
+        snapshot = self.sample_book.to_depth_snapshot(ts_init=0)
+
+        # Act
+        result = OrderBookDepthSnapshot.from_dict(OrderBookDepthSnapshot.to_dict(snapshot))
+
+        # Assert
+        assert result == snapshot
+        assert not result.ask_prices.flags.writeable
+
+    def test_depth_snapshot_with_unequal_arrays_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            OrderBookDepthSnapshot(
+                instrument_id=self.instrument.id,
+                bid_prices=[1.0, 0.9],
+                bid_sizes=[1.0],
+                bid_counts=[1],
+                ask_prices=[],
+                ask_sizes=[],
+                ask_counts=[],
+                sequence=0,
+                ts_event=0,
+                ts_init=0,
+            )
+
     def test_l3_get_avg_px_for_quantity(self):
         bid_price = self.sample_book.get_avg_px_for_quantity(Quantity(5.0, 0), 1)
         ask_price = self.sample_book.get_avg_px_for_quantity(Quantity(12.0, 0), 2)
@@ -458,6 +458,21 @@ class TestOrders:
             == "LimitOrder(BUY 100_000 AUD/USD.SIM LIMIT @ 1.00000 GTC, status=INITIALIZED, client_order_id=O-19700101-000000-000-001-1, venue_order_id=None, position_id=None, exec_algorithm_id=TWAP, exec_spawn_id=O-19700101-000000-000-001-1, tags=None)"  # noqa
         )
 
+    def test_initialized_order_has_empty_venue_order_ids_trade_ids_and_commissions(self):
+        # Arrange, Act
+        order = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+
+        # Assert
+        assert order.venue_order_ids == []
+        assert order.trade_ids == []
+        assert order.commissions() == []
+        assert order.to_dict()["commissions"] is None
+
     def test_limit_order_to_dict(self):
         # Arrange
         order = self.order_factory.limit(
@@ -15,8 +15,10 @@
 
 import pytest
 
+from nautilus_trader.common.component import HandlerProfiler
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.component import handler_name
 from nautilus_trader.common.component import is_matching_py
 from nautilus_trader.core.message import Request
 from nautilus_trader.core.message import Response
@@ -456,6 +458,124 @@ class TestMessageBus:
         assert len(subscriber) == 2
         assert subscriber == ["DUMMY EVENT", "TRADER EVENT"]
 
+    def test_instantiate_message_bus_defaults_to_untrusted(self):
+        # Arrange, Act, Assert
+        assert not self.msgbus.trusted
+
+    def test_publish_with_none_message_when_untrusted_raises_type_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(TypeError):
+            self.msgbus.publish("events.system.DUMMY", None)
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_trusted_mode_behaves_identically_on_valid_input(self, trusted):
+        # Arrange
+        msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            trusted=trusted,
+        )
+
+        subscriber = []
+        endpoint = []
+        handler = []
+        msgbus.subscribe(topic="events.*", handler=subscriber.append)
+        msgbus.register(endpoint="mailbox", handler=endpoint.append)
+
+        request_id = UUID4()
+        request = Request(
+            callback=handler.append,
+            request_id=request_id,
+            ts_init=self.clock.timestamp_ns(),
+        )
+        response = Response(
+            correlation_id=request_id,
+            response_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        msgbus.publish("events.system.DUMMY", "EVENT")
+        msgbus.send("mailbox", "message")
+        msgbus.send("unknown", "message")
+        msgbus.request(endpoint="mailbox", request=request)
+        msgbus.response(response)
+
+        # Assert
+        assert msgbus.trusted == trusted
+        assert subscriber == ["EVENT"]
+        assert endpoint == ["message", request]
+        assert handler == [response]
+        assert msgbus.pub_count == 1
+        assert msgbus.sent_count == 1
+        assert msgbus.req_count == 1
+        assert msgbus.res_count == 1
+
+    def test_send_and_publish_with_profiler_records_handler_stats(self):
+        # Arrange
+        profiler = HandlerProfiler()
+        self.msgbus.set_profiler(profiler)
+
+        subscriber = []
+        endpoint = []
+        self.msgbus.subscribe(topic="events.*", handler=subscriber.append)
+        self.msgbus.register(endpoint="mailbox", handler=endpoint.append)
+
+        # Act
+        self.msgbus.publish("events.system.DUMMY", "EVENT1")
+        self.msgbus.publish("events.system.DUMMY", "EVENT2")
+        self.msgbus.send("mailbox", "message")
+
+        # Assert
+        stats = {(s.name, s.message_type): s for s in profiler.stats()}
+        assert subscriber == ["EVENT1", "EVENT2"]
+        assert endpoint == ["message"]
+        assert stats[("list.append", "str")].count == 2
+        assert stats[("mailbox", "str")].count == 1
+        assert stats[("mailbox", "str")].category == "other"
+
+    def test_profiler_records_self_time_excluding_nested_handlers(self):
+        # Arrange
+        profiler = HandlerProfiler()
+        self.msgbus.set_profiler(profiler)
+
+        endpoint = []
+        self.msgbus.register(endpoint="inner", handler=endpoint.append)
+        self.msgbus.register(
+            endpoint="outer",
+            handler=lambda msg: self.msgbus.send("inner", msg),
+        )
+
+        # Act
+        self.msgbus.send("outer", "message")
+
+        # Assert
+        report = profiler.report()
+        outer = next(h for h in report["handlers"] if h["name"] == "outer")
+        inner = next(h for h in report["handlers"] if h["name"] == "inner")
+        assert endpoint == ["message"]
+        assert outer["total_ns"] >= inner["total_ns"]
+        assert outer["self_ns"] <= outer["total_ns"] - inner["total_ns"]
+        assert report["categories"]["other"]["count"] == 2
+
+    def test_set_profiler_none_disables_profiling(self):
+        # Arrange
+        profiler = HandlerProfiler()
+        self.msgbus.set_profiler(profiler)
+        self.msgbus.set_profiler(None)
+        self.msgbus.register(endpoint="mailbox", handler=[].append)
+
+        # Act
+        self.msgbus.send("mailbox", "message")
+
+        # Assert
+        assert profiler.stats() == []
+
+    def test_handler_name_for_bound_method_uses_owner_id(self):
+        # Arrange, Act, Assert
+        assert handler_name(self.msgbus.send) == "MessageBus.send"
+        assert handler_name([].append) == "list.append"
+
 
 @pytest.mark.parametrize(
     ("topic", "pattern", "expected"),
@@ -302,6 +302,115 @@ def test_catalog_append_data(catalog: ParquetDataCatalog) -> None:
     assert len(bars) == len(all_bars) == 20
 
 
+def test_catalog_write_derived_bars_with_fingerprint(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
+    instrument = TestInstrumentProvider.adabtc_binance()
+    stub_bars = TestDataStubs.binance_bars_from_csv(
+        "ADABTC-1m-2021-11-27.csv",
+        bar_type,
+        instrument,
+    )
+    fingerprint = {
+        "source": "trade_ticks",
+        "instrument_id": instrument.id.value,
+        "start": None,
+        "end": stub_bars[-1].ts_init,
+        "source_last_ts": stub_bars[-1].ts_init,
+        "bar_type": str(bar_type),
+    }
+
+    # Act
+    catalog.write_derived_bars(str(bar_type), stub_bars, fingerprint)
+
+    # Assert
+    end = stub_bars[-1].ts_init
+    assert catalog.derived_bars_fingerprint(str(bar_type), end=end) == fingerprint
+    assert catalog.derived_bars(str(bar_type), end=end) == stub_bars
+    assert catalog.derived_bars_fingerprint(str(bar_type)) is None  # Different range
+    assert catalog.bars(bar_types=[str(bar_type)]) == []
+
+
+def test_catalog_write_derived_bars_does_not_overwrite_catalog_bars(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
+    instrument = TestInstrumentProvider.adabtc_binance()
+    stub_bars = TestDataStubs.binance_bars_from_csv(
+        "ADABTC-1m-2021-11-27.csv",
+        bar_type,
+        instrument,
+    )
+    catalog.write_data(stub_bars)
+
+    # Act
+    catalog.write_derived_bars(str(bar_type), stub_bars[:10], {"bar_type": str(bar_type)})
+
+    # Assert
+    assert len(catalog.bars(bar_types=[str(bar_type)])) == len(stub_bars)
+    assert len(catalog.derived_bars(str(bar_type))) == 10
+
+
+def test_catalog_derived_bars_for_different_ranges_kept_separately(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
+    instrument = TestInstrumentProvider.adabtc_binance()
+    stub_bars = TestDataStubs.binance_bars_from_csv(
+        "ADABTC-1m-2021-11-27.csv",
+        bar_type,
+        instrument,
+    )
+    ranges = [
+        (stub_bars[2].ts_init, stub_bars[5].ts_init),
+        (stub_bars[10].ts_init, stub_bars[20].ts_init),
+    ]
+
+    # Act
+    for start, end in ranges:
+        fingerprint = {"bar_type": str(bar_type), "start": start, "end": end}
+        catalog.write_derived_bars(str(bar_type), stub_bars, fingerprint)
+
+    # Assert
+    for start, end in ranges:
+        fingerprint = catalog.derived_bars_fingerprint(str(bar_type), start=start, end=end)
+        assert fingerprint == {"bar_type": str(bar_type), "start": start, "end": end}
+    assert catalog.derived_bars(str(bar_type), *ranges[0]) == stub_bars[2:6]
+    assert catalog.derived_bars(str(bar_type), *ranges[1]) == stub_bars[10:21]
+
+
+def test_catalog_write_derived_bars_for_same_range_overwrites(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
+    instrument = TestInstrumentProvider.adabtc_binance()
+    stub_bars = TestDataStubs.binance_bars_from_csv(
+        "ADABTC-1m-2021-11-27.csv",
+        bar_type,
+        instrument,
+    )
+    catalog.write_derived_bars(str(bar_type), stub_bars, {"source_last_ts": 1})
+
+    # Act
+    catalog.write_derived_bars(str(bar_type), stub_bars[:5], {"source_last_ts": 2})
+
+    # Assert
+    assert catalog.derived_bars_fingerprint(str(bar_type)) == {"source_last_ts": 2}
+    assert catalog.derived_bars(str(bar_type)) == stub_bars[:5]
+
+
+def test_catalog_derived_bars_fingerprint_when_none_written(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
+
+    # Act, Assert
+    assert catalog.derived_bars_fingerprint(str(bar_type)) is None
+    assert catalog.derived_bars(str(bar_type)) == []
+
+
 def test_catalog_bars_querying_by_instrument_id(catalog: ParquetDataCatalog) -> None:
     # Arrange
     bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
@@ -373,6 +482,83 @@ def test_catalog_write_pyo3_trade_ticks(catalog: ParquetDataCatalog) -> None:
     assert len(all_trades) == 69_806
 
 
+def test_catalog_write_data_parallel_by_instrument(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    instruments = [
+        TestInstrumentProvider.default_fx_ccy(symbol)
+        for symbol in ("AUD/USD", "EUR/USD", "GBP/USD", "USD/JPY")
+    ]
+    quotes = [
+        TestDataStubs.quote_tick(instrument=instrument, ts_event=i, ts_init=i)
+        for i in range(10)
+        for instrument in instruments
+    ]
+
+    # Act
+    catalog.write_data(quotes, max_workers=4)
+
+    # Assert
+    assert len(catalog.quote_ticks()) == 40
+    for instrument in instruments:
+        written = catalog.quote_ticks(instrument_ids=[instrument.id])
+        assert [q.ts_init for q in written] == list(range(10))
+
+
+def test_catalog_write_data_not_monotonic_raises(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    quotes = [TestDataStubs.quote_tick(instrument=instrument, ts_init=i) for i in (0, 2, 1)]
+
+    # Act, Assert
+    with pytest.raises(ValueError, match="found 2 followed by 1"):
+        catalog.write_data(quotes)
+
+
+def test_catalog_write_arrow_record_batches(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    path = TEST_DATA_DIR / "truefx" / "audusd-ticks.csv"
+    df = pd.read_csv(path)
+    instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    wrangler = QuoteTickDataWranglerV2.from_instrument(instrument)
+    pyo3_quotes = sorted(wrangler.from_pandas(df), key=lambda x: x.ts_init)
+    table = catalog.serializer.serialize_batch(pyo3_quotes, data_cls=nautilus_pyo3.QuoteTick)
+
+    # Act
+    catalog.write_data(table.to_batches(max_chunksize=10_000), data_cls=QuoteTick)
+
+    # Assert
+    quotes = catalog.quote_ticks(instrument_ids=[instrument.id])
+    assert len(quotes) == 100_000
+    assert quotes[0].ts_init == pyo3_quotes[0].ts_init
+
+
+def test_catalog_write_arrow_record_batches_without_data_cls_raises(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    quotes = [TestDataStubs.quote_tick(instrument=instrument, ts_init=i) for i in range(2)]
+    table = catalog.serializer.serialize_batch(quotes, data_cls=QuoteTick)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        catalog.write_data(table.to_batches())
+
+
+def test_catalog_write_arrow_record_batches_not_monotonic_raises(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    quotes = [TestDataStubs.quote_tick(instrument=instrument, ts_init=i) for i in range(4)]
+    first = catalog.serializer.serialize_batch(quotes[:2], data_cls=QuoteTick)
+    second = catalog.serializer.serialize_batch(quotes[2:], data_cls=QuoteTick)
+
+    # Act, Assert
+    with pytest.raises(ValueError, match="monotonically increasing"):
+        catalog.write_data(second.to_batches() + first.to_batches(), data_cls=QuoteTick)
+
+
 def test_catalog_multiple_bar_types(catalog: ParquetDataCatalog) -> None:
     # Arrange
     bar_type1 = TestDataStubs.bartype_adabtc_binance_1min_last()
@@ -14,10 +14,18 @@
 # -------------------------------------------------------------------------------------------------
 
 import copy
+import os
+import threading
+import time
 from collections import Counter
 
+import pyarrow as pa
+import pytest
+
 from nautilus_trader.backtest.node import BacktestNode
 from nautilus_trader.backtest.results import BacktestResult
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.signal import generate_signal_class
 from nautilus_trader.config import BacktestDataConfig
 from nautilus_trader.config import BacktestEngineConfig
@@ -32,7 +40,12 @@ from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.enums import QueueOverflowPolicy
+from nautilus_trader.persistence.writer import StreamingFeatherWriter
+from nautilus_trader.persistence.writer import ThreadedStreamingFeatherWriter
 from nautilus_trader.test_kit.mocks.data import NewsEventData
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from nautilus_trader.test_kit.stubs.persistence import TestPersistenceStubs
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 
@@ -433,3 +446,297 @@ class TestPersistenceStreaming:
             "TradeTick": 179,
         }
         assert counts == expected
+
+
+class TestStreamingFeatherWriter:
+    def setup(self) -> None:
+        self.clock = TestClock()
+        self.cache = Cache()
+        self.instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        self.cache.add_instrument(self.instrument)
+
+    def _writer(self, path: str, max_buffer_rows: int) -> StreamingFeatherWriter:
+        return StreamingFeatherWriter(
+            path=path,
+            cache=self.cache,
+            clock=self.clock,
+            max_buffer_rows=max_buffer_rows,
+            include_types=[TradeTick],
+        )
+
+    def _trade_ticks(self, count: int) -> list[TradeTick]:
+        return [
+            TestDataStubs.trade_tick(
+                instrument=self.instrument,
+                trade_id=str(i),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i in range(count)
+        ]
+
+    def _read_batches(self, writer: StreamingFeatherWriter) -> list[pa.RecordBatch]:
+        batches: list[pa.RecordBatch] = []
+        for path in sorted(writer.fs.glob(f"{writer.path}/trade_tick/*.feather")):
+            with writer.fs.open(path, "rb") as f:
+                batches.extend(pa.ipc.open_stream(f))
+        return batches
+
+    def test_write_without_buffering_by_default(self, tmp_path) -> None:
+        # Arrange
+        writer = StreamingFeatherWriter(
+            path=str(tmp_path / "stream"),
+            cache=self.cache,
+            clock=self.clock,
+            include_types=[TradeTick],
+        )
+        ticks = self._trade_ticks(2)
+
+        # Act
+        for tick in ticks:
+            writer.write(tick)
+
+        # Assert
+        assert writer.buffered_rows == 0
+        writer.close()
+        assert [batch.num_rows for batch in self._read_batches(writer)] == [1, 1]
+
+    def test_write_buffers_rows_until_max_buffer_rows(self, tmp_path) -> None:
+        # Arrange
+        writer = self._writer(str(tmp_path / "stream"), max_buffer_rows=3)
+        ticks = self._trade_ticks(4)
+
+        # Act
+        for tick in ticks[:2]:
+            writer.write(tick)
+        buffered_before = writer.buffered_rows
+        writer.write(ticks[2])
+        buffered_after = writer.buffered_rows
+        writer.write(ticks[3])
+        writer.close()
+
+        # Assert
+        assert buffered_before == 2
+        assert buffered_after == 0
+        assert writer.buffered_rows == 0
+        assert [batch.num_rows for batch in self._read_batches(writer)] == [3, 1]
+
+    def test_flush_writes_buffered_rows_as_single_batch(self, tmp_path) -> None:
+        # Arrange
+        writer = self._writer(str(tmp_path / "stream"), max_buffer_rows=1_000)
+
+        # Act
+        for tick in self._trade_ticks(10):
+            writer.write(tick)
+        writer.flush()
+        writer.close()
+
+        # Assert
+        batches = self._read_batches(writer)
+        assert [batch.num_rows for batch in batches] == [10]
+        assert writer.is_closed
+
+    def test_write_flushes_buffered_rows_after_flush_interval(self, tmp_path) -> None:
+        # Arrange
+        writer = self._writer(str(tmp_path / "stream"), max_buffer_rows=1_000)
+        ticks = self._trade_ticks(3)
+
+        # Act
+        writer.write(ticks[0])
+        writer.write(ticks[1])
+        self.clock.advance_time(2_000_000_000)  # Beyond default 1s flush interval
+        writer.write(ticks[2])
+
+        # Assert
+        assert writer.buffered_rows == 0
+        writer.close()
+        assert [batch.num_rows for batch in self._read_batches(writer)] == [3]
+
+    def test_threaded_writer_flush_writes_all_queued_rows(self, tmp_path) -> None:
+        # Arrange
+        writer = ThreadedStreamingFeatherWriter(
+            path=str(tmp_path / "stream"),
+            cache=self.cache,
+            clock=self.clock,
+            max_buffer_rows=4,
+            include_types=[TradeTick],
+        )
+
+        # Act
+        for tick in self._trade_ticks(10):
+            writer.write(tick)
+        writer.flush()
+
+        # Assert
+        metrics = writer.get_metrics()
+        assert writer.queue_depth == 0
+        assert writer.buffered_rows == 0
+        assert metrics["write_count"] == 10
+        assert metrics["dropped_count"] == 0
+        assert metrics["max_write_latency_ns"] > 0
+        writer.close()
+        assert writer.is_closed
+        assert [batch.num_rows for batch in self._read_batches(writer)] == [4, 4, 2]
+
+    def _gated_threaded_writer(
+        self,
+        path: str,
+        monkeypatch: pytest.MonkeyPatch,
+        overflow_policy: QueueOverflowPolicy,
+    ) -> tuple[ThreadedStreamingFeatherWriter, threading.Event]:
+        # Hold the writer thread on the first object, so the queue fills deterministically
+        gate = threading.Event()
+        started = threading.Event()
+        write = StreamingFeatherWriter.write
+
+        def gated_write(writer: StreamingFeatherWriter, obj: object) -> None:
+            started.set()
+            gate.wait()
+            write(writer, obj)
+
+        monkeypatch.setattr(StreamingFeatherWriter, "write", gated_write)
+
+        writer = ThreadedStreamingFeatherWriter(
+            path=path,
+            cache=self.cache,
+            clock=self.clock,
+            max_buffer_rows=1,
+            include_types=[TradeTick],
+            queue_size=2,
+            overflow_policy=overflow_policy,
+        )
+        ticks = self._trade_ticks(1)
+        writer.write(ticks[0])
+        assert started.wait(timeout=5)
+
+        return writer, gate
+
+    def _wait_for_queue_depth(self, writer: ThreadedStreamingFeatherWriter, depth: int) -> None:
+        deadline = time.monotonic() + 5
+        while writer.queue_depth != depth and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert writer.queue_depth == depth
+
+    def _written_ts_inits(self, writer: StreamingFeatherWriter) -> list[int]:
+        return [
+            ts_init
+            for batch in self._read_batches(writer)
+            for ts_init in batch.column("ts_init").to_pylist()
+        ]
+
+    def test_threaded_writer_drop_newest_when_queue_full(self, tmp_path, monkeypatch) -> None:
+        # Arrange
+        writer, gate = self._gated_threaded_writer(
+            str(tmp_path / "stream"),
+            monkeypatch,
+            QueueOverflowPolicy.DROP_NEWEST,
+        )
+
+        # Act
+        for tick in self._trade_ticks(5)[1:]:
+            writer.write(tick)
+        gate.set()
+        writer.flush()
+        writer.close()
+
+        # Assert
+        metrics = writer.get_metrics()
+        assert metrics["dropped_count"] == 2
+        assert metrics["write_count"] == 3
+        assert metrics["max_queue_depth"] == 2
+        assert self._written_ts_inits(writer) == [0, 1, 2]
+
+    def test_threaded_writer_drop_oldest_when_queue_full(self, tmp_path, monkeypatch) -> None:
+        # Arrange
+        writer, gate = self._gated_threaded_writer(
+            str(tmp_path / "stream"),
+            monkeypatch,
+            QueueOverflowPolicy.DROP_OLDEST,
+        )
+
+        # Act
+        for tick in self._trade_ticks(5)[1:]:
+            writer.write(tick)
+        gate.set()
+        writer.flush()
+        writer.close()
+
+        # Assert
+        metrics = writer.get_metrics()
+        assert metrics["dropped_count"] == 2
+        assert metrics["write_count"] == 3
+        assert self._written_ts_inits(writer) == [0, 3, 4]
+
+    def test_threaded_writer_drop_oldest_never_drops_flush(self, tmp_path, monkeypatch) -> None:
+        # Arrange
+        writer, gate = self._gated_threaded_writer(
+            str(tmp_path / "stream"),
+            monkeypatch,
+            QueueOverflowPolicy.DROP_OLDEST,
+        )
+        ticks = self._trade_ticks(4)
+        writer.write(ticks[1])
+        flush_thread = threading.Thread(target=writer.flush)
+        flush_thread.start()
+        self._wait_for_queue_depth(writer, 2)
+
+        # Act
+        writer.write(ticks[2])
+        writer.write(ticks[3])
+        gate.set()
+        flush_thread.join(timeout=5)
+
+        # Assert
+        assert not flush_thread.is_alive()
+        assert writer.queue_depth == 0
+        assert writer.dropped_count == 2
+        writer.close()
+        assert self._written_ts_inits(writer) == [0, 3]
+
+    def test_threaded_writer_drop_oldest_never_drops_stop(self, tmp_path, monkeypatch) -> None:
+        # Arrange
+        writer, gate = self._gated_threaded_writer(
+            str(tmp_path / "stream"),
+            monkeypatch,
+            QueueOverflowPolicy.DROP_OLDEST,
+        )
+        ticks = self._trade_ticks(3)
+        writer.write(ticks[1])
+        close_thread = threading.Thread(target=writer.close)
+        close_thread.start()
+        self._wait_for_queue_depth(writer, 2)
+
+        # Act
+        writer.write(ticks[2])
+        gate.set()
+        close_thread.join(timeout=5)
+
+        # Assert
+        assert not close_thread.is_alive()
+        assert writer.dropped_count == 1
+        assert writer.is_closed
+
+    def test_threaded_writer_fsyncs_on_interval(self, tmp_path, monkeypatch) -> None:
+        # Arrange
+        fsyncs: list[int] = []
+        monkeypatch.setattr(os, "fsync", fsyncs.append)
+        writer = ThreadedStreamingFeatherWriter(
+            path=str(tmp_path / "stream"),
+            cache=self.cache,
+            clock=self.clock,
+            max_buffer_rows=1,
+            include_types=[TradeTick],
+            fsync_interval_ms=1,
+        )
+        time.sleep(0.01)  # Beyond the fsync interval
+
+        # Act
+        writer.write(self._trade_ticks(1)[0])
+        deadline = time.monotonic() + 5
+        while not fsyncs and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        # Assert
+        assert fsyncs  # Synced without an explicit flush
+        writer.close()
+        assert self._written_ts_inits(writer) == [0]
@@ -31,6 +31,7 @@ from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import PositionSide
 from nautilus_trader.model.events import AccountState
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import PositionId
@@ -43,6 +44,7 @@ from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.position import Position
 from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.portfolio.portfolio import PositionAggregate
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.component import TestComponentStubs
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -187,6 +189,52 @@ class TestPortfolio:
         # Arrange, Act, Assert
         assert self.portfolio.is_flat(AUDUSD_SIM.id) is True
 
+    def test_position_aggregate_when_no_instrument_returns_none(self):
+        # Arrange, Act, Assert
+        assert self.portfolio.position_aggregate(USDJPY_SIM.id) is None
+
+    def test_position_aggregates_when_no_positions_returns_empty_dict(self):
+        # Arrange, Act, Assert
+        assert self.portfolio.position_aggregates(AccountId("SIM-001")) == {}
+
+    def test_position_aggregates_are_maintained_per_account(self):
+        # Arrange
+        account_id1 = AccountId("SIM-001")
+        account_id2 = AccountId("SIM-002")
+
+        positions = []
+        for account_id, side, position_id in (
+            (account_id1, OrderSide.BUY, PositionId("P-1")),
+            (account_id2, OrderSide.SELL, PositionId("P-2")),
+        ):
+            order = self.order_factory.market(
+                AUDUSD_SIM.id,
+                side,
+                Quantity.from_int(100_000),
+            )
+            fill = TestEventStubs.order_filled(
+                order=order,
+                instrument=AUDUSD_SIM,
+                account_id=account_id,
+                position_id=position_id,
+                last_px=Price.from_str("1.00000"),
+            )
+            positions.append(Position(instrument=AUDUSD_SIM, fill=fill))
+
+        # Position opened before any aggregates are built
+        self.cache.add_position(positions[0], OmsType.HEDGING)
+
+        # Act
+        self.cache.add_position(positions[1], OmsType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(positions[1]))
+
+        # Assert
+        assert self.portfolio.position_aggregate(AUDUSD_SIM.id).net_qty() == 0.0
+        assert self.portfolio.position_aggregate(AUDUSD_SIM.id, account_id1).net_qty() == 100_000
+        assert self.portfolio.position_aggregate(AUDUSD_SIM.id, account_id2).net_qty() == -100_000
+        assert list(self.portfolio.position_aggregates(account_id1)) == [AUDUSD_SIM.id]
+        assert self.portfolio.position_aggregates(account_id2)[AUDUSD_SIM.id].short_qty == 100_000
+
     def test_open_value_when_no_account_returns_none(self):
         # Arrange, Act, Assert
         assert self.portfolio.net_exposures(SIM) is None
@@ -1292,6 +1340,7 @@ class TestPortfolio:
         assert not self.portfolio.is_net_short(AUDUSD_SIM.id)
         assert self.portfolio.is_flat(AUDUSD_SIM.id)
         assert self.portfolio.is_completely_flat()
+        assert self.portfolio.analyzer.running_statistics(USD)["Trades"] == 1
 
     def test_several_positions_with_different_instruments_updates_portfolio(self):
         # Arrange
@@ -1432,3 +1481,234 @@ class TestPortfolio:
         assert self.portfolio.is_net_long(AUDUSD_SIM.id)
         assert self.portfolio.is_flat(GBPUSD_SIM.id)
         assert not self.portfolio.is_completely_flat()
+
+    def test_hedged_positions_unrealized_pnl_and_net_exposure_marked_per_side(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        last_audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80501"),
+            ask_price=Price.from_str("0.80505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last_audusd)
+        self.portfolio.update_quote_tick(last_audusd)
+
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(50_000),
+        )
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-2"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position1 = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position2 = Position(instrument=AUDUSD_SIM, fill=fill2)
+
+        self.cache.add_position(position1, OmsType.HEDGING)
+        self.cache.add_position(position2, OmsType.HEDGING)
+
+        # Act
+        self.portfolio.update_position(TestEventStubs.position_opened(position1))
+        self.portfolio.update_position(TestEventStubs.position_opened(position2))
+        self.portfolio.update_position(TestEventStubs.position_opened(position2))  # Duplicate event
+
+        # Assert
+        expected_pnl = (
+            position1.unrealized_pnl(last_audusd.bid_price).as_double()
+            + position2.unrealized_pnl(last_audusd.ask_price).as_double()
+        )
+        assert expected_pnl == -9751.50
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(-9751.50, USD)
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-9751.50, USD)}
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(120753.50, USD)
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(120753.50, USD)}
+        assert self.portfolio.net_position(AUDUSD_SIM.id) == Decimal(50000)
+
+    def test_unrealized_pnl_recalculated_from_latest_quote(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        self.portfolio.update_account(TestEventStubs.margin_account_state(account_id))
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        self.cache.add_position(position, OmsType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        quote1 = TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=1.00010, ask_price=1.00020)
+        quote2 = TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=0.99990, ask_price=1.00000)
+
+        # Act
+        self.cache.add_quote_tick(quote1)
+        self.portfolio.update_quote_tick(quote1)
+        result1 = self.portfolio.unrealized_pnl(AUDUSD_SIM.id)
+
+        self.cache.add_quote_tick(quote2)
+        self.portfolio.update_quote_tick(quote2)
+        result2 = self.portfolio.unrealized_pnl(AUDUSD_SIM.id)
+
+        # Assert
+        assert result1 == Money(10.00, USD)
+        assert result2 == Money(-10.00, USD)
+
+
+class TestPositionAggregate:
+    def setup(self):
+        # Fixture Setup
+        self.order_factory = OrderFactory(
+            trader_id=TestIdStubs.trader_id(),
+            strategy_id=StrategyId("S-001"),
+            clock=TestClock(),
+        )
+
+    def test_instantiate_aggregate(self):
+        # Arrange, Act
+        aggregate = PositionAggregate(AUDUSD_SIM)
+
+        # Assert
+        assert aggregate.instrument_id == AUDUSD_SIM.id
+        assert not aggregate.is_inverse
+        assert aggregate.is_flat()
+        assert aggregate.net_qty() == 0.0
+        assert aggregate.avg_px_open(PositionSide.LONG) == 0.0
+        assert aggregate.unrealized_pnl(PositionSide.LONG, 1.0) == 0.0
+
+    def test_update_aggregates_positions_per_side(self):
+        # Arrange
+        aggregate = PositionAggregate(AUDUSD_SIM)
+
+        # Act
+        aggregate.update(PositionId("P-1"), PositionSide.LONG, 100_000, 1.00000)
+        aggregate.update(PositionId("P-2"), PositionSide.LONG, 100_000, 1.00010)
+        aggregate.update(PositionId("P-3"), PositionSide.SHORT, 50_000, 1.00020)
+
+        # Assert
+        assert not aggregate.is_flat()
+        assert aggregate.long_qty == 200_000
+        assert aggregate.short_qty == 50_000
+        assert aggregate.net_qty() == 150_000
+        assert aggregate.avg_px_open(PositionSide.LONG) == pytest.approx(1.00005)
+        assert aggregate.avg_px_open(PositionSide.SHORT) == pytest.approx(1.00020)
+        assert aggregate.unrealized_pnl(PositionSide.LONG, 1.00015) == pytest.approx(20.0)
+        assert aggregate.unrealized_pnl(PositionSide.SHORT, 1.00030) == pytest.approx(-5.0)
+        assert aggregate.notional_value(PositionSide.SHORT, 1.00030) == pytest.approx(50_015.0)
+        assert aggregate.net_open_notional() == pytest.approx(150_000.0)
+
+    def test_update_with_same_position_replaces_prior_state(self):
+        # Arrange
+        aggregate = PositionAggregate(AUDUSD_SIM)
+        aggregate.update(PositionId("P-1"), PositionSide.LONG, 100_000, 1.00000)
+
+        # Act
+        aggregate.update(PositionId("P-1"), PositionSide.LONG, 100_000, 1.00000)
+        aggregate.update(PositionId("P-1"), PositionSide.SHORT, 20_000, 1.00010)
+
+        # Assert
+        assert aggregate.long_qty == 0.0
+        assert aggregate.short_qty == 20_000
+        assert aggregate.avg_px_open(PositionSide.SHORT) == pytest.approx(1.00010)
+
+    def test_update_with_flat_position_removes_position(self):
+        # Arrange
+        aggregate = PositionAggregate(AUDUSD_SIM)
+        aggregate.update(PositionId("P-1"), PositionSide.LONG, 100_000, 1.00003)
+
+        # Act
+        aggregate.update(PositionId("P-1"), PositionSide.FLAT, 0, 0.0)
+
+        # Assert
+        assert aggregate.is_flat()
+        assert aggregate.long_qty == 0.0
+        assert aggregate.long_value == 0.0
+
+    def test_inverse_instrument_unrealized_pnl_matches_position(self):
+        # Arrange
+        aggregate = PositionAggregate(BTCUSD_BITMEX)
+        order = self.order_factory.market(
+            BTCUSD_BITMEX.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=BTCUSD_BITMEX,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("10000.0"),
+        )
+        position = Position(instrument=BTCUSD_BITMEX, fill=fill)
+
+        # Act
+        aggregate.update(position.id, position.side, position.quantity.as_double(), position.avg_px_open)
+
+        # Assert
+        last = Price.from_str("11000.0")
+        assert aggregate.is_inverse
+        assert aggregate.unrealized_pnl(PositionSide.LONG, last.as_double()) == pytest.approx(
+            position.unrealized_pnl(last).as_double(),
+        )
+        assert aggregate.avg_px_open(PositionSide.LONG) == pytest.approx(10000.0)
@@ -23,6 +23,7 @@ from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.messages import TradingStateChanged
 from nautilus_trader.config import ExecEngineConfig
 from nautilus_trader.config import RiskEngineConfig
+from nautilus_trader.config import StrategyConfig
 from nautilus_trader.core.message import Event
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.execution.emulator import OrderEmulator
@@ -38,6 +39,7 @@ from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.currencies import USDT
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import OrderStatus
 from nautilus_trader.model.enums import TradingState
@@ -58,6 +60,7 @@ from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.orders.list import OrderList
+from nautilus_trader.model.position import Position
 from nautilus_trader.portfolio.portfolio import Portfolio
 from nautilus_trader.risk.engine import RiskEngine
 from nautilus_trader.test_kit.mocks.exec_clients import MockExecutionClient
@@ -71,6 +74,7 @@ from nautilus_trader.trading.strategy import Strategy
 
 _AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 _GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
+_USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 _XBTUSD_BITMEX = TestInstrumentProvider.xbtusd_bitmex()
 _ADAUSDT_BINANCE = TestInstrumentProvider.adausdt_binance()
 _ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
@@ -245,6 +249,47 @@ class TestRiskEngineWithCashAccount:
         assert max_notionals == {_AUDUSD_SIM.id: Decimal("1000000")}
         assert max_notional == Decimal(1_000_000)
 
+    def test_risk_limits_compiled_from_instrument_and_settings(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(_AUDUSD_SIM.id, 1_000_000)
+
+        # Act
+        limits = self.risk_engine.risk_limits(_AUDUSD_SIM.id)
+
+        # Assert
+        assert limits.instrument is _AUDUSD_SIM
+        assert limits.price_precision == _AUDUSD_SIM.price_precision
+        assert limits.size_precision == _AUDUSD_SIM.size_precision
+        assert limits.check_price_positive
+        assert limits.max_quantity_raw == _AUDUSD_SIM.max_quantity.raw
+        assert limits.min_quantity_raw == _AUDUSD_SIM.min_quantity.raw
+        assert limits.has_max_notional_per_order
+        assert limits.max_notional_per_order == Money(1_000_000, USD)
+        assert limits.max_notional_per_order_raw == Money(1_000_000, USD).raw
+        assert limits.has_min_notional
+        assert limits.min_notional_raw == _AUDUSD_SIM.min_notional.raw
+        assert limits.has_max_notional
+        assert limits.max_notional_raw == _AUDUSD_SIM.max_notional.raw
+        assert not limits.has_max_exposure
+
+    def test_risk_limits_when_instrument_not_in_cache_returns_none(self):
+        # Arrange, Act, Assert
+        assert self.risk_engine.risk_limits(_GBPUSD_SIM.id) is None
+
+    def test_risk_limits_recompiled_when_settings_change(self):
+        # Arrange
+        limits1 = self.risk_engine.risk_limits(_AUDUSD_SIM.id)
+
+        # Act
+        self.risk_engine.set_max_notional_per_order(_AUDUSD_SIM.id, 500_000)
+        limits2 = self.risk_engine.risk_limits(_AUDUSD_SIM.id)
+
+        # Assert
+        assert not limits1.has_max_notional_per_order
+        assert limits2 is not limits1
+        assert limits2.max_notional_per_order == Money(500_000, USD)
+        assert self.risk_engine.risk_limits(_AUDUSD_SIM.id) is limits2
+
     def test_given_random_command_then_logs_and_continues(self):
         # Arrange
         random = TradingCommand(
@@ -2303,3 +2348,309 @@ class TestRiskEngineWithCryptoCashAccount:
         account = self.cache.account(self.account_id)
         assert account.balance(_ETHUSDT_BINANCE.base_currency).total == Money(0.00000000, ETH)
         assert self.portfolio.net_position(_ETHUSDT_BINANCE.id) == Decimal("0.02050")
+
+
+class TestRiskEngineWithMarginAccount:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.trader_id = TestIdStubs.trader_id()
+        self.account_id = TestIdStubs.account_id()
+        self.venue = Venue("SIM")
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+        )
+
+        self.cache = TestComponentStubs.cache()
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.exec_engine = ExecutionEngine(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=ExecEngineConfig(debug=True),
+        )
+
+        self.risk_engine = RiskEngine(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=RiskEngineConfig(debug=True),
+        )
+
+        self.exec_client = MockExecutionClient(
+            client_id=ClientId(self.venue.value),
+            venue=self.venue,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        account_state = AccountState(
+            account_id=self.account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,  # reported
+            balances=[
+                AccountBalance(
+                    Money(10_000, USD),
+                    Money(0, USD),
+                    Money(10_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(account_state)
+        self.exec_engine.register_client(self.exec_client)
+
+        # Prepare data
+        self.cache.add_instrument(_AUDUSD_SIM)
+
+        self.strategy = Strategy()
+        self.strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.risk_engine.start()
+        self.exec_engine.start()
+
+    def _submit_limit(self, side: OrderSide, quantity: int, instrument=_AUDUSD_SIM, price: float = 1.0):
+        order = self.strategy.order_factory.limit(
+            instrument.id,
+            side,
+            Quantity.from_int(quantity),
+            instrument.make_price(price),
+        )
+
+        submit_order = SubmitOrder(
+            trader_id=self.trader_id,
+            strategy_id=self.strategy.id,
+            position_id=None,
+            order=order,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        self.risk_engine.execute(submit_order)
+        return order
+
+    def _open_position(self, side: OrderSide, quantity: int, account_id: AccountId | None = None):
+        position = self._make_position(side, quantity, account_id)
+        self.cache.add_position(position, OmsType.NETTING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+        return position
+
+    def _make_position(self, side: OrderSide, quantity: int, account_id: AccountId | None = None):
+        account_id = account_id or self.account_id
+        order = self.strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            side,
+            Quantity.from_int(quantity),
+        )
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=_AUDUSD_SIM,
+            account_id=account_id,
+            position_id=PositionId(f"P-{account_id.get_id()}"),
+            last_px=Price.from_str("1.00000"),
+        )
+        return Position(instrument=_AUDUSD_SIM, fill=fill)
+
+    def test_set_max_exposures_changes_settings(self):
+        # Arrange, Act
+        self.risk_engine.set_max_exposure_per_instrument(_AUDUSD_SIM.id, 1_000_000)
+        self.risk_engine.set_max_exposure_per_account(self.account_id, 2_000_000)
+
+        # Assert
+        assert self.risk_engine.max_exposures_per_instrument() == {
+            _AUDUSD_SIM.id: Decimal("1000000"),
+        }
+        assert self.risk_engine.max_exposure_per_instrument(_AUDUSD_SIM.id) == Decimal(1_000_000)
+        assert self.risk_engine.max_exposures_per_account() == {
+            self.account_id: Decimal("2000000"),
+        }
+        assert self.risk_engine.max_exposure_per_account(self.account_id) == Decimal(2_000_000)
+
+    def test_submit_order_within_free_margin_then_sends_to_client(self):
+        # Arrange, Act
+        order = self._submit_limit(OrderSide.BUY, 100_000)
+
+        # Assert
+        assert order.status == OrderStatus.INITIALIZED
+        assert self.exec_engine.command_count == 1
+
+    def test_submit_order_when_margin_init_exceeds_free_balance_then_denies(self):
+        # Arrange, Act
+        order = self._submit_limit(OrderSide.BUY, 1_000_000)
+
+        # Assert
+        assert order.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 0
+
+    def test_position_events_update_exposures(self):
+        # Arrange, Act
+        self._open_position(OrderSide.BUY, 100_000)
+
+        # Assert
+        assert self.risk_engine.instrument_exposure(_AUDUSD_SIM.id) == 100_000.0
+        assert self.risk_engine.account_exposure(self.account_id, USD) == 100_000.0
+
+    def test_exposures_with_open_position_in_cache_read_from_portfolio(self):
+        # Arrange
+        position = self._make_position(OrderSide.BUY, 100_000)
+        self.cache.add_position(position, OmsType.NETTING)
+
+        # Act, Assert
+        assert self.risk_engine.instrument_exposure(_AUDUSD_SIM.id) == 100_000.0
+        assert self.risk_engine.account_exposure(self.account_id, USD) == 100_000.0
+
+        # Events for the cached position replace (not add to) its exposure
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+        assert self.risk_engine.instrument_exposure(_AUDUSD_SIM.id) == 100_000.0
+        assert self.risk_engine.account_exposure(self.account_id, USD) == 100_000.0
+
+    def test_exposures_are_keyed_by_account(self):
+        # Arrange, Act
+        self._open_position(OrderSide.BUY, 100_000)
+        self._open_position(OrderSide.SELL, 40_000, account_id=AccountId("SIM-002"))
+
+        # Assert
+        assert self.risk_engine.instrument_exposure(_AUDUSD_SIM.id) == 60_000.0
+        assert self.risk_engine.account_exposure(self.account_id, USD) == 100_000.0
+        assert self.risk_engine.account_exposure(AccountId("SIM-002"), USD) == 40_000.0
+
+    def test_submit_reducing_order_with_netting_then_requires_no_margin(self):
+        # Arrange
+        self._open_position(OrderSide.BUY, 1_000_000)
+
+        # Act
+        order = self._submit_limit(OrderSide.SELL, 1_000_000)
+
+        # Assert
+        assert order.status == OrderStatus.INITIALIZED
+        assert self.exec_engine.command_count == 1
+
+    def test_submit_order_against_other_account_position_then_requires_margin(self):
+        # Arrange
+        self._open_position(OrderSide.BUY, 1_000_000, account_id=AccountId("SIM-002"))
+
+        # Act
+        order = self._submit_limit(OrderSide.SELL, 1_000_000)
+
+        # Assert
+        assert order.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 0
+
+    def test_submit_opposite_order_with_hedging_venue_then_requires_margin(self):
+        # Arrange
+        self.risk_engine.register_venue_oms_type(self.venue, OmsType.HEDGING)
+        self._open_position(OrderSide.BUY, 1_000_000)
+
+        # Act
+        order = self._submit_limit(OrderSide.SELL, 1_000_000)
+
+        # Assert
+        assert order.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 0
+
+    def test_submit_opposite_order_with_hedging_strategy_override_then_requires_margin(self):
+        # Arrange
+        self.strategy = Strategy(config=StrategyConfig(oms_type="HEDGING"))
+        self.strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        self.risk_engine.register_oms_type(self.strategy)
+        self._open_position(OrderSide.BUY, 1_000_000)
+
+        # Act
+        order = self._submit_limit(OrderSide.SELL, 1_000_000)
+
+        # Assert
+        assert order.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 0
+
+    def test_submit_order_with_margin_in_other_currency_converts_with_xrate(self):
+        # Arrange
+        self.cache.add_instrument(_USDJPY_SIM)
+        self.cache.add_quote_tick(
+            TestDataStubs.quote_tick(_USDJPY_SIM, bid_price=100.0, ask_price=100.0),
+        )
+
+        # Act
+        order1 = self._submit_limit(OrderSide.BUY, 100_000, instrument=_USDJPY_SIM, price=100.0)
+        order2 = self._submit_limit(OrderSide.BUY, 1_000_000, instrument=_USDJPY_SIM, price=100.0)
+
+        # Assert
+        assert order1.status == OrderStatus.INITIALIZED
+        assert order2.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 1
+
+    def test_submit_order_with_margin_in_other_currency_and_no_xrate_then_sends_to_client(self):
+        # Arrange
+        self.cache.add_instrument(_USDJPY_SIM)
+
+        # Act (margin cannot be checked without an exchange rate)
+        order = self._submit_limit(OrderSide.BUY, 1_000_000, instrument=_USDJPY_SIM, price=100.0)
+
+        # Assert
+        assert order.status == OrderStatus.INITIALIZED
+        assert self.exec_engine.command_count == 1
+
+    def test_submit_order_when_projected_instrument_exposure_exceeds_max_then_denies(self):
+        # Arrange
+        self.risk_engine.set_max_exposure_per_instrument(_AUDUSD_SIM.id, 150_000)
+        self._open_position(OrderSide.BUY, 100_000)
+
+        # Act
+        order = self._submit_limit(OrderSide.BUY, 100_000)
+
+        # Assert
+        assert order.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 0
+
+    def test_submit_order_when_projected_account_exposure_exceeds_max_then_denies(self):
+        # Arrange
+        self.risk_engine.set_max_exposure_per_account(self.account_id, 150_000)
+        self._open_position(OrderSide.SELL, 100_000)
+
+        # Act
+        order = self._submit_limit(OrderSide.SELL, 100_000)
+
+        # Assert
+        assert order.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 0
+
+    def test_submit_reducing_order_when_exposure_above_max_then_sends_to_client(self):
+        # Arrange
+        self.risk_engine.set_max_exposure_per_instrument(_AUDUSD_SIM.id, 50_000)
+        self._open_position(OrderSide.BUY, 100_000)
+
+        # Act
+        order = self._submit_limit(OrderSide.SELL, 20_000)
+
+        # Assert
+        assert order.status == OrderStatus.INITIALIZED
+        assert self.exec_engine.command_count == 1
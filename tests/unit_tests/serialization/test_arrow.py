@@ -25,9 +25,11 @@ from nautilus_trader.common.messages import ComponentStateChanged
 from nautilus_trader.common.messages import ShutdownSystem
 from nautilus_trader.common.messages import TradingStateChanged
 from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.model.book import OrderBookDepthSnapshot
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.events import AccountState
 from nautilus_trader.model.identifiers import ComponentId
@@ -158,6 +160,26 @@ class TestArrowSerializer:
         assert isinstance(deltas[0], OrderBookDelta)
         assert not isinstance(deserialized[0], OrderBookDelta)  # TODO: Legacy wrangler
 
+    def test_serialize_and_deserialize_order_book_depth_snapshot(self):
+        # Arrange
+        book = TestDataStubs.make_book(
+            instrument=AUDUSD_SIM,
+            book_type=BookType.L2_MBP,
+            bids=[(0.80000, 100_000.0), (0.79990, 200_000.0)],
+            asks=[(0.80010, 100_000.0)],
+        )
+        snapshot = book.to_depth_snapshot(ts_init=0, depth=5)
+
+        # Act
+        serialized = ArrowSerializer.serialize(snapshot)
+        deserialized = ArrowSerializer.deserialize(data_cls=OrderBookDepthSnapshot, batch=serialized)
+
+        # Assert
+        assert deserialized == [snapshot]
+        self.catalog.write_data([snapshot])
+        result = self.catalog.query(data_cls=OrderBookDepthSnapshot)
+        assert result == [snapshot]
+
     def test_serialize_and_deserialize_order_book_deltas(self):
         # Arrange
         deltas = OrderBookDeltas(
@@ -17,6 +17,7 @@ from base64 import b64encode
 from decimal import Decimal
 
 import msgspec
+import pandas as pd
 
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.enums import ComponentState
@@ -142,6 +143,70 @@ class TestMsgSpecSerializer:
         print(b64encode(serialized))
         print(deserialized)
 
+    def test_serialize_with_timestamps_as_str_is_wire_compatible(self):
+        # Arrange
+        serializer = MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True)
+        order = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity(100_000, precision=0),
+            Price(1.00000, precision=5),
+            TimeInForce.GTD,
+            expire_time=pd.Timestamp("1970-01-01 00:01", tz="UTC"),
+        )
+        event = order.last_event
+
+        # Act
+        serialized = serializer.serialize(event)
+        deserialized = serializer.deserialize(serialized)
+
+        # Assert
+        expected = OrderInitialized.to_dict(event)
+        for key in ("ts_init", "ts_event", "expire_time_ns"):
+            expected[key] = str(expected[key])
+        assert serialized == msgspec.msgpack.encode(expected)
+        assert deserialized == event
+        assert deserialized.ts_init == event.ts_init
+
+    def test_serialize_and_deserialize_with_timestamps_as_iso8601(self):
+        # Arrange
+        serializer = MsgSpecSerializer(
+            encoding=msgspec.msgpack,
+            timestamps_as_str=True,
+            timestamps_as_iso8601=True,
+        )
+        command = CancelOrder(
+            trader_id=self.trader_id,
+            strategy_id=StrategyId("SCALPER-001"),
+            instrument_id=AUDUSD_SIM.id,
+            client_order_id=ClientOrderId("O-123456"),
+            venue_order_id=VenueOrderId("001"),
+            command_id=UUID4(),
+            ts_init=1_000_000_001,
+        )
+
+        # Act
+        serialized = serializer.serialize(command)
+        deserialized = serializer.deserialize(serialized)
+
+        # Assert
+        assert msgspec.msgpack.decode(serialized)["ts_init"] == "1970-01-01T00:00:01.000000001Z"
+        assert deserialized == command
+        assert deserialized.ts_init == 1_000_000_001
+
+    def test_serialize_untyped_dicts_with_dynamic_keys_converts_timestamps(self):
+        # Arrange
+        serializer = MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True)
+        payloads = [{f"key_{i}": i, f"ts_{i}": i} for i in range(1_000)]
+
+        # Act
+        serialized = [serializer.serialize(dict(payload)) for payload in payloads]
+
+        # Assert
+        for i, payload in enumerate(serialized):
+            assert msgspec.msgpack.decode(payload) == {f"key_{i}": i, f"ts_{i}": str(i)}
+            assert serializer.deserialize(payload) == {f"key_{i}": i, f"ts_{i}": i}
+
     def test_pack_and_unpack_market_orders(self):
         # Arrange
         order = self.order_factory.market(
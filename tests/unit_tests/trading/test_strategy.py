@@ -174,6 +174,27 @@ class TestStrategy:
         self.data_engine.start()
         self.exec_engine.start()
 
+    def test_register_with_trusted_msgbus_creates_trusted_order_factory(self) -> None:
+        # Arrange
+        msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            trusted=True,
+        )
+        strategy = Strategy()
+
+        # Act
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        # Assert
+        assert strategy.order_factory.trusted
+
     def test_strategy_to_importable_config_with_no_specific_config(self) -> None:
         # Arrange
         config = StrategyConfig()